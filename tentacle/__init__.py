@@ -13,7 +13,22 @@ DEFAULT_INCLUDE = {
     "tcl_blender": "TclBlender",
     "tcl_max": "TclMax",
     "tcl_maya": "TclMaya",
+    "startup_profile": "StartupProfile",  # cold-start profiler behind Tcl.launch(profile=)
+    "ui_cache": "UiCache",  # compiled .ui cache the entry classes load panels through
+    "slot_manifest": "SlotManifest",  # lazy slot-class registration for the entry classes
+    "slot_telemetry": "SlotTelemetry",  # per-slot dispatch timings (Preferences > Slot Timings)
+    "panel_pool": "PanelPool",  # idle-time prebuild of the most opened standalone panels
     "slots._slots": "Slots",
+    "slots._selection_mask": "SelectionMask",  # Blender select flags as NumPy masks
+    "slots._row_cache": "RowCache",  # per-mesh rows on a signature: the cached mesh queries' table
+    "slots._scene_stats": "SceneStats",  # cached poly counts shared by HUD / export / Scene Info
+    "slots._mesh_diagnostics": "MeshDiagnostics",  # cached non-manifold scans for Unfold's repair
+    "slots._similar_index": "SimilarIndex",  # cached mesh descriptors behind Select Similar
+    "slots._type_index": "TypeIndex",  # callback-maintained node-type sets for Select by Type
+    "slots._face_graph": "FaceGraphs",  # NumPy face normals / islands / edge angles for selection
+    "slots._key_clipboard": "KeyClipboard",  # Copy / Paste Keys as NumPy columns, persisted
+    "slots._recent_files": "RecentFileIndex",  # recent + autosave file metadata, scanned off-thread
+    "slots._webxr_delta": "WebXrDelta",  # WebXR Live Update: hashes of the last push, delta blobs
     "slots.maya._slots_maya": "SlotsMaya",
     "slots.blender._slots_blender": "SlotsBlender",
     # Per-panel shared mixins (slots/_<panel>.py). Registered so a concrete panel
@@ -27,6 +42,7 @@ DEFAULT_INCLUDE = {
     # silently bind their widget to another panel's slot. Mixing in per panel keeps
     # each name owned by exactly the panels that opted in.
     "slots._edit": "EditMixin",
+    "slots._hud": "HudMixin",
     "slots._hud_warnings": "HudWarningsMixin",
     "slots._lighting": "LightingMixin",
     "slots._main": "MainMixin",
@@ -0,0 +1,376 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Warm-standby pool: the standalone panels a user opens most, prebuilt while the host idles.
+
+``preload=True`` warms only the marking menu's own pages — the binding-target startmenus and
+the submenus they open. A standalone panel (``polygons``, ``uv``, ``animation``,
+``preferences``; 20-45 KB of ``.ui`` and dozens of option-box ``*_init`` calls each) still
+pays its whole load and ``register_children`` inside the click that first opens it — about
+950 ms in the checked-in ``naming`` bench (``03_lazy_load_ui`` + ``04_register_children``).
+
+:class:`PanelPool` moves that work to idle time:
+
+- **What** — every standalone open is counted (the marking menu's ``_show_window``), and the
+  counts persist per host under ``Tcl.cache_dir("panels")``. The :attr:`PanelPool.MAX_PANELS`
+  most opened (at least :attr:`PanelPool.MIN_OPENS` times) are the build queue.
+- **When** — a build runs in slices of :attr:`PanelPool.SLICE_MS`: the ``.ui`` load is one
+  step, then ``register_children`` one top-level subtree at a time, then the menus' deferred
+  registrations. Between slices the event loop runs; a slice only starts while the host is
+  idle — no gesture, popup, modal, mouse button or moving pointer, and (like
+  ``preload_menus``) straight from the host's own loop where the menu asks for that.
+- **How much** — each built panel is charged :attr:`PanelPool.WIDGET_KB` per widget against
+  a budget (:attr:`PanelPool.BUDGET_MB`, ``TENTACLE_PANEL_POOL_MB`` or ``install(budget_mb=)``).
+  Panels the user opened count too; when a build overflows it, the least recently built
+  panel the pool still owns is dropped. Only a panel the pool built, that was never opened,
+  is hidden, and whose slot class no other page of the same name has bound to, is
+  evictable — anything else may hold live state.
+
+The entry classes install it on construction (``TENTACLE_PANEL_POOL=0`` opts out)::
+
+    PanelPool.install(self, "maya")   # counts opens, schedules the first idle build
+"""
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from tentacle.tcl import Tcl
+
+
+class PanelPool:
+    """Idle-time builder of the user's most opened standalone panels.
+
+    Parameters:
+        sb (Switchboard): The switchboard the panels load through.
+        host (str): ``"maya"`` / ``"blender"`` — names the open-count store.
+        menu (MarkingMenu): The menu whose gestures and preload the pool yields to.
+        path (str): The store. Defaults to ``<cache>/panels/<host>.json``.
+        budget_mb (float): Memory budget. Defaults to ``TENTACLE_PANEL_POOL_MB`` or
+            :attr:`BUDGET_MB`.
+    """
+
+    #: Environment switch: ``0`` / ``off`` / ``false`` disables :meth:`install`.
+    ENV = "TENTACLE_PANEL_POOL"
+
+    #: Environment override of :attr:`BUDGET_MB`.
+    BUDGET_ENV = "TENTACLE_PANEL_POOL_MB"
+
+    #: Estimated memory the built panels may hold.
+    BUDGET_MB = 64
+
+    #: Estimated resident cost of one built widget (Qt object, style, slot wiring).
+    WIDGET_KB = 24
+
+    #: Panels kept warm — the most opened first.
+    MAX_PANELS = 6
+
+    #: Opens before a panel is worth prebuilding.
+    MIN_OPENS = 2
+
+    #: Work done per idle tick before the event loop runs again.
+    SLICE_MS = 8
+
+    #: Delay before the first build, so startup and the menu preload settle first.
+    START_DELAY_MS = 5000
+
+    #: Re-check interval while the host is busy.
+    RETRY_MS = 1000
+
+    _active = None
+
+    def __init__(self, sb, host, menu=None, path=None, budget_mb=None):
+        if budget_mb is None:
+            try:
+                budget_mb = float(os.environ.get(self.BUDGET_ENV, self.BUDGET_MB))
+            except ValueError:
+                budget_mb = self.BUDGET_MB
+        self.sb = sb
+        self.host = host
+        self.menu = menu
+        self.path = path or os.path.join(Tcl.cache_dir("panels"), f"{host}.json")
+        self.budget_kb = budget_mb * 1024.0
+        self.opens = {}  # panel -> opens, all sessions
+        self.costs = {}  # panel -> measured KB of its last build
+        self.built = []  # panels built so far, in order — for tests and the bench
+        self._owned = OrderedDict()  # panel -> KB; built by the pool, never opened; LRU first
+        self._adopted = {}  # panel -> KB; opened by the user this session
+        self._own_slots = set()  # owned panels whose slot instance the build created
+        self._queue = []
+        self._job = None  # (panel, build generator)
+        self._scheduled = False
+        self._cursor = None
+        self._load()
+
+    # ------------------------------------------------------------------ install
+    @classmethod
+    def enabled(cls):
+        """False when ``TENTACLE_PANEL_POOL`` is set to ``0`` / ``off`` / ``false``."""
+        return os.environ.get(cls.ENV, "1").strip().lower() not in ("0", "off", "false")
+
+    @classmethod
+    def active(cls):
+        """The installed pool, or None."""
+        return cls._active
+
+    @classmethod
+    def install(cls, menu, host=None, **kwargs):
+        """Count *menu*'s standalone opens and schedule the first idle build; idempotent.
+
+        Returns the pool (or None when disabled by :attr:`ENV`).
+        """
+        if not cls.enabled():
+            return None
+        if cls._active is not None:
+            return cls._active
+        pool = cls._active = cls(menu.sb, host or Tcl.host() or "qt", menu=menu, **kwargs)
+        show_window = menu._show_window
+
+        def counted_show_window(widget, *args, **kwargs):
+            try:
+                pool.record_open(widget.objectName())
+            except Exception as error:  # counting must never block a show
+                pool.sb.logger.debug(f"[panel_pool] open not counted: {error}")
+            return show_window(widget, *args, **kwargs)
+
+        menu._show_window = counted_show_window
+        pool.schedule(cls.START_DELAY_MS)
+        return pool
+
+    @classmethod
+    def uninstall(cls):
+        """Stop building; the menu keeps its counting wrapper until it is rebuilt."""
+        pool, cls._active = cls._active, None
+        if pool is not None:
+            pool._queue, pool._job = [], None
+
+    # ------------------------------------------------------------------ store
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            opens = {str(k): int(v) for k, v in data.get("opens", {}).items()}
+            costs = {str(k): float(v) for k, v in data.get("costs", {}).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        self.opens, self.costs = opens, costs
+
+    def write(self):
+        """Write the open counts and build costs; never raises (the store is a hint)."""
+        try:
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": 1, "host": self.host, "opens": self.opens, "costs": self.costs},
+                    f,
+                )
+            os.replace(tmp, self.path)
+        except OSError as error:
+            self.sb.logger.debug(f"[panel_pool] could not write {self.path}: {error}")
+
+    # ------------------------------------------------------------------ queries
+    def ranked(self):
+        """The panels worth keeping warm, most opened first."""
+        names = sorted(
+            (n for n, count in self.opens.items() if count >= self.MIN_OPENS),
+            key=lambda n: -self.opens[n],
+        )
+        return [n for n in names if self.sb.is_registered_ui(n)][: self.MAX_PANELS]
+
+    def used_kb(self):
+        """Estimated memory held by owned and opened panels."""
+        return sum(self._owned.values()) + sum(self._adopted.values())
+
+    def is_warm(self, name):
+        """True when the pool built *name* and it has not been opened since."""
+        return name in self._owned
+
+    def _cost(self, ui):
+        from qtpy import QtWidgets
+
+        return (len(ui.findChildren(QtWidgets.QWidget)) + 1) * self.WIDGET_KB
+
+    # ------------------------------------------------------------------ opens
+    def record_open(self, name):
+        """Count an open of *name*; a panel the pool built becomes the user's."""
+        if not name:
+            return
+        self.opens[name] = self.opens.get(name, 0) + 1
+        if name in self._owned:
+            self._adopted[name] = self._owned.pop(name)
+            self._own_slots.discard(name)
+        elif name not in self._adopted:
+            self._adopted[name] = self.costs.get(name, 0.0)
+        self.write()
+        self.schedule(self.RETRY_MS)
+
+    # ------------------------------------------------------------------ scheduling
+    def schedule(self, delay_ms=0):
+        """Queue the ranked panels not built yet and start the idle loop (no-op if running)."""
+        queued = set(self._queue)
+        if self._job is not None:
+            queued.add(self._job[0])
+        for name in self.ranked():
+            if name in queued or name in self._owned or name in self._adopted:
+                continue
+            ui = self.sb.loaded_ui.peek(name)
+            if ui is not None and getattr(ui, "is_initialized", False):
+                continue
+            self._queue.append(name)
+        if (self._queue or self._job) and not self._scheduled:
+            self._scheduled = True
+            from qtpy import QtCore
+
+            QtCore.QTimer.singleShot(delay_ms, self._tick)
+
+    def _tick(self):
+        self._scheduled = False
+        if PanelPool._active is not self or getattr(self.menu, "_retired", False):
+            return
+        busy = self.busy()
+        if not busy and getattr(self.menu, "PRELOAD_ONLY_FROM_HOST_LOOP", False):
+            try:
+                sys._getframe(1)  # a Python caller beneath this tick: a script pumping events
+                busy = True
+            except ValueError:
+                pass
+        from qtpy import QtCore
+
+        if busy:
+            self._scheduled = True
+            QtCore.QTimer.singleShot(self.RETRY_MS, self._tick)
+            return
+        if self.run_slice():
+            self._scheduled = True
+            QtCore.QTimer.singleShot(0, self._tick)
+
+    def busy(self):
+        """True while the user is mid-interaction — a build slice would land under their hand."""
+        from qtpy import QtGui, QtWidgets
+
+        menu = self.menu
+        try:
+            if menu is not None and (
+                menu.isVisible()
+                or getattr(menu, "_activation_key_held", False)
+                or getattr(menu, "_preload_queue", None)
+            ):
+                return True
+        except RuntimeError:  # the menu's C++ side is gone
+            return True
+        app = QtWidgets.QApplication
+        if app.mouseButtons() or app.activePopupWidget() or app.activeModalWidget():
+            return True
+        cursor = QtGui.QCursor.pos()
+        moved = self._cursor is not None and cursor != self._cursor
+        self._cursor = cursor
+        return moved
+
+    def run_slice(self, slice_ms=None):
+        """Build for up to *slice_ms*; returns True while work remains."""
+        deadline = time.perf_counter() + (slice_ms or self.SLICE_MS) / 1000.0
+        while True:
+            if self._job is None:
+                if not self._queue:
+                    return False
+                name = self._queue.pop(0)
+                if self.used_kb() + self.costs.get(name, 0.0) > self.budget_kb:
+                    self._evict(self.costs.get(name, 0.0))
+                    if self.used_kb() + self.costs.get(name, 0.0) > self.budget_kb:
+                        self._queue = []  # the rest rank lower: nothing left fits
+                        return False
+                self._job = (name, self._build(name))
+            name, job = self._job
+            try:
+                next(job)
+            except StopIteration as done:
+                self._job = None
+                self._finish(name, done.value)
+            except Exception as error:  # a bad panel stays lazy; the pool carries on
+                self._job = None
+                self.sb.logger.warning(f"[panel_pool] building {name!r} failed: {error}")
+            if time.perf_counter() >= deadline:
+                return bool(self._job or self._queue)
+
+    # ------------------------------------------------------------------ building
+    def _build(self, name):
+        """Generator: load *name*, then register its children a subtree per step."""
+        from qtpy import QtCore, QtWidgets
+
+        key = self.sb.get_base_name(name)
+        fresh_slots = not self.sb.slots_instantiated(key)
+        ui = self.sb.get_ui(name)
+        if ui is None or getattr(ui, "is_initialized", False):
+            return None
+        if getattr(ui, "has_tags", None) and ui.has_tags(("startmenu", "submenu")):
+            return None  # a marking-menu page: preload_menus' job
+        yield
+        central = ui.centralWidget() if hasattr(ui, "centralWidget") else None
+        if central is not None:
+            children = central.findChildren(
+                QtWidgets.QWidget, options=QtCore.Qt.FindDirectChildrenOnly
+            )
+            for child in children:
+                ui.register_children(child)
+                yield
+        ui.register_children()  # the rest, and the menus' deferred registrations
+        if fresh_slots and self.sb.slots_instantiated(key):
+            self._own_slots.add(name)
+        return ui
+
+    def _finish(self, name, ui):
+        if ui is None:
+            return
+        cost = self._cost(ui)
+        self.costs[name] = cost
+        self._owned[name] = cost
+        self.built.append(name)
+        if self.used_kb() > self.budget_kb:
+            self._evict(0.0)
+        self.write()
+
+    # ------------------------------------------------------------------ eviction
+    def _evictable(self, name):
+        ui = self.sb.loaded_ui.peek(name)
+        if ui is None:
+            return True
+        try:
+            if ui.isVisible():
+                return False
+        except RuntimeError:
+            return True
+        if name not in self._own_slots:
+            return not self.sb.slots_instantiated(self.sb.get_base_name(name))
+        # The slot instance is shared by every page of the base name; one of them
+        # initialized since would be left bound to a deleted panel.
+        for relative in self.sb.get_ui_relatives(name, upstream=True, downstream=True):
+            page = self.sb.loaded_ui.peek(relative) if relative != name else None
+            if page is not None and getattr(page, "is_initialized", False):
+                return False
+        return True
+
+    def _evict(self, incoming_kb):
+        """Drop owned panels, least recently built first, until *incoming_kb* fits."""
+        for name in list(self._owned):
+            if self.used_kb() + incoming_kb <= self.budget_kb:
+                return
+            if not self._evictable(name):
+                continue
+            self._owned.pop(name)
+            ui = self.sb.loaded_ui.peek(name)
+            if ui is None:
+                continue
+            try:
+                del self.sb.loaded_ui[name]
+            except KeyError:
+                pass
+            if name in self._own_slots:
+                self._own_slots.discard(name)
+                try:
+                    del self.sb.slot_instances[self.sb.get_base_name(name)]
+                except KeyError:
+                    pass
+            try:
+                ui.deleteLater()
+            except RuntimeError:
+                pass
@@ -0,0 +1,306 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Slot manifest: register a DCC's slot classes without importing their modules.
+
+Handed a directory (``slot_source="slots/maya"``), the Switchboard's slot registry imports
+every ``*.py`` in it at construction — 60+ Maya modules, each pulling ``mayatk`` /
+``maya.cmds`` and running its module body — so startup grew with the number of *panels*,
+though only the startmenus are ever shown before the user asks for more.
+
+:class:`SlotManifest` gives the registry the same rows (``classname``, ``classobj``,
+``filename``, ``filepath``) read from the sources' syntax instead: each ``classobj`` is a
+stand-in class that imports its module on first use — instantiation when the panel's slots
+are created, or any attribute the stand-in cannot answer itself — and forwards to the real
+class from then on.
+
+- **Contents** — per module: its classes, their bases, and the methods each defines (the
+  widget slots ``b000`` / ``tb001`` / ``cmb002_init`` among them). The shared panel mixins
+  (``slots/_<panel>.py``) are scanned as well, so :attr:`slot_methods` on a stand-in includes
+  what it inherits from them.
+- **Location** — one JSON file per slot directory under ``Tcl.cache_dir("slots")``.
+- **Invalidation** — every entry is stamped with its file's size and mtime; a startup stats
+  the directory (no reads) and re-scans only the files whose stamp moved.
+- **Misses never block** — with no manifest yet (first run, cleared cache) the directory is
+  handed to the Switchboard as before and the manifest is built on a background thread for
+  the next start. ``python -m tentacle.slot_manifest`` builds it ahead of time.
+"""
+import ast
+import hashlib
+import importlib
+import json
+import os
+import sys
+import threading
+import uuid
+from functools import reduce
+from pathlib import Path
+
+from tentacle.tcl import Tcl
+
+
+class _LazySlotsMeta(type):
+    """Metaclass of the manifest's stand-in classes; see :meth:`SlotManifest.rows`."""
+
+    def resolve(cls):
+        """The real class, importing its module on first call."""
+        real = cls.__dict__.get("_resolved")
+        if real is None:
+            module = importlib.import_module(cls.__module__)
+            real = reduce(getattr, cls.__qualname__.split("."), module)
+            type.__setattr__(cls, "_resolved", real)
+        return real
+
+    def __call__(cls, *args, **kwargs):
+        return cls.resolve()(*args, **kwargs)
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):  # introspection probes (inspect, copy, ...) stay cheap
+            raise AttributeError(name)
+        return getattr(cls.resolve(), name)
+
+    def __dir__(cls):
+        return dir(cls.resolve())
+
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, cls.resolve())
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, cls.resolve())
+
+    def __repr__(cls):
+        state = "" if cls.__dict__.get("_resolved") else "unloaded "
+        return f"<{state}slots class '{cls.__module__}.{cls.__qualname__}'>"
+
+
+class SlotManifest:
+    """The cached class/method index of one slot directory.
+
+    Parameters:
+        slot_dir (str): A slot directory inside the tentacle package (``slots/maya``).
+    """
+
+    #: Bump when the manifest's layout changes; it is part of the file name.
+    FORMAT = 1
+
+    def __init__(self, slot_dir):
+        self.slot_dir = Path(slot_dir).resolve()
+        root = Path(__file__).resolve().parent
+        relative = self.slot_dir.relative_to(root)  # ValueError outside the package
+        self.package = ".".join((root.name,) + relative.parts)
+        self.shared_dir = self.slot_dir.parent  # the slots/_<panel>.py mixins
+        self._modules = None
+
+    # ------------------------------------------------------------------ sources
+    @classmethod
+    def lazy_source(cls, slot_source, anchor):
+        """What an entry class should hand the Switchboard as ``slot_source``.
+
+        Manifest rows when *slot_source* is a tentacle slot directory whose manifest is
+        cached; otherwise *slot_source* unchanged (a class, a module, a directory outside
+        the package — or a first run, which also starts building the manifest).
+
+        Parameters:
+            slot_source: The entry class's ``slot_source`` argument.
+            anchor (str): ``__file__`` of the entry class; relative paths resolve from it.
+        """
+        if not isinstance(slot_source, str):
+            return slot_source
+        path = Path(os.path.dirname(anchor), slot_source)
+        if not path.is_dir():
+            return slot_source
+        try:
+            manifest = cls(path)
+        except ValueError:
+            return slot_source
+        rows = manifest.rows()
+        if rows is None:
+            threading.Thread(
+                target=manifest.build, name="tentacle-slot-manifest", daemon=True
+            ).start()
+            return slot_source
+        return rows
+
+    def sources(self):
+        """The files the manifest covers: the slot modules, then the shared mixins."""
+        own = (p for p in self.slot_dir.glob("*.py") if not p.name.endswith("_ui.py"))
+        shared = self.shared_dir.glob("_*.py")
+        return sorted(own) + sorted(p for p in shared if p.name != "__init__.py")
+
+    @staticmethod
+    def stamp(path):
+        """``[size, mtime_ns]`` of *path* — what an entry's freshness is checked against."""
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def scan(path):
+        """``{qualname: {"bases": [...], "methods": [...]}}`` for every class in *path*.
+
+        Nested classes are included (the registry's own scan walks the whole tree);
+        bases are recorded by their last name (``tentacle.SlotsMaya`` -> ``SlotsMaya``).
+        """
+        tree = ast.parse(Path(path).read_bytes(), str(path))
+        classes = {}
+
+        def visit(node, prefix):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.ClassDef):
+                    qualname = f"{prefix}{child.name}"
+                    classes[qualname] = {
+                        "bases": [ast.unparse(b).rsplit(".", 1)[-1] for b in child.bases],
+                        "methods": [
+                            n.name
+                            for n in child.body
+                            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+                        ],
+                    }
+                    visit(child, f"{qualname}.")
+                elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue  # classes local to a function are not importable
+                else:
+                    visit(child, prefix)
+
+        visit(tree, "")
+        return classes
+
+    # ------------------------------------------------------------------ cache
+    def cache_path(self, create=True):
+        """``slots/<dir name>-<path hash>-v<FORMAT>.json`` under the tentacle cache dir."""
+        key = hashlib.sha1(str(self.slot_dir).encode("utf-8")).hexdigest()[:10]
+        name = f"{self.slot_dir.name}-{key}-v{self.FORMAT}.json"
+        return Path(Tcl.cache_dir("slots", create=create), name)
+
+    def modules(self, refresh=True):
+        """``{file name: {"stamp", "classes"}}`` — the manifest's contents.
+
+        Shared mixin files are keyed ``../<name>``.
+
+        Read from the cache. With *refresh*, entries whose file's stamp moved are
+        re-scanned, new files added, deleted ones dropped, and the result written back.
+
+        Returns:
+            dict | None: None when nothing is cached yet (see :meth:`build`).
+        """
+        if self._modules is None:
+            try:
+                self._modules = json.loads(self.cache_path(create=False).read_bytes())
+            except (OSError, ValueError):
+                return None
+        if refresh:
+            self._refresh()
+        return self._modules
+
+    def build(self):
+        """Scan every source now and write the manifest; returns its contents."""
+        self._modules = {}
+        self._refresh()
+        return self._modules
+
+    def _refresh(self):
+        current, changed = {}, False
+        for path in self.sources():
+            try:
+                stamp = self.stamp(path)
+            except OSError:
+                continue
+            key = path.name if path.parent == self.slot_dir else f"../{path.name}"
+            entry = self._modules.get(key)
+            if entry is None or entry["stamp"] != stamp:
+                try:
+                    classes = self.scan(path)
+                except (OSError, SyntaxError, ValueError):
+                    classes = {}  # the import will report it, on first show
+                entry = {"stamp": stamp, "classes": classes}
+                changed = True
+            current[key] = entry
+        if changed or current.keys() != self._modules.keys():
+            self._modules = current
+            self._write()
+
+    def _write(self):
+        target = self.cache_path()
+        scratch = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            scratch.write_text(json.dumps(self._modules), encoding="utf-8")
+            os.replace(scratch, target)
+        except OSError:  # a read-only cache costs the next start a rebuild, nothing more
+            if scratch.exists():
+                scratch.unlink()
+
+    # ------------------------------------------------------------------ queries
+    def slot_methods(self, qualname, _index=None):
+        """Every method name *qualname* defines or inherits from a scanned class."""
+        classes = _index if _index is not None else self._class_index()
+        methods, seen = set(), set()
+        pending = [qualname.rsplit(".", 1)[-1]]
+        while pending:
+            name = pending.pop()
+            if name in seen or name not in classes:
+                continue
+            seen.add(name)
+            methods.update(classes[name]["methods"])
+            pending.extend(classes[name]["bases"])
+        return frozenset(methods)
+
+    def _class_index(self):
+        """``{class name: info}`` across every scanned file (bases resolve by name)."""
+        classes = {}
+        for entry in (self.modules(refresh=False) or {}).values():
+            for name, info in entry["classes"].items():
+                classes.setdefault(name.rsplit(".", 1)[-1], info)
+        return classes
+
+    def rows(self):
+        """Slot-registry rows for the directory's classes, each ``classobj`` a stand-in.
+
+        Returns:
+            list | None: ``(classname, classobj, filename, filepath)`` tuples; None when
+            no manifest is cached yet.
+        """
+        modules = self.modules()
+        if modules is None:
+            return None
+        index, rows = self._class_index(), []
+        for file_name, entry in modules.items():
+            if file_name.startswith("../"):
+                continue
+            stem = file_name[: -len(".py")]
+            module = f"{self.package}.{stem}"
+            filepath = str(self.slot_dir / file_name)
+            for qualname in entry["classes"]:
+                name = qualname.rsplit(".", 1)[-1]
+                stand_in = _LazySlotsMeta(
+                    name,
+                    (),
+                    {
+                        "__module__": module,
+                        "__qualname__": qualname,
+                        "__doc__": f"Unimported stand-in for {module}.{qualname}.",
+                        "slot_methods": self.slot_methods(qualname, index),
+                    },
+                )
+                rows.append((name, stand_in, stem, filepath))
+        return rows
+
+
+def main(argv=None):
+    """``python -m tentacle.slot_manifest [slot dirs...]`` — build manifests ahead of time.
+
+    Default: every DCC slot directory under ``tentacle/slots``. Prints one line per
+    directory with its module and class counts.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    slots = Path(__file__).resolve().parent / "slots"
+    dirs = [Path(a) for a in argv] or sorted(
+        p for p in slots.iterdir() if p.is_dir() and (p / "__init__.py").exists()
+    )
+    for slot_dir in dirs:
+        modules = SlotManifest(slot_dir).build()
+        own = {k: v for k, v in modules.items() if not k.startswith("../")}
+        count = sum(len(v["classes"]) for v in own.values())
+        print(f"{slot_dir.name}: {len(own)} modules, {count} classes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
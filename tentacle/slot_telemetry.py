@@ -0,0 +1,403 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Per-slot latency telemetry, recorded at the slot dispatch chokepoint.
+
+Every marking-menu command runs through one method — uitk's ``SlotWrapper._invoke`` (after
+debounce, around the busy cursor). :class:`SlotTelemetry` wraps it at class level, the same
+way ``_ClickDebugger._install_slot_trace`` does in :mod:`tentacle.tcl_blender`, and for each
+invocation records:
+
+- **wall time** — the whole dispatch, slot body included;
+- **progress time** — the part spent inside ``sb.progress`` blocks (the footer bar pumps the
+  event loop per tick, so a slot that is slow *and* shows progress reads differently from one
+  that freezes the host);
+- **whether it raised** — the exception itself still propagates untouched.
+
+Recording is an append to a bounded ``collections.deque`` — atomic under the GIL, no lock — and
+the ring is folded into per-slot aggregates (count, errors, total / max time and a fixed
+log-bucket histogram, so percentiles merge across sessions) whenever it fills, on demand and
+at exit. The entry classes install it on construction (``TENTACLE_TELEMETRY=0`` opts out)::
+
+    SlotTelemetry.install("maya")      # patches dispatch, writes the aggregate at exit
+    SlotTelemetry.active().report()    # the text table Preferences ▸ Slot Timings shows
+
+The aggregate is one JSON file per host under ``Tcl.cache_dir("telemetry")`` holding the last
+:attr:`SlotTelemetry.SESSIONS` sessions; the report merges them with the live one. Stdlib only;
+uitk is imported by :meth:`SlotTelemetry.install`, not here.
+"""
+import atexit
+import bisect
+import json
+import logging
+import math
+import os
+import time
+import uuid
+from collections import deque
+
+from tentacle.tcl import Tcl
+
+logger = logging.getLogger(__name__)
+
+
+class _SlotStats:
+    """Aggregate timings for one slot: counts, sums and a log-bucket histogram."""
+
+    #: Histogram bucket upper edges in ms: ``0.1 * 1.25**i`` — 0.1 ms to ~2 min, each
+    #: bucket 25% wider than the last, so a percentile is within 25% of the true value.
+    EDGES_MS = tuple(0.1 * 1.25**i for i in range(64))
+
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "progress_ms", "hist")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.progress_ms = 0.0
+        self.hist = {}  # bucket index -> invocations
+
+    def add(self, ms, progress_ms, raised):
+        self.count += 1
+        self.errors += raised
+        self.total_ms += ms
+        self.progress_ms += progress_ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        i = min(bisect.bisect_left(self.EDGES_MS, ms), len(self.EDGES_MS) - 1)
+        self.hist[i] = self.hist.get(i, 0) + 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        self.progress_ms += other.progress_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        for i, n in other.hist.items():
+            self.hist[i] = self.hist.get(i, 0) + n
+        return self
+
+    def percentile(self, q):
+        """Upper edge (ms) of the bucket holding the *q*-th percentile (``0 < q <= 100``)."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * q / 100.0)
+        seen = 0
+        for i in sorted(self.hist):
+            seen += self.hist[i]
+            if seen >= rank:
+                return min(self.EDGES_MS[i], self.max_ms)
+        return self.max_ms
+
+    def to_json(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "progress_ms": round(self.progress_ms, 3),
+            "hist": {str(i): n for i, n in sorted(self.hist.items())},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        stats = cls()
+        stats.count = int(data.get("count", 0))
+        stats.errors = int(data.get("errors", 0))
+        stats.total_ms = float(data.get("total_ms", 0.0))
+        stats.max_ms = float(data.get("max_ms", 0.0))
+        stats.progress_ms = float(data.get("progress_ms", 0.0))
+        stats.hist = {int(i): int(n) for i, n in (data.get("hist") or {}).items()}
+        return stats
+
+
+class _TimedProgress:
+    """Wraps the context ``sb.progress`` returns so its block's time is charged to the slot
+    being dispatched. Only the outermost block of a slot counts — nested bars overlap it."""
+
+    def __init__(self, context, frame):
+        self._context = context
+        self._frame = frame  # [progress seconds, open blocks]
+        self._start = None
+
+    def __enter__(self):
+        if not self._frame[1]:
+            self._start = time.perf_counter()
+        self._frame[1] += 1
+        return self._context.__enter__()
+
+    def __exit__(self, *exc):
+        try:
+            return self._context.__exit__(*exc)
+        finally:
+            self._frame[1] -= 1
+            if self._start is not None:
+                self._frame[0] += time.perf_counter() - self._start
+
+    def __getattr__(self, attr):
+        return getattr(self._context, attr)
+
+
+class SlotTelemetry:
+    """Per-slot invocation timings for one host session.
+
+    Parameters:
+        host (str): ``"maya"`` / ``"blender"`` — names the aggregate file.
+        path (str): The aggregate file. Defaults to ``<cache>/telemetry/<host>.json``.
+        capacity (int): Records the ring holds before it is folded.
+    """
+
+    #: Environment switch: ``0`` / ``off`` / ``false`` disables :meth:`install`.
+    ENV = "TENTACLE_TELEMETRY"
+
+    #: Sessions kept in the aggregate file (oldest dropped first).
+    SESSIONS = 20
+
+    #: Rows :meth:`report` lists (slowest by total time first).
+    REPORT_LIMIT = 60
+
+    _active = None
+    _patch = None  # (original _invoke, original progress) while installed
+
+    def __init__(self, host, path=None, capacity=4096):
+        self.host = host
+        self.path = path or os.path.join(Tcl.cache_dir("telemetry"), f"{host}.json")
+        self.capacity = capacity
+        self.session = uuid.uuid4().hex
+        self.started = time.time()
+        self._ring = deque(maxlen=capacity)  # (key, seconds, progress seconds, raised)
+        self._stats = {}  # key -> _SlotStats, this session
+        self._labels = {}  # key -> widget text, captured on first sight
+        self._frames = []  # open dispatches, innermost last: [progress s, open blocks]
+        self._history_labels = {}  # labels of the last aggregate(), stored sessions included
+
+    # ------------------------------------------------------------------ install
+    @classmethod
+    def enabled(cls):
+        """False when ``TENTACLE_TELEMETRY`` is set to ``0`` / ``off`` / ``false``."""
+        return os.environ.get(cls.ENV, "1").strip().lower() not in ("0", "off", "false")
+
+    @classmethod
+    def active(cls):
+        """The installed session's telemetry, or None."""
+        return cls._active
+
+    @classmethod
+    def install(cls, host, **kwargs):
+        """Start recording every slot dispatch; idempotent. Returns the session (or None when
+        disabled by :attr:`ENV`, or when this uitk lacks the dispatch it patches).
+
+        Install before any other ``_invoke`` patch that restores by value (the Blender click
+        debugger does): it then wraps this one and hands it back when it is removed.
+        """
+        if not cls.enabled():
+            return None
+        if cls._active is not None:
+            return cls._active
+        try:
+            from uitk import SlotWrapper
+            from uitk.switchboard.dialogs import SwitchboardDialogsMixin
+
+            # Anchor to the true originals, peeling a patch a module reload left behind.
+            orig_invoke = getattr(
+                SlotWrapper._invoke, "_telemetry_orig", SlotWrapper._invoke
+            )
+            orig_progress = getattr(
+                SwitchboardDialogsMixin.progress,
+                "_telemetry_orig",
+                SwitchboardDialogsMixin.progress,
+            )
+        except (ImportError, AttributeError) as error:
+            logger.debug(f"[slot_telemetry] not installed: {error}")
+            return None
+
+        def timed_invoke(wrapper, *args, **kwargs):
+            telemetry = cls._active
+            if telemetry is None:
+                return orig_invoke(wrapper, *args, **kwargs)
+            frame = [0.0, 0]
+            telemetry._frames.append(frame)
+            raised = False
+            start = time.perf_counter()
+            try:
+                return orig_invoke(wrapper, *args, **kwargs)
+            except BaseException:
+                raised = True
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                telemetry._frames.pop()
+                telemetry.record(
+                    telemetry._slot_key(wrapper), elapsed, frame[0], raised
+                )
+
+        def timed_progress(sb, *args, **kwargs):
+            context = orig_progress(sb, *args, **kwargs)
+            telemetry = cls._active
+            if telemetry is None or not telemetry._frames:
+                return context
+            return _TimedProgress(context, telemetry._frames[-1])
+
+        timed_invoke._telemetry_orig = orig_invoke
+        timed_progress._telemetry_orig = orig_progress
+        SlotWrapper._invoke = timed_invoke
+        SwitchboardDialogsMixin.progress = timed_progress
+        cls._patch = (orig_invoke, orig_progress)
+
+        cls._active = cls(host, **kwargs)
+        atexit.register(cls._active.write)
+        return cls._active
+
+    @classmethod
+    def uninstall(cls, write=True):
+        """Restore the unpatched dispatch; writes the session first unless *write* is False."""
+        telemetry, cls._active = cls._active, None
+        if telemetry is not None:
+            atexit.unregister(telemetry.write)
+            if write:
+                telemetry.write()
+        if cls._patch is not None:
+            from uitk import SlotWrapper
+            from uitk.switchboard.dialogs import SwitchboardDialogsMixin
+
+            SlotWrapper._invoke, SwitchboardDialogsMixin.progress = cls._patch
+            cls._patch = None
+
+    # ------------------------------------------------------------------ recording
+    def _slot_key(self, wrapper):
+        """``<SlotClass>.<method>`` — a mixin's slot is counted per panel that dispatched it."""
+        slot = wrapper.slot
+        name = getattr(slot, "__name__", None) or repr(slot)
+        owner = getattr(slot, "__self__", None)
+        key = f"{type(owner).__name__}.{name}" if owner is not None else name
+        if key not in self._labels:
+            try:
+                text = wrapper.widget.text()
+            except Exception:
+                text = ""
+            self._labels[key] = text if isinstance(text, str) else ""
+        return key
+
+    def record(self, key, seconds, progress_seconds=0.0, raised=False):
+        """Append one invocation to the ring (folded once it is full)."""
+        self._ring.append((key, seconds, progress_seconds, raised))
+        if len(self._ring) >= self.capacity:
+            self.fold()
+
+    def fold(self):
+        """Drain the ring into this session's aggregates."""
+        ring, stats = self._ring, self._stats
+        while True:
+            try:
+                key, seconds, progress_seconds, raised = ring.popleft()
+            except IndexError:
+                return
+            entry = stats.get(key)
+            if entry is None:
+                entry = stats[key] = _SlotStats()
+            entry.add(seconds * 1000.0, progress_seconds * 1000.0, raised)
+
+    # ------------------------------------------------------------------ persistence
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        sessions = data.get("sessions") if isinstance(data, dict) else None
+        return [s for s in sessions or [] if isinstance(s, dict)]
+
+    def _session_json(self):
+        return {
+            "id": self.session,
+            "started": round(self.started, 3),
+            "ended": round(time.time(), 3),
+            "labels": {k: v for k, v in self._labels.items() if v},
+            "slots": {k: s.to_json() for k, s in self._stats.items()},
+        }
+
+    def write(self):
+        """Fold, then write this session into the host's aggregate file (replacing an earlier
+        write of the same session) and drop all but the last :attr:`SESSIONS`. Never raises —
+        it runs at interpreter exit."""
+        try:
+            self.fold()
+            if not self._stats:
+                return None
+            sessions = [s for s in self._load() if s.get("id") != self.session]
+            sessions = (sessions + [self._session_json()])[-self.SESSIONS :]
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "host": self.host, "sessions": sessions}, f)
+            os.replace(tmp, self.path)
+            return self.path
+        except Exception as error:
+            print(f"SlotTelemetry: could not write {self.path}: {error}")
+            return None
+
+    # ------------------------------------------------------------------ queries
+    def aggregate(self, history=True):
+        """``{key: _SlotStats}`` for this session, merged with the stored ones when *history*."""
+        self.fold()
+        merged = {}
+        labels = {}
+        sessions = (
+            [s for s in self._load() if s.get("id") != self.session] if history else []
+        )
+        for session in sessions:
+            labels.update(session.get("labels") or {})
+            for key, data in (session.get("slots") or {}).items():
+                merged.setdefault(key, _SlotStats()).merge(_SlotStats.from_json(data))
+        for key, stats in self._stats.items():
+            merged.setdefault(key, _SlotStats()).merge(stats)
+        labels.update(self._labels)
+        self._history_labels = labels
+        return merged
+
+    def rows(self, history=True):
+        """One dict per slot, slowest by total time first."""
+        merged = self.aggregate(history)
+        labels = self._history_labels
+        rows = [
+            {
+                "slot": key,
+                "label": labels.get(key, ""),
+                "count": s.count,
+                "errors": s.errors,
+                "mean_ms": s.total_ms / s.count if s.count else 0.0,
+                "p50_ms": s.percentile(50),
+                "p95_ms": s.percentile(95),
+                "p99_ms": s.percentile(99),
+                "max_ms": s.max_ms,
+                "total_ms": s.total_ms,
+                "progress_ms": s.progress_ms,
+            }
+            for key, s in merged.items()
+        ]
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def report(self, history=True):
+        """Monospace text table of :meth:`rows` (the Slot Timings viewer)."""
+        rows = self.rows(history)
+        shown, dropped = rows[: self.REPORT_LIMIT], rows[self.REPORT_LIMIT :]
+        lines = [
+            f"{sum(r['count'] for r in rows)} slot call(s) across {len(rows)} slot(s)"
+            + (" — this and the stored sessions" if history else " — this session"),
+            "",
+            f"{'SLOT':<28}{'CALLS':>7}{'ERR':>5}{'P50':>9}{'P95':>9}{'P99':>9}"
+            f"{'MAX':>9}{'TOTAL s':>9}{'PROG %':>8}  LABEL",
+            "-" * 112,
+        ]
+        for r in shown:
+            share = 100.0 * r["progress_ms"] / r["total_ms"] if r["total_ms"] else 0.0
+            lines.append(
+                f"{r['slot'][:27]:<28}{r['count']:>7}{r['errors']:>5}"
+                f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+                f"{r['max_ms']:>9.1f}{r['total_ms'] / 1000.0:>9.2f}{share:>8.0f}"
+                f"  {r['label']}"
+            )
+        if dropped:
+            lines.append(f"... {len(dropped)} more slot(s)")
+        lines += ["", "Times in ms (percentiles within 25%). Stored in:", self.path]
+        return "\n".join(lines)
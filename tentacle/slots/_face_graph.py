@@ -0,0 +1,234 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic face graph: face normals, edge adjacency and islands as arrays.
+
+Select Island and Select Edges By Angle walked the mesh one component at a time — a
+``polyInfo`` line parsed per face, an iterator step per edge, a Python union-find over
+face names — which on a million-face mesh takes minutes. Both only need two things in
+bulk: each face's normal and which faces share each edge.
+
+* :class:`FaceGraph` holds one mesh's polygon topology — corners, the edge each corner
+  starts, the faces of each edge — and answers in NumPy: face normals from a point
+  array (:meth:`FaceGraph.normals`), faces whose normal lies within a per-axis range of
+  any source normal (:meth:`FaceGraph.similar`), islands of a face subset
+  (:meth:`FaceGraph.islands`, labelled by :func:`connected_labels`), and the dihedral
+  angle of every edge (:meth:`FaceGraph.edge_angles`).
+* :class:`FaceGraphs` is one process-wide table per engine that keeps each mesh's
+  graph against a topology signature, so only a topology change rebuilds it; points
+  (and with them the normals) are read fresh on every query.
+
+Forks subclass :class:`FaceGraphs` with the hooks and hand out
+:meth:`FaceGraphs.instance`.
+"""
+import numpy as np
+
+from tentacle import RowCache
+
+
+def connected_labels(count, pairs):
+    """Component label of each of *count* elements linked by ``(n, 2)`` index *pairs*.
+
+    Array union-find after Shiloach–Vishkin: each round hooks the higher root of every
+    link that still spans two trees under the lower one, then jumps pointers
+    (``labels = labels[labels]``) until every tree is a star, so the rounds grow with
+    log n rather than with the longest path. An element's label is the lowest index
+    in its component.
+    """
+    labels = np.arange(count)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    a, b = pairs[:, 0], pairs[:, 1]
+    while True:
+        ra, rb = labels[a], labels[b]
+        split = ra != rb
+        if not split.any():
+            return labels
+        a, b, ra, rb = a[split], b[split], ra[split], rb[split]
+        np.minimum.at(labels, np.maximum(ra, rb), np.minimum(ra, rb))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+class FaceGraph:
+    """Polygon topology of one mesh as index arrays.
+
+    Parameters:
+        counts (array): Corners per face.
+        corners (array): Vertex index of each corner, face by face.
+        corner_edges (array): Engine edge index of the edge from each corner to the next.
+        edge_count (int, optional): Edges in the mesh (default: the highest index + 1).
+    """
+
+    #: Distinct source normals :meth:`similar` compares against every face directly;
+    #: past this, sorting the faces once is cheaper.
+    SORT_AFTER = 16
+
+    def __init__(self, counts, corners, corner_edges, edge_count=None):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.corners = np.asarray(corners, dtype=np.int64)
+        self.corner_edges = np.asarray(corner_edges, dtype=np.int64)
+        self.starts = np.cumsum(self.counts) - self.counts
+        self.corner_faces = np.repeat(np.arange(len(self.counts)), self.counts)
+        following = np.arange(1, len(self.corners) + 1)
+        following[np.cumsum(self.counts) - 1] = self.starts
+        #: Vertex index of the next corner round each corner's face.
+        self.next_corners = self.corners[following]
+        if edge_count is None:
+            edge_count = int(self.corner_edges.max()) + 1 if len(corner_edges) else 0
+        order = np.argsort(self.corner_edges, kind="stable")
+        edges, faces = self.corner_edges[order], self.corner_faces[order]
+        shared = edges[1:] == edges[:-1]
+        #: ``(n, 2)`` faces sharing an edge — chained, so n-gon fans stay connected.
+        self.face_pairs = np.column_stack((faces[:-1][shared], faces[1:][shared]))
+        #: ``(edge_count, 2)`` the two faces of each manifold edge; -1 for the others.
+        self.edge_faces = np.full((edge_count, 2), -1, dtype=np.int64)
+        per_edge = np.bincount(self.corner_edges, minlength=edge_count)
+        manifold = np.flatnonzero(per_edge == 2)
+        first = np.searchsorted(edges, manifold)
+        self.edge_faces[manifold] = np.column_stack((faces[first], faces[first + 1]))
+
+    @property
+    def face_count(self):
+        return len(self.counts)
+
+    def normals(self, points):
+        """Unit normal of each face from ``(n, 3)`` vertex *points* (Newell's method, so
+        an n-gon that is not quite planar still averages out); zero for a degenerate face.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        normals = np.zeros((self.face_count, 3))
+        if not len(self.corners):
+            return normals
+        here = [points[:, axis][self.corners] for axis in range(3)]
+        there = [points[:, axis][self.next_corners] for axis in range(3)]
+        for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+            terms = (here[j] - there[j]) * (here[k] + there[k])
+            normals[:, i] = np.add.reduceat(terms, self.starts)
+        length = np.sqrt(np.einsum("ij,ij->i", normals, normals))[:, None]
+        return np.divide(normals, length, out=np.zeros_like(normals), where=length > 0)
+
+    @staticmethod
+    def similar(normals, sources, ranges):
+        """Bool mask of the *normals* within ``(x, y, z)`` *ranges* of any of *sources*.
+
+        Per axis and inclusive, as ``mtk.Components.get_faces_with_similar_normals``
+        compares. Past :attr:`SORT_AFTER` distinct sources, the normals are sorted on
+        x once and each source tests only the slice inside its x range.
+        """
+        normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+        sources = np.unique(np.asarray(sources, dtype=np.float64).reshape(-1, 3), axis=0)
+        ranges = np.asarray(ranges, dtype=np.float64)
+        mask = np.zeros(len(normals), dtype=bool)
+        if len(sources) <= FaceGraph.SORT_AFTER:
+            x, y, z = normals.T
+            for sx, sy, sz in sources:
+                mask |= (
+                    (np.abs(x - sx) <= ranges[0])
+                    & (np.abs(y - sy) <= ranges[1])
+                    & (np.abs(z - sz) <= ranges[2])
+                )
+            return mask
+        order = np.argsort(normals[:, 0], kind="stable")
+        xs = normals[order, 0]
+        for source in sources:
+            lo = np.searchsorted(xs, source[0] - ranges[0], side="left")
+            hi = np.searchsorted(xs, source[0] + ranges[0], side="right")
+            rows = order[lo:hi]
+            near = np.all(np.abs(normals[rows, 1:] - source[1:]) <= ranges[1:], axis=1)
+            mask[rows[near]] = True
+        return mask
+
+    def islands(self, mask):
+        """Island label of each face in bool *mask* (faces joined by a shared edge), -1
+        for the faces outside it. A label is the lowest face index of its island.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        pairs = self.face_pairs
+        pairs = pairs[mask[pairs[:, 0]] & mask[pairs[:, 1]]]
+        labels = connected_labels(self.face_count, pairs)
+        labels[~mask] = -1
+        return labels
+
+    def similar_islands(self, normals, seeds, ranges, sources=None):
+        """Faces of the islands of similar-normal faces that hold a *seeds* face.
+
+        The similar set is every face within *ranges* of a *sources* normal (default:
+        the seeds' own), the seeds included; its islands that touch a seed are
+        returned, as sorted face indices.
+        """
+        seeds = np.asarray(seeds, dtype=np.int64)
+        if not len(seeds):
+            return np.empty(0, dtype=np.int64)
+        sources = normals[seeds] if sources is None else sources
+        mask = self.similar(normals, sources, ranges)
+        mask[seeds] = True
+        labels = self.islands(mask)
+        return np.flatnonzero(np.isin(labels, labels[seeds]) & mask)
+
+    def edge_angles(self, normals):
+        """Angle in degrees between the two face normals of each edge; NaN for an edge
+        without exactly two faces.
+        """
+        angles = np.full(len(self.edge_faces), np.nan)
+        manifold = self.edge_faces[:, 0] >= 0
+        a = normals[self.edge_faces[manifold, 0]]
+        b = normals[self.edge_faces[manifold, 1]]
+        cross = np.hypot(
+            np.hypot(
+                a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+                a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+            ),
+            a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0],
+        )
+        angles[manifold] = np.degrees(np.arctan2(cross, np.einsum("ij,ij->i", a, b)))
+        return angles
+
+
+class FaceGraphs(RowCache):
+    """Per-mesh :class:`FaceGraph` keyed on a topology signature.
+
+    Subclasses provide :meth:`_signature`, :meth:`_topology` and :meth:`_points`;
+    :meth:`_key` when the engine's mesh handles are not hashable or not stable.
+    """
+
+    #: Graphs kept before the table is dropped wholesale — each holds a few arrays the
+    #: size of the mesh, so far fewer than the per-mesh rows of ``SceneStats``.
+    MAX_ROWS = 64
+
+    def __init__(self):
+        super().__init__()
+        self.built = 0  # graphs built so far — for tests and the bench
+
+    # ------------------------------------------------------------------ hooks
+    def _signature(self, mesh):
+        """Hashable topology token of *mesh* — must be cheap (element counts, an id)."""
+        raise NotImplementedError
+
+    def _signatures(self, meshes):
+        """One :meth:`_signature` per mesh — graphs are built one mesh at a time."""
+        return [self._signature(mesh) for mesh in meshes]
+
+    def _topology(self, mesh):
+        """``(counts, corners, corner_edges, edge_count)`` of *mesh* — see :class:`FaceGraph`.
+        """
+        raise NotImplementedError
+
+    def _points(self, mesh, world):
+        """``(n, 3)`` vertex positions of *mesh*, in world space when *world*."""
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------ queries
+    def graph(self, mesh):
+        """The :class:`FaceGraph` of *mesh*, built when its topology signature moved."""
+        (key,), stale = self._refresh(
+            [mesh], lambda ms: [FaceGraph(*self._topology(m)) for m in ms]
+        )
+        self.built += len(stale)
+        return self._value(key)
+
+    def normals(self, mesh, world=False):
+        """``(graph, face normals)`` of *mesh* — the points are always read fresh."""
+        graph = self.graph(mesh)
+        return graph, graph.normals(self._points(mesh, world))
@@ -0,0 +1,213 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic behavior for the ``hud`` startmenu.
+
+The HUD is a readout rebuilt every time ``hudTextEdit`` is shown, and most of what it
+reads is expensive on a dense scene: Maya's ``polyEvaluate`` face/tri/UV counts and the
+``polyNormalPerVertex`` query over ``vtxFace[*][*]``, Blender's ``update_from_editmode``
+and per-object ``foreach_get``. None of it changes between two shows unless the scene
+did, so the HUD is a small **section cache** here:
+
+* each readout block (``"status"``, ``"selection"``, ``"components"``) is built ONCE into
+  a list of HTML lines and replayed from the cache on every later show;
+* a section is dropped only when one of the engine events the fork maps to it in
+  :attr:`HudMixin.HUD_SECTION_EVENTS` fires — subscribed through the same
+  ``ScriptJobManager`` the scene footer uses (``SceneMixin._create_footer_controller``);
+* the sections an edit can change without a selection event (the counts) are also
+  dropped when the fork's edit key moves — its cheap :meth:`HudMixin._hud_edit_key`
+  plus a counter bumped by the :attr:`HudMixin.HUD_EDIT_EVENTS`. Maya has no scriptJob
+  event for "a selected mesh's topology changed"; an undoable edit moves the head of
+  its undo queue, and the counter catches the edits that leave the head as it was
+  (two identical moves, or undo disabled).
+
+Lines that are O(1) and change on their own schedule — the warning details, the
+release notice, the previous command — are never cached: caching them would only add
+an invalidation path that can go stale.
+
+A section whose event could not be subscribed (an engine that does not know the event
+name) is built live on every show rather than cached forever: a slow HUD is a
+performance bug, a HUD reporting the last scene's units is a correctness one.
+"""
+
+
+class _HudLines:
+    """``insertText`` recorder — stands in for the HUD while a section is built.
+
+    The ``insert_*`` readers write through ``hud.insertText``; handing them this instead
+    captures the section as plain HTML lines without changing a single reader.
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def insertText(self, text):
+        self.lines.append(text)
+
+
+class HudMixin:
+    """Shared ``hud`` startmenu behavior. Mixed in ahead of the DCC Slots base.
+
+    Forks provide ``_script_job_manager()``, ``HUD_SECTION_EVENTS`` and
+    ``construct_hud`` (which renders through :meth:`hud_section`), and call
+    :meth:`_subscribe_hud_invalidation` from ``__init__`` once ``self.ui`` is bound.
+    """
+
+    #: ``{section: (engine event, ...)}`` — the events that make a cached section stale.
+    #: Fork-set; a section absent here is never cached.
+    HUD_SECTION_EVENTS = {}
+
+    #: Sections that also depend on scene *edits*, dropped whenever
+    #: :meth:`_hud_edit_key` changes between two renders.
+    HUD_EDIT_SECTIONS = ("selection", "components")
+
+    #: Engine events that count as an edit — each bumps the counter that is part of
+    #: the edit key. Fork-set.
+    HUD_EDIT_EVENTS = ()
+
+    #: Delay between ``hudTextEdit.shown`` and the full build (ms). Rendering cached
+    #: sections is cheap, but a HUD flicked open and shut should still cost nothing.
+    HUD_BUILD_DELAY = 500
+
+    _hud_request_token: int = 0
+    _hud_last_edit_key = None
+    _hud_edits: int = 0  # HUD_EDIT_EVENTS fired so far, monotonic
+
+    #: ``{section: [html, ...]}`` and the sections never cached (their event could
+    #: not be subscribed). Bound per instance by :meth:`_subscribe_hud_invalidation`;
+    #: the class-level ``None`` means "not wired", which caches nothing.
+    _hud_cache = None
+    _hud_live_sections = None
+
+    # ------------------------------------------------------------------ hooks
+    def _script_job_manager(self):
+        """Return the DCC engine's ``ScriptJobManager`` class (``mtk``/``btk``)."""
+        raise NotImplementedError
+
+    def _hud_edit_key(self):
+        """A cheap token that changes when the scene is edited, or ``None`` if the
+        fork's events already cover edits (Blender's ``DepsgraphUpdated``)."""
+        return None
+
+    def construct_hud(self) -> None:
+        raise NotImplementedError
+
+    # ------------------------------------------------------------ section cache
+    def invalidate_hud(self, *sections) -> None:
+        """Drop *sections* from the cache (all of them when called bare)."""
+        if self._hud_cache is None:
+            return
+        if not sections:
+            self._hud_cache.clear()
+            return
+        for section in sections:
+            self._hud_cache.pop(section, None)
+
+    def hud_section(self, hud, section: str, build) -> None:
+        """Render *section* into *hud*, building it only when it is not cached.
+
+        Parameters:
+            hud: The text widget (anything with ``insertText``).
+            section (str): Cache key — a :attr:`HUD_SECTION_EVENTS` entry.
+            build (callable): ``build(lines)`` writes the section through
+                ``lines.insertText``, exactly as it would write to the HUD.
+        """
+        cache = self._hud_cache
+        lines = None if cache is None else cache.get(section)
+        if lines is None:
+            recorder = _HudLines()
+            build(recorder)
+            lines = recorder.lines
+            if (
+                cache is not None
+                and section in self.HUD_SECTION_EVENTS
+                and section not in self._hud_live_sections
+            ):
+                cache[section] = lines
+        for line in lines:
+            hud.insertText(line)
+
+    def _check_hud_edit_key(self) -> None:
+        """Drop the edit-sensitive sections when :meth:`_hud_edit_key` moved."""
+        try:
+            key = (self._hud_edits, self._hud_edit_key())
+        except Exception:  # a failed probe must not keep a stale count alive
+            key = object()
+        if key != self._hud_last_edit_key:
+            self.invalidate_hud(*self.HUD_EDIT_SECTIONS)
+        self._hud_last_edit_key = key
+
+    def _subscribe_hud_invalidation(self) -> None:
+        """Subscribe each :attr:`HUD_SECTION_EVENTS` event to drop its sections, and
+        each :attr:`HUD_EDIT_EVENTS` event to bump the edit counter.
+
+        One subscription per event (not per section), owned by ``hudTextEdit`` so the
+        engine tears them down with the widget. An event the engine rejects leaves its
+        sections live — rebuilt on every show — instead of cached with nothing to clear
+        them (for an edit event, the :attr:`HUD_EDIT_SECTIONS`).
+        """
+        self._hud_cache = {}
+        self._hud_live_sections = set()
+        hud = self.ui.hudTextEdit
+        by_event = {}
+        for section, events in self.HUD_SECTION_EVENTS.items():
+            for event in events:
+                by_event.setdefault(event, []).append(section)
+
+        mgr = self._script_job_manager().instance()
+        for event, sections in by_event.items():
+            try:
+                mgr.subscribe(
+                    event,
+                    lambda s=tuple(sections): self.invalidate_hud(*s),
+                    owner=hud,
+                )
+            except Exception as error:  # noqa: BLE001 - an unknown event is not fatal
+                self.sb.logger.debug(f"[hud] {event!r} not subscribed: {error}")
+                self._hud_live_sections.update(sections)
+        for event in self.HUD_EDIT_EVENTS:
+            try:
+                mgr.subscribe(event, self._count_hud_edit, owner=hud)
+            except Exception as error:  # noqa: BLE001 - an unknown event is not fatal
+                self.sb.logger.debug(f"[hud] {event!r} not subscribed: {error}")
+                self._hud_live_sections.update(self.HUD_EDIT_SECTIONS)
+        mgr.connect_cleanup(hud, owner=hud)
+
+    def _count_hud_edit(self, *_) -> None:
+        self._hud_edits += 1
+
+    # ------------------------------------------------------------------ build
+    def request_hud_build(self) -> None:
+        """Start a new HUD build request, only the latest token will be used."""
+        self._hud_request_token += 1
+        my_token = self._hud_request_token
+
+        # Lightweight pre-build phase: evaluate opted-in warnings synchronously
+        # and surface their icons immediately so the user gets feedback even if
+        # they dismiss the HUD before the delayed full build runs.
+        self._active_warnings = self.evaluate_warnings()
+        self.insert_warning_icons(self.ui.hudTextEdit, self._active_warnings)
+
+        self.sb.QtCore.QTimer.singleShot(
+            self.HUD_BUILD_DELAY, lambda: self._delayed_hud_build(my_token)
+        )
+
+    def _delayed_hud_build(self, token: int) -> None:
+        if token != self._hud_request_token:
+            return  # Outdated request, ignore.
+        if not (self.ui.isVisible() and self.ui.hudTextEdit.isVisible()):
+            return
+        self._check_hud_edit_key()
+        self.construct_hud()
+
+    def insert_prev_command(self, hud) -> None:
+        """The last command run from tentacle — read live, it is one attribute."""
+        method = self.sb.prev_slot
+        if method:
+            hud.insertText(
+                'Prev Command: <font style="color: Yellow;">{}'.format(method.__doc__)
+            )
+
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -0,0 +1,447 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Copied animation keys as NumPy columns — the Animation panels' Copy / Paste Keys clipboard.
+
+Engine-agnostic: it imports neither ``maya`` nor ``bpy``. Each engine's ``copy_keys``
+answers with nested Python containers (mayatk: ``{object: {attr: [key dict, ...]}}``;
+blendertk: ``{"keys": {(data_path, index): [(frame, value), ...]}, "tangents": ...}``),
+which the Animation slots used to keep as their clipboard: a dict per key, walked again
+to count them, gone with the slot instance. A mocap clip of a few hundred thousand keys
+made that the heaviest thing the panel held.
+
+:class:`KeyClipboard` holds the same keys as columns instead:
+
+* ``keys`` — one structured array (:data:`KEY_DTYPE`) of every key, grouped by curve;
+  ``starts[i]:starts[i + 1]`` slices curve *i*. Tangent data lives in the same row (see
+  :data:`KEY_DTYPE` for what each column means per engine); tangent / interpolation
+  names are indices into a small string table.
+* ``curves`` — one dict per curve: its address (``object``, ``attr``, ``index``),
+  whether it is a value-only snapshot (``scalar``), what tangent data it carries, and
+  its infinity / extrapolation.
+
+:meth:`KeyClipboard.persist` writes the clipboard to ``<cache>/keys/<host>/`` (the keys
+as a raw ``.npy``, the rest as JSON) and hands back a copy whose ``keys`` are
+memory-mapped from that file, so a large clip is paged in as a paste reads it rather
+than held; the next session's Paste Keys finds it there. Paste streams it back to the
+engine in chunks of at most :attr:`KeyClipboard.CHUNK_KEYS` keys
+(:meth:`KeyClipboard.maya_chunks` / :meth:`KeyClipboard.blender_chunks`), each rebuilt in
+the engine's own buffer shape, so ``paste_keys`` stays the one paste path and the
+engine-side dict never exists for more than one chunk.
+
+The format is shared; a store is per host, because a curve's address is not portable
+(a Maya plug is not a Blender data path).
+"""
+import json
+import os
+import uuid
+
+import numpy as np
+
+#: One row per key. ``in_a``/``in_b``/``out_a``/``out_b``: Maya's in/out tangent angle and
+#: weight; Blender's left/right handle offset from the key (x, y). ``in_type``/``out_type``:
+#: Maya's in/out tangent type; Blender's left/right handle type. ``interp``/``easing``:
+#: Blender's interpolation and easing. ``lock``: Maya's tangent lock (False = broken).
+#: String columns index :attr:`KeyClipboard.names`; 0 is "not captured".
+KEY_DTYPE = np.dtype(
+    [
+        ("time", "f8"),
+        ("value", "f8"),
+        ("in_a", "f8"),
+        ("in_b", "f8"),
+        ("out_a", "f8"),
+        ("out_b", "f8"),
+        ("in_type", "u2"),
+        ("out_type", "u2"),
+        ("interp", "u2"),
+        ("easing", "u2"),
+        ("lock", "?"),
+    ]
+)
+
+#: Maya key-dict tangent fields, in column order (``in_a`` .. ``out_b``).
+_MAYA_FLOATS = ("inAngle", "inWeight", "outAngle", "outWeight")
+#: Blender tangent-dict field -> column.
+_BLENDER_NAMES = (
+    ("handle_left_type", "in_type"),
+    ("handle_right_type", "out_type"),
+    ("interpolation", "interp"),
+    ("easing", "easing"),
+)
+
+
+class _Builder:
+    """Accumulates rows column by column, then packs them once."""
+
+    def __init__(self):
+        self.curves, self.names = [], [""]
+        self._index = {"": 0}
+        self.columns = {name: [] for name in KEY_DTYPE.names}
+        self.starts = [0]
+
+    def name(self, text):
+        if not text:
+            return 0
+        i = self._index.get(text)
+        if i is None:
+            i = self._index[text] = len(self.names)
+            self.names.append(text)
+        return i
+
+    def curve(self, rows, **curve):
+        if not rows:
+            return
+        for column, values in zip(KEY_DTYPE.names, zip(*rows)):
+            self.columns[column].extend(values)
+        self.curves.append(curve)
+        self.starts.append(self.starts[-1] + len(rows))
+
+    def build(self, host, mode, frame):
+        keys = np.zeros(self.starts[-1], dtype=KEY_DTYPE)
+        for column, values in self.columns.items():
+            keys[column] = values
+        return KeyClipboard(host, mode, self.curves, keys, self.starts, self.names, frame)
+
+
+class KeyClipboard:
+    """Copied keys for one host, as columns (see module).
+
+    Parameters:
+        host (str): ``"maya"`` / ``"blender"`` — whose addresses the curves hold.
+        mode (str): The copy mode the keys came from (the engine's vocabulary).
+        curves (list): One dict per curve (see module).
+        keys (numpy.ndarray): :data:`KEY_DTYPE` rows, grouped by curve.
+        starts (numpy.ndarray): ``len(curves) + 1`` offsets into *keys*.
+        names (list): The string table the name columns index.
+        frame (float): The frame the copy was made at.
+    """
+
+    FORMAT = 1
+
+    #: Most keys one paste call receives.
+    CHUNK_KEYS = 20000
+
+    def __init__(self, host, mode, curves, keys, starts, names, frame=None):
+        self.host = host
+        self.mode = mode
+        self.curves = curves
+        self.keys = keys
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.names = names
+        self.frame = frame
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __bool__(self):
+        return bool(self.curves)
+
+    def __repr__(self):
+        return (
+            f"<KeyClipboard {self.host}/{self.mode}: {len(self)} key(s), "
+            f"{len(self.curves)} curve(s)>"
+        )
+
+    def objects(self):
+        """Source objects, in copy order."""
+        return list(dict.fromkeys(c["object"] for c in self.curves))
+
+    def matching(self, targets):
+        """The *targets* a by-name paste finds data for (short names compared)."""
+        sources = {o.split("|")[-1] for o in self.objects()}
+        return [t for t in targets if str(t).split("|")[-1] in sources]
+
+    # ------------------------------------------------------------------ build
+    @classmethod
+    def from_maya(cls, data, mode="auto", frame=None):
+        """Columns from ``mtk.AnimUtils.copy_keys``'s ``{object: {attr: data}}``.
+
+        *data* per attribute is a float (a value-only snapshot, keyed at the paste
+        frame), a list of key dicts, or the ``tangent_detail`` envelope
+        ``{"keys": [...], "preInfinity": ..., "postInfinity": ...}``.
+        """
+        b = _Builder()
+        for obj, attrs in (data or {}).items():
+            for attr, value in attrs.items():
+                curve = dict(object=obj, attr=attr, index=-1, scalar=False)
+                if isinstance(value, dict) and "keys" in value:
+                    curve["pre"] = value.get("preInfinity", "constant")
+                    curve["post"] = value.get("postInfinity", "constant")
+                    value = value["keys"]
+                if not isinstance(value, list):
+                    curve["scalar"] = True
+                    b.curve([(frame or 0.0, float(value), 0, 0, 0, 0, 0, 0, 0, 0, False)], **curve)
+                    continue
+                detail = bool(value) and "inAngle" in value[0]
+                curve["detail"] = detail
+                curve["lock"] = bool(value) and "lock" in value[0]
+                rows = []
+                for key in value:
+                    floats = [key.get(k, 0.0) if detail else 0.0 for k in _MAYA_FLOATS]
+                    rows.append(
+                        (
+                            key["time"],
+                            key["value"],
+                            *floats,
+                            b.name(key.get("inTangentType")),
+                            b.name(key.get("outTangentType")),
+                            0,
+                            0,
+                            bool(key.get("lock", True)),
+                        )
+                    )
+                b.curve(rows, **curve)
+        return b.build("maya", mode, frame)
+
+    @classmethod
+    def from_blender(cls, buffer, source=""):
+        """Columns from a ``btk.copy_keys`` dict buffer (``"current_frame"`` / ``"selected"``).
+
+        An ``"action"``-mode buffer is a datablock, not keys, and is not accepted here.
+        """
+        b = _Builder()
+        mode = buffer["mode"]
+        frame = buffer.get("frame")
+        if mode == "current_frame":
+            for (path, index), value in buffer["values"].items():
+                b.curve(
+                    [(frame or 0.0, float(value), 0, 0, 0, 0, 0, 0, 0, 0, True)],
+                    object=source, attr=path, index=index, scalar=True,
+                )
+        elif mode == "selected":
+            tangents = buffer.get("tangents") or {}
+            extrapolation = buffer.get("extrapolation") or {}
+            for (path, index), points in buffer["keys"].items():
+                details = tangents.get((path, index)) or []
+                rows = []
+                for i, (x, y) in enumerate(points):
+                    t = details[i] if i < len(details) else {}
+                    left = t.get("handle_left", (0.0, 0.0))
+                    right = t.get("handle_right", (0.0, 0.0))
+                    rows.append(
+                        (x, y, *left, *right, *(b.name(t.get(k)) for k, _c in _BLENDER_NAMES), True)
+                    )
+                b.curve(
+                    rows,
+                    object=source,
+                    attr=path,
+                    index=index,
+                    scalar=False,
+                    detail=bool(details),
+                    extrapolation=extrapolation.get((path, index)),
+                )
+        else:
+            raise ValueError(f"Unsupported copy buffer mode: {mode!r}")
+        return b.build("blender", mode, frame)
+
+    # ------------------------------------------------------------------ chunks
+    def _pieces(self, chunk_keys):
+        """Yield lists of ``(curve, lo, hi)`` pieces, at most *chunk_keys* keys a list.
+
+        Whole curves are batched together; a curve longer than *chunk_keys* is split,
+        and each of its pieces is a list of its own (a piece not starting the curve
+        needs its own paste anchor).
+        """
+        chunk_keys = max(1, int(chunk_keys or self.CHUNK_KEYS))
+        batch, size = [], 0
+        for i in range(len(self.curves)):
+            lo, hi = int(self.starts[i]), int(self.starts[i + 1])
+            if hi - lo > chunk_keys:
+                if batch:
+                    yield batch
+                    batch, size = [], 0
+                for start in range(lo, hi, chunk_keys):
+                    yield [(i, start, min(start + chunk_keys, hi))]
+                continue
+            if size + hi - lo > chunk_keys and batch:
+                yield batch
+                batch, size = [], 0
+            batch.append((i, lo, hi))
+            size += hi - lo
+        if batch:
+            yield batch
+
+    def chunk_count(self, chunk_keys=None):
+        return sum(1 for _ in self._pieces(chunk_keys))
+
+    def maya_chunks(self, target_time, chunk_keys=None):
+        """Yield ``(copied_data, target_time)`` for ``mtk.AnimUtils.paste_keys``, chunk by chunk.
+
+        *target_time* is where each curve's first key lands, as ``paste_keys`` anchors
+        it; a split curve's later pieces are anchored by their offset into the curve, so
+        the pasted result matches one unchunked call.
+        """
+        for pieces in self._pieces(chunk_keys):
+            anchor = target_time
+            data = {}
+            for i, lo, hi in pieces:
+                curve = self.curves[i]
+                rows = self.keys[lo:hi]
+                if curve["scalar"]:
+                    value = float(rows["value"][0])
+                else:
+                    first = int(self.starts[i])
+                    if lo > first and target_time is not None:
+                        anchor = target_time + float(rows["time"][0] - self.keys["time"][first])
+                    value = self._maya_keys(curve, rows)
+                    if "pre" in curve:
+                        value = {
+                            "keys": value,
+                            "preInfinity": curve["pre"],
+                            "postInfinity": curve["post"],
+                        }
+                data.setdefault(curve["object"], {})[curve["attr"]] = value
+            yield data, anchor
+
+    def _maya_keys(self, curve, rows):
+        keys = []
+        for row in rows.tolist():  # one C-level conversion, then plain tuples
+            time, value, in_a, in_b, out_a, out_b, in_type, out_type, _i, _e, lock = row
+            key = {"time": time, "value": value}
+            if in_type:
+                key["inTangentType"] = self.names[in_type]
+            if out_type:
+                key["outTangentType"] = self.names[out_type]
+            if curve.get("detail"):
+                key.update(inAngle=in_a, inWeight=in_b, outAngle=out_a, outWeight=out_b)
+            if curve.get("lock"):
+                key["lock"] = lock
+            keys.append(key)
+        return keys
+
+    def blender_chunks(self, target_time, chunk_keys=None):
+        """Yield ``(buffer, target_time)`` for ``btk.paste_keys``, chunk by chunk.
+
+        ``btk.paste_keys`` lands the buffer's EARLIEST key on *target_time*; each chunk's
+        anchor keeps that chunk's offset from the clipboard's earliest key, so the
+        pasted result matches one unchunked call. ``None`` pastes at the copied frames.
+        """
+        earliest = float(self.keys["time"].min()) if len(self) else 0.0
+        for pieces in self._pieces(chunk_keys):
+            if self.mode == "current_frame":
+                values = {
+                    (self.curves[i]["attr"], self.curves[i]["index"]): float(
+                        self.keys["value"][lo]
+                    )
+                    for i, lo, _hi in pieces
+                }
+                yield {"mode": "current_frame", "frame": self.frame, "values": values}, target_time
+                continue
+            buffer = {"mode": "selected", "keys": {}, "tangents": {}, "extrapolation": {}}
+            first = None
+            for i, lo, hi in pieces:
+                curve = self.curves[i]
+                path = (curve["attr"], curve["index"])
+                rows = self.keys[lo:hi]
+                times = rows["time"]
+                first = float(times.min()) if first is None else min(first, float(times.min()))
+                buffer["keys"][path] = list(zip(times.tolist(), rows["value"].tolist()))
+                if curve.get("detail"):
+                    buffer["tangents"][path] = [self._blender_tangent(r) for r in rows.tolist()]
+                if curve.get("extrapolation"):
+                    buffer["extrapolation"][path] = curve["extrapolation"]
+            anchor = None if target_time is None else target_time + (first - earliest)
+            yield buffer, anchor
+
+    def _blender_tangent(self, row):
+        tangent = {"handle_left": (row[2], row[3]), "handle_right": (row[4], row[5])}
+        for j, (field, _column) in enumerate(_BLENDER_NAMES):
+            tangent[field] = self.names[row[6 + j]]
+        return tangent
+
+    # ------------------------------------------------------------------ persistence
+    @staticmethod
+    def directory(host):
+        """The host's store: ``<cache>/keys/<host>``."""
+        from tentacle import Tcl
+
+        return Tcl.cache_dir("keys", host)
+
+    def save(self, directory):
+        """Write the clipboard to *directory* (keys ``.npy`` + ``clipboard.json``).
+
+        The keys file is named per save and the JSON, replaced last, names it — a
+        reader never pairs one save's table with another's keys, and a keys file still
+        mapped by a previous load (which Windows will not replace) is left alone.
+        Stale keys files are removed best-effort.
+        """
+        keys_name = f"keys-{uuid.uuid4().hex}.npy"
+        with open(os.path.join(directory, keys_name), "wb") as f:
+            np.save(f, np.ascontiguousarray(self.keys))
+        meta = {
+            "format": self.FORMAT,
+            "host": self.host,
+            "mode": self.mode,
+            "frame": self.frame,
+            "keys": keys_name,
+            "count": len(self),
+            "starts": self.starts.tolist(),
+            "curves": self.curves,
+            "names": self.names,
+        }
+        path = os.path.join(directory, "clipboard.json")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, path)
+        for name in os.listdir(directory):
+            if name.startswith("keys-") and name != keys_name:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+        return path
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """The clipboard saved in *directory*, or None (nothing saved, or unreadable).
+
+        Parameters:
+            mmap (bool): Map the keys from disk (read-only) instead of reading them in.
+        """
+        try:
+            with open(os.path.join(directory, "clipboard.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("format") != cls.FORMAT:
+                return None
+            keys = np.load(
+                os.path.join(directory, meta["keys"]),
+                mmap_mode="r" if mmap and meta["count"] else None,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if keys.dtype != KEY_DTYPE or len(keys) != meta["count"]:
+            return None
+        return cls(
+            meta["host"],
+            meta["mode"],
+            meta["curves"],
+            keys,
+            meta["starts"],
+            meta["names"],
+            meta.get("frame"),
+        )
+
+    def persist(self, host=None):
+        """Save to the host's store and return the memory-mapped copy (see module).
+
+        Returns this clipboard, unsaved, when the store cannot be written.
+        """
+        directory = self.directory(host or self.host)
+        try:
+            self.save(directory)
+        except OSError:
+            return self
+        return self.load(directory) or self
+
+    @classmethod
+    def restore(cls, host):
+        """The host's last persisted clipboard, or None."""
+        return cls.load(cls.directory(host))
+
+    @classmethod
+    def discard(cls, host):
+        """Forget the host's persisted clipboard (a copy it cannot hold superseded it)."""
+        try:
+            os.remove(os.path.join(cls.directory(host), "clipboard.json"))
+        except OSError:
+            pass
@@ -48,20 +48,160 @@ when none are, adds the found material to the combo and adopts it — the list n
 carrying a material assigned to the selection is the list's limitation, not a
 reason for "Get Material" to fail.
 
+And the **material index** every list surface reads (:meth:`material_index` /
+:meth:`indexed_materials`): one scan of the scene's materials — names, default and Arnold
+flags — plus each material's swatch icon, built on first use and replayed until the
+scene's material SET changes. ``cmb002`` refreshes on every show and every popup, and
+each Assign list on every show; with 1,500+ materials, rescanning (and re-rendering a
+swatch per material) on each of those made opening the panel take seconds. The forks
+say what invalidates it: engine events in :attr:`MATERIAL_INDEX_EVENTS` (Maya adds
+node added / removed / renamed callbacks) and an optional :meth:`_material_index_key`
+read on every lookup (Blender's datablock names — a rename or add anywhere changes it).
+:meth:`_refresh_material_lists` drops it too, so a slot that changed the set never
+reads its own stale index. A swatch shows the material's color as of the index build — a
+color edit alone fires none of those events. Assignment is deliberately NOT indexed: assigning fires
+none of those events, so a cached "assigned" flag would lie until the next one.
+
 Hooks each ``<Panel>Slots`` fork must supply: ``_rename_current(text)``,
-``select_by_mat(...)``, ``_selection_mats()``. Optional:
-``_list_filter_names()`` (defaults to no filters).
+``select_by_mat(...)``, ``_selection_mats()``, ``_script_job_manager()``,
+``_build_material_index()``, ``_material_swatch_icon(name)``. Optional:
+``_list_filter_names()`` (defaults to no filters), ``_material_index_key()``.
 """
 import pythontk as ptk
 
 
+class _IndexedMaterial:
+    """One row of the material index: a material's name and the flags lists filter on.
+
+    ``short`` / ``leaf`` are the name without namespace / without DAG path — equal to
+    ``name`` where the DCC has neither (Blender). ``icon`` is the swatch, rendered on
+    first use and kept with the row.
+    """
+
+    __slots__ = ("name", "short", "leaf", "default", "arnold", "icon")
+
+    def __init__(self, name, short=None, leaf=None, default=False, arnold=False):
+        self.name = name
+        self.short = short or name
+        self.leaf = leaf or name
+        self.default = default
+        self.arnold = arnold
+        self.icon = None
+
+    def __repr__(self):
+        return f"_IndexedMaterial({self.name!r})"
+
+
 class MaterialsMixin:
     """DCC-agnostic ``materials`` slot behavior.
 
-    The submenu's ``b003`` "Get + Select" one-shot, and the shared
-    adopt-the-selection's-material path behind ``b003`` / ``b002``.
+    The submenu's ``b003`` "Get + Select" one-shot, the shared
+    adopt-the-selection's-material path behind ``b003`` / ``b002``, and the
+    scene-change-invalidated material index the list surfaces read.
     """
 
+    #: Engine events after which the scene's material set may differ. Fork-set.
+    MATERIAL_INDEX_EVENTS = ()
+
+    _material_index = None
+    _material_index_key_value = None
+    #: False until :meth:`_subscribe_material_index` ran: until something can
+    #: invalidate the index, every lookup rescans rather than caching forever.
+    _material_index_live = False
+
+    # ------------------------------------------------------------------ index
+    def _build_material_index(self):
+        """Scan the scene, sorted by short name (DCC hook).
+
+        Returns:
+            list: One ``{"name", "short", "leaf", "default", "arnold"}`` dict per
+                material (all but ``name`` optional — see :class:`_IndexedMaterial`).
+        """
+        raise NotImplementedError
+
+    def _material_swatch_icon(self, name):
+        """Swatch ``QIcon`` for the material *name*, or None (DCC hook)."""
+        raise NotImplementedError
+
+    def _material_index_key(self):
+        """A cheap value that changes whenever the material set does, or None.
+
+        Read on every lookup, for a DCC whose events can't say so (Blender). Default:
+        None — the events alone keep the index honest.
+        """
+        return None
+
+    def _subscribe_material_index(self, widget):
+        """Subscribe :attr:`MATERIAL_INDEX_EVENTS` to drop the index, owned by *widget*.
+
+        Called once, from ``cmb002``'s first init (the Assign lists force that init,
+        so every surface is covered). An event the engine rejects is logged and
+        skipped — the remaining events, and :meth:`_refresh_material_lists`, still
+        invalidate.
+        """
+        mgr = self._script_job_manager().instance()
+        for event in self.MATERIAL_INDEX_EVENTS:
+            try:
+                mgr.subscribe(event, self.invalidate_material_index, owner=widget)
+            except Exception as error:
+                self.sb.logger.debug(f"[materials] {event!r} not subscribed: {error}")
+        mgr.connect_cleanup(widget, owner=widget)
+        self._material_index_live = True
+        return mgr
+
+    def invalidate_material_index(self, *_):
+        """Drop the material index; the next lookup rescans. Safe as any callback."""
+        self._material_index = None
+
+    def material_index(self):
+        """``[_IndexedMaterial, ...]`` for every scene material — cached (see module)."""
+        key = self._material_index_key()
+        if self._material_index is None or key != self._material_index_key_value:
+            index = [_IndexedMaterial(**row) for row in self._build_material_index()]
+            if not self._material_index_live:
+                return index
+            self._material_index = index
+            self._material_index_key_value = key
+        return self._material_index
+
+    def indexed_materials(self, exclude_defaults=False, exclude_arnold=False, exc=None):
+        """``{display_name: name}`` over the index, sorted — the lists' one query.
+
+        The display name is the short name, except where several listed materials
+        share one (across namespaces): every member of such a group is keyed on its
+        namespace-qualified leaf instead, so none is dropped (the engine's own
+        ``as_dict`` rule, applied to the filtered set).
+
+        Parameters:
+            exclude_defaults (bool): Drop the DCC's built-in default materials.
+            exclude_arnold (bool): Drop Arnold shaders.
+            exc (str/list): Short-name patterns to drop (``ptk.filter_list``).
+        """
+        rows = [
+            row
+            for row in self.material_index()
+            if not (exclude_defaults and row.default)
+            and not (exclude_arnold and row.arnold)
+        ]
+        if exc:
+            rows = ptk.filter_list(rows, exc=exc, map_func=lambda row: row.short)
+        counts = {}
+        for row in rows:
+            counts[row.short] = counts.get(row.short, 0) + 1
+        return {
+            (row.short if counts[row.short] == 1 else row.leaf): row.name
+            for row in rows
+        }
+
+    def material_swatch(self, name):
+        """The indexed swatch icon for *name* — rendered once per index build."""
+        for row in self.material_index():
+            if row.name == name:
+                if row.icon is None:
+                    row.icon = self._material_swatch_icon(name) or False
+                return row.icon or None
+        return self._material_swatch_icon(name)
+
     def _assign_root_text(self, widget):
         """Root-row label for the Assign list (``list000``) hosted by *widget*.
 
@@ -125,7 +265,11 @@ class MaterialsMixin:
         rebuild off it. ``init_slot`` blocks the combo's own signals while it
         re-populates, so this does not double up with the
         ``currentIndexChanged`` -> :meth:`_refresh_assign_lists` connection.
+
+        The material index is dropped first: the caller just changed the set, and
+        its engine event may not have been delivered yet (or at all).
         """
+        self.invalidate_material_index()
         self.ui.cmb002.init_slot()
         self._refresh_assign_lists()
 
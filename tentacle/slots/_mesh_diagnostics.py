@@ -0,0 +1,64 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic mesh diagnostics: per-mesh check results, cached.
+
+Unfold's repair path asks the same questions several times a click — which meshes have
+non-manifold vertices, which have non-manifold UVs — before the cleanup, after it, and
+once more for the Warn + Select fallback when the retry still fails. Each ask used to
+rescan every mesh in the selection with one command per shape, although only the meshes
+the cleanup touched can have a different answer.
+
+:class:`MeshDiagnostics` is one process-wide table per engine:
+
+* per mesh, the components each check (:attr:`MeshDiagnostics.CHECKS`) flagged;
+* each result is kept against the mesh's *signature* — a cheap topology / UV token
+  (:meth:`MeshDiagnostics._signatures`) — and its dirty counter, which :meth:`touch`
+  bumps for a mesh edited in a way the signature may not show;
+* every mesh with no current result for a check is scanned in one batch
+  (:meth:`MeshDiagnostics._scan`), not one command per mesh.
+
+Forks subclass it with the two hooks and hand out :meth:`MeshDiagnostics.instance`.
+"""
+
+from tentacle import RowCache
+
+
+class MeshDiagnostics(RowCache):
+    """Per-mesh ``{check: [components]}`` keyed on a signature and a dirty counter.
+
+    Subclasses provide :meth:`_signatures` and :meth:`_scan`; :meth:`_key` when the
+    engine's mesh handles are not hashable or not stable across calls.
+    """
+
+    #: The checks a subclass scans for.
+    CHECKS = ("vertices", "uvs")
+
+    def __init__(self):
+        super().__init__()
+        self.scanned = 0  # mesh scans run so far — for tests and the bench
+
+    # ------------------------------------------------------------------ hooks
+    def _scan(self, meshes, check):
+        """The components *check* flags on each of *meshes*, one list per mesh in
+        order — from one batched call, not one per mesh.
+        """
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------ queries
+    def find(self, meshes, check):
+        """``{key: [components]}`` flagged by *check*, in *meshes* order.
+
+        Keyed by :meth:`_key` (the mesh itself by default); only meshes with a finding
+        are returned — an empty dict when there are none.
+        """
+        if check not in self.CHECKS:
+            raise ValueError(f"Unknown check {check!r}; expected one of {self.CHECKS}.")
+        meshes = list(meshes)
+        if not meshes:
+            return {}
+        keys, stale = self._refresh(
+            meshes, lambda ms: [list(c or ()) for c in self._scan(ms, check)], check
+        )
+        self.scanned += len(stale)
+        found = {key: self._value(key, check) for key in keys}
+        return {key: list(components) for key, components in found.items() if components}
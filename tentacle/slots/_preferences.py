@@ -6,12 +6,12 @@ The per-panel home for logic the Maya and Blender ``Preferences`` forks share (m
 ahead of their ``SlotsMaya`` / ``SlotsBlender`` base). Grow this class rather than adding a
 new module per feature — see the convention in ``tentacle/CLAUDE.md``.
 
-Currently: the marking-menu + standalone-window theme selectors, and the presentation
-policy for tools whose external app isn't installed. The theme selectors expose the two
-previously hard-pinned uitk window themes so the user can pick light / dark / high-contrast
-per window style; both read and write the live MarkingMenu theme properties, which persist
-per host and re-theme any already-open windows. The logic is pure uitk, so nothing is
-DCC-specific to fork.
+Currently: the marking-menu + standalone-window theme selectors, the presentation
+policy for tools whose external app isn't installed, and the Slot Timings viewer. The
+theme selectors expose the two previously hard-pinned uitk window themes so the user can
+pick light / dark / high-contrast per window style; both read and write the live
+MarkingMenu theme properties, which persist per host and re-theme any already-open
+windows. The logic is pure uitk, so nothing is DCC-specific to fork.
 """
 
 
@@ -23,6 +23,7 @@ class PreferencesMixin:
     (``sb.unmet_policy``, read by every ``sb.gate`` call).
     ``header`` > ``tb000`` — re-probe those apps (``Slots.recheck_app_gates``), so a
     mid-session install is picked up without restarting the host.
+    ``header`` > ``tb001`` — the per-slot timings ``SlotTelemetry`` has recorded.
     """
 
     @staticmethod
@@ -123,7 +124,8 @@ class PreferencesMixin:
         self.sb.recheck_gates()
 
     def header_init(self, widget):
-        """Header menu — the manual re-probe that pairs with ``cmb006``.
+        """Header menu — the manual re-probe that pairs with ``cmb006``, and the
+        Slot Timings viewer.
 
         Built in code rather than in Designer because the panel's ``.ui`` pair is
         shared by every DCC and this entry is DCC-agnostic; the ``#submenu``
@@ -144,6 +146,16 @@ class PreferencesMixin:
                     "mid-session install stays invisible until the cache is dropped."
                 ),
             )
+            widget.menu.add(
+                self.sb.registered_widgets.PushButton,
+                setText="Slot Timings",
+                setObjectName="tb001",
+                setToolTip=(
+                    "How long each marking-menu command has taken: calls, p50/p95/p99 "
+                    "and worst times, errors, and the share spent behind a progress "
+                    "bar. Covers this session and the last stored ones."
+                ),
+            )
 
     def tb000(self):
         """Re-check installed tools: drop the cached probes, then re-apply the gates."""
@@ -151,3 +163,22 @@ class PreferencesMixin:
         self.sb.message_box(
             f"Re-checked installed tools — <hl>{updated}</hl> widget(s) re-presented."
         )
+
+    def tb001(self):
+        """Slot Timings: the session's per-slot dispatch timings, merged with the stored ones."""
+        from tentacle import SlotTelemetry
+
+        telemetry = SlotTelemetry.active()
+        if telemetry is None:
+            self.sb.message_box(
+                f"Slot telemetry is off (<hl>{SlotTelemetry.ENV}=0</hl>)."
+            )
+            return
+        self.sb.text_view_dialog(
+            telemetry.report(),
+            "Ok",
+            title="Slot Timings",
+            size=(900, 520),
+            monospace=True,
+            word_wrap=False,
+        )
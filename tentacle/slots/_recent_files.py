@@ -0,0 +1,292 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic index of recent and autosaved scene files.
+
+The scene panel's Recent Files list and Autosave combo used to ask the engine on every
+init — ``get_recent_files`` stats each entry, ``get_recent_autosave`` walks every autosave
+directory and stats every file in it — on the UI thread. Against a network-mounted project
+drive that stalls the panel's show.
+
+:class:`RecentFileIndex` keeps the answer instead, one per host:
+
+* per file: ``path``, ``kind`` (``"recent"`` / ``"autosave"``), ``mtime``, ``size``,
+  ``exists`` and the owning ``workspace`` (the nearest ancestor holding
+  ``workspace.mel``);
+* readers (:meth:`RecentFileIndex.recent`, :meth:`RecentFileIndex.autosaves`) answer from
+  memory and never touch the filesystem — a file not stat'd yet reads ``exists=None``;
+* :meth:`RecentFileIndex.refresh` re-stats on a daemon thread and hands back a
+  ``Future`` (deliver it with ``Slots.deliver``); the UI thread only supplies the paths
+  and directories, which the engine knows without I/O;
+* the index persists to ``Tcl.cache_dir("recent")/<host>.json``, so a cold start renders
+  the last session's answer at once.
+
+Scene open / save events :meth:`touch` the file (MRU order, no I/O) and mark the index
+stale; the next panel show renders what is known and refreshes behind it.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+
+class RecentFileIndex:
+    """Recent + autosave file metadata for one host, refreshed off the UI thread.
+
+    Parameters:
+        host (str): ``"maya"`` / ``"blender"`` — names the store.
+        path (str): The store. Defaults to ``<cache>/recent/<host>.json``.
+    """
+
+    #: Seconds an answer is current; an older one is re-checked on the next show.
+    TTL = 60
+
+    #: Recent-file paths kept in MRU order.
+    MAX_RECENT = 50
+
+    #: The file whose directory is a workspace root.
+    WORKSPACE_MARKER = "workspace.mel"
+
+    _instances = {}
+    _guard = threading.Lock()
+
+    def __init__(self, host, path=None):
+        if path is None:
+            from tentacle import Tcl
+
+            path = os.path.join(Tcl.cache_dir("recent"), f"{host}.json")
+        self.host = host
+        self.path = path
+        self.version = 0  # bumped whenever an answer changes what readers see
+        self.checked_at = 0.0
+        self._lock = threading.Lock()
+        self._order = []  # recent paths, newest first
+        self._entries = {}  # path -> entry dict
+        self._future = None
+        self._touched = []  # paths touch()ed since the scan in flight began
+        self._pending = None  # (recent, autosave_dirs, extensions) queued behind a refresh
+        self._load()
+
+    @classmethod
+    def instance(cls, host):
+        """The process-wide index for *host*."""
+        with cls._guard:
+            index = cls._instances.get(host)
+            if index is None:
+                index = cls._instances[host] = cls(host)
+            return index
+
+    # ------------------------------------------------------------------ store
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            entries = {e["path"]: e for e in data.get("entries", ()) if e.get("path")}
+            order = [p for p in data.get("recent", ()) if p in entries]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return
+        self._entries, self._order = entries, order
+        self.checked_at = float(data.get("checked_at", 0.0))
+
+    def _write(self):
+        with self._lock:
+            data = {
+                "version": 1,
+                "host": self.host,
+                "checked_at": self.checked_at,
+                "recent": list(self._order),
+                "entries": list(self._entries.values()),
+            }
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+    # ------------------------------------------------------------------ readers
+    def get(self, path):
+        """The entry for *path* (a copy), or None."""
+        with self._lock:
+            entry = self._entries.get(os.path.normpath(path))
+            return dict(entry) if entry else None
+
+    def recent(self, limit=None):
+        """Recent-file entries, newest first (missing ones included — see ``exists``)."""
+        with self._lock:
+            return [dict(self._entries[p]) for p in self._order[:limit]]
+
+    def autosaves(self, max_age=None):
+        """Existing autosave entries, newest first, modified within *max_age* seconds."""
+        cutoff = time.time() - max_age if max_age else 0.0
+        with self._lock:
+            rows = [
+                dict(e)
+                for e in self._entries.values()
+                if e["kind"] == "autosave" and e["exists"] and e["mtime"] >= cutoff
+            ]
+        return sorted(rows, key=lambda e: e["mtime"], reverse=True)
+
+    def is_stale(self):
+        return time.time() - self.checked_at > self.TTL
+
+    # ------------------------------------------------------------------ updates
+    def touch(self, path):
+        """Move *path* to the head of the recent list (a scene open / save) — no I/O.
+
+        The entry's metadata is left as it was; the next :meth:`refresh` re-stats it, and
+        the index is marked stale so the next show asks for one.
+        """
+        if not path:
+            return
+        path = os.path.normpath(path)
+        with self._lock:
+            self._promote(path)
+            self.checked_at = 0.0
+            self.version += 1
+            self._touched.append(path)
+
+    def _promote(self, path):
+        """Put *path* at the head of the recent list (the lock held)."""
+        if path in self._order:
+            self._order.remove(path)
+        self._order.insert(0, path)
+        del self._order[self.MAX_RECENT :]
+        entry = self._entries.get(path)
+        if entry is None or entry["kind"] != "recent":
+            self._entries[path] = self._entry(path, "recent", stat=False)
+
+    def refresh(self, recent, autosave_dirs=(), extensions=None):
+        """Re-stat *recent* and rescan *autosave_dirs* on a daemon thread.
+
+        A refresh already running is not duplicated: its future is returned, and the
+        scan re-runs with the newer arguments only when :meth:`touch` landed after it
+        began — its answer would otherwise bury the touch.
+
+        Parameters:
+            recent (list/callable): Recent-file paths, newest first (the engine's MRU
+                list) — or a zero-argument callable returning them, called on the worker
+                for a source that is itself file I/O (Blender's ``recent-files.txt``).
+            autosave_dirs (list/callable): Directories holding the host's autosaves, or a
+                callable as above.
+            extensions (tuple): Autosave file extensions (``(".ma", ".mb")``); all when None.
+
+        Returns:
+            (Future): Resolves to this index once the answer is current.
+        """
+        args = (recent, autosave_dirs, tuple(extensions or ()))
+        with self._lock:
+            if self._future is not None and not self._future.done():
+                if self._touched:
+                    self._pending = args
+                return self._future
+            future = self._future = Future()
+            self._touched = []
+        # A daemon thread: a scan stuck on a dead network mount must not hold the DCC
+        # open at exit (an executor joins its workers).
+        threading.Thread(
+            target=self._work,
+            args=(future, args),
+            name=f"tentacle-recent-{self.host}",
+            daemon=True,
+        ).start()
+        return future
+
+    def _work(self, future, args):
+        try:
+            while args is not None:
+                recent, autosave_dirs, extensions = args
+                recent = recent() if callable(recent) else recent
+                autosave_dirs = autosave_dirs() if callable(autosave_dirs) else autosave_dirs
+                self._apply(*self._scan(recent or (), autosave_dirs or (), extensions))
+                with self._lock:
+                    args, self._pending = self._pending, None
+            try:
+                self._write()
+            except OSError:
+                pass  # the index is a cache: an unwritable store costs the next cold start
+            future.set_result(self)
+        except Exception as error:  # delivered to the reader through the future
+            future.set_exception(error)
+
+    # ------------------------------------------------------------------ worker side
+    @staticmethod
+    def _entry(path, kind, stat=None, workspace=""):
+        """*stat* None is a missing file; False is one not stat'd yet."""
+        return {
+            "path": path,
+            "kind": kind,
+            "mtime": stat.st_mtime if stat else 0.0,
+            "size": stat.st_size if stat else 0,
+            "exists": None if stat is False else stat is not None,
+            "workspace": workspace,
+        }
+
+    def _workspace(self, directory, cache):
+        """The nearest ancestor of *directory* holding :attr:`WORKSPACE_MARKER`, or ""."""
+        seen = []
+        while directory and directory not in cache:
+            seen.append(directory)
+            if os.path.isfile(os.path.join(directory, self.WORKSPACE_MARKER)):
+                cache[directory] = directory
+                break
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                cache[directory] = ""
+                break
+            directory = parent
+        found = cache.get(directory, "")
+        for d in seen:
+            cache[d] = found
+        return found
+
+    def _scan(self, recent, autosave_dirs, extensions):
+        """Stat every recent path and every autosave file — the blocking part."""
+        workspaces = {}
+        entries = {}
+        order = []
+        for path in recent:
+            path = os.path.normpath(path)
+            if path in entries:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            workspace = self._workspace(os.path.dirname(path), workspaces) if stat else ""
+            entries[path] = self._entry(path, "recent", stat, workspace)
+            order.append(path)
+        for directory in autosave_dirs:
+            try:
+                listing = list(os.scandir(directory))
+            except OSError:
+                continue
+            for item in listing:
+                if extensions and not item.name.lower().endswith(extensions):
+                    continue
+                path = os.path.normpath(item.path)
+                if path in entries:
+                    continue
+                try:
+                    if not item.is_file():
+                        continue
+                    stat = item.stat()
+                except OSError:
+                    continue
+                workspace = self._workspace(os.path.dirname(path), workspaces)
+                entries[path] = self._entry(path, "autosave", stat, workspace)
+        return order[: self.MAX_RECENT], entries
+
+    def _apply(self, order, entries):
+        """Swap in a scan's answer, with any path touched while it ran put back on top.
+
+        A touched answer stays stale (``checked_at`` untouched), so the next show asks
+        for the scan that stats those paths.
+        """
+        with self._lock:
+            changed = order != self._order or entries != self._entries
+            self._order, self._entries = order, entries
+            touched, self._touched = self._touched, []
+            for path in reversed(touched):
+                self._promote(path)
+            self.checked_at = 0.0 if touched else time.time()
+            if changed or touched:
+                self.version += 1
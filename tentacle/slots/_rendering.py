@@ -7,15 +7,17 @@ The per-panel home for logic the Maya and Blender ``Rendering`` forks share
 class rather than adding a new module per feature — see the convention in
 ``tentacle/CLAUDE.md``.
 
-Currently: the WebXR Preview slot (``tb002``). Its option box and push flow
-are identical across DCCs by design — same objectNames per the cross-DCC
-QSettings rule, same engine surface (``mtk.WebXrPreview`` /
+Currently: the WebXR Preview slot (``tb002``), with its Live Update path — a
+delta patched into the open page (:class:`~tentacle.slots._webxr_delta.WebXrDelta`)
+instead of a re-exported GLB whenever the scene's structure held. Its option
+box and push flow are identical across DCCs by design — same objectNames per
+the cross-DCC QSettings rule, same engine surface (``mtk.WebXrPreview`` /
 ``btk.WebXrPreview`` mirror each other via ``pythontk.PreviewBridge``) — and
 duplicated per fork they drifted exactly as the convention predicts: a stale
 tooltip had to be found and fixed twice. Only what genuinely differs per DCC
-stays in the forks: the selection read, the engine class, where its log goes,
-and the Scene Sidecar tooltip (each names what *that* DCC's FBX exporter
-loses).
+stays in the forks: the selection read, the engine class, the delta table,
+where its log goes, and the Scene Sidecar tooltip (each names what *that* DCC's
+FBX exporter loses).
 """
 
 
@@ -69,8 +71,18 @@ class RenderingMixin:
             "that an open page can pick up — including one open in a headset — reuses it "
             "rather than stealing focus; a push after you closed it opens a new one.",
         )
+        menu.add(
+            "QCheckBox",
+            setText="Live Update",
+            setObjectName="chk064",
+            setChecked=True,
+            setToolTip="Patch the open preview with only what changed since the last "
+            "push — moved nodes, edited meshes, material values — instead of exporting "
+            "the whole GLB again. Falls back to a full push when nodes were added, "
+            "removed, renamed or reparented, or when no page is watching.",
+        )
 
-    def webxr_push(self, widget, engine, has_selection, log_hint):
+    def webxr_push(self, widget, engine, has_selection, log_hint, delta=None):
         """Read the option box and push to the live preview (``rendering.tb002``).
 
         Parameters:
@@ -82,6 +94,10 @@ class RenderingMixin:
             has_selection: Zero-arg callable — whether anything is selected.
             log_hint: Where that DCC surfaces bridge logging (e.g. "script
                 editor"), for the failure message.
+            delta: The DCC's :class:`WebXrDelta` table (``webxr_delta()``), or
+                None for full pushes only. With Live Update on, a push the open
+                page can take as a delta skips the export entirely; a full push
+                rebases the table on what it published.
         """
         menu = widget.option_box.menu
         whole_scene = menu.cmb061.currentIndex() == 1
@@ -98,6 +114,27 @@ class RenderingMixin:
         if getattr(self, "_webxr", None) is None:
             self._webxr = engine()
 
+        # Everything that shapes the GLB beyond the scene itself: a delta is only
+        # valid against a base built with the same options.
+        options = (whole_scene, menu.chk061.isChecked(), menu.chk063.isChecked())
+        scope = "all" if whole_scene else "selected"
+        live = delta is not None and menu.chk064.isChecked()
+        server = getattr(self._webxr.deliverer, "server", None)
+        if live and server is not None and server.is_running and server.has_viewer():
+            patched = delta.push(
+                server,
+                self._webxr.scope_objects(scope),
+                options,
+                textures=menu.chk061.isChecked(),
+            )
+            if patched is not None:
+                self.sb.message_box(
+                    f"Preview v{delta.base[1]} patched: {patched['nodes']} nodes, "
+                    f"{patched['meshes']} meshes, {patched['materials']} materials "
+                    f"({patched['bytes'] / 1024:.0f} KB sent)"
+                )
+                return
+
         result = self._webxr.push(
             whole_scene=whole_scene,
             open_browser="auto" if menu.chk062.isChecked() else False,
@@ -108,8 +145,19 @@ class RenderingMixin:
             self.sb.message_box(
                 f"WebXR preview failed — see the {log_hint} for details."
             )
+            if delta is not None:
+                delta.invalidate()
             return
 
+        if live:
+            server = self._webxr.deliverer.server
+            server.add_script(delta.SCRIPT_NAME, delta.SCRIPT)
+            delta.rebase(
+                server, self._webxr.scope_objects(scope), result["version"], options
+            )
+        elif delta is not None:
+            delta.invalidate()
+
         # The sidecar summary is reported, not left to the log: read nothing /
         # matched nothing / switched off all render the same unlit preview, so
         # without it the feature can't be debugged from the panel.
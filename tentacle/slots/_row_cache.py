@@ -0,0 +1,102 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic per-mesh row cache: the table behind the cached mesh queries.
+
+:class:`SceneStats`, :class:`MeshDiagnostics`, :class:`SimilarIndex` and
+:class:`FaceGraphs` each keep something costly to read per mesh — counts, check
+results, descriptors, a topology graph — and re-read it only once the mesh changes.
+:class:`RowCache` is that bookkeeping, once:
+
+* rows keyed by :meth:`RowCache._key`, each held against the mesh's *signature*
+  (:meth:`RowCache._signatures`, cheap per mesh) and a dirty counter that
+  :meth:`RowCache.touch` bumps for an edit the signature may not show;
+* :meth:`RowCache._refresh` re-measures every stale row of a query in one batch,
+  through the subclass's own measuring call; a row may hold several *parts* (one per
+  check) that go stale independently;
+* past :attr:`RowCache.MAX_ROWS` meshes the table is dropped wholesale — renamed and
+  deleted meshes leave rows behind, and a rebuild costs one measuring pass;
+* :meth:`RowCache.instance` hands out one process-wide table per subclass.
+
+Subclasses keep only their hooks and queries.
+"""
+
+
+class RowCache:
+    """Per-mesh ``{part: value}`` keyed on a signature and a dirty counter.
+
+    Subclasses provide :meth:`_signatures` and call :meth:`_refresh` from their
+    queries; :meth:`_key` when the engine's mesh handles are not hashable or not
+    stable across calls.
+    """
+
+    #: Meshes kept before the table is dropped wholesale.
+    MAX_ROWS = 250_000
+
+    _instance = None
+
+    def __init__(self):
+        self._rows = {}  # key -> {part: (signature, dirty, value)}
+        self._dirty = {}  # key -> edits reported through touch()
+
+    @classmethod
+    def instance(cls):
+        """The process-wide table for this engine (one per subclass)."""
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------ hooks
+    def _key(self, mesh):
+        """Hashable, stable identity of *mesh* (default: the handle itself)."""
+        return mesh
+
+    def _signatures(self, meshes):
+        """One hashable token per mesh that moves with what the rows hold — must be
+        cheap (O(1) per mesh)."""
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------ rows
+    def _refresh(self, meshes, measure, part=None):
+        """``(keys, stale)`` of *meshes*: their keys in order, and the indices whose
+        *part* was re-measured — by one ``measure(stale meshes)`` call returning a
+        value per mesh in order.
+        """
+        keys = [self._key(m) for m in meshes]
+        signatures = self._signatures(meshes)
+        rows, dirty = self._rows, self._dirty
+        stale = []
+        for i, (key, signature) in enumerate(zip(keys, signatures)):
+            cached = rows.get(key, {}).get(part)
+            if cached is None or cached[:2] != (signature, dirty.get(key, 0)):
+                stale.append(i)
+        if stale:
+            added = len({keys[i] for i in stale if keys[i] not in rows})
+            if len(rows) + added > self.MAX_ROWS:
+                rows.clear()
+                stale = list(range(len(meshes)))
+            for i, value in zip(stale, measure([meshes[i] for i in stale])):
+                key = keys[i]
+                rows.setdefault(key, {})[part] = (signatures[i], dirty.get(key, 0), value)
+        return keys, stale
+
+    def _value(self, key, part=None):
+        """The value :meth:`_refresh` last measured for *key*'s *part*."""
+        return self._rows[key][part][2]
+
+    # ------------------------------------------------------------------ events
+    def touch(self, *meshes):
+        """Mark *meshes* edited — their next query re-measures, whatever the signature."""
+        for mesh in meshes:
+            key = self._key(mesh)
+            self._dirty[key] = self._dirty.get(key, 0) + 1
+
+    def invalidate(self, *meshes):
+        """Forget *meshes* (every mesh when called bare) — the next query re-measures."""
+        if not meshes:
+            self._rows.clear()
+            self._dirty.clear()
+            return
+        for mesh in meshes:
+            key = self._key(mesh)
+            self._rows.pop(key, None)
+            self._dirty.pop(key, None)
@@ -2,7 +2,7 @@
 # coding=utf-8
 """Behavior shared by the Maya and Blender ``scene`` panels.
 
-Three subsystems live here:
+Four subsystems live here:
 
 * the **Fix Non-Orthogonal Axes** header entry (``tb002``): the scan, the
   report, the confirmation and the result summary are identical on both sides
@@ -18,15 +18,22 @@ Three subsystems live here:
   destination, run the blocking hand-off, report. Identical on both sides
   because the bridges are mirrors (``mtk.BlenderBridge`` ↔ ``btk.MayaBridge``)
   and the bridge itself carries everything that differs — its target app's
-  display name and the scene extensions it writes.
+  display name and the scene extensions it writes; and
+* **Recent Files / Autosave** (``list000`` / ``cmb002``): rendered from the
+  shared :class:`tentacle.RecentFileIndex`, which stats the files on a worker
+  thread, so a dead network mount no longer stalls the panel's show.
 
 Only the engine handle, the scope resolvers, the wording of what the fix *does*
-to the object, which events signal a workspace change, the open scene's path and
-the foreign-format bridge are DCC-specific — those are the hooks below.
+to the object, which events signal a workspace change, the open scene's path,
+the foreign-format bridge and where recent files and autosaves live are
+DCC-specific — those are the hooks below.
 """
 
 import os
 import html
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pythontk as ptk
 
@@ -131,6 +138,16 @@ class SceneMixin:
             return None
         return os.path.splitext(scene_path)[0] + extension
 
+    def _export_chunk_roots(self, options):
+        """``[(root, triangles), ...]`` — the export set's top-level objects, in order.
+
+        What :meth:`_export_scene_chunked` partitions. *options* is the export's (see
+        :meth:`_export_scene_native`): the scope, and whether the scene's cameras and
+        lights go with it. Only forks that offer the Split option (``cmb_split`` in
+        their ``tb003_init``) implement it.
+        """
+        raise NotImplementedError
+
     def _export_scene_native(self, export_format, out_path, options, tick):
         """Write *out_path* in a NATIVE format — ``"fbx"`` / ``"obj"`` / ``"glb"``.
 
@@ -140,8 +157,14 @@ class SceneMixin:
 
         *options* is the option box's booleans: ``selection_only``,
         ``include_cameras`` / ``include_lights`` / ``include_skins`` /
-        ``include_tangents``, ``embed_textures``. *tick* paints a progress status
-        (Maya's GLB route uses it for the conversion leg).
+        ``include_tangents``, ``embed_textures`` — plus ``objects`` when a split
+        export writes one chunk: exactly those roots, whatever the scope said. *tick*
+        is the export's
+        :class:`~tentacle.slots._slots.SlotJob` (``tick(text=...)`` sets the status).
+
+        Runs on the UI thread. A hook with a long non-DCC tail returns it as
+        ``tail(job)`` instead of running it: the caller runs it on the job's worker
+        (Maya's GLB route returns its FBX -> GLB conversion). Returns None otherwise.
         """
         raise NotImplementedError
 
@@ -188,7 +211,7 @@ class SceneMixin:
         if export_format == "foreign":
             # The bridge owns its own wait cursor and reporting — it is a
             # multi-second app launch, not a DCC-side write, so it does not belong
-            # under the progress context below.
+            # under the export job below.
             result = self._run_foreign_export(
                 out_path, self._selected_objects() if selection_only else None
             )
@@ -200,23 +223,162 @@ class SceneMixin:
             return
 
         # Every native writer is a single blocking call that scales with poly count,
-        # so on dense scenes the UI sits frozen with no feedback. Run inside the
-        # footer progress context, painting a status before the blocking step
-        # (``tick()`` pumps the event loop) so it reads as working, not hung. Let
-        # failures propagate out of the context so it suppresses its "Complete" flash
-        # on a non-clean exit.
-        try:
-            with self.sb.progress(
-                text=f"Exporting {extension.lstrip('.').upper()}… "
-                "dense scenes can take a while"
-            ) as tick:
-                tick()  # paint the status before the blocking export
-                self._export_scene_native(export_format, out_path, options, tick)
-        except Exception as error:  # noqa: BLE001 - every writer, one report
-            self.sb.message_box(f"Export failed:<br>{error}")
-            return
+        # so the write itself stays a UI-thread call — but it runs as a job
+        # (``Slots.run_job``): the footer status paints first, and whatever tail the
+        # hook hands back (Maya's FBX -> GLB conversion) runs on the worker while
+        # the DCC stays usable. The job reports a failure as "Export failed".
+        label = extension.lstrip(".").upper()
+        split = getattr(menu, "cmb_split", None)  # offered by forks that can split
+        split = split.currentData() if split is not None else "none"
 
-        self.sb.message_box(f"Exported <hl>{ptk.format_path(out_path, 'file')}</hl>.")
+        def export(job):
+            if split != "none":
+                return self._export_scene_chunked(
+                    job, export_format, out_path, options, split
+                )
+            job.progress(text=f"Exporting {label}… dense scenes can take a while")
+            tail = job.on_main(
+                self._export_scene_native, export_format, out_path, options, job
+            )
+            if tail is not None:
+                tail(job)
+            return out_path
+
+        self.run_job(
+            export,
+            name="Export",
+            key="export_scene",
+            done=lambda path: self.sb.message_box(
+                f"Exported <hl>{ptk.format_path(path, 'file')}</hl>."
+            ),
+        )
+
+    # ------------------------------------------------ export: split into chunks
+    #: ``(label, data)`` for the Split combo of forks that offer it.
+    EXPORT_SPLIT_ITEMS = (
+        ("Single File", "none"),
+        ("One File per Assembly", "assembly"),
+        ("Split by Triangle Budget", "tris"),
+    )
+    #: Triangles per file in ``"tris"`` mode. A root denser than this gets a file
+    #: of its own — roots are never cut.
+    EXPORT_CHUNK_TRIS = 1_000_000
+    #: Out-of-process conversions (FBX2glTF) running at once in a split export.
+    EXPORT_CONVERT_WORKERS = 4
+
+    @classmethod
+    def _partition_export(cls, roots, mode, budget=None):
+        """Group ``[(root, triangles), ...]`` into export chunks, keeping their order.
+
+        ``"assembly"``: one chunk per root that carries geometry. ``"tris"``: roots
+        are packed greedily up to *budget* (default :attr:`EXPORT_CHUNK_TRIS`)
+        triangles per chunk. Either way, roots without triangles (lights, cameras,
+        locators) ride in the first chunk rather than getting files of their own.
+
+        Returns:
+            list: ``[[root, ...], ...]`` — never an empty chunk.
+        """
+        budget = budget or cls.EXPORT_CHUNK_TRIS
+        loose = [root for root, tris in roots if not tris]
+        chunks, current, total = [], [], 0
+        for root, tris in roots:
+            if not tris:
+                continue
+            if current and (mode == "assembly" or total + tris > budget):
+                chunks.append(current)
+                current, total = [], 0
+            current.append(root)
+            total += tris
+        if current:
+            chunks.append(current)
+        if loose:
+            if chunks:
+                chunks[0][:0] = loose
+            else:
+                chunks.append(loose)
+        return chunks
+
+    @staticmethod
+    def _chunk_path(out_path, index, roots, mode):
+        """``<stem>_<root name>.<ext>`` per assembly, ``<stem>_part<NN>.<ext>`` by budget."""
+        stem, extension = os.path.splitext(out_path)
+        if mode == "assembly":
+            name = roots[-1].replace("|", "/").rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+            label = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        else:
+            label = f"part{index + 1:02d}"
+        return f"{stem}_{label}{extension}"
+
+    def _export_scene_chunked(self, job, export_format, out_path, options, mode):
+        """Write the export as one file per chunk plus a JSON manifest; return its path.
+
+        Runs on the export job's worker. Each chunk is a separate
+        :meth:`_export_scene_native` call on the UI thread — so only one chunk's
+        data is ever in flight, and the footer counts chunks — and the tails the
+        hook hands back (Maya's FBX -> GLB conversion, an out-of-process tool) run
+        in parallel, each starting as soon as its chunk is written. The manifest
+        (``<stem>.manifest.json`` beside the chunks) lists every file with its
+        roots and triangle count, for a game-side loader or a later merge.
+        """
+        roots = job.on_main(self._export_chunk_roots, options)
+        tris_of = dict(roots)
+        chunks = self._partition_export(roots, mode)
+        if not chunks:
+            raise RuntimeError("Nothing to export.")
+        paths = [
+            self._chunk_path(out_path, i, chunk, mode) for i, chunk in enumerate(chunks)
+        ]
+        if len(set(paths)) < len(paths):  # two assemblies sharing a short name
+            paths = [
+                self._chunk_path(out_path, i, chunk, "tris")
+                for i, chunk in enumerate(chunks)
+            ]
+        total = len(chunks)
+        source = job.on_main(self._current_scene_path)
+        with ThreadPoolExecutor(
+            max_workers=self.EXPORT_CONVERT_WORKERS, thread_name_prefix="tentacle-export"
+        ) as pool:
+            tails = []
+            for index, (chunk, path) in enumerate(zip(chunks, paths)):
+                job.check()
+                job.progress(
+                    index, total, f"Exporting {index + 1}/{total}: "
+                    f"{os.path.basename(path)}"
+                )
+                tail = job.on_main(
+                    self._export_scene_native,
+                    export_format,
+                    path,
+                    dict(options, objects=chunk),
+                    job,
+                )
+                if tail is not None:
+                    tails.append(pool.submit(tail, job))
+            job.progress(total, total, f"Finishing {len(tails)} conversion(s)…")
+            for future in tails:
+                future.result()  # the first failure fails the export
+
+        manifest = os.path.splitext(out_path)[0] + ".manifest.json"
+        entries = [
+            {
+                "file": os.path.basename(path),
+                "roots": list(chunk),
+                "triangles": sum(tris_of.get(root) or 0 for root in chunk),
+            }
+            for chunk, path in zip(chunks, paths)
+        ]
+        with open(manifest, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source": source,
+                    "format": export_format,
+                    "split": mode,
+                    "chunks": entries,
+                },
+                f,
+                indent=2,
+            )
+        return manifest
 
     # ------------------------------------------------ export: the foreign format
     def _run_foreign_export(self, out_path, objects=None):
@@ -328,6 +490,126 @@ class SceneMixin:
         if self._footer_controller:
             self._footer_controller.update()
 
+    # ------------------------------------------- list000 / cmb002  Recent + Autosave
+    #: Store name for the shared :class:`tentacle.RecentFileIndex`. Fork-set.
+    RECENT_HOST = ""
+    #: Autosave file extensions the scan keeps. Fork-set.
+    AUTOSAVE_EXTENSIONS = ()
+    #: Rows in the Recent Files flyout.
+    RECENT_LIMIT = 11
+    #: Autosaves older than this (seconds) are left out of the Autosave combo.
+    AUTOSAVE_MAX_AGE = 24 * 3600
+    RECENT_TRUNCATE = 65
+    #: Engine events that put the open scene at the head of the recent list.
+    RECENT_INDEX_EVENTS = ("SceneOpened", "SceneSaved")
+
+    def _recent_file_paths(self):
+        """The DCC's recent-file paths, newest first (hook). Called on the UI thread.
+
+        May instead return a zero-argument callable producing them, which the
+        index's worker calls — for a source that is itself a file read (Blender's
+        ``recent-files.txt``). Nothing touching the DCC's API belongs in one.
+        """
+        raise NotImplementedError
+
+    def _autosave_dirs(self):
+        """Directories the DCC writes autosaves to (hook). Called on the UI thread."""
+        raise NotImplementedError
+
+    def _recent_index(self):
+        from tentacle import RecentFileIndex
+
+        return RecentFileIndex.instance(self.RECENT_HOST)
+
+    def _subscribe_recent_index(self, widget):
+        """Subscribe :attr:`RECENT_INDEX_EVENTS` to :meth:`_on_recent_file_event`, owned by *widget*."""
+        mgr = self._script_job_manager().instance()
+        for event in self.RECENT_INDEX_EVENTS:
+            try:
+                mgr.subscribe(event, self._on_recent_file_event, owner=widget)
+            except Exception as error:
+                self.sb.logger.debug(f"[scene] {event!r} not subscribed: {error}")
+        mgr.connect_cleanup(widget, owner=widget)
+
+    def _on_recent_file_event(self, *_):
+        """Scene open / save: the open scene moves to the head of the recent list."""
+        self._recent_index().touch(self._current_scene_path())
+
+    def _refresh_recent_index(self, widget):
+        """Re-stat the index in the background when stale; re-init *widget* on a change.
+
+        The re-init renders from memory again and finds the index fresh, so it never
+        schedules another scan.
+        """
+        index = self._recent_index()
+        if not index.is_stale():
+            return
+        version = index.version
+        try:
+            future = index.refresh(
+                recent=self._recent_file_paths(),
+                autosave_dirs=self._autosave_dirs(),
+                extensions=self.AUTOSAVE_EXTENSIONS,
+            )
+        except Exception as error:
+            self.sb.logger.debug(f"[scene] recent-file refresh not started: {error}")
+            return
+
+        def done(future):
+            if future.exception() is not None:
+                self.sb.logger.debug(f"[scene] recent-file scan: {future.exception()}")
+            elif index.version != version:
+                widget.init_slot()
+
+        self.deliver(future, done)
+
+    def list000_init(self, widget):
+        """Recent Files, rendered from the recent-file index (see ``_recent_files.py``).
+
+        Rebuilt from memory on every show; files the last scan found missing stay
+        listed, marked, rather than silently dropping out.
+        """
+        widget.clear()
+        if not widget.is_initialized:
+            widget.refresh_on_show = True
+            widget.fixed_item_height = 18
+            widget.apply_preset(
+                "expand_up" if widget.ui.has_tags("submenu") else "hover_menu"
+            )
+            self._subscribe_recent_index(widget)
+        entries = self._recent_index().recent(self.RECENT_LIMIT)
+        paths = [e["path"] for e in entries]
+        labels = [
+            label if e["exists"] is not False else f"{label}  (missing)"
+            for label, e in zip(ptk.truncate(paths, self.RECENT_TRUNCATE), entries)
+        ]
+        w1 = widget.add("Recent Files")
+        w1.sublist.add(zip(labels, paths))
+        widget.setVisible(bool(paths))
+        self._refresh_recent_index(widget)
+
+    def cmb002_init(self, widget):
+        """Autosave: the index's autosaves from the last day, newest first."""
+        if not widget.is_initialized:
+            widget.before_popup_shown.connect(widget.init_slot)
+        autosave_dict = {
+            f"{time.strftime('%H:%M:%S', time.localtime(e['mtime']))}  "
+            f"{ptk.format_path(e['path'], 'file')}": e["path"]
+            for e in self._recent_index().autosaves(self.AUTOSAVE_MAX_AGE)
+        }
+        widget.add(autosave_dict, header="Autosave:", clear=True)
+        self._refresh_recent_index(widget)
+
+    def _recent_file_missing(self, path):
+        """True (after telling the user) when the index last saw *path* missing."""
+        entry = self._recent_index().get(path)
+        if entry is None or entry["exists"] is not False:
+            return False
+        self.sb.message_box(
+            f"File not found:\n<hl>{ptk.format_path(path, 'file')}</hl>"
+        )
+        return True
+
     # ------------------------------------------------------- list003  Tools list
     #: Tooltip for the Tools list's root row. Fork-set, because the forks stock
     #: different categories (only Maya has Recover) and the row should name what
@@ -0,0 +1,66 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic scene statistics: per-mesh poly counts, cached.
+
+The HUD's selection readout, the dense-export guard and Get Scene Info's scope check
+all need the same numbers — faces, triangles, UVs, vertices over some set of meshes —
+and each used to query them on its own: three ``polyEvaluate`` calls per HUD build, one
+more over every mesh before an export, a per-object Python loop in Blender. None of
+those numbers change unless the mesh's topology does.
+
+:class:`SceneStats` is one process-wide table per engine:
+
+* a row of counts per mesh, measured in one batch for every mesh the table has no
+  current row for (:meth:`SceneStats._measure`);
+* each row is kept against the mesh's *signature* — a cheap, O(1)-per-mesh topology
+  token (:meth:`SceneStats._signatures`); a row whose signature moved is re-measured;
+* totals for any subset are one NumPy sum over the subset's rows.
+
+Forks subclass it with the two hooks and hand out :meth:`SceneStats.instance`.
+"""
+
+from tentacle import RowCache
+
+
+class SceneStats(RowCache):
+    """Per-mesh ``(faces, tris, uvs, verts)`` keyed on a topology signature.
+
+    Subclasses provide :meth:`_signatures` and :meth:`_measure`; :meth:`_key` when the
+    engine's mesh handles are not hashable or not stable across calls.
+    """
+
+    #: Column order of a row, and the keys of :meth:`totals`.
+    FIELDS = ("faces", "tris", "uvs", "verts")
+
+    def __init__(self):
+        super().__init__()
+        self.measured = 0  # meshes measured so far — for tests and the bench
+
+    # ------------------------------------------------------------------ hooks
+    def _measure(self, meshes):
+        """Counts for *meshes*, one ``FIELDS``-ordered row each (array-like ``(n, 4)``)."""
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------ queries
+    def counts(self, meshes):
+        """``(n, 4)`` int64 array of per-mesh counts, in *meshes* order."""
+        import numpy as np
+
+        meshes = list(meshes)
+        if not meshes:
+            return np.zeros((0, len(self.FIELDS)), dtype=np.int64)
+        keys, stale = self._refresh(meshes, self._measure_rows)
+        self.measured += len(stale)
+        return np.stack([self._value(key) for key in keys])
+
+    def totals(self, meshes):
+        """``{"faces", "tris", "uvs", "verts"}`` summed over *meshes* (zeros when empty)."""
+        return dict(zip(self.FIELDS, (int(n) for n in self.counts(meshes).sum(axis=0))))
+
+    # ------------------------------------------------------------------ internals
+    def _measure_rows(self, meshes):
+        import numpy as np
+
+        return np.asarray(self._measure(meshes), dtype=np.int64).reshape(
+            len(meshes), len(self.FIELDS)
+        )
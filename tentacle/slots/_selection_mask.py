@@ -0,0 +1,229 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Vert / edge / face select state of a Blender mesh as NumPy masks.
+
+Engine-specific, but it imports nothing from Blender (``bmesh`` only when it writes to
+an Edit-Mode mesh), so it sits with the shared slot modules rather than in the
+``blender`` slot package, whose files each define one slot class.
+
+Reading or restoring a selection one element at a time (``[p.index for p in
+me.polygons if p.select]``, ``bm.faces[i].select_set(True)``) is a Python call per
+polygon, which takes minutes on a multi-million-face scan. :class:`SelectionMask`
+instead moves the three ``select`` flags in bulk with ``foreach_get`` / ``foreach_set``,
+and composes them with array operations:
+
+* ``a | b`` (union), ``a & b`` (intersection), ``a - b`` (difference);
+* :meth:`SelectionMask.flushed` — faces select their verts and edges, as ``select_set`` does;
+* :meth:`SelectionMask.from_edges` — edges select their verts and the faces they close;
+* :meth:`SelectionMask.grown` — Blender's *Select More* (vertex-adjacent faces).
+
+Topology (loop -> vertex / edge / face, edge -> vertices) is read once per mask, and only
+when a flush or grow needs it. A mask stays valid until the mesh's topology changes.
+
+Edit Mode is handled: a capture syncs the edit-mesh into the mesh data first
+(``update_from_editmode``), and :meth:`SelectionMask.apply` reloads the edit-mesh from
+the data after writing (``BMesh.from_mesh``), both C-speed bulk copies. The reload
+builds new elements, so the edit-mesh's select history (its active element among them)
+is carried over by index.
+"""
+import numpy as np
+
+
+class _Topology:
+    """The loop/edge index arrays of one mesh (read with ``foreach_get``)."""
+
+    def __init__(self, mesh):
+        n_loops, n_faces = len(mesh.loops), len(mesh.polygons)
+        self.loop_verts = np.empty(n_loops, dtype=np.int32)
+        self.loop_edges = np.empty(n_loops, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", self.loop_verts)
+        mesh.loops.foreach_get("edge_index", self.loop_edges)
+        starts = np.empty(n_faces, dtype=np.int32)
+        totals = np.empty(n_faces, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", starts)
+        mesh.polygons.foreach_get("loop_total", totals)
+        self.loop_faces = np.empty(n_loops, dtype=np.int32)
+        self.loop_faces[_spans(starts, totals)] = np.repeat(
+            np.arange(n_faces, dtype=np.int32), totals
+        )
+        self.edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", self.edge_verts)
+        self.edge_verts = self.edge_verts.reshape(-1, 2)
+
+
+def _spans(starts, totals):
+    """Concatenated ``range(start, start + total)`` per face, without a Python loop."""
+    if not len(totals):
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(totals) + totals, totals)
+    return offsets + np.arange(totals.sum())
+
+
+class SelectionMask:
+    """Bool arrays ``verts``, ``edges``, ``faces`` — one mesh's select flags.
+
+    Parameters:
+        mesh: The ``bpy.types.Mesh`` the arrays index (topology is read from it on demand).
+        verts, edges, faces (numpy.ndarray): Bool masks, one entry per element.
+    """
+
+    #: ``(attribute, mesh collection)`` per mask.
+    DOMAINS = (("verts", "vertices"), ("edges", "edges"), ("faces", "polygons"))
+
+    def __init__(self, mesh, verts, edges, faces, topology=None):
+        self.mesh = mesh
+        self.verts, self.edges, self.faces = verts, edges, faces
+        self._topology = topology
+
+    # ------------------------------------------------------------------ build
+    @classmethod
+    def capture(cls, obj, sync=True):
+        """The current select flags of *obj* (a mesh object; Edit Mode included).
+
+        Parameters:
+            sync (bool): Copy an Edit-Mode *obj*'s edit-mesh into its data first. Pass
+                False when the caller already did (or wants the data as it stands).
+        """
+        if sync and obj.mode == "EDIT":
+            obj.update_from_editmode()
+        mesh = obj.data
+        masks = []
+        for _attr, collection in cls.DOMAINS:
+            items = getattr(mesh, collection)
+            mask = np.empty(len(items), dtype=bool)
+            items.foreach_get("select", mask)
+            masks.append(mask)
+        return cls(mesh, *masks)
+
+    @classmethod
+    def empty(cls, obj):
+        """Nothing selected — same shape as *obj*'s mesh."""
+        mesh = obj.data
+        return cls(
+            mesh,
+            *(np.zeros(len(getattr(mesh, c)), dtype=bool) for _a, c in cls.DOMAINS),
+        )
+
+    @classmethod
+    def from_faces(cls, obj, indices):
+        """Faces *indices* with their verts and edges — ``select_set(True)`` on each face."""
+        mask = cls.empty(obj)
+        mask.faces[np.asarray(indices, dtype=np.int64)] = True
+        return mask.flushed()
+
+    @classmethod
+    def from_edges(cls, obj, indices):
+        """Edges *indices* with their verts, and every face all of whose edges are among
+        them — an Edge-mode ``select_set`` on each edge, then ``select_flush_mode``.
+        """
+        mask = cls.empty(obj)
+        mask.edges[np.asarray(indices, dtype=np.int64)] = True
+        topo = mask.topology()
+        mask.verts[topo.edge_verts[mask.edges].ravel()] = True
+        unselected = np.bincount(
+            topo.loop_faces,
+            weights=~mask.edges[topo.loop_edges],
+            minlength=len(mask.faces),
+        )
+        mask.faces = unselected == 0
+        return mask
+
+    # ------------------------------------------------------------------ apply
+    def apply(self, obj):
+        """Write the masks to *obj*'s select flags (replacing them)."""
+        edit = obj.mode == "EDIT"
+        if edit:  # the data must match the edit-mesh's topology before it is reloaded
+            obj.update_from_editmode()
+        mesh = obj.data
+        for attr, collection in self.DOMAINS:
+            getattr(mesh, collection).foreach_set("select", getattr(self, attr))
+        mesh.update()
+        if edit:
+            import bmesh
+
+            bm = bmesh.from_edit_mesh(mesh)
+            history = self._history(bm)
+            bm.clear()
+            bm.from_mesh(mesh)
+            for attr in {attr for attr, _index in history}:
+                getattr(bm, attr).ensure_lookup_table()
+            for attr, index in history:
+                if getattr(self, attr)[index]:  # still selected: keep its place
+                    bm.select_history.add(getattr(bm, attr)[index])
+            bmesh.update_edit_mesh(mesh)
+
+    @staticmethod
+    def _history(bm):
+        """``bm.select_history`` as ``(mask attribute, index)`` pairs, oldest first."""
+        import bmesh
+
+        kinds = (
+            (bmesh.types.BMVert, "verts"),
+            (bmesh.types.BMEdge, "edges"),
+            (bmesh.types.BMFace, "faces"),
+        )
+        elements = list(bm.select_history)
+        attrs = [next(a for kind, a in kinds if isinstance(e, kind)) for e in elements]
+        for attr in set(attrs):
+            getattr(bm, attr).index_update()
+        return [(attr, e.index) for attr, e in zip(attrs, elements)]
+
+    # ------------------------------------------------------------------ algebra
+    def _combine(self, other, op):
+        return SelectionMask(
+            self.mesh,
+            *(op(getattr(self, a), getattr(other, a)) for a, _c in self.DOMAINS),
+            topology=self._topology or other._topology,
+        )
+
+    def __or__(self, other):
+        return self._combine(other, np.logical_or)
+
+    def __and__(self, other):
+        return self._combine(other, np.logical_and)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def topology(self):
+        if self._topology is None:
+            self._topology = _Topology(self.mesh)
+        return self._topology
+
+    def flushed(self):
+        """Selected faces also select their verts and edges (``select_set`` semantics)."""
+        topo = self.topology()
+        loops = self.faces[topo.loop_faces]
+        verts, edges = self.verts.copy(), self.edges.copy()
+        verts[topo.loop_verts[loops]] = True
+        edges[topo.loop_edges[loops]] = True
+        return SelectionMask(self.mesh, verts, edges, self.faces.copy(), topo)
+
+    def grown(self, steps=1):
+        """*Select More*: add every face sharing a vertex with the selection, *steps* times."""
+        topo = self.topology()
+        mask = self.flushed()
+        for _ in range(steps):
+            touched = np.bincount(
+                topo.loop_faces,
+                weights=mask.verts[topo.loop_verts],
+                minlength=len(mask.faces),
+            )
+            mask.faces |= touched > 0
+            mask = mask.flushed()
+        return mask
+
+    # ------------------------------------------------------------------ queries
+    def face_indices(self):
+        return np.flatnonzero(self.faces)
+
+    def counts(self):
+        """``(verts, edges, faces)`` selected."""
+        return tuple(int(getattr(self, a).sum()) for a, _c in self.DOMAINS)
+
+    def __bool__(self):
+        return bool(self.verts.any() or self.edges.any() or self.faces.any())
+
+    def __repr__(self):
+        v, e, f = self.counts()
+        return f"<SelectionMask {self.mesh.name!r}: {v}v {e}e {f}f>"
@@ -9,12 +9,261 @@ new module per feature — see the convention in ``tentacle/CLAUDE.md``.
 Currently: the header Package menu (Update / Reload entries), the ecosystem-wide
 in-app updater, the uitk editor launchers, and the marking-menu binding combos.
 Only ``tb001`` (Reload Scripts) and the pip interpreter stay DCC-specific.
+
+The updater's CHECK never runs on the Qt thread. It is a ``pip list`` subprocess against
+the DCC's interpreter plus one index round trip per distribution — seconds behind a slow
+proxy — so it runs on a daemon worker and its ``{dist: latest}`` answer is cached on
+disk per interpreter (:class:`_UpdateCheck`). One answer serves every reader: the HUD's
+"New release available" line and the Update Package button, every panel in this
+process (one in-flight check per interpreter) and every DCC session on the machine (a
+lock file makes a second process wait for the first one's result instead of asking the
+index again).
 """
+import hashlib
 import html
+import json
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pythontk as ptk
 
 
+class _UpdateCheck:
+    """The ecosystem update check: background, disk-cached, one per interpreter.
+
+    A result is a plain dict — ``{"checked_at", "installed", "latest", "dists",
+    "error"}`` — written as JSON to ``Tcl.cache_dir("updates")/<interpreter hash>.json``
+    (the installed half differs per interpreter, so mayapy and Blender's python never
+    share a file). Readers state how old an answer they accept (``max_age``): the HUD takes
+    :attr:`TTL`, an explicit Update click a few minutes, so both read the same file.
+
+    Failures are cached too, for :attr:`FAILURE_TTL` only: an unreachable index must
+    not be re-asked by every panel that opens, but nor should one bad minute hide a
+    release for hours.
+    """
+
+    #: Seconds a successful answer stays fresh for passive readers (the HUD).
+    TTL = 6 * 3600
+    #: Seconds a failed check is remembered before the index is asked again.
+    FAILURE_TTL = 15 * 60
+    #: Env var naming a PyPI-layout JSON index to ask instead of pypi.org — a URL
+    #: template with ``{dist}`` (``http://127.0.0.1:8000/pypi/{dist}/json``), which is
+    #: how a mirror or a local stand-in index is pointed at.
+    INDEX_ENV = "TENTACLE_UPDATE_INDEX"
+    #: Per-request index timeout (s) — same budget as ``ptk.PackageManager``.
+    INDEX_TIMEOUT = ptk.PackageManager.INDEX_TIMEOUT
+    #: A lock older than this (s) belongs to a process that died mid-check.
+    LOCK_STALE = 120
+    #: How often (s) a process waiting on another's lock re-reads the cache.
+    LOCK_POLL = 0.25
+
+    _guard = threading.Lock()
+    #: ``{python_path: Future}`` — the in-flight or last-finished check per interpreter.
+    _futures = {}
+
+    # ------------------------------------------------------------------ cache
+    @classmethod
+    def cache_path(cls, python_path) -> str:
+        from tentacle import Tcl
+
+        key = hashlib.sha1(os.path.normcase(str(python_path)).encode("utf-8"))
+        return os.path.join(Tcl.cache_dir("updates"), key.hexdigest()[:16] + ".json")
+
+    @classmethod
+    def is_fresh(cls, result, max_age=None) -> bool:
+        """True when *result* is young enough for a reader accepting *max_age* (s)."""
+        if not result:
+            return False
+        ttl = cls.FAILURE_TTL if result.get("error") else cls.TTL
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+        return time.time() - result.get("checked_at", 0) < ttl
+
+    @classmethod
+    def read(cls, python_path, max_age=None):
+        """The cached result for *python_path*, or ``None`` when absent or stale."""
+        try:
+            with open(cls.cache_path(python_path), "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return result if cls.is_fresh(result, max_age) else None
+
+    @classmethod
+    def write(cls, python_path, result) -> None:
+        """Write *result* atomically, so a concurrent reader never sees half a file."""
+        path = cls.cache_path(python_path)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def invalidate(cls, python_path) -> None:
+        """Forget the answer for *python_path* (after an upgrade changed what's installed)."""
+        with cls._guard:
+            cls._futures.pop(python_path, None)
+        try:
+            os.remove(cls.cache_path(python_path))
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------ check
+    @classmethod
+    def submit(cls, python_path, max_age=None, dists_for=None) -> Future:
+        """The check for *python_path* as a future — shared, never duplicated.
+
+        Returns the in-flight check when one is running, a finished future when this
+        process or the disk already holds an answer young enough, and only otherwise
+        starts a worker.
+        """
+        with cls._guard:
+            future = cls._futures.get(python_path)
+            if future is not None:
+                if not future.done():
+                    return future
+                if future.exception() is None and cls.is_fresh(
+                    future.result(), max_age
+                ):
+                    return future
+
+            future = Future()
+            cached = cls.read(python_path, max_age)
+            if cached is not None:
+                future.set_result(cached)
+            else:
+                # A daemon thread, not an executor: a check stuck on a dead proxy
+                # must not hold the DCC open at exit (executors join their workers).
+                threading.Thread(
+                    target=cls._work,
+                    args=(future, python_path, max_age, dists_for),
+                    name="tentacle-update-check",
+                    daemon=True,
+                ).start()
+            cls._futures[python_path] = future
+            return future
+
+    @classmethod
+    def _work(cls, future, python_path, max_age, dists_for) -> None:
+        try:
+            future.set_result(cls._locked_check(python_path, max_age, dists_for))
+        except Exception as error:  # delivered to the reader through the future
+            future.set_exception(error)
+
+    @classmethod
+    def _locked_check(cls, python_path, max_age, dists_for):
+        """Run the check under the cross-process lock, or adopt the holder's answer."""
+        lock = cls.cache_path(python_path) + ".lock"
+        deadline = time.time() + cls.LOCK_STALE
+        while True:
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock) > cls.LOCK_STALE:
+                        os.remove(lock)  # its owner died mid-check
+                        continue
+                except OSError:
+                    continue  # released between the two calls — try again
+                result = cls.read(python_path, max_age)
+                if result is not None:
+                    return result  # the other process finished: adopt its answer
+                if time.time() > deadline:
+                    break  # give up waiting and ask the index ourselves
+                time.sleep(cls.LOCK_POLL)
+                continue
+            os.close(fd)
+            try:
+                # Another process may have written while we queued for the lock.
+                result = cls.read(python_path, max_age)
+                if result is None:
+                    result = cls.check(python_path, dists_for)
+                    cls.write(python_path, result)
+                return result
+            finally:
+                try:
+                    os.remove(lock)
+                except OSError:
+                    pass
+        result = cls.check(python_path, dists_for)
+        cls.write(python_path, result)
+        return result
+
+    @classmethod
+    def check(cls, python_path, dists_for=None):
+        """Ask pip and the index — the blocking part. Never call on the Qt thread.
+
+        Parameters:
+            python_path (str): The interpreter whose environment is checked.
+            dists_for (callable): ``installed -> dists``; defaults to
+                    :meth:`SettingsMixin.ecosystem_dists`.
+        """
+        pkg_mgr = ptk.PackageManager(python_path=python_path)
+        installed = pkg_mgr.list_packages()
+        dists = list((dists_for or SettingsMixin.ecosystem_dists)(installed))
+        index = os.environ.get(cls.INDEX_ENV)
+        if index:
+            latest = cls.latest_versions(index, dists)
+        else:
+            # Concurrent, and failure-isolating: an unreachable lookup maps to None.
+            latest = pkg_mgr.latest_versions(dists)
+        # If NONE of them resolved the check itself failed, and the result must say
+        # so instead of quietly claiming everything is current.
+        error = None if any(latest.values()) else "could not reach the package index"
+        return {
+            "checked_at": time.time(),
+            "installed": installed,
+            "latest": latest,
+            "dists": dists,
+            "error": error,
+        }
+
+    @classmethod
+    def latest_versions(cls, index, dists):
+        """``{dist: latest_or_None}`` from a PyPI-layout JSON *index* URL template.
+
+        ``ptk.PackageManager`` only knows pypi.org; this is the same concurrent,
+        failure-isolating lookup against the index :attr:`INDEX_ENV` names (a
+        mirror, or a local stand-in when testing).
+        """
+
+        def _one(dist):
+            try:
+                with urllib.request.urlopen(
+                    index.format(dist=dist), timeout=cls.INDEX_TIMEOUT
+                ) as response:
+                    return json.loads(response.read().decode())["info"]["version"]
+            except Exception:  # unknown, never "outdated"
+                return None
+
+        if not dists:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(dists))) as pool:
+            return dict(zip(dists, pool.map(_one, dists)))
+
+    @staticmethod
+    def outdated(result):
+        """``[(dist, installed, latest), ...]`` for every dist the index has newer.
+
+        An unknown latest (``None``) is skipped, never reported: comparing against it
+        would read a failed lookup as an available update.
+        """
+        installed_all = result.get("installed") or {}
+        latest_all = result.get("latest") or {}
+        rows = []
+        for dist in result.get("dists") or latest_all:
+            latest = latest_all.get(dist)
+            if not latest:
+                continue
+            installed = installed_all.get(dist)
+            if installed != latest:
+                rows.append((dist, installed or "not installed", latest))
+        return rows
+
+
 class SettingsMixin:
     """DCC-agnostic ``settings`` slot behavior.
 
@@ -95,36 +344,64 @@ class SettingsMixin:
                 setToolTip="Reload Tentacle and its dependencies in the current session.",
             )
 
+    #: Seconds an answer may be old when the user explicitly asks (Update Package).
+    #: Short — a click means "now" — but long enough that a click right after the
+    #: HUD's launch check reuses it instead of asking the index twice.
+    UPDATE_CLICK_MAX_AGE = 5 * 60
+
+    @staticmethod
+    def start_update_check(python_path, max_age=None, dists_for=None):
+        """The shared ecosystem update check for *python_path*, as a future.
+
+        Static so a panel that must not mix this class in (the HUD — it would bind
+        this panel's ``tb000`` to its own widgets) can still share the one answer:
+        ``SettingsMixin.start_update_check(path)``. Never blocks; see
+        :class:`_UpdateCheck` for the cache and dedup rules.
+
+        Parameters:
+            python_path (str): The interpreter whose environment is checked.
+            max_age (float): Oldest answer (s) the caller accepts. Defaults to
+                    ``_UpdateCheck.TTL``.
+            dists_for (callable): ``installed -> dists``; defaults to
+                    :meth:`ecosystem_dists`.
+
+        Returns:
+            (Future): Resolves to ``{"checked_at", "installed", "latest", "dists",
+                    "error"}``; see :meth:`outdated_dists`.
+        """
+        return _UpdateCheck.submit(python_path, max_age, dists_for)
+
+    @staticmethod
+    def outdated_dists(result):
+        """``[(dist, installed, latest), ...]`` from a check result (see above)."""
+        return _UpdateCheck.outdated(result)
+
     def tb000(self):
         """Update Package"""
         self.check_for_update()
 
     def check_for_update(self):
-        """Check the whole ecosystem for updates and upgrade what's outdated."""
-        pkg_mgr = ptk.PackageManager(python_path=self._update_python_path())
+        """Check the whole ecosystem for updates and upgrade what's outdated.
+
+        Returns immediately: the check runs in the background (or is answered from
+        the shared cache) and :meth:`_report_update` takes over on the UI thread.
+        """
+        python_path = self._update_python_path()
+        future = self.start_update_check(
+            python_path, self.UPDATE_CLICK_MAX_AGE, self.ecosystem_dists
+        )
+        self.deliver(future, lambda f: self._report_update(f, python_path))
+
+    def _report_update(self, future, python_path):
+        """Present a finished check: up to date, or offer the upgrade."""
         try:
-            installed_all = pkg_mgr.list_packages()  # one pip call for every version
-            # Concurrent, and failure-isolating: a lookup that could not reach
-            # the index comes back None. Comparing against None would read as
-            # "outdated", so an unknown is skipped rather than reported — but if
-            # NONE of them resolved, the check itself failed and must say so
-            # instead of quietly claiming everything is current.
-            dists = self.ecosystem_dists(installed_all)
-            latest_all = pkg_mgr.latest_versions(dists)
-            if not any(latest_all.values()):
-                raise RuntimeError("could not reach the package index")
-
-            outdated = []
-            for dist in dists:
-                latest = latest_all.get(dist)
-                if not latest:
-                    continue
-                installed = installed_all.get(dist)
-                if installed != latest:
-                    outdated.append((dist, installed or "not installed", latest))
+            result = future.result()
+            if result.get("error"):
+                raise RuntimeError(result["error"])
 
+            outdated = self.outdated_dists(result)
             if not outdated:
-                this_ver = installed_all.get("tentacletk", "")
+                this_ver = (result.get("installed") or {}).get("tentacletk", "")
                 self.sb.message_box(
                     f"<b><hl>{this_ver}</hl> is already the latest version.</b>"
                 )
@@ -144,7 +421,10 @@ class SettingsMixin:
                 return
 
             # One resolver run for the whole set (update() splits on whitespace).
+            pkg_mgr = ptk.PackageManager(python_path=python_path)
             pkg_mgr.update(" ".join(dist for dist, _installed, _latest in outdated))
+            # What is installed just changed — the cached answer now lies.
+            _UpdateCheck.invalidate(python_path)
             self.sb.message_box(
                 "<b>Update <hl>complete</hl>.</b><br>"
                 "<small>Run Reload Scripts (or restart) to apply.</small>"
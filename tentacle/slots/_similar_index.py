@@ -0,0 +1,220 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic descriptor index for Select Similar.
+
+Select Similar measured every polygon mesh in the scene on every click — a handful of
+``polyEvaluate`` calls (or bmesh passes) per mesh — then compared each one against the
+reference in Python, and changing the tolerance meant clicking again to redo all of it.
+A mesh's metrics only change when the mesh or its transform does.
+
+:class:`SimilarIndex` is one process-wide table per engine:
+
+* per mesh, a descriptor vector — the counts, the local / world area and the
+  bounding-box dimensions (:attr:`SimilarIndex.METRICS`) — measured in one batch for the
+  meshes whose *signature* moved (:meth:`SimilarIndex._signatures`) or that
+  :meth:`touch` marked edited;
+* :meth:`SimilarIndex.snapshot` stacks the vectors of the candidate meshes into one
+  NumPy array; :meth:`SimilarSnapshot.match` narrows each reference to a window of a
+  sorted column (``searchsorted``) and tests only that window, vectorized. A snapshot
+  is cheap to query again, which is what lets the option box re-select live as the
+  tolerance or the metrics change.
+
+Forks subclass it with the hooks and hand out :meth:`SimilarIndex.instance`.
+"""
+import numpy as np
+
+from tentacle import RowCache
+
+
+class SimilarSnapshot:
+    """Descriptor rows of a fixed list of meshes, queried by :meth:`match`."""
+
+    def __init__(self, meshes, matrix, columns, eps, key):
+        self.meshes = meshes
+        self.matrix = matrix
+        self._columns = columns  # metric -> slice into a row
+        self._eps = eps  # metric -> relative floor
+        self._sorted = {}  # column -> (argsort order, sorted values)
+        self._key = key  # the index's mesh identity
+        self._rows = {}  # key -> first row
+        for row, mesh in enumerate(meshes):
+            self._rows.setdefault(key(mesh), row)
+
+    def index(self, mesh):
+        """Row of *mesh* in the snapshot, or None."""
+        return self._rows.get(self._key(mesh))
+
+    def match(self, references, metrics=None, tolerance=0.0):
+        """Rows similar to any of the *references* rows on every one of *metrics*.
+
+        Two rows are similar on a metric when every value differs by at most
+        *tolerance* — or, for a metric with an :attr:`SimilarIndex.EPS` floor, by at
+        most that fraction of the larger magnitude. *metrics* defaults to
+        :attr:`SimilarIndex.DEFAULT`. The references themselves are left out; rows come
+        back in snapshot order.
+        """
+        metrics = [m for m in SimilarIndex.METRICS if m in (metrics or ())]
+        metrics = metrics or list(SimilarIndex.DEFAULT)
+        references = sorted(set(references))
+        if not references:
+            return []
+        hit = np.zeros(len(self.meshes), dtype=bool)
+        # The window column: an exact count when one is compared — the narrowest.
+        lead = next((m for m in metrics if m in SimilarIndex.INTEGER), metrics[0])
+        column = self._columns[lead].start
+        order, values = self._sorted_column(column)
+        lead_eps = self._eps.get(lead, 0.0)
+        for ref in references:
+            row = self.matrix[ref]
+            value = row[column]
+            half = max(tolerance, lead_eps * abs(value) / (1.0 - lead_eps))
+            lo = np.searchsorted(values, value - half, side="left")
+            hi = np.searchsorted(values, value + half, side="right")
+            rows = order[lo:hi]
+            ok = np.ones(len(rows), dtype=bool)
+            for metric in metrics:
+                cols = self._columns[metric]
+                a = row[cols]
+                b = self.matrix[rows, cols]
+                limit = tolerance
+                eps = self._eps.get(metric)
+                if eps:
+                    magnitude = np.maximum(np.abs(a).max(), np.abs(b).max(axis=1))
+                    limit = np.maximum(tolerance, eps * magnitude)
+                ok &= np.abs(b - a).max(axis=1) <= limit
+            hit[rows[ok]] = True
+        hit[references] = False
+        return np.flatnonzero(hit).tolist()
+
+    def _sorted_column(self, column):
+        cached = self._sorted.get(column)
+        if cached is None:
+            values = self.matrix[:, column]
+            order = np.argsort(values, kind="stable")
+            cached = self._sorted[column] = (order, values[order])
+        return cached
+
+
+class SimilarIndex(RowCache):
+    """Per-mesh descriptor vectors keyed on a signature and a dirty counter.
+
+    Subclasses provide :meth:`_signatures` and :meth:`_measure`; :meth:`_key` when the
+    engine's mesh handles are not hashable or not stable across calls.
+    """
+
+    #: Compared metrics (Maya's ``polyEvaluate`` names): the ``vertex`` … ``uvcoord``
+    #: counts; ``area`` / ``worldArea`` — face area in object / world space;
+    #: ``boundingBox`` — the bounding-box size along the object's own axes, scaled to world.
+    METRICS = (
+        "vertex",
+        "edge",
+        "face",
+        "triangle",
+        "shell",
+        "uvcoord",
+        "area",
+        "worldArea",
+        "boundingBox",
+    )
+
+    #: Values per metric where it is not one.
+    WIDTHS = {"boundingBox": 3}
+
+    #: Count metrics — compared with the tolerance verbatim.
+    INTEGER = frozenset(("vertex", "edge", "face", "triangle", "shell", "uvcoord"))
+
+    #: Metrics compared when none is chosen (``mtk.get_similar_mesh``'s default set).
+    DEFAULT = ("vertex", "edge", "face", "uvcoord", "triangle", "shell", "area", "worldArea")
+
+    #: ``{metric: relative floor}`` under the tolerance, for float metrics an engine
+    #: computes with round-off (none by default).
+    EPS = {}
+
+    def __init__(self):
+        super().__init__()
+        self.measured = 0  # mesh measurements run so far — for tests and the bench
+        self._columns = {}
+        start = 0
+        for metric in self.METRICS:
+            width = self.WIDTHS.get(metric, 1)
+            self._columns[metric] = slice(start, start + width)
+            start += width
+        self.width = start
+
+    # ------------------------------------------------------------------ hooks
+    def _measure(self, meshes):
+        """``{metric: value}`` of every metric for each of *meshes*, one dict per mesh.
+
+        A value is a number, or :attr:`WIDTHS` numbers; a missing metric never matches.
+        """
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------ values
+    @staticmethod
+    def count_shells(vertex_count, edges):
+        """Connected vertex components of a mesh with ``(n, 2)`` vertex-index *edges*."""
+        labels = np.arange(vertex_count)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if not len(edges):
+            return int(vertex_count)
+        a, b = edges[:, 0], edges[:, 1]
+        while True:
+            low = np.minimum(labels[a], labels[b])
+            merged = labels.copy()
+            np.minimum.at(merged, a, low)
+            np.minimum.at(merged, b, low)
+            merged = merged[merged]  # pointer jumping: follow each label to its root
+            if np.array_equal(merged, labels):
+                return int(np.count_nonzero(labels == np.arange(vertex_count)))
+            labels = merged
+
+    @staticmethod
+    def fan_area(points, corners, starts, totals):
+        """Summed area of polygons given as loops: ``corners`` — the vertex index of each
+        loop — with each polygon's first loop (``starts``) and loop count (``totals``).
+        Each polygon is fanned from its first corner.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        corners = np.asarray(corners, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        totals = np.asarray(totals, dtype=np.int64)
+        if not len(corners):
+            return 0.0
+        polygon = np.repeat(np.arange(len(starts)), totals)
+        offset = np.arange(len(corners)) - starts[polygon]
+        fan = np.flatnonzero((offset >= 1) & (offset <= totals[polygon] - 2))
+        a = points[corners[starts[polygon[fan]]]]
+        b = points[corners[fan]]
+        c = points[corners[fan + 1]]
+        return float(0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1).sum())
+
+    # ------------------------------------------------------------------ queries
+    def descriptors(self, meshes):
+        """``(len(meshes), width)`` array of descriptor rows, in *meshes* order."""
+        meshes = list(meshes)
+        if not meshes:
+            return np.zeros((0, self.width))
+        keys, stale = self._refresh(
+            meshes, lambda ms: [self._vector(values) for values in self._measure(ms)]
+        )
+        self.measured += len(stale)
+        return np.vstack([self._value(key) for key in keys])
+
+    def snapshot(self, meshes):
+        """A :class:`SimilarSnapshot` over *meshes* — measures only what moved."""
+        meshes = list(meshes)
+        return SimilarSnapshot(
+            meshes, self.descriptors(meshes), self._columns, self.EPS, self._key
+        )
+
+    # ------------------------------------------------------------------ internals
+    def _vector(self, values):
+        row = np.full(self.width, np.nan)
+        for metric, cols in self._columns.items():
+            value = values.get(metric)
+            if value is None:
+                continue
+            value = np.ravel(np.asarray(value, dtype=np.float64))
+            if len(value) == cols.stop - cols.start:
+                row[cols] = value
+        return row
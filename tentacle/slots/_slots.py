@@ -1,9 +1,133 @@
 # !/usr/bin/python
 # coding=utf-8
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pythontk as ptk
 from qtpy import QtCore
 from uitk import Signals, Cancelable
 
 
+class SlotJob:
+    """Handle a :meth:`Slots.run_job` worker uses to report back and reach the DCC.
+
+    The worker owns the pure-Python and file-I/O parts of a long slot (conversion,
+    report formatting, a file scan); everything that touches the DCC API or a widget
+    goes through :meth:`on_main` / :meth:`map_on_main`, which queue the call for the
+    slot's UI-thread timer and block until it has run. Progress is recorded, not
+    painted: the timer pushes the latest state to the footer on its next tick.
+
+    Cancellation is cooperative and shared with the footer: :attr:`scope` is the
+    scope the footer's progress bar reports into, so Esc-hold or the footer's stop
+    button cancels it, and the worker's next :meth:`check` (or queued main-thread
+    call) raises :class:`pythontk.OperationCancelled`.
+
+    Parameters:
+        name (str): Label for the footer, the log and any error dialog.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.scope = ptk.CancelScope(name)
+        self.future = None  # the worker's concurrent.futures.Future, once submitted
+        self._calls = queue.SimpleQueue()
+        self._state = None  # latest (value, total, text) not yet painted
+        self._state_lock = threading.Lock()
+        self._main = threading.get_ident()
+
+    def __call__(self, value=None, total=None, text=None):
+        """Alias of :meth:`progress`, so a job passes wherever a ``tick`` is expected."""
+        return self.progress(value, total, text)
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancellation was requested. A flag read, safe from any thread."""
+        return self.scope.cancelled
+
+    def cancel(self, reason="cancelled"):
+        """Request cancellation (thread-safe, idempotent)."""
+        self.scope.cancel(reason)
+
+    def check(self):
+        """Raise :class:`pythontk.OperationCancelled` if cancellation was requested."""
+        if self.scope.cancelled:
+            raise ptk.OperationCancelled(
+                f"'{self.name}' cancelled", scope=self.scope, reason=self.scope.reason
+            )
+
+    def progress(self, value=None, total=None, text=None) -> bool:
+        """Record progress for the footer; returns False once cancelled.
+
+        The ``(current, total, message)`` shape of the mayatk / pythontk progress
+        callbacks, so a job can be handed to them directly. Omitted fields keep
+        their last value.
+        """
+        with self._state_lock:
+            last = self._state or (None, None, None)
+            self._state = (
+                last[0] if value is None else value,
+                last[1] if total is None else total,
+                last[2] if text is None else text,
+            )
+        return not self.scope.cancelled
+
+    def on_main(self, fn, *args, **kwargs):
+        """Run ``fn(*args, **kwargs)`` on the UI thread and return its result.
+
+        Blocks the worker until the slot's timer has run the call; its exception
+        re-raises here. Called from the UI thread itself, *fn* simply runs.
+        """
+        if threading.get_ident() == self._main:
+            return fn(*args, **kwargs)
+        self.check()
+        future = Future()
+        self._calls.put((fn, args, kwargs, future))
+        return future.result()
+
+    def map_on_main(self, fn, items, batch=64):
+        """``[fn(item) for item in items]`` on the UI thread, *batch* calls per hop.
+
+        One round trip per item would spend the timer's ticks on scheduling; one
+        for the whole list would freeze the UI for all of it. Cancellation is
+        checked between batches.
+        """
+        items = list(items)
+        results = []
+        for start in range(0, len(items), batch):
+            chunk = items[start : start + batch]
+            results.extend(self.on_main(lambda chunk=chunk: [fn(i) for i in chunk]))
+        return results
+
+    # ------------------------------------------------------------------ UI thread
+    def _take_state(self):
+        with self._state_lock:
+            state, self._state = self._state, None
+        return state
+
+    def _drain(self, budget_ms):
+        """Run queued main-thread calls for up to *budget_ms*; fail them once cancelled."""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while True:
+            try:
+                fn, args, kwargs, future = self._calls.get_nowait()
+            except queue.Empty:
+                return
+            if self.scope.cancelled:
+                try:
+                    self.check()
+                except ptk.OperationCancelled as error:
+                    future.set_exception(error)
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as error:  # noqa: BLE001 - re-raised on the worker
+                future.set_exception(error)
+            if time.perf_counter() >= deadline:
+                return
+
+
 class Slots(QtCore.QObject):
     """Provides methods that can be triggered by widgets in the ui.
     Parent to the 'Init' slot class, which is in turn, inherited by every other slot class.
@@ -41,6 +165,8 @@ class Slots(QtCore.QObject):
     def __init__(self, switchboard):
         super().__init__()
         self.sb = switchboard
+        self._jobs = {}  # run_job key -> (SlotJob, footer, stop button, done)
+        self._job_timer = None
 
         # Repeat-last is the unified uitk ``repeat_last_command`` command now —
         # registered by the Switchboard and bound ONCE to an always-visible host.
@@ -209,6 +335,215 @@ class Slots(QtCore.QObject):
                 self.sb.logger.debug(f"[recheck_app_gates] {spec}: {error}")
         return self.sb.recheck_gates()
 
+    def deliver(self, future, callback, interval: int = 100) -> None:
+        """Call ``callback(future)`` on the UI thread once *future* is done.
+
+        The hand-back half of any work a slot pushes off the Qt thread: the worker
+        only ever completes a ``concurrent.futures.Future``, and the callback — which
+        may touch widgets and open message boxes — runs from a QTimer owned by this
+        slot, so it is always on the thread the slot lives on. Polled rather than
+        signalled: a done-callback fires on the WORKER thread, and a queued signal
+        would need a QObject defined at class-body time for every caller. A future
+        already done is delivered synchronously.
+
+        Parameters:
+            future (concurrent.futures.Future): The background result.
+            callback (callable): Receives the finished future (call ``.result()``
+                inside it; a worker exception re-raises there).
+            interval (int): Poll period in ms.
+        """
+        if future.done():
+            callback(future)
+            return
+        timer = QtCore.QTimer(self)
+        timer.setInterval(interval)
+
+        def poll():
+            if not future.done():
+                return
+            timer.stop()
+            timer.deleteLater()
+            callback(future)
+
+        timer.timeout.connect(poll)
+        timer.start()
+
+    #: Worker threads shared by every slot's :meth:`run_job`. Created on first use.
+    JOB_WORKERS = 2
+    #: Per timer tick, the most UI-thread time spent on a job's queued calls (ms).
+    JOB_BUDGET_MS = 20
+    _job_pool = None
+    _job_pool_lock = threading.Lock()
+
+    def run_job(self, work, *args, name="", text="", done=None, key=None, ui=None, **kwargs):
+        """Run ``work(job, *args, **kwargs)`` on a worker thread; the UI stays live.
+
+        For the long tail of a slot — the conversion, the report formatting, the file
+        scan — that otherwise holds the Qt thread under ``sb.progress``. *work* gets a
+        :class:`SlotJob`: it reports progress through it, checks it for cancellation,
+        and routes every DCC-API or widget call through ``job.on_main`` /
+        ``job.map_on_main``. Those calls run from a QTimer owned by this slot, a
+        bounded batch per tick (:attr:`JOB_BUDGET_MS`), so the DCC stays usable while
+        the worker waits on them.
+
+        The footer of *ui* (default: the active UI) shows the job's progress and a
+        stop button; Esc-hold on the bar cancels too. On success ``done(result)`` runs
+        on the UI thread. A cancelled job ends quietly ("Cancelled" in the footer); a
+        failed one is logged and reported as "<name> failed". While a job with the
+        same *key* is still running, a second one is refused.
+
+        Parameters:
+            work (callable): ``work(job, *args, **kwargs)``; its return value is the result.
+            name (str): Label for the log and dialogs. Defaults to *work*'s name.
+            text (str): Initial footer status text.
+            done (callable, optional): Receives the result, on the UI thread.
+            key (str, optional): One running job per key per slot. Defaults to *name*.
+            ui (QWidget, optional): UI whose footer shows progress.
+
+        Returns:
+            SlotJob: The running job, or None when *key* is already running.
+        """
+        name = name or getattr(work, "__name__", "Job")
+        key = key or name
+        if key in self._jobs:
+            self.sb.message_box(f"<hl>{name}</hl> is already running.")
+            return None
+
+        job = SlotJob(name)
+        ui = ui or getattr(self.sb, "active_ui", None) or getattr(self.sb, "current_ui", None)
+        footer = getattr(ui, "footer", None)
+        button = None
+        if footer is not None and hasattr(footer, "start_progress"):
+            # Started under the job's scope: the bar adopts the ambient scope, so its
+            # Esc-hold cancels this job rather than a scope of its own.
+            with job.scope.activate():
+                footer.start_progress(text=text or f"{name}…")
+            button = footer.add_action_button(
+                icon_name="stop",
+                tooltip=f"Cancel {name}",
+                callback=lambda *_: job.cancel("footer"),
+            )
+        else:
+            footer = None
+
+        with Slots._job_pool_lock:
+            if Slots._job_pool is None:
+                Slots._job_pool = ThreadPoolExecutor(
+                    max_workers=self.JOB_WORKERS, thread_name_prefix="tentacle-job"
+                )
+        self._jobs[key] = (job, footer, button, done)
+        job.future = Slots._job_pool.submit(work, job, *args, **kwargs)
+        # One timer per slot pumps all of its jobs and stops when none are left. It
+        # is never deleteLater()'d: a deferred delete still pending when the slot
+        # itself goes away frees the timer twice.
+        if self._job_timer is None:
+            self._job_timer = QtCore.QTimer(self)
+            self._job_timer.setInterval(15)
+            self._job_timer.timeout.connect(self._pump_jobs)
+        self._job_timer.start()
+        return job
+
+    def _pump_jobs(self):
+        """One UI-thread tick for every running job: paint, run its calls, finish it."""
+        for key, (job, footer, button, done) in list(self._jobs.items()):
+            state = job._take_state()
+            if state is not None and footer is not None:
+                value, total, status = state
+                if total:
+                    footer.set_progress_total(total)
+                bar = footer.progress_bar
+                if value is not None and bar.maximum() > 0:
+                    bar.setValue(min(value, bar.maximum()))
+                if status and status != footer.statusText():
+                    footer.setStatusText(status)
+                    continue  # let the new status paint before any blocking main call
+            job._drain(self.JOB_BUDGET_MS)
+            if job.future.done():
+                del self._jobs[key]
+                self._finish_job(job, footer, button, done)
+        if not self._jobs:
+            self._job_timer.stop()
+
+    def _finish_job(self, job, footer, button, done):
+        """Close out a :meth:`run_job` on the UI thread: footer, result, report."""
+        if button is not None:
+            button.deleteLater()
+        try:
+            result = job.future.result()
+        except ptk.OperationCancelled:
+            self.sb.logger.info(f"[run_job] {job.name}: cancelled.")
+            if footer is not None:
+                footer.finish_progress("Cancelled", delay_ms=500)
+            return
+        except Exception as error:  # noqa: BLE001 - every job, one report
+            self.sb.logger.error(f"[run_job] {job.name} failed.", exc_info=error)
+            if footer is not None:
+                footer.finish_progress("Failed", delay_ms=500)
+            self.sb.message_box(f"{job.name} failed:<br>{error}")
+            return
+        if footer is not None:
+            footer.finish_progress("Complete", delay_ms=500)
+        if done is not None:
+            done(result)
+
+    def stream_report(
+        self, sections, name="Report", title="", size=(760, 520), monospace=False, empty=None
+    ):
+        """Render a report on a :meth:`run_job` worker, shown section by section.
+
+        The second half of a two-stage report: the slot snapshots the DCC data on the
+        UI thread, then hands a *sections* iterable — typically a generator over that
+        snapshot — whose items are built on the worker (file IO, aggregation, sorting,
+        HTML). The viewer (``sb.text_view_dialog``) opens with the first non-empty
+        section and each later one is added as it finishes, keeping the reader's scroll
+        position. Closing the viewer cancels the rest.
+
+        Parameters:
+            sections (iterable): HTML chunks, in report order; empty ones are skipped.
+            name (str): Job name for the footer and the one-running-per-name guard.
+            title, size, monospace: Passed to ``sb.text_view_dialog``.
+            empty (str, optional): Message box text when no section had content.
+
+        Returns:
+            SlotJob: The running job, or None when one named *name* is still running.
+        """
+
+        def render(job):
+            viewer, parts = None, []
+            for chunk in sections:
+                job.check()
+                if not chunk:
+                    continue
+                parts.append(chunk)
+                job.progress(text=f"{name}: {len(parts)} section(s) shown…")
+                viewer = job.on_main(
+                    self._show_report, viewer, "".join(parts), title, size, monospace
+                )
+                if viewer is None:
+                    job.cancel("viewer closed")
+                    job.check()
+            return viewer
+
+        def done(viewer):
+            if viewer is None and empty:
+                self.sb.message_box(empty)
+
+        return self.run_job(render, name=name, text=f"{name}…", done=done)
+
+    def _show_report(self, viewer, html, title, size, monospace):
+        """Open the report viewer, or update the open one; None once the user closed it."""
+        if viewer is None:
+            return self.sb.text_view_dialog(
+                html, "Ok", title=title, size=size, monospace=monospace
+            )
+        if not viewer.isVisible():
+            return None
+        bar = viewer.text_edit.verticalScrollBar()
+        position = bar.value()
+        viewer.setText(html)
+        bar.setValue(position)
+        return viewer
+
     def toggle_camera_view(self):
         """Toggle between the last two viewport-camera views in slot history.
 
@@ -0,0 +1,154 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic node-type index: every scene node, bucketed by its type.
+
+Select by Type used to hand every node in the scene to the type filter on each click
+— a ``cmds.ls()`` of hundreds of thousands of names, filtered again by the handler —
+and its category rows could not say how many nodes they hold without another scan.
+Which nodes a scene holds only changes when one is created or deleted.
+
+:class:`TypeIndex` is one process-wide table per engine:
+
+* ``{type: {node id}}``, read in one scan (:meth:`TypeIndex._scan`) on first use and
+  again once :meth:`mark_stale` was called (a scene open, an import);
+* kept current between scans from the engine's node-added / node-removed events —
+  :meth:`added` and :meth:`removed` only queue the event, which costs nothing when a
+  bulk operation fires thousands of them; the queue is applied on the next query;
+* a query over types (:meth:`ids`, :meth:`count`) is a union of the types' sets, with
+  each abstract type expanded to the concrete types under it (:meth:`TypeIndex._expand`)
+  — kept until :meth:`types_changed` reports that a plugin added or removed types.
+
+Forks subclass it with the hooks and hand out :meth:`TypeIndex.instance`.
+"""
+
+
+class TypeIndex:
+    """``{type: {node id}}`` over the whole scene, updated from add / remove events.
+
+    Subclasses provide :meth:`_scan` and :meth:`_resolve`; :meth:`_expand` when a type
+    query should also match the types derived from it.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._by_type = {}  # type -> {node id}
+        self._type_of = {}  # node id -> type
+        self._events = []  # queued (added, node) events, applied on the next query
+        self._expanded = {}  # type -> frozenset of concrete types
+        self.stale = True
+        self.scans = 0  # full scans run so far — for tests and the bench
+
+    @classmethod
+    def instance(cls):
+        """The process-wide index for this engine (one per subclass)."""
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------ hooks
+    def _scan(self):
+        """Every node in the scene as ``(node id, type)`` pairs — one batched read."""
+        raise NotImplementedError
+
+    def _resolve(self, node):
+        """``(node id, type)`` of an event's *node*, or None once it no longer exists."""
+        return node
+
+    def _expand(self, node_type):
+        """The concrete types a query for *node_type* matches (default: itself)."""
+        return (node_type,)
+
+    # ------------------------------------------------------------------ events
+    def added(self, node):
+        """Queue a node-created event (cheap — safe from an engine callback)."""
+        if not self.stale:
+            self._events.append((True, node))
+
+    def removed(self, node):
+        """Queue a node-deleted event (*node* as :meth:`_resolve` accepts it)."""
+        if not self.stale:
+            self._events.append((False, node))
+
+    def mark_stale(self):
+        """Drop the index — the next query rescans (after a scene open or an import)."""
+        self.stale = True
+        self._events.clear()
+
+    def types_changed(self):
+        """Forget the expanded type hierarchy — a plugin registered or removed node types."""
+        self._expanded.clear()
+
+    # ------------------------------------------------------------------ queries
+    def ids(self, types, exact=False):
+        """``set`` of the ids of every node whose type is, or derives from, one of *types*.
+
+        Parameters:
+            types (str/list): Node type(s).
+            exact (bool): Match *types* only, not the types derived from them.
+        """
+        self._update()
+        result = set()
+        for node_type in self._concrete(types, exact):
+            result |= self._by_type.get(node_type, set())
+        return result
+
+    def count(self, types, exact=False):
+        """How many nodes :meth:`ids` would return, without building the union (a node has
+        one concrete type, so the concrete sets never overlap).
+        """
+        self._update()
+        concrete = self._concrete(types, exact)
+        return sum(len(self._by_type.get(t, ())) for t in concrete)
+
+    def types(self):
+        """``{type: node count}`` of the concrete types present in the scene."""
+        self._update()
+        return {t: len(ids) for t, ids in self._by_type.items() if ids}
+
+    # ------------------------------------------------------------------ internals
+    def _concrete(self, types, exact=False):
+        if isinstance(types, str):
+            types = (types,)
+        if exact:
+            return set(types)
+        concrete = set()
+        for node_type in types:
+            expanded = self._expanded.get(node_type)
+            if expanded is None:
+                expanded = frozenset(self._expand(node_type))
+                self._expanded[node_type] = expanded
+            concrete |= expanded
+        return concrete
+
+    def _update(self):
+        """Rescan when stale, else apply the queued events in order."""
+        if self.stale:
+            self._by_type.clear()
+            self._type_of.clear()
+            self._events.clear()
+            for node_id, node_type in self._scan():
+                self._insert(node_id, node_type)
+            self.stale = False
+            self.scans += 1
+            return
+        events, self._events = self._events, []
+        for is_added, node in events:
+            resolved = self._resolve(node)
+            if resolved is None:
+                continue
+            node_id, node_type = resolved
+            if is_added:
+                self._insert(node_id, node_type)
+            else:
+                self._discard(node_id)
+
+    def _insert(self, node_id, node_type):
+        self._discard(node_id)
+        self._type_of[node_id] = node_type
+        self._by_type.setdefault(node_type, set()).add(node_id)
+
+    def _discard(self, node_id):
+        node_type = self._type_of.pop(node_id, None)
+        if node_type is not None:
+            self._by_type[node_type].discard(node_id)
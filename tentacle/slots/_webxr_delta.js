@@ -0,0 +1,220 @@
+/*
+  Live Update — patch the model on screen from tentacle's delta push instead of
+  reloading a whole GLB (the page half of `tentacle/slots/_webxr_delta.py`).
+
+  A full push publishes a new version and the page reloads it. Between full
+  pushes the DCC writes `delta.json` beside the manifest: every node, mesh and
+  material changed since that version, at its current value, with geometry and
+  textures in content-addressed blobs under `delta/`. This script polls it and
+  applies what it has not applied yet:
+
+  - a node's `delta` is its world-space move since the version loaded, in the
+    glTF scene's frame, so the loaded world matrix (kept per node at load) times
+    the delta is where it stands now — however the FBX conversion split the
+    transform between a node and its mesh;
+  - a mesh's buffer holds object-space corners and `world` its node's world
+    matrix, so the geometry is carried into whatever object the GLB made;
+  - a material patches every loaded material of its name, in place.
+
+  A document is applied only against the version it was written for (`base`,
+  read from the manifest at load) and only once (`seq`). Each blob is fetched
+  once for the life of the page — a texture that did not change is never
+  fetched again.
+
+  Activate:  PreviewServer.add_script("tentacle_delta", <this file>)
+*/
+
+//: How often the delta document is read. A patch costs a fetch of a few
+//: kilobytes when nothing changed, so this can sit well under a second.
+const POLL_MS = 500;
+
+export default function liveUpdate(viewer) {
+  const { THREE } = viewer;
+  let loaded = null; // manifest version of the model on screen
+  let applied = 0; // seq applied against it
+  let root = null; // the glTF scene — the frame every matrix is in
+  let named = new Map(); // GLB node name -> object (unique names only)
+  let origin = new Map(); // object -> its matrix in `root`'s frame at load
+  const done = new Map(); // "kind:name" -> hash applied
+  const buffers = new Map(); // blob url -> Promise<ArrayBuffer>
+  const textures = new Map(); // blob url -> Promise<Texture>
+  let busy = false;
+
+  async function reset(gltf) {
+    loaded = null;
+    applied = 0;
+    done.clear();
+    root = gltf?.scene || null;
+    named = new Map();
+    origin = new Map();
+    if (!root) return;
+    root.updateWorldMatrix(true, true);
+    const inverse = root.matrixWorld.clone().invert();
+    const seen = new Set();
+    root.traverse((object) => {
+      const name = object.userData?.name;
+      if (!name) return;
+      if (seen.has(name)) named.delete(name);
+      else named.set(name, object);
+      seen.add(name);
+      origin.set(object, inverse.clone().multiply(object.matrixWorld));
+    });
+    const manifest = await (await fetch('manifest.json', { cache: 'no-store' })).json();
+    loaded = manifest.version;
+  }
+
+  const matrix = (values) => new THREE.Matrix4().fromArray(values);
+
+  function place(object, local) {
+    // `local` is in the glTF scene's frame; the object's parent may sit anywhere.
+    object.parent.updateWorldMatrix(true, false);
+    const world = root.matrixWorld.clone().multiply(local);
+    object.parent.matrixWorld.clone().invert().multiply(world)
+      .decompose(object.position, object.quaternion, object.scale);
+    object.updateMatrixWorld(true);
+  }
+
+  function blob(cache, url, load) {
+    if (!cache.has(url)) {
+      const pending = load(url);
+      pending.catch(() => cache.delete(url)); // a failed fetch is retried next poll
+      cache.set(url, pending);
+    }
+    return cache.get(url);
+  }
+
+  const bufferFor = (url) => blob(buffers, url, async (u) => {
+    const response = await fetch(u);
+    if (!response.ok) throw new Error(`${u}: HTTP ${response.status}`);
+    return response.arrayBuffer();
+  });
+
+  const textureFor = (url) => blob(textures, url, async (u) => {
+    const texture = await new THREE.TextureLoader().loadAsync(u);
+    texture.flipY = false; // glTF's convention, which the buffers follow
+    texture.colorSpace = THREE.SRGBColorSpace;
+    return texture;
+  });
+
+  function patch(material, entry, texture) {
+    const [r, g, b, a] = entry.color;
+    material.color?.setRGB(r, g, b, THREE.LinearSRGBColorSpace);
+    if ('metalness' in material) material.metalness = entry.metallic;
+    if ('roughness' in material) material.roughness = entry.roughness;
+    material.emissive?.setRGB(...entry.emissive, THREE.LinearSRGBColorSpace);
+    material.opacity = a;
+    material.transparent = a < 1;
+    if (texture !== undefined) material.map = texture;
+    material.needsUpdate = true;
+  }
+
+  async function applyMaterials(materials) {
+    const made = new Map();
+    for (const [name, entry] of Object.entries(materials)) {
+      // Absent when the push carries no textures: the GLB had none either.
+      const texture = entry.map === undefined ? undefined
+        : entry.map ? await textureFor(entry.map) : null;
+      const matches = [];
+      root.traverse((object) => {
+        for (const material of viewer.materialsOf(object)) {
+          if (material.name === name && !matches.includes(material)) matches.push(material);
+        }
+      });
+      if (!matches.length) {
+        const material = new THREE.MeshStandardMaterial({ name });
+        matches.push(material);
+      }
+      if (done.get(`material:${name}`) !== entry.hash) {
+        for (const material of matches) patch(material, entry, texture);
+        done.set(`material:${name}`, entry.hash);
+      }
+      made.set(name, matches[0]);
+    }
+    return made;
+  }
+
+  function geometryOf(buffer, entry) {
+    const geometry = new THREE.BufferGeometry();
+    const { layout } = entry;
+    const floats = ([offset, count], size) => new THREE.BufferAttribute(
+      new Float32Array(buffer, offset, count * size).slice(), size);
+    geometry.setAttribute('position', floats(layout.position, 3));
+    if (layout.normal) geometry.setAttribute('normal', floats(layout.normal, 3));
+    if (layout.uv) geometry.setAttribute('uv', floats(layout.uv, 2));
+    const [offset, count] = layout.index;
+    geometry.setIndex(new THREE.BufferAttribute(new Uint32Array(buffer, offset, count).slice(), 1));
+    for (const [start, size, slot] of entry.groups) geometry.addGroup(start, size, slot);
+    if (!layout.normal) geometry.computeVertexNormals();
+    return geometry;
+  }
+
+  function replace(object, geometry, materials) {
+    const material = materials.length > 1 ? materials : materials[0];
+    if (object.isMesh) {
+      object.geometry.dispose();
+      object.geometry = geometry;
+      object.material = material;
+      return;
+    }
+    // A node of several primitives loads as a group of unnamed meshes.
+    for (const child of [...object.children]) {
+      if (child.isMesh && (child.userData.liveUpdate || !child.userData.name)) {
+        child.geometry.dispose();
+        object.remove(child);
+      }
+    }
+    const mesh = new THREE.Mesh(geometry, material);
+    mesh.userData.liveUpdate = true;
+    object.add(mesh);
+  }
+
+  async function apply(delta) {
+    const counts = { nodes: 0, meshes: 0, materials: 0 };
+    const materials = await applyMaterials(delta.materials || {});
+    counts.materials = Object.keys(delta.materials || {}).length;
+    for (const [name, entry] of Object.entries(delta.nodes || {})) {
+      const object = named.get(name);
+      if (!object || done.get(`node:${name}`) === entry.hash) continue;
+      place(object, matrix(entry.delta).multiply(origin.get(object)));
+      done.set(`node:${name}`, entry.hash);
+      counts.nodes += 1;
+    }
+    for (const [name, entry] of Object.entries(delta.meshes || {})) {
+      const object = named.get(name);
+      if (!object || done.get(`mesh:${name}`) === entry.hash) continue;
+      const geometry = geometryOf(await bufferFor(entry.buffer), entry);
+      object.updateWorldMatrix(true, false);
+      geometry.applyMatrix4(object.matrixWorld.clone().invert()
+        .multiply(root.matrixWorld).multiply(matrix(entry.world)));
+      const slots = entry.materials.map((key) => materials.get(key)
+        || new THREE.MeshStandardMaterial());
+      replace(object, geometry, slots.length ? slots : [new THREE.MeshStandardMaterial()]);
+      done.set(`mesh:${name}`, entry.hash);
+      counts.meshes += 1;
+    }
+    return counts;
+  }
+
+  async function poll() {
+    if (busy || loaded === null || !root) return;
+    busy = true;
+    try {
+      const response = await fetch('delta.json', { cache: 'no-store' });
+      if (!response.ok) return;
+      const delta = await response.json();
+      if (delta.protocol !== 1 || delta.base !== loaded || delta.seq <= applied) return;
+      const { nodes, meshes } = await apply(delta);
+      applied = delta.seq;
+      if (nodes || meshes) viewer.setStatus(`Live update: ${nodes} nodes, ${meshes} meshes`);
+    } catch (error) {
+      console.warn('Live update failed:', error);
+    } finally {
+      busy = false;
+    }
+  }
+
+  viewer.on('load', ({ gltf }) => { reset(gltf); });
+  // Registered after a model may already be on screen (the first live push).
+  if (viewer.parts.length) reset(viewer.parts[0].gltf);
+  setInterval(poll, POLL_MS);
+}
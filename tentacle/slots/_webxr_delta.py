@@ -0,0 +1,433 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Shared, DCC-agnostic delta push for the WebXR Preview.
+
+A WebXR push exports the whole scope to FBX, converts it to a GLB (textures embedded)
+and has the page load the new file — seconds, on a big scene minutes, after moving one
+object. Between two pushes that keep the scene's structure, what changed is a handful
+of transforms, a mesh, a material.
+
+:class:`WebXrDelta` is one process-wide table per engine:
+
+* after a full push, :meth:`WebXrDelta.rebase` records what the page now holds: the
+  structure (node names and parents), each node's world matrix, each mesh's
+  signature (:meth:`WebXrDelta._signature`, a hash of its arrays) and material
+  assignment, and a hash of each material's values — no buffer is packed;
+* :meth:`WebXrDelta.push` compares the scene against that base and writes into the
+  preview server's root ``delta.json`` — every node, mesh and material that changed
+  since the base, at its current value — beside content-addressed blobs: a mesh's
+  buffers as ``delta/<hash>.bin``, a texture as ``delta/<hash><ext>``. A blob is
+  written once and the page fetches each hash once, so an unchanged texture never
+  crosses again. A change the delta cannot carry (a node added, removed, renamed or
+  reparented; two nodes of one name; another full publish in between) returns None
+  — the caller falls back to a full push;
+* the page half is a viewer script (``_webxr_delta.js``, :attr:`WebXrDelta.SCRIPT`)
+  registered with ``PreviewServer.add_script``: it polls ``delta.json`` and patches
+  the loaded model in place — matrices, geometry, material values — with no reload.
+
+Values cross in glTF's frame (Y up, metres) through :meth:`WebXrDelta._frame`: node
+changes as world-space deltas and mesh points in object space with the node's world
+matrix beside them, so the page never needs to know how the FBX conversion split a
+transform between a node and its mesh.
+
+Forks subclass it with the hooks and hand out :meth:`WebXrDelta.instance`.
+"""
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+
+class WebXrDelta:
+    """Content hashes of the last full push, and the delta the live page patches.
+
+    Subclasses provide :meth:`_nodes`, :meth:`_worlds`, :meth:`_mesh`,
+    :meth:`_signature`, :meth:`_materials`, :meth:`_geometry` and :meth:`_material`;
+    :attr:`BASIS` and :meth:`_unit` when the engine is not Y up in metres.
+    """
+
+    #: Version of the ``delta.json`` layout the page script reads.
+    PROTOCOL = 1
+
+    #: The page script, and the name it is registered under with the server.
+    SCRIPT = Path(__file__).with_name("_webxr_delta.js")
+    SCRIPT_NAME = "tentacle_delta"
+
+    #: The delta document and the blob folder, under the server's root.
+    FILE = "delta.json"
+    BLOBS = "delta"
+
+    #: The engine's axes -> glTF's (rows: glTF x, y, z in engine coordinates).
+    BASIS = np.eye(3)
+
+    _instance = None
+
+    def __init__(self):
+        self.base = None  # (server root, version, options) of the model on the page
+        self.seq = 0  # deltas written against the base
+        self._structure = None  # ((name, parent name), ...) at the base
+        self._matrices = {}  # node name -> world-matrix hash at the base
+        self._meshes = {}  # node name -> (signature, dirty, material keys) at the base
+        self._values = {}  # material key -> value hash at the base
+        self._changed = {"nodes": set(), "meshes": set(), "materials": set()}
+        self._origin = {}  # node name -> world matrix at the base (glTF frame)
+        self._read = {}  # node name -> (token, geometry hash, mesh entry) last read
+        self._files = {}  # texture path -> ((mtime, size), blob name)
+        self._written = set()  # blob names in the current root
+        self._dirty = {}  # node name -> edits reported through touch()
+        self.read = 0  # mesh geometry reads so far — for tests and the bench
+
+    @classmethod
+    def instance(cls):
+        """The process-wide table for this engine (one per subclass)."""
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------ hooks
+    def _nodes(self, objects):
+        """``(name, parent name or None, node)`` of *objects* and every node under
+        them, parents first. Names are the ones the GLB carries.
+        """
+        raise NotImplementedError
+
+    def _worlds(self, nodes):
+        """``(len(nodes), 4, 4)`` world matrices (column vectors, engine units)."""
+        raise NotImplementedError
+
+    def _mesh(self, node):
+        """The mesh *node* carries, or None."""
+        raise NotImplementedError
+
+    def _signature(self, mesh):
+        """Hashable token that moves whenever *mesh*'s points, UVs or normals do.
+
+        Hash the arrays outright rather than a sample: an edit the signature misses
+        never reaches the page unless someone calls :meth:`touch`.
+        """
+        raise NotImplementedError
+
+    def _materials(self, node, mesh):
+        """``[(material key, material), ...]`` per slot of *mesh* (a key may be None).
+        """
+        raise NotImplementedError
+
+    def _geometry(self, mesh):
+        """The triangles of *mesh* as corner arrays, in object space:
+        ``{"position": (n, 3), "normal": (n, 3) or None, "uv": (n, 2) or None,
+        "index": (3t,) corner indices, "slot": (t,) material slot per triangle}``.
+        """
+        raise NotImplementedError
+
+    def _material(self, material):
+        """``{"color": (r, g, b, a), "metallic", "roughness", "emissive": (r, g, b),
+        "map": base-colour image path or None}`` — linear values.
+        """
+        raise NotImplementedError
+
+    def _unit(self):
+        """Metres per engine unit."""
+        return 1.0
+
+    # ------------------------------------------------------------------ events
+    def touch(self, *names):
+        """Mark the meshes of nodes *names* edited — re-read despite the signature."""
+        for name in names:
+            self._dirty[name] = self._dirty.get(name, 0) + 1
+
+    def invalidate(self):
+        """Forget the base — the next push is a full one."""
+        self.base = None
+
+    # ------------------------------------------------------------------ queries
+    def rebase(self, server, objects, version, options=()):
+        """Record *objects* as what the page holds after full push *version*.
+
+        Reads matrices, signatures and material values only. Resets ``delta.json``
+        in *server*'s root so a page cannot apply a delta meant for the old model, and
+        deletes the blobs there that no cached mesh or current texture still names.
+        """
+        nodes = self._nodes(objects)
+        frame = self._frame()
+        worlds = self._worlds([node for _name, _parent, node in nodes])
+        self._structure = tuple((name, parent) for name, parent, _node in nodes)
+        self._matrices = {}
+        self._origin = {}
+        self._meshes = {}
+        self._values = {}
+        for (name, _parent, node), world in zip(nodes, worlds):
+            world = frame @ world @ np.linalg.inv(frame)
+            self._matrices[name] = self._hash(world)
+            self._origin[name] = world
+            mesh = self._mesh(node)
+            if mesh is None:
+                continue
+            slots = self._materials(node, mesh)
+            self._meshes[name] = (self._token(name, mesh), tuple(k for k, _m in slots))
+            for key, material in slots:
+                if key is not None and key not in self._values:
+                    self._values[key] = self._hash(self._values_of(material))
+        self._changed = {"nodes": set(), "meshes": set(), "materials": set()}
+        root = Path(server.root)
+        if self.base is None or self.base[0] != str(root):
+            self._written.clear()
+        self.base = (str(root), version, tuple(options))
+        self.seq = 0
+        self._write_json(root / self.FILE, self._document({}, {}, {}))
+        self._prune(root)
+
+    def push(self, server, objects, options=(), textures=True):
+        """Write the delta since the base into *server*'s root.
+
+        Parameters:
+            server: The ``PreviewServer`` the base was pushed to.
+            objects: The scope, as :meth:`rebase` was given it.
+            options: The push options the base was built with; any change means a
+                full push (the GLB would differ in ways a delta does not carry).
+            textures: Whether the base embedded textures — maps are only sent then.
+
+        Returns:
+            ``{"seq", "nodes", "meshes", "materials", "blobs", "bytes"}`` — entries in
+            the document and blobs written by this call — or None when only a full
+            push can express the change.
+        """
+        root = Path(server.root)
+        if self.base != (str(root), server.version, tuple(options)):
+            return None
+        nodes = self._nodes(objects)
+        structure = tuple((name, parent) for name, parent, _node in nodes)
+        if structure != self._structure or len(dict(structure)) < len(structure):
+            return None  # a name the page cannot resolve to one node needs a reload
+
+        changed = self._changed
+        written = {"blobs": 0, "bytes": 0}
+        frame = self._frame()
+        worlds = self._worlds([node for _name, _parent, node in nodes])
+        doc_nodes, doc_meshes, doc_materials = {}, {}, {}
+        used = {}  # material key -> material, of the meshes in the document
+        for (name, _parent, node), world in zip(nodes, worlds):
+            world = frame @ world @ np.linalg.inv(frame)
+            world_hash = self._hash(world)
+            if world_hash != self._matrices.get(name):
+                changed["nodes"].add(name)
+            if name in changed["nodes"]:
+                move = world @ np.linalg.inv(self._origin[name])
+                doc_nodes[name] = {"hash": world_hash, "delta": self._columns(move)}
+            mesh = self._mesh(node)
+            if mesh is None:
+                continue
+            slots = self._materials(node, mesh)
+            keys = tuple(k for k, _m in slots)
+            token = self._token(name, mesh)
+            if (token, keys) != self._meshes.get(name):
+                changed["meshes"].add(name)
+            for key, material in slots:
+                if key is None:
+                    continue
+                if self._hash(self._values_of(material)) != self._values.get(key):
+                    changed["materials"].add(key)
+                if key in changed["materials"]:
+                    used[key] = material
+            if name not in changed["meshes"]:
+                continue
+            entry = self._mesh_entry(root, name, mesh, token, written)
+            entry = dict(entry, materials=list(keys), world=self._columns(world))
+            entry["hash"] = self._hash((entry["buffer"], keys, entry["world"]))
+            doc_meshes[name] = entry
+            used.update((k, m) for k, m in slots if k is not None)
+        for key, material in used.items():
+            doc_materials[key] = self._material_entry(root, material, textures, written)
+
+        self.seq += 1
+        self._write_json(
+            root / self.FILE, self._document(doc_nodes, doc_meshes, doc_materials)
+        )
+        return dict(
+            seq=self.seq,
+            nodes=len(doc_nodes),
+            meshes=len(doc_meshes),
+            materials=len(doc_materials),
+            **written,
+        )
+
+    # ------------------------------------------------------------------ internals
+    def _frame(self):
+        """Engine -> glTF: the axis change, scaled to metres (4x4)."""
+        frame = np.eye(4)
+        frame[:3, :3] = np.asarray(self.BASIS, dtype=np.float64) * self._unit()
+        return frame
+
+    def _token(self, name, mesh):
+        return (self._signature(mesh), self._dirty.get(name, 0))
+
+    def _values_of(self, material):
+        """A material's values, with its map as the file's stat rather than its path."""
+        values = dict(self._material(material))
+        path = values.get("map")
+        if path:
+            try:
+                stat = os.stat(path)
+                values["map"] = (str(path), stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                values["map"] = None
+        return values
+
+    def _mesh_entry(self, root, name, mesh, token, written):
+        """The buffer entry of *mesh*, read only when *token* moved since the last."""
+        cached = self._read.get(name)
+        if cached is not None and cached[0] == token:
+            entry = cached[2]
+            # Repacked only if the blob went missing from the root.
+            self._write_blob(
+                root, entry["buffer"], lambda: self._pack(mesh)[0], written
+            )
+            return entry
+        payload, entry = self._pack(mesh)
+        self._write_blob(root, entry["buffer"], lambda: payload, written)
+        self._read[name] = (token, entry["buffer"], entry)
+        return entry
+
+    def _pack(self, mesh):
+        """``(bytes, entry)`` — a mesh's corner arrays packed into one buffer."""
+        geometry = self._geometry(mesh)
+        self.read += 1
+        basis = np.asarray(self.BASIS, dtype=np.float64)
+        arrays = {"position": np.asarray(geometry["position"]) @ basis.T * self._unit()}
+        if geometry.get("normal") is not None:
+            arrays["normal"] = np.asarray(geometry["normal"]) @ basis.T
+        if geometry.get("uv") is not None:
+            uv = np.array(geometry["uv"], dtype=np.float64)
+            uv[:, 1] = 1.0 - uv[:, 1]  # glTF's v runs down the image
+            arrays["uv"] = uv
+        slot = np.asarray(geometry["slot"], dtype=np.int64)
+        order = np.argsort(slot, kind="stable")
+        index = np.asarray(geometry["index"], dtype=np.uint32).reshape(-1, 3)[order]
+        slots, starts, counts = np.unique(
+            slot[order], return_index=True, return_counts=True
+        )
+        layout, chunks, offset = {}, [], 0
+        for key, array in arrays.items():
+            data = np.ascontiguousarray(array, dtype=np.float32).tobytes()
+            layout[key] = [offset, len(array)]
+            chunks.append(data)
+            offset += len(data)
+        layout["index"] = [offset, index.size]
+        chunks.append(np.ascontiguousarray(index).tobytes())
+        payload = b"".join(chunks)
+        entry = {
+            "buffer": f"{self.BLOBS}/{self._hash(payload)}.bin",
+            "layout": layout,
+            "groups": [
+                [int(s) * 3, int(c) * 3, int(k)]
+                for s, c, k in zip(starts, counts, slots)
+            ],
+        }
+        return payload, entry
+
+    def _material_entry(self, root, material, textures, written):
+        values = self._material(material)
+        entry = {
+            "color": [float(v) for v in values.get("color", (1, 1, 1, 1))],
+            "metallic": float(values.get("metallic", 0.0)),
+            "roughness": float(values.get("roughness", 0.5)),
+            "emissive": [float(v) for v in values.get("emissive", (0, 0, 0))],
+        }
+        if textures:
+            path = values.get("map")
+            entry["map"] = self._texture(root, path, written) if path else None
+        entry["hash"] = self._hash(entry)
+        return entry
+
+    def _texture(self, root, path, written):
+        """Blob name of the image at *path* (hashed once per file version), or None."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(path)
+        if cached is None or cached[0] != version:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+            name = f"{self.BLOBS}/{digest.hexdigest()}{Path(path).suffix.lower()}"
+            cached = self._files[path] = (version, name)
+        name = cached[1]
+        if name not in self._written or not (root / name).is_file():
+            target = root / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, f"{target}.tmp")
+            os.replace(f"{target}.tmp", target)
+            self._written.add(name)
+            written["blobs"] += 1
+            written["bytes"] += version[1]
+        return name
+
+    def _write_blob(self, root, name, payload, written):
+        """Write blob *name* unless it is already in *root*."""
+        target = root / name
+        if name in self._written and target.is_file():
+            return
+        data = payload()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        Path(f"{target}.tmp").write_bytes(data)
+        os.replace(f"{target}.tmp", target)
+        self._written.add(name)
+        written["blobs"] += 1
+        written["bytes"] += len(data)
+
+    def _prune(self, root):
+        """Delete the blobs in *root* that the new base leaves unreferenced.
+
+        The page reloaded, so no delta it holds names a blob any more; only the
+        buffers cached for nodes still in the structure and each texture's current
+        version are worth keeping for the next push.
+        """
+        names = {name for name, _parent in self._structure}
+        self._read = {n: cached for n, cached in self._read.items() if n in names}
+        keep = {cached[2]["buffer"] for cached in self._read.values()}
+        keep.update(name for _version, name in self._files.values())
+        folder = root / self.BLOBS
+        for path in folder.iterdir() if folder.is_dir() else ():
+            if f"{self.BLOBS}/{path.name}" not in keep:
+                try:
+                    path.unlink()
+                except OSError:  # still being served; the next rebase retries
+                    continue
+        self._written &= keep
+
+    def _document(self, nodes, meshes, materials):
+        return {
+            "protocol": self.PROTOCOL,
+            "base": self.base[1],
+            "seq": self.seq,
+            "nodes": nodes,
+            "meshes": meshes,
+            "materials": materials,
+        }
+
+    @staticmethod
+    def _write_json(path, document):
+        """Replace *path* atomically — a page polling it never reads half a file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Path(f"{path}.tmp").write_text(json.dumps(document), encoding="utf-8")
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def _columns(matrix):
+        """A 4x4 as glTF / three.js store it: 16 floats, column-major."""
+        return np.asarray(matrix, dtype=np.float64).T.ravel().tolist()
+
+    @staticmethod
+    def _hash(value):
+        if isinstance(value, np.ndarray):
+            data = np.round(value, 9).tobytes()
+        elif isinstance(value, (bytes, bytearray)):
+            data = bytes(value)
+        else:
+            data = json.dumps(value, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
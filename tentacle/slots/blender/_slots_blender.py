@@ -2,7 +2,276 @@
 # coding=utf-8
 import bpy
 import blendertk as btk
-from tentacle import Slots
+from tentacle import FaceGraphs, SceneStats, SimilarIndex, Slots, WebXrDelta
+
+
+class BlenderSceneStats(SceneStats):
+    """:class:`tentacle.SceneStats` over mesh objects, keyed by ``name_full``.
+
+    Every count is a collection length here (triangles: loops − 2·polygons, exact
+    for Blender's hole-free n-gons), so a row costs what its signature does; the
+    table is what lets the HUD, the export guard and Scene Info share one pass.
+    Counts are the base mesh's, before modifiers.
+    """
+
+    def _key(self, obj):
+        return obj.name_full
+
+    @staticmethod
+    def _row(obj):
+        me = obj.data
+        uv = me.uv_layers.active
+        polygons = len(me.polygons)
+        return (polygons, len(me.loops) - 2 * polygons, len(uv.data) if uv else 0,
+                len(me.vertices))
+
+    def _signatures(self, meshes):
+        return [(o.data.name_full,) + self._row(o) for o in meshes]
+
+    def _measure(self, meshes):
+        return [self._row(o) for o in meshes]
+
+
+class BlenderSimilarIndex(SimilarIndex):
+    """:class:`tentacle.SimilarIndex` over mesh objects, keyed by ``name_full``.
+
+    Every metric is read with ``foreach_get`` (world area: the vertices moved by
+    ``matrix_world``, fanned per polygon; shells: :meth:`SimilarIndex.count_shells`
+    over the edges), so no bmesh is built. The signature is the mesh datablock's
+    name and counts, the object's bound box and its world matrix. Counts are the base
+    mesh's, before modifiers; the float floors mirror the Maya fork's.
+    """
+
+    EPS = {"area": 1e-6, "boundingBox": 1e-6, "worldArea": 1e-2}
+
+    def _key(self, obj):
+        return obj.name_full
+
+    def _signatures(self, meshes):
+        return [
+            (
+                o.data.name_full,
+                len(o.data.vertices),
+                len(o.data.edges),
+                len(o.data.polygons),
+                len(o.data.loops),
+                tuple(tuple(corner) for corner in o.bound_box),
+                tuple(tuple(row) for row in o.matrix_world),
+            )
+            for o in meshes
+        ]
+
+    def _measure(self, meshes):
+        import numpy as np
+
+        rows = []
+        for o in meshes:
+            me = o.data
+            co = np.empty(len(me.vertices) * 3)
+            me.vertices.foreach_get("co", co)
+            edges = np.empty(len(me.edges) * 2, dtype=np.int64)
+            me.edges.foreach_get("vertices", edges)
+            corners = np.empty(len(me.loops), dtype=np.int64)
+            me.loops.foreach_get("vertex_index", corners)
+            area, starts, totals = (
+                np.empty(len(me.polygons), dtype=dtype)
+                for dtype in (np.float64, np.int64, np.int64)
+            )
+            me.polygons.foreach_get("area", area)
+            me.polygons.foreach_get("loop_start", starts)
+            me.polygons.foreach_get("loop_total", totals)
+            matrix = np.array(o.matrix_world)
+            world = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+            uv = me.uv_layers.active
+            rows.append(
+                dict(
+                    vertex=len(me.vertices),
+                    edge=len(me.edges),
+                    face=len(me.polygons),
+                    triangle=len(me.loops) - 2 * len(me.polygons),
+                    shell=self.count_shells(len(me.vertices), edges),
+                    uvcoord=len(uv.data) if uv else 0,
+                    area=float(area.sum()),
+                    worldArea=self.fan_area(world, corners, starts, totals),
+                    boundingBox=tuple(o.dimensions),
+                )
+            )
+        return rows
+
+
+class BlenderFaceGraphs(FaceGraphs):
+    """:class:`tentacle.FaceGraphs` over mesh objects, keyed by ``name_full``.
+
+    Corners and corner edges are ``foreach_get`` reads of the loops, put in polygon order
+    by each polygon's ``loop_start`` / ``loop_total`` (loop blocks need not follow polygon
+    order), so no bmesh is built.
+    The signature is the mesh datablock's name and counts. An Edit-Mode object must be
+    synced (``update_from_editmode``) before a query.
+    """
+
+    def _key(self, obj):
+        return obj.name_full
+
+    def _signature(self, obj):
+        me = obj.data
+        return (me.name_full, len(me.vertices), len(me.edges), len(me.polygons), len(me.loops))
+
+    def _topology(self, obj):
+        import numpy as np
+
+        me = obj.data
+        corners = np.empty(len(me.loops), dtype=np.int64)
+        corner_edges = np.empty(len(me.loops), dtype=np.int64)
+        starts = np.empty(len(me.polygons), dtype=np.int64)
+        counts = np.empty(len(me.polygons), dtype=np.int64)
+        me.loops.foreach_get("vertex_index", corners)
+        me.loops.foreach_get("edge_index", corner_edges)
+        me.polygons.foreach_get("loop_start", starts)
+        me.polygons.foreach_get("loop_total", counts)
+        order = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(len(corners))
+        return counts, corners[order], corner_edges[order], len(me.edges)
+
+    def _points(self, obj, world):
+        import numpy as np
+
+        co = np.empty(len(obj.data.vertices) * 3)
+        obj.data.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+        if not world:
+            return co
+        matrix = np.array(obj.matrix_world)
+        return co @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+class BlenderWebXrDelta(WebXrDelta):
+    """:class:`tentacle.WebXrDelta` over objects, named by ``name`` as the FBX export names them.
+
+    Nodes are the scope's objects and their children, parents first. A mesh is the
+    object's evaluated mesh (modifiers applied, as exported; an Edit-Mode object is
+    synced first), and its signature hashes the coordinates, corner normals and active
+    UVs outright — ``foreach_get`` is cheap enough that no edit is missed. Geometry is
+    per-loop ``foreach_get`` reads over ``loop_triangles``; material values come off the
+    first Principled BSDF, the map off an Image Texture feeding its Base Color. Blender
+    is Z up, so :attr:`BASIS` turns it to glTF's Y up; the unit is the scene's scale.
+    """
+
+    BASIS = ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, -1.0, 0.0))
+
+    def _nodes(self, objects):
+        nodes = {}
+        for obj in objects:
+            for o in (obj, *obj.children_recursive):
+                nodes.setdefault(o.name_full, o)
+
+        def depth(obj):
+            return 0 if obj.parent is None else 1 + depth(obj.parent)
+
+        ordered = sorted(nodes.values(), key=depth)
+        return [(o.name, o.parent.name if o.parent else None, o) for o in ordered]
+
+    def _worlds(self, nodes):
+        import numpy as np
+
+        return np.array([np.array(o.matrix_world) for o in nodes], dtype=np.float64)
+
+    def _unit(self):
+        return bpy.context.scene.unit_settings.scale_length
+
+    def _mesh(self, obj):
+        if obj.type != "MESH":
+            return None
+        if obj.mode == "EDIT":
+            obj.update_from_editmode()
+        return obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+
+    def _signature(self, obj):
+        import numpy as np
+
+        me = obj.data
+        co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+        me.vertices.foreach_get("co", co)
+        arrays = [co, self._normals(me, np.float32)]
+        if me.uv_layers.active is not None:
+            uv = np.empty(len(me.loops) * 2, dtype=np.float32)
+            me.uv_layers.active.data.foreach_get("uv", uv)
+            arrays.append(uv)
+        digest = self._hash(b"".join(a.tobytes() for a in arrays))
+        return (me.name_full, len(me.polygons), len(me.loops), digest)
+
+    @staticmethod
+    def _normals(me, dtype=float):
+        """Flat per-loop (corner) normals of *me*."""
+        import numpy as np
+
+        normal = np.empty(len(me.loops) * 3, dtype=dtype)
+        if hasattr(me, "corner_normals"):  # 4.1+
+            me.corner_normals.foreach_get("vector", normal)
+        else:
+            me.calc_normals_split()
+            me.loops.foreach_get("normal", normal)
+        return normal
+
+    def _materials(self, node, obj):
+        return [
+            (slot.material.name, slot.material) if slot.material else (None, None)
+            for slot in node.material_slots
+        ]
+
+    def _geometry(self, obj):
+        import numpy as np
+
+        me = obj.data
+        me.calc_loop_triangles()
+        count = len(me.loops)
+        index = np.empty(len(me.loop_triangles) * 3, dtype=np.int64)
+        slot = np.empty(len(me.loop_triangles), dtype=np.int64)
+        me.loop_triangles.foreach_get("loops", index)
+        me.loop_triangles.foreach_get("material_index", slot)
+        vertex = np.empty(count, dtype=np.int64)
+        me.loops.foreach_get("vertex_index", vertex)
+        co = np.empty(len(me.vertices) * 3)
+        me.vertices.foreach_get("co", co)
+        normal = self._normals(me)
+        uv = None
+        if me.uv_layers.active is not None:
+            uv = np.empty(count * 2)
+            me.uv_layers.active.data.foreach_get("uv", uv)
+            uv = uv.reshape(-1, 2)
+        return {
+            "position": co.reshape(-1, 3)[vertex],
+            "normal": normal.reshape(-1, 3),
+            "uv": uv,
+            "index": index,
+            "slot": slot,
+        }
+
+    def _material(self, material):
+        values = {
+            "color": tuple(material.diffuse_color),
+            "metallic": material.metallic,
+            "roughness": material.roughness,
+            "emissive": (0.0, 0.0, 0.0),
+            "map": None,
+        }
+        tree = material.node_tree if material.use_nodes else None
+        bsdf = next((n for n in tree.nodes if n.type == "BSDF_PRINCIPLED"), None) if tree else None
+        if bsdf is None:
+            return values
+        inputs = bsdf.inputs
+        base = inputs["Base Color"]
+        values["color"] = (*base.default_value[:3], inputs["Alpha"].default_value)
+        values["metallic"] = inputs["Metallic"].default_value
+        values["roughness"] = inputs["Roughness"].default_value
+        emission = inputs.get("Emission Color") or inputs.get("Emission")  # 4.0 renamed it
+        strength = inputs.get("Emission Strength")
+        if emission is not None:
+            weight = strength.default_value if strength is not None else 1.0
+            values["emissive"] = tuple(c * weight for c in emission.default_value[:3])
+        source = base.links[0].from_node if base.is_linked else None
+        if source is not None and source.type == "TEX_IMAGE" and source.image is not None:
+            values["map"] = bpy.path.abspath(source.image.filepath) or None
+            values["color"] = (1.0, 1.0, 1.0, values["color"][3])  # the map is the color
+        return values
 
 
 class SlotsBlender(Slots):
@@ -31,6 +300,26 @@ class SlotsBlender(Slots):
         ``bpy.context.active_object`` (which returns ``None`` there)."""
         return btk.active_object()
 
+    @staticmethod
+    def scene_stats():
+        """The shared :class:`BlenderSceneStats` table."""
+        return BlenderSceneStats.instance()
+
+    @staticmethod
+    def similar_index():
+        """The shared :class:`BlenderSimilarIndex` table."""
+        return BlenderSimilarIndex.instance()
+
+    @staticmethod
+    def face_graphs():
+        """The shared :class:`BlenderFaceGraphs` table."""
+        return BlenderFaceGraphs.instance()
+
+    @staticmethod
+    def webxr_delta():
+        """The shared :class:`BlenderWebXrDelta` table."""
+        return BlenderWebXrDelta.instance()
+
     @staticmethod
     def effective_fps() -> float:
         """The scene frame rate as the user understands it — ``fps / fps_base`` — shared by all
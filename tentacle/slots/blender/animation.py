@@ -2,7 +2,7 @@
 # coding=utf-8
 import bpy
 import blendertk as btk
-from tentacle import SlotsBlender
+from tentacle import KeyClipboard, SlotsBlender
 
 
 class Animation(SlotsBlender):
@@ -21,6 +21,9 @@ class Animation(SlotsBlender):
         super().__init__(switchboard)
         self.ui = self.sb.loaded_ui.animation
         self._copied_action = None
+        # Current Frame / Selected Keys copies, as columns. None: not looked up yet (the
+        # first paste restores the last session's); False: an Action copy superseded it.
+        self._key_clipboard = None
 
     #: ``category -> [(label, objectName, tooltip)]`` for the header Tools list
     #: (was five separator sections of loose header buttons). Mirror of the Maya
@@ -834,9 +837,16 @@ class Animation(SlotsBlender):
             btk.paste_keys(targets, action)
             return
 
-        self._copied_action = btk.copy_keys(active, mode=mode)
-        if self._copied_action is None:
+        copied = btk.copy_keys(active, mode=mode)
+        if copied is None:
             self.sb.message_box("Nothing to copy for the chosen mode.")
+            return
+        if mode == "action":  # a datablock: pasted natively, within this session only
+            self._copied_action, self._key_clipboard = copied, False
+            KeyClipboard.discard("blender")
+            return
+        self._copied_action = None
+        self._key_clipboard = KeyClipboard.from_blender(copied, source=active.name).persist()
 
     def tb018_init(self, widget):
         m = widget.option_box.menu
@@ -854,24 +864,43 @@ class Animation(SlotsBlender):
     @btk.undoable
     def tb018(self, widget):
         """Paste Keys (independent copies onto the selection)."""
-        if self._copied_action is None:
+        if self._key_clipboard is None:
+            self._key_clipboard = KeyClipboard.restore("blender")
+        if self._copied_action is None and not self._key_clipboard:
             self.sb.message_box("Nothing copied — use Copy Keys first.")
             return
         paste_mode = widget.option_box.menu.cmb039.currentData()
         target_time = (
             bpy.context.scene.frame_current if paste_mode == "playhead" else None
         )
-        try:
-            pasted = btk.paste_keys(
-                self.selected_objects(), self._copied_action, target_time=target_time
+        if self._copied_action is None:
+            pasted = self._paste_key_clipboard(
+                self._key_clipboard, self.selected_objects(), target_time
             )
-        except ReferenceError:  # the copied action was deleted (e.g. file reload/purge)
-            self._copied_action = None
-            self.sb.message_box("The copied keys no longer exist — use Copy Keys again.")
-            return
+        else:
+            try:
+                pasted = btk.paste_keys(
+                    self.selected_objects(), self._copied_action, target_time=target_time
+                )
+            except ReferenceError:  # the copied action was deleted (e.g. file reload/purge)
+                self._copied_action = None
+                self.sb.message_box("The copied keys no longer exist — use Copy Keys again.")
+                return
         if not pasted:
             self.sb.message_box("Nothing pasted — select target object(s) first.")
 
+    def _paste_key_clipboard(self, clipboard, objects, target_time):
+        """Stream *clipboard* into ``btk.paste_keys`` a chunk at a time; the objects pasted onto."""
+        pasted = []
+        with self.sb.progress(total=clipboard.chunk_count(), text="Pasting keys") as update:
+            for i, (buffer, anchor) in enumerate(clipboard.blender_chunks(target_time)):
+                for obj in btk.paste_keys(objects, buffer, target_time=anchor):
+                    if obj not in pasted:
+                        pasted.append(obj)
+                if not update(i + 1):
+                    break
+        return pasted
+
     _SCALE_UNIFORM_TOOLTIP = (
         "Time scaling factor:\n\n"
         "UNIFORM MODE:\n"
@@ -1155,13 +1184,19 @@ class Animation(SlotsBlender):
             self.sb.message_box("<hl>No animation</hl> found in the selected scope.")
             return
         csv_output = m.chk_csv_output.isChecked()
-        text = (
-            btk.format_animation_info_csv(records)
-            if csv_output
-            else btk.format_animation_info_html(records)
-        )
-        self.sb.text_view_dialog(
-            text, "Ok", title="Get Animation Info", size=(780, 520), monospace=csv_output
+
+        def sections():  # the records are plain data: formatted on a worker
+            if csv_output:
+                yield btk.format_animation_info_csv(records)
+            else:
+                yield btk.format_animation_info_html(records)
+
+        self.stream_report(
+            sections(),
+            name="Get Animation Info",
+            title="Get Animation Info",
+            size=(780, 520),
+            monospace=csv_output,
         )
 
     # ------------------------------------------------------------------ tb019  Optimize Keys
@@ -2,7 +2,7 @@
 # coding=utf-8
 import bpy
 import blendertk as btk
-from tentacle import EditMixin, SlotsBlender
+from tentacle import EditMixin, SelectionMask, SlotsBlender
 
 
 class Edit(EditMixin, SlotsBlender):
@@ -474,8 +474,8 @@ class Edit(EditMixin, SlotsBlender):
         }
 
         # Overlapping faces — Repair deletes them; in Select mode the selected dupes are captured
-        # and re-applied after the topology pass below (which rewrites the mesh select flags
-        # wholesale — the union mirrors Maya's additive ``select -add``).
+        # (as NumPy masks) and unioned back in after the topology pass below, which rewrites the
+        # mesh select flags wholesale — the union mirrors Maya's additive ``select -add``.
         overlap_n = 0
         overlap_faces = {}
         if m.chk025.isChecked():
@@ -483,9 +483,7 @@ class Edit(EditMixin, SlotsBlender):
                 objects, delete=repair, select=not repair
             )
             if not repair and any(criteria.values()):
-                overlap_faces = {
-                    o: [p.index for p in o.data.polygons if p.select] for o in objects
-                }
+                overlap_faces = {o: SelectionMask.capture(o) for o in objects}
 
         if not repair:
             self._mesh_cleanup_select(
@@ -577,8 +575,8 @@ class Edit(EditMixin, SlotsBlender):
             uv_area_tolerance=m.s008.value(),
             **criteria,
         )
-        for o, indices in overlap_faces.items():  # union the dupes back in
-            self._reselect_faces(o, indices)
+        for o, dupes in overlap_faces.items():  # union the dupes back in
+            self._reselect_faces(o, dupes)
         self._show_problem_components(objects, counts.get("_mode", "VERT"))
 
         rows = [
@@ -628,32 +626,21 @@ class Edit(EditMixin, SlotsBlender):
                 pass
 
     @staticmethod
-    def _reselect_faces(obj, indices):
-        """Additively re-select faces by index, with the down-flush to verts/edges that keeps
-        them selected across ``mesh.select_mode``'s selection flush — used by tb000 to union
-        the overlapping-face dupes with the topology-diagnostic selection (both engine passes
-        rewrite the select flags wholesale)."""
-        import bmesh
-
-        if not indices:
+    def _reselect_faces(obj, faces):
+        """Additively re-select faces, with the down-flush to verts/edges that keeps them
+        selected across ``mesh.select_mode``'s selection flush — used by tb000 to union the
+        overlapping-face dupes with the topology-diagnostic selection (both engine passes
+        rewrite the select flags wholesale).
+
+        Parameters:
+            faces (SelectionMask | list): A captured mask (its faces are used) or face indices.
+        """
+        if isinstance(faces, SelectionMask):
+            faces = faces.face_indices()
+        if not len(faces):
             return
-        if obj.mode == "EDIT":  # mesh-data writes wouldn't reach the live edit-bmesh
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.faces.ensure_lookup_table()
-            for i in indices:
-                bm.faces[i].select_set(True)  # select_set flushes down to verts/edges
-            bm.select_flush(True)
-            bmesh.update_edit_mesh(obj.data)
-            return
-        mesh = obj.data
-        for i in indices:
-            p = mesh.polygons[i]
-            p.select = True
-            for vi in p.vertices:
-                mesh.vertices[vi].select = True
-            for li in p.loop_indices:
-                mesh.edges[mesh.loops[li].edge_index].select = True
-        mesh.update()
+        current = SelectionMask.capture(obj)
+        (current | SelectionMask.from_faces(obj, faces)).apply(obj)
 
     # ------------------------------------------------------------------ tb002  Delete Selected
     @btk.undoable
@@ -4,7 +4,7 @@ import os
 
 import bpy
 import blendertk as btk
-from tentacle import HudWarningsMixin, SlotsBlender
+from tentacle import HudMixin, HudWarningsMixin, SlotsBlender
 
 
 class StatusMixin:
@@ -43,26 +43,11 @@ class HudSelectionMixin:
     apart so the two can't be confused at an import site.
     """
 
-    @staticmethod
-    def _poly_counts(objects):
-        """(faces, tris, uvs) across the given mesh objects — C-speed via foreach_get
-        (a Python per-polygon loop would hang the HUD on dense photogrammetry meshes)."""
-        import numpy as np
-
-        faces = tris = uvs = 0
-        for o in objects:
-            if o.type != "MESH":
-                continue
-            me = o.data
-            n = len(me.polygons)
-            faces += n
-            if n:
-                loop_total = np.empty(n, dtype=np.int32)
-                me.polygons.foreach_get("loop_total", loop_total)
-                tris += int(np.clip(loop_total - 2, 0, None).sum())
-            if me.uv_layers.active:
-                uvs += len(me.uv_layers.active.data)
-        return faces, tris, uvs
+    def _poly_counts(self, objects):
+        """(faces, tris, uvs) across the given mesh objects, from the shared
+        :meth:`scene_stats` table (no per-polygon pass, cached across HUD builds)."""
+        counts = self.scene_stats().totals(o for o in objects if o.type == "MESH")
+        return counts["faces"], counts["tris"], counts["uvs"]
 
     def insert_selection_info(self, hud, selection) -> None:
         numberOfSelected = len(selection)
@@ -170,36 +155,41 @@ class WarningsMixin(HudWarningsMixin):
         )
 
 
-class HudSlots(SlotsBlender, StatusMixin, HudSelectionMixin, WarningsMixin):
-    """HUD Slots for Blender, providing scene and selection information."""
+class HudSlots(HudMixin, SlotsBlender, StatusMixin, HudSelectionMixin, WarningsMixin):
+    """HUD Slots for Blender, providing scene and selection information.
 
-    _hud_request_token: int = 0
+    Sections are cached and replayed by the shared :class:`tentacle.HudMixin`.
+    ``DepsgraphUpdated`` fires on every data edit (topology, units, mirror flags),
+    so it is the topology-dirty signal Maya has to approximate from its undo queue.
+    """
+
+    HUD_SECTION_EVENTS = {
+        "status": ("SceneOpened", "NewSceneOpened", "DepsgraphUpdated"),
+        "selection": (
+            "SceneOpened",
+            "SelectionChanged",
+            "DepsgraphUpdated",
+            "Undo",
+            "Redo",
+        ),
+        "components": (
+            "SceneOpened",
+            "SelectionChanged",
+            "DepsgraphUpdated",
+            "Undo",
+            "Redo",
+        ),
+    }
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.ui = self.sb.loaded_ui.hud_startmenu
         self.ui.hudTextEdit.shown.connect(self.request_hud_build)
         self._active_warnings: list = []
+        self._subscribe_hud_invalidation()
 
-    def request_hud_build(self) -> None:
-        """Start a new HUD build request, only the latest token will be used."""
-        self._hud_request_token += 1
-        my_token = self._hud_request_token
-
-        # Lightweight pre-build phase: evaluate opted-in warnings synchronously
-        # and surface their icons immediately so the user gets feedback even if
-        # they dismiss the HUD before the delayed full build runs.
-        self._active_warnings = self.evaluate_warnings()
-        self.insert_warning_icons(self.ui.hudTextEdit, self._active_warnings)
-
-        self.sb.QtCore.QTimer.singleShot(500, lambda: self._delayed_hud_build(my_token))
-
-    def _delayed_hud_build(self, token: int) -> None:
-        if token != self._hud_request_token:
-            return  # Outdated request, ignore.
-        if not (self.ui.isVisible() and self.ui.hudTextEdit.isVisible()):
-            return
-        self.construct_hud()
+    def _script_job_manager(self):
+        return btk.ScriptJobManager
 
     def construct_hud(self) -> None:
         hud = self.ui.hudTextEdit
@@ -209,17 +199,21 @@ class HudSlots(SlotsBlender, StatusMixin, HudSelectionMixin, WarningsMixin):
         selection = self.selected_objects()
         active = bpy.context.view_layer.objects.active
         if active and active.mode == "EDIT" and active.type == "MESH":
-            self.insert_component_info(hud, active)
+            self.hud_section(
+                hud,
+                "components",
+                lambda lines: self.insert_component_info(lines, active),
+            )
         elif selection:
-            self.insert_selection_info(hud, selection)
+            self.hud_section(
+                hud,
+                "selection",
+                lambda lines: self.insert_selection_info(lines, selection),
+            )
         else:
-            self.insert_scene_status(hud)
+            self.hud_section(hud, "status", self.insert_scene_status)
 
-        method = self.sb.prev_slot
-        if method:
-            hud.insertText(
-                'Prev Command: <font style="color: Yellow;">{}'.format(method.__doc__)
-            )
+        self.insert_prev_command(hud)
 
 
 # --------------------------------------------------------------------------------------------
@@ -172,17 +172,39 @@ class MaterialsSlots(MaterialsMixin, SlotsBlender):
             # mirrors the current material (see the mixin).
             widget.currentIndexChanged.connect(self._refresh_assign_lists)
             widget.on_editing_finished.connect(self._refresh_assign_lists)
+            self._subscribe_material_index(widget)
 
         # Item data is the material NAME, not the Material datablock: a stored reference
         # goes stale on undo (any later attribute access raises ReferenceError), so every
         # consumer re-resolves the name against bpy.data at use time (_resolve_material).
-        materials = btk.get_scene_mats(sort=True)
-        widget.add({m.name: m.name for m in materials}, clear=True, restore_index=True)
-        for i, mat in enumerate(materials):
-            icon = btk.get_mat_swatch_icon(mat)
+        # Names and swatches come off the shared material index (see MaterialsMixin).
+        materials = self.indexed_materials()
+        widget.add(materials, clear=True, restore_index=True)
+        for i, name in enumerate(materials.values()):
+            icon = self.material_swatch(name)
             if icon:
                 widget.setItemIcon(i, icon)
 
+    # ------------------------------------------------------------------ material index
+    #: Datablocks are reallocated on undo / file load; renames and adds are caught by
+    #: :meth:`_material_index_key` (Blender has no per-datablock add/rename event).
+    MATERIAL_INDEX_EVENTS = ("SceneOpened", "NewSceneOpened", "Undo", "Redo")
+
+    def _script_job_manager(self):
+        return btk.ScriptJobManager
+
+    def _material_index_key(self):
+        """Every material datablock's name, in ``bpy.data`` order — a read of names
+        only, so far cheaper than the swatches it saves re-rendering."""
+        return tuple(m.name for m in bpy.data.materials)
+
+    def _build_material_index(self):
+        return [{"name": m.name} for m in btk.get_scene_mats(sort=True)]
+
+    def _material_swatch_icon(self, name):
+        mat = bpy.data.materials.get(name)
+        return btk.get_mat_swatch_icon(mat) if mat is not None else None
+
     def cmb002(self, index, widget):
         """Current Material (selection only — assignment is on the b-buttons)."""
 
@@ -532,8 +554,8 @@ class MaterialsSlots(MaterialsMixin, SlotsBlender):
         root = widget.add(self._assign_root_text(widget))
         root.sublist.add("New")
         root.sublist.add("Random")
-        for mat in btk.get_scene_mats(sort=True):
-            root.sublist.add(mat.name)
+        for name in self.indexed_materials().values():
+            root.sublist.add(name)
 
     @SlotsBlender.Signals("on_item_interacted")
     def list000(self, item):
@@ -380,6 +380,7 @@ class Rendering(RenderingMixin, SlotsBlender):
             engine=btk.WebXrPreview,
             has_selection=lambda: bool(btk.selected_objects()),
             log_hint="script output",
+            delta=SlotsBlender.webxr_delta(),
         )
 
     # ------------------------------------------------------------------ b-slots
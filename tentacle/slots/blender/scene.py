@@ -2,6 +2,7 @@
 # coding=utf-8
 import os
 import html
+import tempfile
 
 import bpy
 import pythontk as ptk
@@ -13,7 +14,7 @@ class SceneSlots(SceneMixin, SlotsBlender):
     """Blender port of the shared ``scene`` menu.
 
     Recent files / autosave recovery map onto Blender's own recent-files.txt and temp-dir
-    autosaves (``btk.get_recent_files`` / ``btk.get_recent_autosave``); the submenu's
+    autosaves, indexed off the UI thread by the shared ``RecentFileIndex``; the submenu's
     Import / Export expandable lists route through Blender's native format operators
     (file dialogs via ``INVOKE_DEFAULT``).
     Reference Manager opens the library-link panel (``blender_menus/reference_manager``).
@@ -208,38 +209,44 @@ class SceneSlots(SceneMixin, SlotsBlender):
             )
 
     # ------------------------------------------------------------------ list000  Recent Files
-    def list000_init(self, widget):
-        """Initialize Recent Files"""
-        widget.fixed_item_height = 18
-        widget.apply_preset(
-            "expand_up" if widget.ui.has_tags("submenu") else "hover_menu"
-        )
-        recent_files = btk.get_recent_files(slice(0, 11))
-        w1 = widget.add("Recent Files")
-        truncated = ptk.truncate(recent_files, 65)
-        w1.sublist.add(zip(truncated, recent_files))
-        widget.setVisible(bool(recent_files))
+    #: Recent Files / Autosave (SceneMixin hooks).
+    RECENT_HOST = "blender"
+    AUTOSAVE_EXTENSIONS = (".blend",)
+
+    def _recent_file_paths(self):
+        """A reader for Blender's ``recent-files.txt``, newest first (SceneMixin hook).
+
+        Returned as a callable so the read runs on the index's worker;
+        ``btk.get_recent_files`` would also stat every entry on the UI thread.
+        """
+        path = bpy.utils.user_resource("CONFIG", path="recent-files.txt")
+
+        def read():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    return [line.strip() for line in f if line.strip()]
+            except OSError:
+                return []
+
+        return read
+
+    def _autosave_dirs(self):
+        """Blender autosaves to its temp directory (SceneMixin hook)."""
+        temp = bpy.context.preferences.filepaths.temporary_directory
+        return [temp or tempfile.gettempdir()]
 
     @SlotsBlender.Signals("on_item_interacted")
     def list000(self, item):
         """Recent Files"""
         data = item.item_data()
-        if data:
+        if data and not self._recent_file_missing(str(data)):
             self._open_file(str(data))
 
     # ------------------------------------------------------------------ cmb002  Autosave
-    def cmb002_init(self, widget):
-        """Initialize Autosave (recent temp-dir .blend autosaves, newest first)."""
-        recent_autosaves = btk.get_recent_autosave(filter_time=24)
-        autosave_dict = {
-            f"{stamp}  {ptk.format_path(path, 'file')}": path
-            for path, stamp in recent_autosaves
-        }
-        widget.add(autosave_dict, header="Autosave:", clear=True)
-
     def cmb002(self, index, widget):
         """Autosave"""
-        self._open_file(widget.items[index])
+        if not self._recent_file_missing(widget.items[index]):
+            self._open_file(widget.items[index])
 
     # ------------------------------------------------------------------ list001/list002  Import/Export
     def list001_init(self, widget):
@@ -491,8 +498,8 @@ class SceneSlots(SceneMixin, SlotsBlender):
         Minimal port of the Maya twin: returns True (proceed) for the common, non-taxing
         case so the normal path is untouched — the dialog only appears when the export set
         is dense AND tangents are on, the combination that turns a quick export into a
-        multi-minute one. Triangles are summed from the base meshes (per mesh:
-        loops − 2·polygons — exact for the pre-modifier data, O(1) per mesh), filling
+        multi-minute one. Triangles come from the shared ``scene_stats`` table (base
+        meshes, loops − 2·polygons — exact for the pre-modifier data), filling
         polyEvaluate's role without evaluating modifiers. ``message_box`` returns the
         clicked button text (or None if dismissed), so anything but "Yes" cancels."""
         if not include_tangents:
@@ -505,7 +512,7 @@ class SceneSlots(SceneMixin, SlotsBlender):
         meshes = [o for o in pool if o.type == "MESH"]
         if not meshes:
             return True
-        tris = sum(len(o.data.loops) - 2 * len(o.data.polygons) for o in meshes)
+        tris = self.scene_stats().totals(meshes)["tris"]
         if tris < self._DENSE_TRI_THRESHOLD:
             return True
         choice = self.sb.message_box(
@@ -2,7 +2,7 @@
 # coding=utf-8
 import bpy
 import blendertk as btk
-from tentacle import SelectionMixin, SlotsBlender
+from tentacle import SelectionMask, SelectionMixin, SlotsBlender
 
 
 class Selection(SelectionMixin, SlotsBlender):
@@ -103,7 +103,7 @@ class Selection(SelectionMixin, SlotsBlender):
     _COMPONENT_DEFAULT = {"VERT": "NORMAL", "EDGE": "LENGTH", "FACE": "AREA"}
 
     # (objectName, label, tooltip, default-checked) for the object-similarity criteria — Maya's
-    # widgets/objectNames, backed by ``btk.get_similar_mesh`` (polyEvaluate-metric parity).
+    # widgets/objectNames, backed by the cached ``SlotsBlender.similar_index`` descriptors.
     _SIMILAR_CRITERIA = (
         ("chk011", "Vertex", "The number of vertices.", True),
         ("chk012", "Edge", "The number of edges.", True),
@@ -117,6 +117,13 @@ class Selection(SelectionMixin, SlotsBlender):
         ("chk020", "Include Original", "Include the originally selected object(s) in the result.", False),
     )
 
+    # Criterion checkbox -> ``SimilarIndex`` metric (Maya's polyEvaluate flag names).
+    _SIMILAR_METRIC = {
+        "chk011": "vertex", "chk012": "edge", "chk013": "face", "chk014": "triangle",
+        "chk015": "shell", "chk016": "uvcoord", "chk017": "area", "chk018": "worldArea",
+        "chk019": "boundingBox",
+    }
+
     def tb001_init(self, widget):
         widget.option_box.menu.setTitle("Select Similar")
         widget.option_box.menu.add(
@@ -134,6 +141,12 @@ class Selection(SelectionMixin, SlotsBlender):
             widget.option_box.menu.add(
                 "QCheckBox", setText=label, setObjectName=name, setChecked=checked, setToolTip=tip,
             )
+        # Object mode: once a search has run, editing these re-selects from the cached
+        # descriptors (``_similar_live``) instead of waiting for another click.
+        m = widget.option_box.menu
+        m.s000.valueChanged.connect(lambda *_: self._similar_live(m))
+        for name, *_ in self._SIMILAR_CRITERIA:
+            getattr(m, name).toggled.connect(lambda *_: self._similar_live(m))
 
     @staticmethod
     def _uv_island_select_mode():
@@ -147,7 +160,7 @@ class Selection(SelectionMixin, SlotsBlender):
 
     def tb001(self, widget):
         """Select Similar — object-level similarity by topology / area / bounding-box metrics
-        (Maya parity, via ``btk.get_similar_mesh``); in Edit mode with the UV editor in Island
+        (Maya parity, read off the cached ``SlotsBlender.similar_index`` descriptors); in Edit mode with the UV editor in Island
         select mode, the UV shells sharing the selected shell's topology and shape
         (``btk.get_similar_uv_shells`` -- the Stack (Similar) oracle, Maya's UV-shell branch);
         otherwise Blender's native component ``select_similar``."""
@@ -180,25 +193,60 @@ class Selection(SelectionMixin, SlotsBlender):
             except RuntimeError as e:
                 self.sb.message_box(str(e))
             return
-        matched = btk.get_similar_mesh(
-            self.selected_objects(),
-            tolerance=m.s000.value(),
-            inc_orig=m.chk020.isChecked(),
-            select=True,
-            vertex=m.chk011.isChecked(),
-            edge=m.chk012.isChecked(),
-            face=m.chk013.isChecked(),
-            triangle=m.chk014.isChecked(),
-            shell=m.chk015.isChecked(),
-            uvcoord=m.chk016.isChecked(),
-            area=m.chk017.isChecked(),
-            world_area=m.chk018.isChecked(),
-            bounding_box=m.chk019.isChecked(),
+        self._similar_query = None
+        refs = [o for o in self.selected_objects() if o.type == "MESH"]
+        if refs:
+            snapshot = self.similar_index().snapshot(self._similar_candidates())
+            references = [snapshot.index(o) for o in refs]
+            if None not in references:
+                self._similar_query = {"snapshot": snapshot, "references": references}
+                if self._similar_select(m):
+                    return
+        self.sb.message_box(
+            "No similar objects found (select a reference object, or raise the tolerance)."
         )
-        if not matched:
-            self.sb.message_box(
-                "No similar objects found (select a reference object and enable a criterion)."
-            )
+
+    _similar_query = None  # the last object-mode search, re-run by _similar_live
+
+    @staticmethod
+    def _similar_candidates():
+        """The mesh objects of the window's view layer (only those can be selected)."""
+        with btk.window_context_override():
+            return [o for o in bpy.context.view_layer.objects if o.type == "MESH"]
+
+    def _similar_select(self, m):
+        """Select the matches of the last object-mode search for the current options (from the
+        cached :class:`tentacle.SimilarIndex` snapshot; with every criterion unchecked, its
+        default metrics, as in Maya); returns the matched objects, the references not
+        counted."""
+        query = self._similar_query
+        snapshot, references = query["snapshot"], query["references"]
+        metrics = [kw for name, kw in self._SIMILAR_METRIC.items() if getattr(m, name).isChecked()]
+        rows = snapshot.match(references, metrics, m.s000.value())
+        matched = [snapshot.meshes[i] for i in rows]
+        result = matched + ([snapshot.meshes[i] for i in references] if m.chk020.isChecked() else [])
+        with btk.window_context_override():
+            for o in bpy.context.view_layer.objects:
+                o.select_set(False)
+            for o in result:
+                o.select_set(True)
+            if result:
+                bpy.context.view_layer.objects.active = result[0]
+        query["selected"] = {o.name_full for o in self.selected_objects()}
+        return matched
+
+    def _similar_live(self, m):
+        """Re-select the last object-mode search after an option changed — no re-measure —
+        unless the selection (or the mode) moved on since."""
+        query = self._similar_query
+        if not query:
+            return
+        obj = self.active_object()
+        selected = {o.name_full for o in self.selected_objects()}
+        if (obj and obj.mode == "EDIT") or selected != query.get("selected"):
+            self._similar_query = None  # the user picked something else
+            return
+        self._similar_select(m)
 
     # ------------------------------------------------------------------ tb002  Select Island
     # Native ``select_linked`` delimiters {objectName: (label, delimit enum)}. By Normal is the
@@ -247,15 +295,28 @@ class Selection(SelectionMixin, SlotsBlender):
             setToolTip="Upper bound of the edge dihedral-angle range (degrees).",
         )
 
+    #: Degrees the angle range is widened by at both ends (mirror of the Maya fork's).
+    _EDGE_ANGLE_EPS = 1e-3
+
     def tb003(self, widget):
-        """Select Edges By Angle (within the Low–High range, via ``btk.select_edges_by_angle``)."""
+        """Select Edges By Angle (within the Low–High range): every edge's dihedral angle at once
+        off :meth:`face_graphs`, written back as one :class:`SelectionMask` — not a bmesh pass
+        per edge. Boundary edges (not exactly two faces) are excluded, as ``btk.select_edges_by_angle``
+        excludes them."""
+        import numpy as np
+
         m = widget.option_box.menu
         obj = self.ensure_edit_mode("MESH", "EDGE")
         if not obj:
             self.sb.message_box("Select Edges By Angle requires a mesh.")
             return
-        n = btk.select_edges_by_angle(obj, low_angle=m.s006.value(), high_angle=m.s007.value())
-        if not n:
+        obj.update_from_editmode()
+        graph, normals = self.face_graphs().normals(obj)
+        angles = graph.edge_angles(normals)  # NaN on boundary edges: never in range
+        low, high = m.s006.value() - self._EDGE_ANGLE_EPS, m.s007.value() + self._EDGE_ANGLE_EPS
+        hit = np.flatnonzero((angles >= low) & (angles <= high))
+        SelectionMask.from_edges(obj, hit).apply(obj)
+        if not len(hit):
             self.sb.message_box("No edges found in that angle range.")
 
     # ------------------------------------------------------------------ list001  Convert To
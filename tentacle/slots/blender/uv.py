@@ -6,7 +6,7 @@ import os
 import bpy
 import pythontk as ptk
 import blendertk as btk
-from tentacle import UvMixin, SlotsBlender
+from tentacle import SelectionMask, UvMixin, SlotsBlender
 
 
 class Uv(UvMixin, SlotsBlender):
@@ -95,19 +95,24 @@ class Uv(UvMixin, SlotsBlender):
         ``btk.stack_uv_shells`` act on). Names alone invert the intent when only the
         component selection changes on the same objects — the second click would "un-do"
         onto the wrong components; a changed selection now starts a fresh toggle cycle.
-        Object mode contributes a whole-map marker (no component scope)."""
-        import bmesh
-
+        Object mode contributes a whole-map marker (no component scope). Reads the mesh data
+        as it stands: callers sync Edit-Mode objects first (:meth:`_sync_edit_meshes`)."""
         parts = []
         for o in sorted(objects, key=lambda o: o.name):
             if o.mode == "EDIT":
-                bm = bmesh.from_edit_mesh(o.data)
-                sel = tuple(v.index for v in bm.verts if v.select)
-                parts.append((o.name, len(sel), hash(sel)))
+                verts = SelectionMask.capture(o, sync=False).verts  # bulk read, no per-vert loop
+                parts.append((o.name, int(verts.sum()), hash(verts.tobytes())))
             else:
                 parts.append((o.name, -1, 0))  # whole map — no component scope
         return tuple(parts)
 
+    @staticmethod
+    def _sync_edit_meshes(objects):
+        """Copy each Edit-Mode object's edit-mesh into its mesh data (``update_from_editmode``)."""
+        for o in objects:
+            if o.mode == "EDIT":
+                o.update_from_editmode()
+
     # ------------------------------------------------------------------ UV operators (edit mode)
     # Option-box names are Blender-specific (Maya's UV option boxes carry u3dLayout packing
     # params with no Blender analogue): they expose the native operator's own parameters.
@@ -1277,6 +1282,7 @@ class Uv(UvMixin, SlotsBlender):
         if not objects:
             self.sb.message_box("Nothing selected.")
             return
+        self._sync_edit_meshes(objects)
         signature = self._selection_fingerprint(objects)
         if self._b029_last_selection != signature:
             self._b029_pinned = False  # fresh selection — start with Pin
@@ -1368,6 +1374,7 @@ class Uv(UvMixin, SlotsBlender):
         if not objects:
             self.sb.message_box("<b>Nothing selected.</b>")
             return
+        self._sync_edit_meshes(objects)
         signature = self._selection_fingerprint(objects)
         if getattr(self, "_b030_snapshot", None) and self._b030_signature == signature:
             btk.set_uv_coords(objects, self._b030_snapshot)
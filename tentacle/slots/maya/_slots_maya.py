@@ -1,8 +1,598 @@
 # !/usr/bin/python
 # coding=utf-8
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 
-from tentacle import Slots
+from tentacle import (
+    FaceGraphs,
+    MeshDiagnostics,
+    SceneStats,
+    SimilarIndex,
+    Slots,
+    TypeIndex,
+    WebXrDelta,
+)
+
+
+class DagQuery:
+    """Bulk DAG reads and writes for the Maya slots — one command per query, not one per node.
+
+    Scope resolution used to cost a command per shape (an ``intermediateObject`` getAttr,
+    a ``displaySurface`` query and another edit), which on a 30k-shape set-dressing scene
+    is most of the slot's runtime. Every method here issues a fixed number of commands
+    whatever the node count: ``ls``'s own filters (``noIntermediate``, ``visible``,
+    ``type``, ``dag``) and the multi-object forms of ``listRelatives`` / ``displaySurface``.
+    """
+
+    @staticmethod
+    def shapes(nodes=None, type="mesh", visible=False, **kwargs):
+        """Non-intermediate shapes (long names) at or under *nodes*; scene-wide when None.
+
+        Parameters:
+            nodes (list, optional): Roots to walk (``ls -dag``). An empty list yields [].
+            type (str): Node type filter (``"mesh"``, ``"surfaceShape"``, ...).
+            visible (bool): Only shapes visible in the DAG (hidden parents hide them).
+            **kwargs: Further ``cmds.ls`` flags (``leaf=True``, ...).
+        """
+        kwargs.update(type=type, noIntermediate=True, long=True)
+        if visible:
+            kwargs["visible"] = True
+        if nodes is None:
+            return cmds.ls(**kwargs) or []
+        if not nodes:
+            return []
+        return cmds.ls(nodes, dag=True, **kwargs) or []
+
+    @staticmethod
+    def parents(shapes):
+        """The shapes' parent transforms (long names), de-duplicated in first-seen order."""
+        if not shapes:
+            return []
+        return list(dict.fromkeys(cmds.listRelatives(shapes, parent=True, fullPath=True) or []))
+
+    @staticmethod
+    def by_root(roots, nodes):
+        """``{root: [node, ...]}`` — long-named *nodes* grouped under the long-named *roots*."""
+        grouped = {root: [] for root in roots}
+        for node in nodes:
+            parts = node.split("|")
+            for depth in range(len(parts), 1, -1):
+                bucket = grouped.get("|".join(parts[:depth]))
+                if bucket is not None:
+                    bucket.append(node)
+                    break
+        return grouped
+
+    @staticmethod
+    def display_surface(shapes, flag):
+        """``[bool, ...]`` — *flag* (``"xRay"``, ``"twoSidedLighting"``) of each shape.
+
+        One query for the list. Should the command answer for fewer nodes than it was
+        given, the shapes are read one by one rather than mis-paired.
+        """
+        if not shapes:
+            return []
+        values = cmds.displaySurface(shapes, query=True, **{flag: True}) or []
+        if len(values) != len(shapes):
+            values = [
+                (cmds.displaySurface(s, query=True, **{flag: True}) or [False])[0]
+                for s in shapes
+            ]
+        return [bool(v) for v in values]
+
+    @staticmethod
+    def set_display_surface(shapes, flag, value):
+        """Set *flag* on every shape in one ``displaySurface`` edit."""
+        if shapes:
+            cmds.displaySurface(shapes, **{flag: value})
+
+
+class MayaSceneStats(SceneStats):
+    """:class:`tentacle.SceneStats` over mesh shapes, keyed by long name.
+
+    The signature is read off ``MFnMesh`` — vertex, face, face-vertex and UV counts,
+    all stored on the shape — so checking a row is O(1); only a mesh whose topology
+    moved pays for a triangle count, taken from ``MFnMesh.getTriangles`` in the same
+    API pass (it honors holed faces, which face-vertex arithmetic does not).
+    """
+
+    @staticmethod
+    def _meshes(names):
+        selection = om.MSelectionList()
+        for name in names:
+            selection.add(name)
+        return [om.MFnMesh(selection.getDagPath(i)) for i in range(len(names))]
+
+    def _signatures(self, meshes):
+        return [
+            (fn.numVertices, fn.numPolygons, fn.numFaceVertices, fn.numUVs())
+            for fn in self._meshes(meshes)
+        ]
+
+    def _measure(self, meshes):
+        return [
+            (fn.numPolygons, sum(fn.getTriangles()[0]), fn.numUVs(), fn.numVertices)
+            for fn in self._meshes(meshes)
+        ]
+
+
+class MayaMeshDiagnostics(MeshDiagnostics):
+    """:class:`tentacle.MeshDiagnostics` over mesh shapes (long names), via ``polyInfo``.
+
+    The signature adds the edge count and the node's UUID to :class:`MayaSceneStats`'
+    ``MFnMesh`` counts — a new scene's ``pCubeShape1`` is not the last one's. Each check
+    is one ``polyInfo`` over every shape needing a scan, its components split back per
+    shape by their node name; a transform's name only stands for its shape when it has
+    one, so the shapes of a multi-shape transform with findings get a call each.
+    """
+
+    #: ``polyInfo`` flag per check.
+    FLAGS = {"vertices": "nonManifoldVertices", "uvs": "nonManifoldUVs"}
+
+    def _signatures(self, meshes):
+        return [
+            (
+                fn.uuid().asString(),
+                fn.numVertices,
+                fn.numEdges,
+                fn.numPolygons,
+                fn.numFaceVertices,
+                fn.numUVs(),
+            )
+            for fn in MayaSceneStats._meshes(meshes)
+        ]
+
+    def _scan(self, meshes, check):
+        flag = {self.FLAGS[check]: True}
+        flagged = cmds.polyInfo(meshes, **flag) or []
+        if not flagged:
+            return [[] for _ in meshes]
+        # Components come back named by shape or by transform, short or long:
+        # resolve each distinct node once (only meshes with findings have any).
+        under = {}  # transform -> its scanned shapes
+        for shape in meshes:
+            under.setdefault(shape.rpartition("|")[0], []).append(shape)
+        scanned = set(meshes)
+        by_mesh = {}
+        shared = []  # shapes of a multi-shape transform its name can't tell apart
+        for node, components in self._by_node(cmds.ls(flagged, flatten=True)).items():
+            if node not in scanned and node not in under:
+                node = next(iter(cmds.ls(node, long=True) or ()), node)
+            shapes = under.get(node) or ([node] if node in scanned else [])
+            if len(shapes) == 1:
+                by_mesh.setdefault(shapes[0], []).extend(components)
+            elif shapes:
+                shared.extend(s for s in shapes if s not in shared)
+        # Each of those is scanned on its own, so its findings are its own — renamed
+        # onto the shape, as the transform's name would not select them.
+        for shape in shared:
+            found = cmds.ls(cmds.polyInfo(shape, **flag) or [], flatten=True)
+            by_mesh[shape] = [f"{shape}.{c.partition('.')[2]}" for c in found]
+        return [by_mesh.get(shape, []) for shape in meshes]
+
+    @staticmethod
+    def _by_node(components):
+        grouped = {}
+        for component in components:
+            grouped.setdefault(component.partition(".")[0], []).append(component)
+        return grouped
+
+
+class MayaSimilarIndex(SimilarIndex):
+    """:class:`tentacle.SimilarIndex` over polygon-mesh transforms (long names).
+
+    Metrics come from ``polyEvaluate`` — the flags ``mtk.get_similar_mesh`` compares —
+    and ``boundingBox`` is the shapes' object-space box scaled by the world scale, as
+    there. The signature is each non-intermediate mesh shape's UUID, counts and
+    bounding box plus the transform's world matrix, so moving, scaling or editing a
+    mesh re-measures it. The float floors mirror ``mtk.get_similar_mesh``'s.
+    """
+
+    EPS = {"area": 1e-9, "boundingBox": 1e-9, "worldArea": 1e-2}
+
+    #: The metrics read off ``polyEvaluate``, one flag per call.
+    FLAGS = ("vertex", "edge", "face", "triangle", "shell", "uvcoord", "area", "worldArea")
+
+    @staticmethod
+    def _shapes(transforms):
+        """``(transform path, [mesh shape paths])`` per transform, in order."""
+        sel = om.MSelectionList()
+        for name in transforms:
+            sel.add(name)
+        for i in range(sel.length()):
+            path = sel.getDagPath(i)
+            shapes = []
+            for c in range(path.childCount()):
+                child = path.child(c)
+                if not child.hasFn(om.MFn.kMesh):
+                    continue
+                shape = om.MDagPath(path)
+                shape.push(child)
+                if not om.MFnDagNode(shape).isIntermediateObject:
+                    shapes.append(shape)
+            yield path, shapes
+
+    def _signatures(self, meshes):
+        signatures = []
+        for path, shapes in self._shapes(meshes):
+            row = [tuple(path.inclusiveMatrix())]
+            for shape in shapes:
+                fn = om.MFnMesh(shape)
+                box = fn.boundingBox
+                row.append(
+                    (
+                        fn.uuid().asString(),
+                        fn.numVertices,
+                        fn.numEdges,
+                        fn.numPolygons,
+                        fn.numUVs(),
+                        tuple(box.min)[:3],
+                        tuple(box.max)[:3],
+                    )
+                )
+            signatures.append(tuple(row))
+        return signatures
+
+    def _measure(self, meshes):
+        rows = []
+        for name, (_path, shapes) in zip(meshes, self._shapes(meshes)):
+            values = {}
+            for flag in self.FLAGS:
+                value = cmds.polyEvaluate(name, **{flag: True})
+                if isinstance(value, (int, float)):  # else "Nothing counted"
+                    values[flag] = value
+            if shapes:
+                boxes = [om.MFnDagNode(shape).boundingBox for shape in shapes]
+                lo = [min(box.min[i] for box in boxes) for i in range(3)]
+                hi = [max(box.max[i] for box in boxes) for i in range(3)]
+                scale = cmds.xform(name, q=True, scale=True, worldSpace=True)
+                values["boundingBox"] = [
+                    abs((hi[i] - lo[i]) * s) for i, s in enumerate(scale or (1, 1, 1))
+                ]
+            rows.append(values)
+        return rows
+
+
+class MayaFaceGraphs(FaceGraphs):
+    """:class:`tentacle.FaceGraphs` over mesh shapes (long names), read off ``MFnMesh``.
+
+    Corners come from one ``getVertices`` call; Maya has no bulk face-edge read, so the
+    corner edges take one ``MItMeshPolygon`` pass — paid once per topology, as the
+    signature is :class:`MayaMeshDiagnostics`' UUID and counts. Points are read fresh
+    on every query, in object or world space.
+    """
+
+    @staticmethod
+    def _fn(mesh):
+        sel = om.MSelectionList()
+        sel.add(mesh)
+        return om.MFnMesh(sel.getDagPath(0))
+
+    def _signature(self, mesh):
+        fn = self._fn(mesh)
+        return (
+            fn.uuid().asString(),
+            fn.numVertices,
+            fn.numEdges,
+            fn.numPolygons,
+            fn.numFaceVertices,
+        )
+
+    def _topology(self, mesh):
+        fn = self._fn(mesh)
+        counts, corners = fn.getVertices()
+        corner_edges = []
+        it = om.MItMeshPolygon(fn.dagPath())
+        while not it.isDone():
+            corner_edges.extend(it.getEdges())
+            it.next()
+        return counts, corners, corner_edges, fn.numEdges
+
+    def _points(self, mesh, world):
+        import numpy as np
+
+        space = om.MSpace.kWorld if world else om.MSpace.kObject
+        points = np.asarray(self._fn(mesh).getPoints(space), dtype=np.float64)
+        return points.reshape(-1, 4)[:, :3]
+
+    @staticmethod
+    def components(node, kind, indices):
+        """``node.<kind>[a:b]`` names covering the sorted *indices* — one per run, so a
+        million-face result is a few strings for ``cmds.select``, not a million.
+        """
+        import numpy as np
+
+        indices = np.asarray(indices, dtype=np.int64)
+        if not len(indices):
+            return []
+        breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+        firsts = indices[np.concatenate(([0], breaks))]
+        lasts = indices[np.concatenate((breaks - 1, [len(indices) - 1]))]
+        return [
+            f"{node}.{kind}[{a}]" if a == b else f"{node}.{kind}[{a}:{b}]"
+            for a, b in zip(firsts.tolist(), lasts.tolist())
+        ]
+
+
+class MayaWebXrDelta(WebXrDelta):
+    """:class:`tentacle.WebXrDelta` over DAG transforms (long names), read off the API.
+
+    Nodes are the scope's transforms and everything under them, named as the FBX
+    export names them (short names). A mesh is the transform's first non-intermediate
+    shape; its signature hashes the full point, UV and normal arrays (one
+    ``getPoints`` / ``getUVs`` / ``getNormals`` read), so no deformation, UV edit or
+    hardened edge slips past it. Geometry is one ``getPoints`` /
+    ``getTriangleOffsets`` / ``getNormalIds`` / ``getAssignedUVs`` read. Material
+    values come off ``standardSurface`` / ``aiStandardSurface`` or a Lambert-family
+    shader, the map off the ``file`` node feeding its color.
+    """
+
+    #: Shader type -> (color, color weight, metallic, roughness, emission, weight).
+    PBR = {
+        "standardSurface": (
+            "baseColor",
+            "base",
+            "metalness",
+            "specularRoughness",
+            "emissionColor",
+            "emission",
+        ),
+        "aiStandardSurface": (
+            "baseColor",
+            "base",
+            "metalness",
+            "specularRoughness",
+            "emissionColor",
+            "emission",
+        ),
+    }
+
+    def _nodes(self, objects):
+        nodes = cmds.ls(objects, dag=True, type="transform", long=True) or []
+        nodes = sorted(dict.fromkeys(nodes), key=lambda n: n.count("|"))
+        return [
+            (n.rsplit("|", 1)[-1], n.rsplit("|", 1)[0].rsplit("|", 1)[-1] or None, n)
+            for n in nodes
+        ]
+
+    def _worlds(self, nodes):
+        import numpy as np
+
+        sel = om.MSelectionList()
+        for node in nodes:
+            sel.add(node)
+        matrices = [sel.getDagPath(i).inclusiveMatrix() for i in range(len(nodes))]
+        matrices = np.array([list(m) for m in matrices], dtype=np.float64)
+        # MMatrix is row-vector (translation in the last row).
+        return matrices.reshape(-1, 4, 4).transpose(0, 2, 1)
+
+    def _unit(self):
+        return 0.01  # the API reads centimetres, whatever the UI unit
+
+    def _mesh(self, node):
+        _path, shapes = next(MayaSimilarIndex._shapes([node]))
+        return shapes[0].fullPathName() if shapes else None
+
+    def _signature(self, mesh):
+        import numpy as np
+
+        fn = MayaFaceGraphs._fn(mesh)
+        us, vs = fn.getUVs()
+        arrays = (
+            np.asarray(fn.getPoints(om.MSpace.kObject), dtype=np.float64),
+            np.asarray(us, dtype=np.float64),
+            np.asarray(vs, dtype=np.float64),
+            np.asarray(fn.getNormals(om.MSpace.kObject), dtype=np.float64),
+        )
+        return (
+            fn.uuid().asString(),
+            fn.numPolygons,
+            fn.numFaceVertices,
+            self._hash(b"".join(a.tobytes() for a in arrays)),
+        )
+
+    @staticmethod
+    def _engines(mesh):
+        """The shading engines *mesh* is a member of, in a stable order."""
+        return sorted(set(cmds.listConnections(mesh, type="shadingEngine") or []))
+
+    def _materials(self, node, mesh):
+        slots = []
+        for engine in self._engines(mesh):
+            shaders = cmds.ls(
+                cmds.listConnections(f"{engine}.surfaceShader", destination=False)
+                or [],
+                materials=True,
+            )
+            slots.append((shaders[0], shaders[0]) if shaders else (None, None))
+        return slots
+
+    def _geometry(self, mesh):
+        import numpy as np
+
+        fn = MayaFaceGraphs._fn(mesh)
+        points = np.asarray(fn.getPoints(om.MSpace.kObject), dtype=np.float64)
+        counts, corners = fn.getVertices()
+        counts = np.asarray(counts, dtype=np.int64)
+        # The offsets are already face-vertex slots of the whole mesh, not per face.
+        triangles, offsets = fn.getTriangleOffsets()
+        faces = np.repeat(np.arange(len(counts)), np.asarray(triangles, dtype=np.int64))
+        index = np.asarray(offsets, dtype=np.int64)
+
+        _counts, normal_ids = fn.getNormalIds()
+        normals = np.asarray(fn.getNormals(om.MSpace.kObject), dtype=np.float64)
+        uv = None
+        if fn.numUVs():
+            uv_counts, uv_ids = fn.getAssignedUVs()
+            us, vs = fn.getUVs()
+            table = np.column_stack((us, vs))
+            mapped = np.repeat(np.asarray(uv_counts) > 0, counts)
+            uv = np.zeros((len(mapped), 2))
+            uv[mapped] = table[np.asarray(uv_ids, dtype=np.int64)]
+
+        engines = self._engines(mesh)
+        shaders, face_shaders = fn.getConnectedShaders(fn.dagPath().instanceNumber())
+        order = [
+            engines.index(n) if n in engines else 0
+            for n in (om.MFnDependencyNode(s).name() for s in shaders)
+        ]
+        face_slots = np.asarray(order + [0], dtype=np.int64)[np.asarray(face_shaders)]
+        return {
+            "position": points.reshape(-1, 4)[:, :3][np.asarray(corners)],
+            "normal": normals.reshape(-1, 3)[np.asarray(normal_ids)],
+            "uv": uv,
+            "index": index,
+            "slot": face_slots[faces],
+        }
+
+    def _material(self, material):
+        def get(attr, default):
+            if not attr or not cmds.attributeQuery(attr, node=material, exists=True):
+                return default
+            value = cmds.getAttr(f"{material}.{attr}")
+            return value[0] if isinstance(value, list) else value
+
+        names = self.PBR.get(cmds.nodeType(material))
+        color_attr = names[0] if names else "color"
+        if names:
+            weight = get(names[1], 1.0)
+            color = [c * weight for c in get(names[0], (1.0, 1.0, 1.0))]
+            metallic, roughness = get(names[2], 0.0), get(names[3], 0.5)
+            emission = [c * get(names[5], 0.0) for c in get(names[4], (0, 0, 0))]
+            alpha = sum(get("opacity", (1.0, 1.0, 1.0))) / 3.0
+        else:
+            color = list(get("color", (0.5, 0.5, 0.5)))
+            metallic, roughness = 0.0, 0.5
+            emission = list(get("incandescence", (0.0, 0.0, 0.0)))
+            alpha = 1.0 - sum(get("transparency", (0.0, 0.0, 0.0))) / 3.0
+        files = cmds.listConnections(
+            f"{material}.{color_attr}", destination=False, type="file"
+        )
+        path = cmds.getAttr(f"{files[0]}.fileTextureName") if files else None
+        if path:
+            color = [1.0, 1.0, 1.0]  # the map is the color, as the GLB's factor
+        return {
+            "color": (*color, alpha),
+            "metallic": metallic,
+            "roughness": roughness,
+            "emissive": tuple(emission),
+            "map": path or None,
+        }
+
+
+class MayaTypeIndex(TypeIndex):
+    """:class:`tentacle.TypeIndex` over every dependency node, keyed by
+    ``(UUID string, MObjectHandle hash)``.
+
+    The UUID alone is not unique: the same file referenced twice brings two copies of
+    each node under one UUID, and a remove event for one copy must not drop the other.
+    Scanned in one walk of the DG. :meth:`install` registers ``MDGMessage`` node-added
+    / node-removed callbacks: an added node is queued as an ``MObjectHandle`` and read
+    when the index is next queried, so nodes created and deleted in between cost
+    nothing; a removed node is queued by id, read while it still exists. Opening,
+    importing or referencing a file marks the index stale instead of queueing every
+    node it brings; loading or unloading a plugin drops the expanded type hierarchy.
+    """
+
+    #: ``MSceneMessage`` events that mark the index stale — before (so the bulk load
+    #: queues nothing) and after (so a query in between cannot keep a half-read scene).
+    SCENE_MESSAGES = (
+        "kBeforeNew",
+        "kAfterNew",
+        "kBeforeOpen",
+        "kAfterOpen",
+        "kBeforeImport",
+        "kAfterImport",
+        "kBeforeCreateReference",
+        "kAfterCreateReference",
+        "kBeforeLoadReference",
+        "kAfterLoadReference",
+        "kAfterUnloadReference",
+        "kAfterRemoveReference",
+    )
+
+    def __init__(self):
+        super().__init__()
+        self._installed = False
+
+    def install(self):
+        """Register the node and scene callbacks once (owned by the index)."""
+        if self._installed:
+            return
+        import mayatk as mtk
+
+        mgr = mtk.ScriptJobManager.instance()
+        for register, callback in (
+            (om.MDGMessage.addNodeAddedCallback, self._on_added),
+            (om.MDGMessage.addNodeRemovedCallback, self._on_removed),
+        ):
+            mgr.add_om_callback(register, callback, "dependNode", owner=self)
+        for message in self.SCENE_MESSAGES:
+            mgr.add_om_callback(
+                om.MSceneMessage.addCallback,
+                getattr(om.MSceneMessage, message),
+                self._on_scene,
+                owner=self,
+            )
+        for message in ("kAfterPluginLoad", "kAfterPluginUnload"):
+            mgr.add_om_callback(
+                om.MSceneMessage.addStringArrayCallback,
+                getattr(om.MSceneMessage, message),
+                self._on_plugin,
+                owner=self,
+            )
+        self._installed = True
+
+    def _on_added(self, node, *_):
+        self.added(om.MObjectHandle(node))
+
+    def _on_removed(self, node, *_):
+        if not self.stale:
+            self.removed((self._id(node), None))
+
+    def _on_scene(self, *_):
+        self.mark_stale()
+
+    def _on_plugin(self, *_):
+        self.types_changed()
+
+    @staticmethod
+    def _id(node, fn=None):
+        """``(UUID, handle hash)`` of the MObject *node* — unique among live nodes."""
+        fn = fn or om.MFnDependencyNode(node)
+        return fn.uuid().asString(), om.MObjectHandle(node).hashCode()
+
+    def _scan(self):
+        pairs = []
+        fn = om.MFnDependencyNode()
+        it = om.MItDependencyNodes()
+        while not it.isDone():
+            node = it.thisNode()
+            fn.setObject(node)
+            pairs.append((self._id(node, fn), fn.typeName))
+            it.next()
+        return pairs
+
+    def _resolve(self, node):
+        if isinstance(node, tuple):
+            return node
+        if not node.isValid():
+            return None
+        fn = om.MFnDependencyNode(node.object())
+        return self._id(node.object(), fn), fn.typeName
+
+    def _expand(self, node_type):
+        return cmds.nodeType(node_type, isTypeName=True, derived=True) or (node_type,)
+
+    def names(self, types, exact=False):
+        """Long names of every node of *types* (see :meth:`TypeIndex.ids`).
+
+        ``ls`` resolves a UUID to every node sharing it, so each copy is returned once.
+        """
+        ids = self.ids(types, exact=exact)
+        if not ids:
+            return []
+        return cmds.ls(list({uuid for uuid, _ in ids}), long=True) or []
 
 
 class SlotsMaya(Slots):
@@ -14,9 +604,49 @@ class SlotsMaya(Slots):
         "The operation requires at least one selected object."
     )
 
+    #: Bulk DAG queries (:class:`DagQuery`) — ``self.dag.shapes(...)``, one command per call.
+    dag = DagQuery
+
     def __init__(self, switchboard):
         super().__init__(switchboard)
 
+    @staticmethod
+    def mesh_shapes(objects=None):
+        """Non-intermediate mesh shapes (long names) under *objects*; every mesh when None."""
+        return DagQuery.shapes(objects)
+
+    @staticmethod
+    def scene_stats():
+        """The shared :class:`MayaSceneStats` table."""
+        return MayaSceneStats.instance()
+
+    @staticmethod
+    def mesh_diagnostics():
+        """The shared :class:`MayaMeshDiagnostics` table."""
+        return MayaMeshDiagnostics.instance()
+
+    @staticmethod
+    def similar_index():
+        """The shared :class:`MayaSimilarIndex` table."""
+        return MayaSimilarIndex.instance()
+
+    @staticmethod
+    def face_graphs():
+        """The shared :class:`MayaFaceGraphs` table."""
+        return MayaFaceGraphs.instance()
+
+    @staticmethod
+    def webxr_delta():
+        """The shared :class:`MayaWebXrDelta` table."""
+        return MayaWebXrDelta.instance()
+
+    @staticmethod
+    def type_index():
+        """The shared :class:`MayaTypeIndex`, its callbacks installed."""
+        index = MayaTypeIndex.instance()
+        index.install()
+        return index
+
     def require_selection(self, message=None, **kwargs):
         """The current selection, or ``None`` — after a message box — when it is empty.
 
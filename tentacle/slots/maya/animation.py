@@ -2,7 +2,7 @@
 # coding=utf-8
 import maya.cmds as cmds
 import mayatk as mtk
-from tentacle import SlotsMaya
+from tentacle import KeyClipboard, SlotsMaya
 
 
 class Animation(SlotsMaya):
@@ -12,6 +12,7 @@ class Animation(SlotsMaya):
         self.sb = switchboard
         self.ui = self.sb.loaded_ui.animation
         self.ui_submenu = self.sb.loaded_ui.animation_submenu
+        self._key_clipboard = None  # restored from the last session on first paste
 
     #: ``category -> [(label, objectName, tooltip)]`` for the header Tools list
     #: (was five separator sections of loose header buttons).
@@ -1503,9 +1504,9 @@ class Animation(SlotsMaya):
     def tb016(self, widget):
         """Get Animation Info — render the report to the viewer dialog.
 
-        Feedback while running is the application wait cursor (set by
-        the slot dispatcher for every slot). The dialog itself opens
-        when the report is ready, which is its own "done" signal.
+        The keyed segments are read on the UI thread under the footer's
+        progress bar; the report itself is formatted on a worker
+        (:meth:`stream_report`), and the viewer opening is its "done" signal.
         """
         menu = widget.option_box.menu
         scope = menu.cmb_scope.currentData() or "selected"
@@ -1525,27 +1526,36 @@ class Animation(SlotsMaya):
         else:  # "all"
             objects = None  # let mayatk fall through to all-scene
 
+        # Stage one, on the UI thread: the keyed segments (plain dicts). Stage two,
+        # the sorting and HTML / CSV table, runs on a worker.
         with self.sb.progress(text="Working: Get Animation Info") as update:
-            html = mtk.SegmentKeys.format_scene_info_html(
+            segments = mtk.SegmentKeys.get_scene_info(
                 objects=objects,
                 detailed=True,
-                by_time=by_time,
-                csv_output=csv_output,
                 ignore_holds=ignore_holds,
                 traversal=traversal,
                 progress_callback=self.sb.progress_adapter(update),
             )
-        if not html:
+        if not segments:
             self.sb.message_box("<hl>No animation</hl> found in the selected scope.")
             return
+        scene_path = cmds.file(query=True, sceneName=True)
+        scene_name = (
+            scene_path.replace("\\", "/").rsplit("/", 1)[-1] if scene_path else "Untitled"
+        )
+
+        def sections():
+            yield mtk.SegmentKeys.format_time_ranges_html(
+                segments,
+                title=f"Animation Info — {scene_name}",
+                per_segment=True,
+                csv_output=csv_output,
+                by_time=by_time,
+            )
 
         # Non-modal viewer so Maya stays responsive while reading.
-        self.sb.text_view_dialog(
-            html,
-            "Ok",
-            title="Get Animation Info",
-            size=(780, 520),
-            monospace=False,
+        self.stream_report(
+            sections(), name="Get Animation Info", title="Get Animation Info", size=(780, 520)
         )
 
     def tb017_init(self, widget):
@@ -1630,10 +1640,9 @@ class Animation(SlotsMaya):
         mode = widget.option_box.menu.cmb038.currentData()
 
         copy_mode = "auto" if mode == "copy_paste" else mode
-        self._stored_attributes = mtk.AnimUtils.copy_keys(mode=copy_mode)
-        self._stored_frame = cmds.currentTime(query=True)
+        copied = mtk.AnimUtils.copy_keys(mode=copy_mode)
 
-        if not self._stored_attributes:
+        if not copied:
             labels = {
                 "auto": "Nothing to copy (no selected keys, channel box attributes, or keyed attributes at current frame).",
                 "current_frame": "No keyed attributes found at current frame.",
@@ -1644,14 +1653,20 @@ class Animation(SlotsMaya):
             self.sb.message_box(labels.get(mode, "Nothing to copy."))
             return
 
+        # Columns from here on: the engine's dict-per-key answer is dropped, and the
+        # clipboard outlives the session (see KeyClipboard).
+        clipboard = KeyClipboard.from_maya(
+            copied, mode=copy_mode, frame=cmds.currentTime(query=True)
+        )
+        del copied
+        self._key_clipboard = clipboard = clipboard.persist()
+
         if mode == "copy_paste":
             objects = cmds.ls(sl=True) or []
             if not objects:
                 self.sb.message_box("You must select at least one object.")
                 return
-            keys_set = mtk.AnimUtils.paste_keys(
-                objects, copied_data=self._stored_attributes
-            )
+            keys_set = self._paste_key_clipboard(clipboard, objects)
             if keys_set > 0:
                 self.sb.message_box(
                     f"Copied and pasted values to {keys_set} object(s)."
@@ -1660,19 +1675,9 @@ class Animation(SlotsMaya):
                 self.sb.message_box("No matching objects found.")
             return
 
-        # Count total items: for multi-key data (list), count keys;
-        # for scalar data (float), count 1 per attribute.
-        total_keys = 0
-        for obj_data in self._stored_attributes.values():
-            for data in obj_data.values():
-                if isinstance(data, list):
-                    total_keys += len(data)
-                else:
-                    total_keys += 1
-        total_attrs = sum(len(v) for v in self._stored_attributes.values())
         self.sb.message_box(
-            f"Copied {total_keys} key(s) across {total_attrs} attribute(s) from "
-            f"{len(self._stored_attributes)} object(s)."
+            f"Copied {len(clipboard)} key(s) across {len(clipboard.curves)} attribute(s) "
+            f"from {len(clipboard.objects())} object(s)."
         )
 
     def tb018_init(self, widget):
@@ -1691,7 +1696,10 @@ class Animation(SlotsMaya):
 
     def tb018(self, widget):
         """Paste Keys: paste previously copied keys onto the selection."""
-        if not hasattr(self, "_stored_attributes") or not self._stored_attributes:
+        if self._key_clipboard is None:
+            self._key_clipboard = KeyClipboard.restore("maya")
+        clipboard = self._key_clipboard
+        if not clipboard:
             self.sb.message_box("No values stored. Use 'Copy Keys' first.")
             return
 
@@ -1701,13 +1709,9 @@ class Animation(SlotsMaya):
             return
 
         paste_mode = widget.option_box.menu.cmb039.currentData()
-        target_time = (
-            getattr(self, "_stored_frame", None) if paste_mode == "source" else None
-        )
+        target_time = clipboard.frame if paste_mode == "source" else None
 
-        keys_set = mtk.AnimUtils.paste_keys(
-            objects, copied_data=self._stored_attributes, target_time=target_time
-        )
+        keys_set = self._paste_key_clipboard(clipboard, objects, target_time)
 
         if keys_set > 0:
             msg = f"Pasted values to {keys_set} object(s)."
@@ -1721,6 +1725,23 @@ class Animation(SlotsMaya):
                 "No matching objects found. Select the same objects you copied from."
             )
 
+    @mtk.undoable
+    def _paste_key_clipboard(self, clipboard, objects, target_time=None):
+        """Stream *clipboard* into ``paste_keys`` a chunk at a time, as one undo step.
+
+        Returns:
+            (int): The objects the copied data matched by name (what ``paste_keys``
+                counts).
+        """
+        if target_time is None:  # fixed up front: every chunk anchors on the same frame
+            target_time = cmds.currentTime(query=True)
+        with self.sb.progress(total=clipboard.chunk_count(), text="Pasting keys") as update:
+            for i, (data, anchor) in enumerate(clipboard.maya_chunks(target_time)):
+                mtk.AnimUtils.paste_keys(objects, copied_data=data, target_time=anchor)
+                if not update(i + 1):
+                    break
+        return len(clipboard.matching(objects))
+
     def tb019_init(self, widget):
         """Optimize Keys Init"""
         widget.option_box.menu.setTitle("Optimize Keys")
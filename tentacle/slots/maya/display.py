@@ -236,24 +236,7 @@ class DisplaySlots(SlotsMaya):
         transform holds multiple shapes (or is a group), and the xRay flag
         itself lives on the shape.
         """
-        if not nodes:
-            return []
-        return (
-            cmds.ls(
-                nodes,
-                dag=True,
-                leaf=True,
-                noIntermediate=True,
-                long=True,
-                type="surfaceShape",
-            )
-            or []
-        )
-
-    @staticmethod
-    def _xray_state(shape) -> bool:
-        result = cmds.displaySurface(shape, xRay=True, query=True)
-        return bool(result[0]) if result else False
+        return SlotsMaya.dag.shapes(nodes or [], type="surfaceShape", leaf=True)
 
     @classmethod
     def _selected_xray_shapes(cls):
@@ -261,8 +244,7 @@ class DisplaySlots(SlotsMaya):
 
     @classmethod
     def _set_xray(cls, shapes, state: bool):
-        for s in shapes:
-            cmds.displaySurface(s, xRay=state)
+        cls.dag.set_display_surface(shapes, "xRay", state)  # one edit for all shapes
         cls._resync_viewport_xray()
 
     @classmethod
@@ -276,7 +258,7 @@ class DisplaySlots(SlotsMaya):
         """
         if not shapes:
             return None
-        target = not all(cls._xray_state(s) for s in shapes)
+        target = not all(cls.dag.display_surface(shapes, "xRay"))
         cls._set_xray(shapes, target)
         return target, len(shapes)
 
@@ -307,14 +289,11 @@ class DisplaySlots(SlotsMaya):
 
     def b006(self):
         """Un-Xray All"""
-        shapes = cmds.ls(type="surfaceShape", noIntermediate=True, long=True) or []
-        self._set_xray(shapes, False)
+        self._set_xray(self.dag.shapes(type="surfaceShape"), False)
 
     def b007(self):
         """Xray Other (uniform toggle across all non-selected shapes)"""
-        all_shapes = set(
-            cmds.ls(type="surfaceShape", noIntermediate=True, long=True) or []
-        )
+        all_shapes = set(self.dag.shapes(type="surfaceShape"))
         other = sorted(all_shapes - set(self._selected_xray_shapes()))
         return self._toggle_xray(other)
 
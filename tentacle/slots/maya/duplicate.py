@@ -153,9 +153,16 @@ class Duplicate(SlotsMaya):
         into instances of a single prototype (scans the selection, or the
         whole scene if nothing is selected)."""
         menu = widget.option_box.menu
+        # Leaf matching only: hierarchy, separate and remainder-combine runs use nodes
+        # that have no partner, so they keep the full scan.
+        leaf_only = not (
+            menu.chk006.isChecked()
+            or menu.chk007.isChecked()
+            or menu.chk009.isChecked()
+        )
 
         created, summary = mtk.AutoInstancer.run_once(
-            None,
+            self._instance_candidates() if leaf_only else None,
             tolerance=menu.s000.value(),
             require_same_material=menu.chk004.isChecked(),
             check_uvs=menu.chk005.isChecked(),
@@ -194,6 +201,36 @@ class Duplicate(SlotsMaya):
                 "No identical meshes to instance and nothing to combine."
             )
 
+    def _instance_candidates(self):
+        """The transforms Auto Instance would scan (the selection, else every transform)
+        that share a vertex count with another — the matcher never pairs meshes whose
+        counts differ, so the rest cannot be instanced and are not compared.
+
+        Counts come from the shared :meth:`scene_stats` table, which re-reads a mesh
+        only once its topology changes — repeat runs over an unchanged scene read none.
+        """
+        transforms = cmds.ls(selection=True, type="transform", long=True) or cmds.ls(
+            type="transform", long=True
+        )
+        if not transforms:
+            return []
+        shapes = {}  # transform -> its first mesh shape, as the matcher picks it
+        for shape in (
+            cmds.listRelatives(
+                transforms, shapes=True, type="mesh", noIntermediate=True, fullPath=True
+            )
+            or []
+        ):
+            shapes.setdefault(shape.rpartition("|")[0], shape)
+        meshes = list(shapes.values())
+        stats = self.scene_stats()
+        verts = stats.counts(meshes)[:, stats.FIELDS.index("verts")].tolist()
+        seen = {}  # vertex count -> meshes holding it
+        for mesh, count in zip(meshes, verts):
+            seen.setdefault(count, []).append(mesh)
+        paired = {mesh for group in seen.values() if len(group) > 1 for mesh in group}
+        return [t for t in transforms if shapes.get(t) in paired]
+
     def tb000_init(self, widget):
         widget.option_box.menu.add(
             "QCheckBox",
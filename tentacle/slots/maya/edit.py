@@ -220,19 +220,12 @@ class Edit(EditMixin, SlotsMaya):
         """Transform(s) for the Mesh Cleanup ``scope``: 'selected' -> the current selection;
         'visible' -> every visible mesh; 'all' -> every mesh in the scene. Non-selected scopes
         resolve mesh shapes (skipping intermediates) back to their transforms — what
-        ``clean_geometry`` / ``polyEvaluate`` operate on."""
+        ``clean_geometry`` / ``polyEvaluate`` operate on. Two commands whatever the scene
+        size (``SlotsMaya.dag``)."""
         if scope == "selected":
             return cmds.ls(sl=1, transforms=1) or []
-        kwargs = {"type": "mesh"}
-        if scope == "visible":
-            kwargs["visible"] = True
-        shapes = [
-            s
-            for s in (cmds.ls(**kwargs) or [])
-            if not cmds.getAttr(f"{s}.intermediateObject")
-        ]
-        transforms = cmds.listRelatives(shapes, parent=True, fullPath=True) or []
-        return list(dict.fromkeys(transforms))  # de-dupe, preserve order
+        dag = SlotsMaya.dag
+        return dag.parents(dag.shapes(visible=scope == "visible"))
 
     @staticmethod
     def _poly_counts(objects):
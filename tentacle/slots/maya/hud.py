@@ -5,19 +5,32 @@ import os
 import maya.cmds as cmds
 import pythontk as ptk
 import mayatk as mtk
-from tentacle import HudWarningsMixin, SlotsMaya
+from tentacle import HudMixin, HudWarningsMixin, SettingsMixin, SlotsMaya
 
 
 class StatusMixin:
-    def insert_scene_status(self, hud) -> None:
-        # New version? (Update via the settings header's "Update Package"
-        # button — the old auto-update option is gone, and its stale
+    def insert_version_status(self, hud) -> None:
+        """New version? Read live — the check completes on its own schedule, so the
+        line is never part of the cached ``status`` section.
+
+        The answer is the shared ecosystem check (``SettingsMixin.start_update_check``)
+        — the same one the Update Package button reads — so the line shows nothing
+        until that check has finished, and never blocks the HUD waiting on it.
+        """
+        # (Update via the settings header's "Update Package" button — the old
+        # auto-update option is gone, and its stale
         # ``sb.settings.tb000.menu.auto_update`` widget-chain crashed here:
         # ``sb.settings`` is a SettingsManager now, not the settings window.)
-        if self.new_version_available:
-            hud.insertText(
-                f'New release available: <font style="color: Cyan;">{self.latest_ver}</font>'
-            )
+        check = self._update_check
+        if check is None or not check.done() or check.exception() is not None:
+            return
+        for dist, _installed, latest in SettingsMixin.outdated_dists(check.result()):
+            if dist == "tentacletk":
+                hud.insertText(
+                    f'New release available: <font style="color: Cyan;">{latest}</font>'
+                )
+
+    def insert_scene_status(self, hud) -> None:
         # Symmetry status
         if cmds.symmetricModelling(q=True, symmetry=True):
             axis = cmds.symmetricModelling(q=True, axis=True)
@@ -94,15 +107,14 @@ class HudSelectionMixin:
                             f'Instances: <font style="color: Yellow;">{len(instance_paths)}</font>'
                         )
 
-            objectFaces = cmds.polyEvaluate(selection, face=True)
-            if isinstance(objectFaces, int):
-                hud.insertText(f'Faces: <font style="color: Yellow;">{objectFaces:,d}')
-            objectTris = cmds.polyEvaluate(selection, triangle=True)
-            if isinstance(objectTris, int):
-                hud.insertText(f'Tris: <font style="color: Yellow;">{objectTris:,d}')
-            objectUVs = cmds.polyEvaluate(selection, uvcoord=True)
-            if isinstance(objectUVs, int):
-                hud.insertText(f'UVs: <font style="color: Yellow;">{objectUVs:,d}')
+            # One cached read for all three (SceneStats); a selection without
+            # meshes prints no counts, as polyEvaluate's non-int answer did.
+            meshes = self.mesh_shapes(selection)
+            if meshes:
+                counts = self.scene_stats().totals(meshes)
+                hud.insertText(f'Faces: <font style="color: Yellow;">{counts["faces"]:,d}')
+                hud.insertText(f'Tris: <font style="color: Yellow;">{counts["tris"]:,d}')
+                hud.insertText(f'UVs: <font style="color: Yellow;">{counts["uvs"]:,d}')
 
     def insert_component_info(self, hud, selection) -> None:
         type_, num_selected, total_num = None, None, None
@@ -210,40 +222,75 @@ class WarningsMixin(HudWarningsMixin):
 
 
 class HudSlots(
-    SlotsMaya, ptk.PackageManager, StatusMixin, HudSelectionMixin, WarningsMixin
+    HudMixin,
+    SlotsMaya,
+    StatusMixin,
+    HudSelectionMixin,
+    WarningsMixin,
 ):
-    """HUD Slots for Maya, providing scene and selection information."""
+    """HUD Slots for Maya, providing scene and selection information.
+
+    Sections are cached and replayed by the shared :class:`tentacle.HudMixin`; the
+    scriptJob events below are what make each one stale.
+    """
 
-    _hud_request_token: int = 0
+    HUD_SECTION_EVENTS = {
+        "status": (
+            "SymmetricModellingOptionsChanged",
+            "linearUnitChanged",
+            "timeUnitChanged",
+            "workspaceChanged",
+            "SceneOpened",
+            "NewSceneOpened",
+            # xformConstraint has no event of its own; it is set from a tool's
+            # settings, so a tool change is the closest signal that it may have.
+            "ToolChanged",
+        ),
+        "selection": (
+            "SelectionChanged",
+            "SelectModeChanged",
+            "SelectTypeChanged",
+            "Undo",
+            "Redo",
+            "SceneOpened",
+            "NewSceneOpened",
+        ),
+        "components": (
+            "SelectionChanged",
+            "SelectModeChanged",
+            "SelectTypeChanged",
+            "Undo",
+            "Redo",
+            "SceneOpened",
+            "NewSceneOpened",
+        ),
+    }
+
+    #: Undo / Redo, and every command recorded for Repeat Last — an edit that leaves
+    #: the undo queue's head as it was still moves the key.
+    HUD_EDIT_EVENTS = ("Undo", "Redo", "RecentCommandChanged")
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         mayapy = os.path.join(mtk.get_env_info("install_path"), "bin", "mayapy.exe")
-        self.start_version_check(package_name="tentacletk", python_path=mayapy)
+        self._update_check = SettingsMixin.start_update_check(mayapy)
 
         self.ui = self.sb.loaded_ui.hud_startmenu
         self.ui.hudTextEdit.shown.connect(self.request_hud_build)
         self._active_warnings: list = []
+        self._subscribe_hud_invalidation()
 
-    def request_hud_build(self) -> None:
-        """Start a new HUD build request, only the latest token will be used."""
-        self._hud_request_token += 1
-        my_token = self._hud_request_token
+    def _script_job_manager(self):
+        return mtk.ScriptJobManager
 
-        # Lightweight pre-build phase: evaluate opted-in warnings synchronously
-        # and surface their icons immediately so the user gets feedback even if
-        # they dismiss the HUD before the delayed full build runs.
-        self._active_warnings = self.evaluate_warnings()
-        self.insert_warning_icons(self.ui.hudTextEdit, self._active_warnings)
-
-        self.sb.QtCore.QTimer.singleShot(500, lambda: self._delayed_hud_build(my_token))
-
-    def _delayed_hud_build(self, token: int) -> None:
-        if token != self._hud_request_token:
-            return  # Outdated request, ignore.
-        if not (self.ui.isVisible() and self.ui.hudTextEdit.isVisible()):
-            return
-        self.construct_hud()
+    def _hud_edit_key(self):
+        """The head of the undo queue: most undoable edits (a smooth, an extrude on a
+        still-selected mesh) move it, where no selection event would fire; the
+        :attr:`HUD_EDIT_EVENTS` counter covers a repeat of the same edit."""
+        return (
+            cmds.undoInfo(q=True, undoName=True),
+            cmds.undoInfo(q=True, redoName=True),
+        )
 
     def construct_hud(self) -> None:
         hud = self.ui.hudTextEdit
@@ -252,19 +299,23 @@ class HudSlots(
 
         selection = cmds.ls(sl=True) or []
         if not selection:
-            self.insert_scene_status(hud)
+            self.insert_version_status(hud)
+            self.hud_section(hud, "status", self.insert_scene_status)
         else:
             if cmds.selectMode(q=True, object=True):
-                self.insert_selection_info(hud, selection)
+                self.hud_section(
+                    hud,
+                    "selection",
+                    lambda lines: self.insert_selection_info(lines, selection),
+                )
             elif cmds.selectMode(q=True, component=1):
-                self.insert_component_info(hud, selection)
+                self.hud_section(
+                    hud,
+                    "components",
+                    lambda lines: self.insert_component_info(lines, selection),
+                )
 
-        method = self.sb.prev_slot
-        if method:
-            # Get button text from last used command
-            hud.insertText(
-                'Prev Command: <font style="color: Yellow;">{}'.format(method.__doc__)
-            )
+        self.insert_prev_command(hud)
 
 
 # --------------------------------------------------------------------------------------------
@@ -1,7 +1,9 @@
 # !/usr/bin/python
 # coding=utf-8
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 import maya.mel as mel
+import pythontk as ptk
 import mayatk as mtk
 
 # From this package:
@@ -160,11 +162,10 @@ class MaterialsSlots(MaterialsMixin, SlotsMaya):
         root.sublist.add("New")
         root.sublist.add("Random")
 
-        # Then every scene material, sorted
-        scene_mats = mtk.MatUtils.get_scene_mats(
-            exc="standardSurface", sort=True
-        ) or []
-        for mat in scene_mats:
+        # Then every scene material, sorted (read off the material index).
+        for mat in self.indexed_materials(
+            exclude_defaults=True, exc="standardSurface"
+        ).values():
             root.sublist.add(str(mat))
 
     @SlotsMaya.Signals("on_item_interacted")
@@ -399,29 +400,87 @@ class MaterialsSlots(MaterialsMixin, SlotsMaya):
             # material changes — their root row mirrors it (see the mixin).
             widget.on_editing_finished.connect(self._refresh_assign_lists)
             widget.currentIndexChanged.connect(self._refresh_assign_lists)
+            self._subscribe_material_index(widget)
 
         # Use 'restore_index=True' to save and restore the index. Default
         # materials are shown unless the option-box toggle hides them.
         # (Shading-network utility nodes — aiMultiply, bump2d, … — are dropped
-        # by get_scene_mats itself; they were never materials.)
-        materials_dict = mtk.MatUtils.get_scene_mats(
-            sort=True,
-            as_dict=True,
+        # by get_scene_mats itself; they were never materials.) Read off the
+        # material index, so a show / popup with an unchanged scene rescans
+        # nothing and re-renders no swatch.
+        materials_dict = self.indexed_materials(
             exclude_defaults=self._list_option("chk_hide_defaults"),
-            exc_classification=(
-                "rendernode/arnold*"
-                if self._list_option("chk_hide_arnold")
-                else None
-            ),
+            exclude_arnold=self._list_option("chk_hide_arnold"),
         )
         widget.add(materials_dict, clear=True, restore_index=True)
 
         # Create and set icons with color swatch
-        for i, mat in enumerate(widget.items):
-            icon = mtk.MatUtils.get_mat_swatch_icon(mat)
+        for i, mat in enumerate(materials_dict.values()):
+            icon = self.material_swatch(mat)
             if icon:
                 widget.setItemIcon(i, icon)
 
+    # --- Material index (see MaterialsMixin) ----------------------------
+
+    #: The scriptJob half of what invalidates the index; the node added / removed /
+    #: renamed half has no scriptJob event and is registered as OpenMaya callbacks
+    #: in :meth:`_subscribe_material_index`.
+    MATERIAL_INDEX_EVENTS = ("SceneOpened", "NewSceneOpened")
+
+    def _script_job_manager(self):
+        return mtk.ScriptJobManager
+
+    def _subscribe_material_index(self, widget):
+        """Add node added / removed / renamed callbacks to the scriptJob events.
+
+        Unfiltered by node type: a material can be any plugin type, and each
+        callback only drops a reference, so the cost is a Python call per node.
+        """
+        mgr = super()._subscribe_material_index(widget)
+        on_change = lambda *_: self.invalidate_material_index()  # noqa: E731
+        for register, args in (
+            (om.MDGMessage.addNodeAddedCallback, (on_change,)),
+            (om.MDGMessage.addNodeRemovedCallback, (on_change,)),
+            (om.MNodeMessage.addNameChangedCallback, (om.MObject.kNullObj, on_change)),
+        ):
+            try:
+                mgr.add_om_callback(register, *args, owner=widget)
+            except Exception as error:
+                self.sb.logger.debug(f"[materials] {register.__name__}: {error}")
+        return mgr
+
+    def _build_material_index(self):
+        """One pass per flag over ``get_scene_mats`` — the engine stays the SSoT for
+        what counts as a material, a default, or an Arnold shader."""
+        materials = [
+            str(m)
+            for m in mtk.MatUtils.get_scene_mats(exclude_defaults=False, sort=True)
+            or ()
+        ]
+        user = set(map(str, mtk.MatUtils.get_scene_mats() or ()))
+        non_arnold = set(
+            map(
+                str,
+                mtk.MatUtils.get_scene_mats(
+                    exclude_defaults=False, exc_classification="rendernode/arnold*"
+                )
+                or (),
+            )
+        )
+        return [
+            {
+                "name": m,
+                "short": mtk.CoreUtils.short_name(m),
+                "leaf": mtk.CoreUtils.leaf_name(m),
+                "default": m not in user,
+                "arnold": m not in non_arnold,
+            }
+            for m in materials
+        ]
+
+    def _material_swatch_icon(self, name):
+        return mtk.MatUtils.get_mat_swatch_icon(name)
+
     #: objectNames of the cmb002 option-box list-filter checkboxes. The label
     #: shown when one is reported comes off the widget itself — a second copy
     #: here would be free to drift from the text the user actually sees.
@@ -944,16 +1003,14 @@ class MaterialsSlots(MaterialsMixin, SlotsMaya):
                     tex_materials = [
                         m for m in tex_materials if mtk.MatUtils.is_mat_assigned(m)
                     ]
-                info = (
-                    mtk.MatUtils.get_texture_info(materials=tex_materials)
+                # Only the paths are a scene read; the per-file size / image IO
+                # and the HTML run on a worker below (``stream_report``).
+                paths = (
+                    mtk.MatUtils.get_texture_paths(materials=tex_materials)
                     if tex_materials
                     else []
                 )
-                if not info:
-                    html = None
-                else:
-                    html = mtk.MatUtils.format_texture_info_html(info)
-                    title = f"Texture Info — {len(info)} texture(s)"
+                html = None
             else:
                 # "current" scope explicitly targets one material, so the
                 # scope-wide filters would just drop the user's pick.
@@ -980,6 +1037,21 @@ class MaterialsSlots(MaterialsMixin, SlotsMaya):
                     mtk.MatUtils.format_mat_info_html(records) if records else None
                 )
 
+        if scope == "textures" and paths:
+
+            def sections():
+                info = ptk.ImgUtils.get_image_info(paths)
+                yield mtk.MatUtils.format_texture_info_html(info) if info else ""
+
+            self.stream_report(
+                sections(),
+                name="Texture Info",
+                title=f"Texture Info — {len(paths)} texture(s)",
+                size=(760, 520),
+                empty="<hl>No textures</hl> found in scene.",
+            )
+            return
+
         if html is None:
             if scope == "textures":
                 self.sb.message_box("<hl>No textures</hl> found in scene.")
@@ -487,6 +487,7 @@ class Rendering(RenderingMixin, SlotsMaya):
             engine=mtk.WebXrPreview,
             has_selection=lambda: bool(cmds.ls(selection=True)),
             log_hint="script editor",
+            delta=SlotsMaya.webxr_delta(),
         )
 
     def b001(self):
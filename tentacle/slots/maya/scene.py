@@ -178,28 +178,11 @@ class SceneSlots(SceneMixin, SlotsMaya):
         except Exception as e:
             self.sb.message_box(f"FBX UI callback failed:\n{e}")
 
-    def cmb002_init(self, widget):
-        """Initialize Autosave"""
-        # Fetch recent autosave files
-        recent_autosaves = mtk.get_recent_autosave(
-            filter_time=24, timestamp_format="%H:%M:%S"
-        )
-
-        # Prepare dictionary for ComboBox: key is 'path + timestamp', value is 'path'
-        autosave_dict = {
-            f"{i[1]}  {ptk.format_path(i[0], 'file')}": i[0] for i in recent_autosaves
-        }
-
-        # Add items to the ComboBox
-        widget.add(
-            autosave_dict,
-            header="Autosave:",
-            clear=True,
-        )
-
     def cmb002(self, index, widget):
         """Autosave: reopen a recent autosaved scene file."""
         file = widget.items[index]
+        if self._recent_file_missing(file):
+            return
         try:
             cmds.file(file, open=True, force=True)
         except RuntimeError as e:
@@ -392,17 +375,44 @@ class SceneSlots(SceneMixin, SlotsMaya):
         if action:
             action(self)
 
-    def list000_init(self, widget):
-        """Initialize Recent Files"""
-        widget.fixed_item_height = 18
-        widget.apply_preset(
-            "expand_up" if widget.ui.has_tags("submenu") else "hover_menu"
+    #: Recent Files / Autosave (SceneMixin hooks).
+    RECENT_HOST = "maya"
+    AUTOSAVE_EXTENSIONS = (".ma", ".mb")
+
+    def _recent_file_paths(self):
+        """Maya's recent-file list, newest first (SceneMixin hook).
+
+        The optionVar, not ``mtk.get_recent_files``: that stats every entry, and
+        the index does the statting on its worker. Autosaves Maya logged as recent
+        are left to the Autosave list, as ``get_recent_files`` leaves them.
+        """
+        files = cmds.optionVar(q="RecentFilesList") or []
+        return [f for f in reversed(files) if "Autosave" not in f]
+
+    def _autosave_dirs(self):
+        """Where Maya's autosaves may be, unchecked (SceneMixin hook).
+
+        The candidates ``mtk.EnvUtils.find_autosave_directories`` walks — the named
+        ``autoSave -folder``, the workspace's, ``MAYA_AUTOSAVE_FOLDER``'s and the
+        home one — without its ``os.path.exists`` per directory: a network folder
+        would stall the UI thread on it, and the index's worker skips a directory
+        it cannot list.
+        """
+        named = None
+        if cmds.autoSave(q=True, destination=True) == 1:
+            named = cmds.autoSave(q=True, folder=True) or None
+        candidates = (
+            named,
+            os.path.join(cmds.workspace(q=True, rd=True), "autosave"),
+            os.environ.get("MAYA_AUTOSAVE_FOLDER"),
+            os.path.expanduser("~/maya/autosave"),
         )
-        recent_files = mtk.get_recent_files(slice(0, 11))
-        w1 = widget.add("Recent Files")
-        truncated = ptk.truncate(recent_files, 65)
-        w1.sublist.add(zip(truncated, recent_files))
-        widget.setVisible(bool(recent_files))
+        found = {}
+        for entry in candidates:
+            for directory in entry.split(";") if entry else ():
+                key = os.path.normcase(os.path.normpath(directory))
+                found.setdefault(key, directory)
+        return list(found.values())
 
     @SlotsMaya.Signals("on_item_interacted")
     def list000(self, item):
@@ -410,6 +420,8 @@ class SceneSlots(SceneMixin, SlotsMaya):
         data = item.item_data()
         if not data:  # the "Recent Files" category row carries no file
             return
+        if self._recent_file_missing(data):
+            return
         cmds.file(data, open=True, force=True)
 
     def _script_job_manager(self):
@@ -535,6 +547,21 @@ class SceneSlots(SceneMixin, SlotsMaya):
             )
             for text, data in self._export_format_items():
                 cmb_format.addItem(text, data)
+            cmb_split = widget.option_box.menu.add(
+                "QComboBox",
+                setObjectName="cmb_split",
+                setToolTip=(
+                    "Split the export across files (not Blend):\n"
+                    "• Single File — everything in one file\n"
+                    "• One File per Assembly — a file per top-level object\n"
+                    f"• Split by Triangle Budget — files of up to "
+                    f"{self.EXPORT_CHUNK_TRIS:,} triangles\n"
+                    "Split exports also write <name>.manifest.json listing the files;\n"
+                    "GLB conversions of the parts run in parallel."
+                ),
+            )
+            for text, data in self.EXPORT_SPLIT_ITEMS:
+                cmb_split.addItem(text, data)
 
             # Cameras and lights are scene-level categories: in Selected Only
             # mode they'd only export if explicitly selected, so the
@@ -568,15 +595,13 @@ class SceneSlots(SceneMixin, SlotsMaya):
         """
         if not include_tangents:
             return True
-        meshes = (
-            cmds.ls(selection=True, dag=True, type="mesh", noIntermediate=True)
-            if selection_only
-            else cmds.ls(type="mesh", noIntermediate=True)
-        ) or []
+        meshes = self.mesh_shapes(
+            (cmds.ls(selection=True, long=True) or []) if selection_only else None
+        )
         if not meshes:
             return True
-        tris = cmds.polyEvaluate(meshes, triangle=True)
-        if not isinstance(tris, int) or tris < self._DENSE_TRI_THRESHOLD:
+        tris = self.scene_stats().totals(meshes)["tris"]
+        if tris < self._DENSE_TRI_THRESHOLD:
             return True
         choice = self.sb.message_box(
             f"This export covers <hl>{tris:,}</hl> triangles with "
@@ -588,6 +613,49 @@ class SceneSlots(SceneMixin, SlotsMaya):
         )
         return choice == "Yes"
 
+    def _export_chunk_roots(self, options):
+        """Top-level transforms to split across files, with their triangle counts (SceneMixin hook).
+
+        The selection's roots, or every assembly bar the startup cameras — and bar
+        the camera and light transforms the options leave out, so no chunk is a
+        file with nothing in it. Counts cover each root's whole hierarchy.
+        """
+        if options["selection_only"]:
+            roots = cmds.ls(selection=True, long=True, transforms=True) or []
+        else:
+            startup = {
+                t
+                for c in cmds.ls(cameras=True, long=True) or []
+                if cmds.camera(c, query=True, startupCamera=True)
+                for t in cmds.listRelatives(c, parent=True, fullPath=True) or []
+            }
+            roots = [
+                r for r in cmds.ls(assemblies=True, long=True) or [] if r not in startup
+            ]
+            shapes = (
+                cmds.listRelatives(roots, shapes=True, fullPath=True) or []
+                if roots
+                else []
+            )
+            left_out = set()
+            for kind in ("cameras", "lights"):
+                if options[f"include_{kind}"] or not shapes:
+                    continue
+                matched = cmds.ls(shapes, long=True, **{kind: True}) or []
+                if matched:
+                    left_out.update(
+                        cmds.listRelatives(matched, parent=True, fullPath=True) or []
+                    )
+            roots = [r for r in roots if r not in left_out]
+        meshes = self.mesh_shapes(roots)
+        stats = self.scene_stats()
+        column = stats.counts(meshes)[:, stats.FIELDS.index("tris")]
+        tris = dict(zip(meshes, column.tolist()))
+        return [
+            (root, sum(tris[m] for m in shapes))
+            for root, shapes in self.dag.by_root(roots, meshes).items()
+        ]
+
     def _export_scene_native(self, export_format, out_path, options, tick):
         """Write FBX / OBJ / GLB (SceneMixin hook).
 
@@ -599,7 +667,30 @@ class SceneSlots(SceneMixin, SlotsMaya):
         ``SceneExporter`` follows for its own ``output_format="glb"``. The converter
         does take a ``dst``, but writing straight to the target would leave a partial
         .glb there if it failed — the deliverable is only touched on success.
+
+        The conversion is returned as the export job's tail (see SceneMixin), so
+        only the FBX write and the scene read hold the Qt thread.
+
+        A split export passes one chunk's roots as ``options["objects"]``: they are
+        exported as a selection, and the user's selection is put back afterwards.
         """
+        objects = options.get("objects")
+        if objects:
+            previous = cmds.ls(selection=True, long=True)
+            cmds.select(objects, replace=True)
+            try:
+                return self._export_scene_native(
+                    export_format,
+                    out_path,
+                    dict(options, objects=None, selection_only=True),
+                    tick,
+                )
+            finally:
+                if previous:
+                    cmds.select(previous, replace=True)
+                else:
+                    cmds.select(clear=True)
+
         if export_format == "obj":
             mtk.export_scene_as_obj(
                 file_path=out_path,
@@ -631,30 +722,40 @@ class SceneSlots(SceneMixin, SlotsMaya):
         # shader base colour / emissive) and rides embedded in the GLB. The
         # Blender fork deliberately has no counterpart: it writes GLB through
         # Blender's native glTF exporter — no FBX hop, nothing to repair.
-        sidecar = None
+        # Only the scene read needs Maya; building the sidecar and the conversion
+        # (an FBX2glTF subprocess, a first-use install) are the tail, off the Qt thread.
+        state = source = None
         try:
             objects = (
                 cmds.ls(selection=True, long=True)
                 if options["selection_only"]
                 else cmds.ls(assemblies=True, long=True)
             )
-            sidecar = ptk.MeshConvert.build_scene_sidecar(
-                mtk.SceneState.read(
-                    objects, include_textures=options["embed_textures"]
-                ),
-                source=mtk.SceneState.source(),
-                asset=os.path.basename(write_path),
-            )
+            state = mtk.SceneState.read(objects, include_textures=options["embed_textures"])
+            source = mtk.SceneState.source()
         except Exception:  # a bare GLB still beats no GLB
             self.sb.logger.warning("Scene sidecar skipped.", exc_info=True)
 
-        tick(text="Converting to GLB…")
-        glb_path = ptk.MeshConvert.fbx_to_glb(
-            write_path, overwrite=True, auto_install=True, prompt=False, sidecar=sidecar
-        )
-        if not (glb_path and os.path.isfile(glb_path)):
-            raise RuntimeError("FBX to GLB conversion produced no file.")
-        shutil.move(glb_path, out_path)
+        def convert(job):
+            sidecar = None
+            if state is not None:
+                try:
+                    sidecar = ptk.MeshConvert.build_scene_sidecar(
+                        state, source=source, asset=os.path.basename(write_path)
+                    )
+                except Exception:
+                    self.sb.logger.warning("Scene sidecar skipped.", exc_info=True)
+            job.check()
+            job.progress(text="Converting to GLB…")
+            glb_path = ptk.MeshConvert.fbx_to_glb(
+                write_path, overwrite=True, auto_install=True, prompt=False, sidecar=sidecar
+            )
+            if not (glb_path and os.path.isfile(glb_path)):
+                raise RuntimeError("FBX to GLB conversion produced no file.")
+            job.check()  # the deliverable is only touched by a run that wasn't cancelled
+            shutil.move(glb_path, out_path)
+
+        return convert
 
     def b004(self):
         """Open Hierarchy Sync"""
@@ -776,45 +877,50 @@ class SceneSlots(SceneMixin, SlotsMaya):
         # branches so the user sees a clear message instead of a blank
         # viewer.
         if scope == "all":
-            objects = cmds.ls(type="mesh", long=True, ni=True) or []
+            objects = self.mesh_shapes()
             if not objects:
                 self.sb.message_box(
                     "<hl>No mesh geometry</hl> found in the scene."
                 )
                 return
+            meshes = objects
         else:
-            if not (cmds.ls(selection=True, long=True) or []):
+            selection = cmds.ls(selection=True, long=True) or []
+            if not selection:
                 self.sb.message_box(
                     "<hl>Nothing selected</hl>. Select objects, or pick "
                     "'Entire Scene' from the option menu."
                 )
                 return
             objects = None
-
-        # ``progress_adapter`` auto-syncs the bar's max from the analyzer's
-        # ``(current, 100, message)`` callbacks on the first tick.
-        with self.sb.progress(text="Working: Get Scene Info") as update:
+            meshes = self.mesh_shapes(selection)
+
+        # The scope's size up front, from the shared cache the HUD already filled:
+        # tells the user what they are waiting on before the analyzer's first tick.
+        counts = self.scene_stats().totals(meshes)
+        text = (
+            f"Working: Get Scene Info ({len(meshes):,} meshes, "
+            f"{counts['tris']:,} tris)"
+        )
+        # The analysis reads Maya, so it runs on the UI thread; ``progress_adapter``
+        # auto-syncs the bar's max from the analyzer's ``(current, 100, message)``
+        # callbacks. ``format_audit_html`` returns the report as ``{section: html}``
+        # (``"_header"`` first) under the Adaptive / Generic profile it names.
+        with self.sb.progress(text=text) as update:
             html_dict = mtk.SceneAnalyzer.format_audit_html(
                 adaptive=bool(adaptive),
                 objects=objects,
                 progress_callback=self.sb.progress_adapter(update),
                 sections=sections,
             )
-        # Named report_html (not ``html``) so the module-level ``import html`` used by
-        # b017's ``html.escape`` stays reachable — a bare ``html`` local would shadow it.
-        report_html = "".join(html_dict.values()) if html_dict else ""
-        if not report_html:
-            self.sb.message_box(
-                "<hl>No scene info</hl> available — analyze returned no records."
-            )
-            return
-
-        self.sb.text_view_dialog(
-            report_html,
-            "Ok",
+        # Shown section by section from a worker: the viewer opens on the header and
+        # fills in as each chunk is added.
+        self.stream_report(
+            (html_dict or {}).values(),
+            name="Get Scene Info",
             title="Get Scene Info",
             size=(820, 560),
-            monospace=False,
+            empty="<hl>No scene info</hl> available — analyze returned no records.",
         )
 
     def b011(self):
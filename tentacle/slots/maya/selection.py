@@ -7,6 +7,75 @@ from tentacle import SelectionMixin, SlotsMaya
 
 
 class Selection(SelectionMixin, SlotsMaya):
+    #: Node types each Select by Type leaf can match — the pool the "All Objects" scope
+    #: reads off :meth:`SlotsMaya.type_index` instead of every node in the scene. A leaf
+    #: absent here (the hierarchy walks) still draws from ``cmds.ls()``.
+    _BY_TYPE_POOLS = {
+        "Animated Objects": ("transform",),
+        "Clusters": ("clusterHandle",),
+        "Constraints": ("constraint",),
+        "IK Handles": ("ikHandle", "hikEffector"),
+        "Joints": ("joint",),
+        "Brushes": ("brush",),
+        "Dynamic Constraints": ("dynamicConstraint",),
+        "Fluids": ("fluidShape",),
+        "Follicles": ("follicle",),
+        "Lattices": ("lattice",),
+        "nCloths": ("nCloth",),
+        "nParticles": ("nParticle",),
+        "nRigids": ("nRigid",),
+        "Particles": ("particle",),
+        "Rigid Bodies": ("rigidBody",),
+        "Rigid Constraints": ("rigidConstraint",),
+        "Sculpts": ("implicitSphere", "sculpt"),
+        "Strokes": ("stroke",),
+        "Wires": ("wire",),
+        "All Geometry": ("shape",),
+        "Hidden Geometry": ("shape",),
+        "Non-Selectable Geometry": ("shape",),
+        "NURBS Curves": ("nurbsCurve",),
+        "NURBS Surfaces": ("nurbsSurface",),
+        "Polygon Meshes": ("mesh",),
+        "Single-Instance Geometry": ("shape",),
+        "Templated Geometry": ("shape",),
+        "Groups": ("transform",),
+        "Assets": ("container", "dagContainer"),
+        "Cameras": ("camera",),
+        "Image Planes": ("imagePlane",),
+        "Lights": ("light",),
+        "Locators": ("locator",),
+        "Keyed Locators": ("locator",),
+        "Transforms": ("transform",),
+        "Back-Facing": ("mesh",),
+        "Front-Facing": ("mesh",),
+        "Overlapping": ("mesh",),
+        "Non-Overlapping": ("mesh",),
+        "Texture Borders": ("mesh",),
+        "Unmapped": ("mesh",),
+    }
+
+    #: Leaves whose handler matches ``exactType`` rather than the type and its subtypes.
+    _BY_TYPE_EXACT = {"Locators", "Keyed Locators"}
+
+    #: Leaves whose pool is wider than their matches (a further per-node test), so the
+    #: row shows no count.
+    _BY_TYPE_UNCOUNTED = {
+        "Animated Objects",
+        "All Geometry",
+        "Hidden Geometry",
+        "Non-Selectable Geometry",
+        "Single-Instance Geometry",
+        "Templated Geometry",
+        "Groups",
+        "Keyed Locators",
+        "Back-Facing",
+        "Front-Facing",
+        "Overlapping",
+        "Non-Overlapping",
+        "Texture Borders",
+        "Unmapped",
+    }
+
     def __init__(self, switchboard):
         super().__init__(switchboard)
 
@@ -14,7 +83,15 @@ class Selection(SelectionMixin, SlotsMaya):
         self.submenu = self.sb.loaded_ui.selection_submenu
 
     def list000_init(self, widget):
-        """Select by Type: Hierarchical type list."""
+        """Select by Type: Hierarchical type list.
+
+        Built once; on every later show (``refresh_on_show``) only the row labels are
+        redrawn with the live node counts from :meth:`SlotsMaya.type_index`.
+        """
+        if widget.is_initialized:
+            self._by_type_label(widget)
+            return
+        widget.refresh_on_show = True
         submenu = widget.ui.has_tags("submenu")
         widget.fixed_item_height = 18
         widget.apply_preset("expand_up" if submenu else "hover_menu")
@@ -41,13 +118,40 @@ class Selection(SelectionMixin, SlotsMaya):
         if not submenu:
             self.add_slot_widget(root.sublist, **tb004_kwargs)
 
+        # Leaves carry their type name as item data: the label gains a count.
+        widget.type_rows = []  # (row, name, leaves) — relabelled on each show
         categories = mtk.Selection.get_selection_categories()
         for category, types in categories.items():
             w = root.sublist.add(category)
-            w.sublist.add(sorted(types))
+            leaves = sorted(types)
+            widget.type_rows.append((w, category, leaves))
+            for leaf, row in zip(leaves, w.sublist.add({t: t for t in leaves})):
+                widget.type_rows.append((row, leaf, [leaf]))
 
         if submenu:
             self.add_slot_widget(root.sublist, **tb004_kwargs)
+        self._by_type_label(widget)
+
+    def _by_type_label(self, widget):
+        """Label each Select by Type row with how many nodes of its types the scene holds.
+
+        A category counts the nodes its counted leaves would match, once each.
+        """
+        index = self.type_index()
+        for row, name, leaves in widget.type_rows:
+            counted = [
+                t
+                for t in leaves
+                if t in self._BY_TYPE_POOLS and t not in self._BY_TYPE_UNCOUNTED
+            ]
+            if not counted:
+                row.setText(name)
+                continue
+            ids = set()
+            for leaf in counted:
+                exact = leaf in self._BY_TYPE_EXACT
+                ids |= index.ids(self._BY_TYPE_POOLS[leaf], exact=exact)
+            row.setText(f"{name} ({len(ids)})")
 
     @SlotsMaya.Signals("on_item_interacted")
     def list000(self, item):
@@ -68,10 +172,12 @@ class Selection(SelectionMixin, SlotsMaya):
             self.tb004(item)
             return
 
-        selection_type = item.item_text()
-        objects = self._by_type_scope_objects()
+        selection_type = item.item_data() or item.item_text()
+        objects = self._by_type_scope_objects(selection_type)
         if not objects:
-            self.sb.message_box("Select by Type: no objects in the current scope.")
+            self.sb.message_box(
+                f"Select by Type: no {selection_type.lower()} in the current scope."
+            )
             return
         mode = self._by_type_mode()
 
@@ -151,15 +257,26 @@ class Selection(SelectionMixin, SlotsMaya):
         """
         widget.menu.show_as_popup(anchor_widget=widget, position="cursorPos")
 
-    def _by_type_scope_objects(self):
-        """The object pool Select by Type filters from, per the tb004 scope."""
+    def _by_type_scope_objects(self, selection_type=None):
+        """The object pool Select by Type filters from, per the tb004 scope.
+
+        With a *selection_type* known to :attr:`_BY_TYPE_POOLS`, "All Objects" and
+        "Visible" are narrowed to the nodes of its types, read off the type index.
+        """
         menu = self.submenu.tb004.menu
         scope = menu.cmb_bytype_scope.currentData() or "all"
         if scope == "selected":
             return cmds.ls(selection=True) or []
-        if scope == "visible":
-            return cmds.ls(visible=True) or []
-        return cmds.ls() or []
+        types = self._BY_TYPE_POOLS.get(selection_type)
+        if types is None:
+            if scope == "visible":
+                return cmds.ls(visible=True) or []
+            return cmds.ls() or []
+        exact = selection_type in self._BY_TYPE_EXACT
+        pool = self.type_index().names(types, exact=exact)
+        if scope == "visible" and pool:
+            return cmds.ls(pool, visible=True) or []
+        return pool
 
     def _by_type_mode(self):
         """The selection mode Select by Type applies, per the tb004 setting."""
@@ -604,6 +721,16 @@ class Selection(SelectionMixin, SlotsMaya):
                 "final selection."
             ),
         )
+        # Object mode: once a search has run, editing these re-selects from the
+        # cached descriptors (see _similar_live) instead of waiting for a click.
+        menu.s000.valueChanged.connect(lambda *_: self._similar_live(menu))
+        for name in [m[0] for m in self._SIMILAR_METRICS] + ["chk020"]:
+            getattr(menu, name).toggled.connect(lambda *_: self._similar_live(menu))
+        # A snapshot names the meshes of the scene it was taken in.
+        mgr = mtk.ScriptJobManager.instance()
+        for event in ("SceneOpened", "NewSceneOpened"):
+            mgr.subscribe(event, self._similar_forget, owner=menu)
+        mgr.connect_cleanup(menu, owner=menu)
 
     def tb001(self, widget):
         """Select Similar.
@@ -636,13 +763,21 @@ class Selection(SelectionMixin, SlotsMaya):
             if selection is None:
                 return
 
-            result = mtk.get_similar_mesh(
-                selection,
-                tolerance=tolerance,
-                inc_orig=menu.chk020.isChecked(),
-                select=True,
-                **metrics,
-            )
+            self._similar_query = None
+            snapshot = self.similar_index().snapshot(self._similar_candidates())
+            references = [snapshot.index(t) for t in cmds.ls(selection, long=True)]
+            if None in references:
+                # A reference that is not a polygon mesh: measured on demand.
+                result = mtk.get_similar_mesh(
+                    selection,
+                    tolerance=tolerance,
+                    inc_orig=menu.chk020.isChecked(),
+                    select=True,
+                    **metrics,
+                )
+            else:
+                self._similar_query = {"snapshot": snapshot, "references": references}
+                result = self._similar_select(menu)
             # A no-match either silently clears the selection or (with Include
             # Original on) leaves it untouched — both read as "the button did
             # nothing". Compare against the originals rather than the returned
@@ -708,6 +843,57 @@ class Selection(SelectionMixin, SlotsMaya):
                     "Try a <hl>face</hl> or <hl>object</hl> selection instead."
                 )
 
+    _similar_query = None  # the last object-mode search, re-run by _similar_live
+
+    def _similar_candidates(self):
+        """Every polygon-mesh transform (long names), one per instance."""
+        shapes = self.mesh_shapes()
+        if not shapes:
+            return []
+        parents = cmds.listRelatives(shapes, allParents=True, fullPath=True) or []
+        return list(dict.fromkeys(parents))
+
+    def _similar_select(self, menu):
+        """Select the matches of the last object-mode search for the current options.
+
+        Returns:
+            list: The selected transforms (long names).
+        """
+        query = self._similar_query
+        snapshot, references = query["snapshot"], query["references"]
+        metrics = [
+            kwarg
+            for name, _, kwarg, _, _ in self._SIMILAR_METRICS
+            if getattr(menu, name).isChecked()
+        ]
+        rows = snapshot.match(references, metrics, menu.s000.value())
+        if menu.chk020.isChecked():
+            rows += references
+        # Meshes deleted since the snapshot was taken drop out (``ls`` skips them).
+        result = cmds.ls([snapshot.meshes[i] for i in rows], long=True) or []
+        if result:
+            cmds.select(result, replace=True)
+        else:
+            cmds.select(clear=True)
+        query["selected"] = set(cmds.ls(sl=True, long=True))
+        return result
+
+    def _similar_forget(self, *_):
+        """Drop the last object-mode search (a new scene was opened)."""
+        self._similar_query = None
+
+    def _similar_live(self, menu):
+        """Re-select the last object-mode search after an option changed — from the
+        cached snapshot, no re-measure — unless the selection moved on since.
+        """
+        query = self._similar_query
+        if not query or not cmds.selectMode(q=True, object=True):
+            return
+        if set(cmds.ls(sl=True, long=True)) != query.get("selected"):
+            self._similar_query = None  # the user picked something else
+            return
+        self._similar_select(menu)
+
     def tb002_init(self, widget):
         """ """
         widget.option_box.menu.add(
@@ -762,10 +948,17 @@ class Selection(SelectionMixin, SlotsMaya):
         )
 
     def tb002(self, widget):
-        """Select Island: Select Polygon Face Island"""
-        range_x = float(widget.option_box.menu.s002.value())
-        range_y = float(widget.option_box.menu.s004.value())
-        range_z = float(widget.option_box.menu.s005.value())
+        """Select Island: Select Polygon Face Island
+
+        The faces whose normal lies within the x / y / z range of any selected face's,
+        grouped into islands by shared edges; the islands holding a selected face are
+        selected. Normals (object space, as ``polyInfo -faceNormals``), adjacency and
+        islands are arrays off :meth:`face_graphs`, not a ``polyInfo`` line per face.
+        """
+        import numpy as np
+
+        menu = widget.option_box.menu
+        ranges = (menu.s002.value(), menu.s004.value(), menu.s005.value())
 
         sel = cmds.ls(sl=1) or []
         selected_faces = (
@@ -778,16 +971,29 @@ class Selection(SelectionMixin, SlotsMaya):
             )
             or []
         )
-        if not selected_faces:
+        seeds = {}  # node -> [face index]
+        for face in selected_faces:
+            node, index = face.rsplit(".f[", 1)
+            seeds.setdefault(node, []).append(int(index[:-1]))
+
+        graphs = self.face_graphs()
+        meshes = []
+        for node, faces in seeds.items():
+            # The component names its own shape — a transform may carry several.
+            shape = cmds.ls(f"{node}.f[{faces[0]}]", objectsOnly=True, long=True)
+            if shape:
+                graph, normals = graphs.normals(shape[0])
+                meshes.append((shape[0], graph, normals, faces))
+        if not meshes:
             self.sb.message_box("The operation requires a face selection.")
             return
 
-        similar_faces = mtk.Components.get_faces_with_similar_normals(
-            selected_faces, range_x=range_x, range_y=range_y, range_z=range_z
-        )
-        islands = mtk.Components.get_contiguous_islands(similar_faces)
-        selected_set = set(selected_faces)
-        matching = [f for island in islands if island & selected_set for f in island]
+        # Any selected face's normal counts, on every mesh — as mtk pools them.
+        sources = np.concatenate([normals[faces] for _, _, normals, faces in meshes])
+        matching = []
+        for node, graph, normals, faces in meshes:
+            island = graph.similar_islands(normals, faces, ranges, sources)
+            matching.extend(graphs.components(node, "f", island))
         cmds.select(matching)
 
     def tb003_init(self, widget):
@@ -809,15 +1015,28 @@ class Selection(SelectionMixin, SlotsMaya):
             setToolTip="Normal angle high range.",
         )
 
+    #: Degrees the Select Edges By Angle range is widened by at both ends, so an edge
+    #: typed in exactly (90) is not lost to round-off (``mtk``'s ``_ANGLE_MATCH_EPS``).
+    _EDGE_ANGLE_EPS = 1e-3
+
     def tb003(self, widget):
-        """Select Edges By Angle"""
-        angleLow = widget.option_box.menu.s006.value()
-        angleHigh = widget.option_box.menu.s007.value()
+        """Select Edges By Angle
 
-        objects = cmds.ls(sl=1, objectsOnly=1) or []
-        edges = mtk.Components.get_edges_by_normal_angle(
-            objects, low_angle=angleLow, high_angle=angleHigh
-        )
+        The angle between the world-space normals of each edge's two faces, for every
+        edge at once off :meth:`face_graphs`; a border or non-manifold edge reads 0.
+        """
+        import numpy as np
+
+        low = widget.option_box.menu.s006.value() - self._EDGE_ANGLE_EPS
+        high = widget.option_box.menu.s007.value() + self._EDGE_ANGLE_EPS
+
+        graphs = self.face_graphs()
+        edges = []
+        for shape in self.mesh_shapes(cmds.ls(sl=1, objectsOnly=1) or []):
+            graph, normals = graphs.normals(shape, world=True)
+            angles = np.nan_to_num(graph.edge_angles(normals), nan=0.0)
+            hit = np.flatnonzero((angles >= low) & (angles <= high))
+            edges.extend(graphs.components(shape, "e", hit))
         cmds.select(edges)
 
         cmds.selectMode(component=1)
@@ -1,6 +1,7 @@
 # !/usr/bin/python
 # coding=utf-8
 import os
+import time
 
 import maya.cmds as cmds
 import maya.mel as mel
@@ -458,45 +459,103 @@ class UvSlots(UvMixin, SlotsMaya):
         menu.s020.valueChanged.connect(_sync_gates)
         _sync_gates()
 
-    def _pack_u3d(self, all_uvs, meshes, pack_kwargs, successful, failed) -> None:
+    def _pack_u3d(self, all_uvs, meshes, pack_kwargs, successful, failed) -> dict:
         """Native u3dLayout pack with per-mesh failure isolation.
 
-        Batches all meshes into one call; on failure with several meshes,
-        probes each to isolate the bad one(s) and re-packs the survivors
-        together so they share the tile. A single mesh reports its failure
-        directly — a probe pass would just re-run the same failing call.
-        Appends to *successful* / *failed* in place.
+        1. Pre-screen: whole meshes with non-manifold vertices (``polyInfo``, no
+           pack) are skipped up front — u3dLayout rejects them, and one of them
+           fails the batch for everyone.
+        2. One batched call over the rest.
+        3. If that fails with several meshes, bisect: each failing group is split
+           in half and each half re-tried as one call, until the failing meshes
+           are single. k bad meshes among n cost O(k log n) calls, not n.
+        4. The survivors are re-packed together so they share the tile (each
+           passing half filled it on its own).
+
+        A single mesh reports its failure directly — a probe pass would just
+        re-run the same failing call. Appends to *successful* / *failed* in place.
+
+        Returns:
+            dict: ``calls`` (u3dLayout invocations), ``seconds`` (wall time) and
+            ``screened`` (meshes skipped by the pre-screen).
         """
-        try:
-            cmds.u3dLayout(all_uvs, **pack_kwargs)
-            successful.extend(str(m) for m in meshes)
-            return
-        except RuntimeError as batch_error:
-            if len(meshes) == 1:
-                failed.append((str(meshes[0]), self._classify_u3d_error(batch_error)))
-                return
+        start = time.perf_counter()
+        stats = {"calls": 0, "seconds": 0.0, "screened": 0}
 
-        good = []
-        for mesh in meshes:
-            uvs = cmds.polyListComponentConversion(mesh, fromFace=True, toUV=True) or []
-            if not uvs:
-                continue
+        def pack(uvs):
+            stats["calls"] += 1
             try:
                 cmds.u3dLayout(uvs, **pack_kwargs)
-                good.extend(uvs)
-                successful.append(str(mesh))
-            except RuntimeError as mesh_error:
-                failed.append((str(mesh), self._classify_u3d_error(mesh_error)))
-        if good:
-            try:
-                cmds.u3dLayout(good, **pack_kwargs)
-            except RuntimeError as combine_error:
-                # Survivors packed individually (each filling the tile);
-                # combine failed, so leave them as-is and surface the cause.
-                failed.append(
-                    ("<combined re-pack>", self._classify_u3d_error(combine_error))
+            except RuntimeError as error:
+                return error
+            return None
+
+        # Component entries ("pCube1.f[0:9]") are not screened: the mesh's
+        # non-manifold vertices may lie outside the selected region.
+        screened = self._non_manifold_vertices(
+            [m for m in meshes if "." not in str(m)]
+        )
+        if screened:
+            bad = set()
+            for shape in screened:
+                parents = cmds.listRelatives(shape, parent=True, fullPath=True) or []
+                bad.update(cmds.ls([shape] + parents, long=True))
+            kept = []
+            for mesh in meshes:
+                if "." not in str(mesh) and set(cmds.ls(mesh, long=True)) & bad:
+                    failed.append((str(mesh), "non-manifold vertices"))
+                else:
+                    kept.append(mesh)
+            stats["screened"] = len(meshes) - len(kept)
+            if not kept:
+                stats["seconds"] = time.perf_counter() - start
+                return stats
+            if len(kept) < len(meshes):
+                meshes = kept
+                all_uvs = (
+                    cmds.polyListComponentConversion(meshes, fromFace=True, toUV=True)
+                    or []
                 )
 
+        batch_error = pack(all_uvs)
+        if batch_error is None:
+            successful.extend(str(m) for m in meshes)
+        elif len(meshes) == 1:
+            failed.append((str(meshes[0]), self._classify_u3d_error(batch_error)))
+        else:
+            uvs_of = {}
+            for mesh in meshes:
+                uvs = cmds.polyListComponentConversion(mesh, fromFace=True, toUV=True)
+                if uvs:
+                    uvs_of[str(mesh)] = uvs
+            passed = []  # groups that packed as one call
+
+            def isolate(group, error):
+                if len(group) == 1:
+                    failed.append((group[0], self._classify_u3d_error(error)))
+                    return
+                mid = len(group) // 2
+                for half in (group[:mid], group[mid:]):
+                    half_error = pack([uv for m in half for uv in uvs_of[m]])
+                    if half_error is None:
+                        passed.append(half)
+                    else:
+                        isolate(half, half_error)
+
+            isolate(list(uvs_of), batch_error)
+            good = [m for half in passed for m in half]
+            successful.extend(good)
+            if len(passed) > 1:
+                combine_error = pack([uv for m in good for uv in uvs_of[m]])
+                if combine_error is not None:
+                    # Each passing group packed on its own (filling the tile);
+                    # the combine failed, so leave them as-is and surface the cause.
+                    failed.append(
+                        ("<combined re-pack>", self._classify_u3d_error(combine_error))
+                    )
+        stats["seconds"] = time.perf_counter() - start
+        return stats
+
     @staticmethod
     def _classify_u3d_error(error) -> str:
         """Condense an Unfold3D RuntimeError (u3dLayout / u3dUnfold / u3dOptimize)
@@ -510,23 +569,23 @@ class UvSlots(UvMixin, SlotsMaya):
             return "overlapping UVs"
         return msg.split("\n")[0][:50]
 
-    @staticmethod
-    def _non_manifold_vertices(objects):
+    def _non_manifold_vertices(self, objects):
         """Map each mesh in *objects* to its non-manifold vertices, via polyInfo.
 
         Native ``polyInfo`` is instant, unlike ``EditUtils.find_non_manifold_vertex``
         whose per-vertex Python scan is too slow for the heavy meshes that trip
-        Unfold. Returns ``{mesh_shape: [vertex_components]}`` (only meshes that
-        have any; empty dict when there are none).
+        Unfold. Answers come from the shared :meth:`mesh_diagnostics` table, so a
+        mesh is only rescanned once its topology moved (or it was :meth:`touch`-ed
+        by a repair). Returns ``{mesh_shape: [vertex_components]}`` (only meshes
+        that have any; empty dict when there are none).
+        """
+        return self.mesh_diagnostics().find(self.mesh_shapes(objects or []), "vertices")
+
+    def _non_manifold_uvs(self, objects):
+        """Like :meth:`_non_manifold_vertices`, for non-manifold UVs — the cached
+        counterpart of ``mtk.Diagnostics.find_non_manifold_uvs``.
         """
-        by_mesh = {}
-        if not objects:
-            return by_mesh
-        for shape in cmds.ls(objects, dag=True, type="mesh", noIntermediate=True) or []:
-            verts = cmds.polyInfo(shape, nonManifoldVertices=True) or []
-            if verts:
-                by_mesh[shape] = cmds.ls(verts, flatten=True)
-        return by_mesh
+        return self.mesh_diagnostics().find(self.mesh_shapes(objects or []), "uvs")
 
     def _warn_and_select_non_manifold(self, objects):
         """Select the non-manifold vertices (or UVs) on *objects* and explain.
@@ -537,11 +596,7 @@ class UvSlots(UvMixin, SlotsMaya):
         is what locates the problem.
         """
         verts = [v for vs in self._non_manifold_vertices(objects).values() for v in vs]
-        uvs = [
-            uv
-            for us in mtk.Diagnostics.find_non_manifold_uvs(objects).values()
-            for uv in us
-        ]
+        uvs = [uv for us in self._non_manifold_uvs(objects).values() for uv in us]
         if verts:
             cmds.selectMode(component=True)
             cmds.selectType(vertex=True)
@@ -593,9 +648,14 @@ class UvSlots(UvMixin, SlotsMaya):
         console and returns a summary ``{"total", "fixed", "remaining"}`` of
         non-manifold components, so the caller can briefly mention the repair
         in its result message.
+
+        Every scan goes through the :meth:`mesh_diagnostics` cache: the meshes
+        each step edited are marked dirty, so the before / after / fallback
+        scans re-read only those, not the whole selection.
         """
+        diagnostics = self.mesh_diagnostics()
         before_verts = self._non_manifold_vertices(objects)
-        before_uvs = mtk.Diagnostics.find_non_manifold_uvs(objects)
+        before_uvs = self._non_manifold_uvs(objects)
         total = sum(len(v) for v in before_verts.values()) + sum(
             len(v) for v in before_uvs.values()
         )
@@ -611,23 +671,39 @@ class UvSlots(UvMixin, SlotsMaya):
         except (RuntimeError, ValueError) as exc:
             # Cleanup itself failed — the retry will fall back to Warn + Select.
             print(f"# Unfold: cleanup failed: {exc} #")
+        # Cleanup only edits the meshes it flags; any that moved without a
+        # signature change are caught by marking them dirty.
+        diagnostics.touch(*before_verts)
 
-        # Unconditional: it re-scans internally (no-op on clean meshes), and the
-        # pre-scan above can't see UV corruption the Cleanup pass just exposed.
+        # Re-scanned after the cleanup: it can expose UV corruption the pre-scan
+        # couldn't see — on the meshes it edited, which are the only ones rescanned.
         try:
-            mtk.Diagnostics.repair_non_manifold_uvs(objects)
+            self._repair_non_manifold_uvs(self._non_manifold_uvs(objects))
         except (RuntimeError, ValueError) as exc:
             print(f"# Unfold: UV repair failed: {exc} #")
 
         remaining = sum(
             len(v) for v in self._non_manifold_vertices(objects).values()
-        ) + sum(len(v) for v in mtk.Diagnostics.find_non_manifold_uvs(objects).values())
+        ) + sum(len(v) for v in self._non_manifold_uvs(objects).values())
         fixed = total - remaining
         print(
             f"# Unfold: repaired {fixed} non-manifold component(s), {remaining} remaining #"
         )
         return {"total": total, "fixed": fixed, "remaining": remaining}
 
+    def _repair_non_manifold_uvs(self, uvs_by_shape):
+        """Re-map the faces behind *uvs_by_shape* (``{shape: [uvs]}``) through
+        ``mtk.Diagnostics.repair_non_manifold_uvs``.
+
+        The cached scan only picks the shapes: mtk rescans them itself before and
+        after its repair, and the repaired shapes' cached rows are dropped.
+        """
+        if not uvs_by_shape:
+            return
+        shapes = list(uvs_by_shape)
+        mtk.Diagnostics.repair_non_manifold_uvs(shapes)
+        self.mesh_diagnostics().touch(*shapes)
+
     def tb000(self, widget):
         """Pack UVs with specified settings.
 
@@ -638,8 +714,9 @@ class UvSlots(UvMixin, SlotsMaya):
         1. Gets UV packing parameters from UI controls
         2. Calculates appropriate padding based on texture resolution
         3. Packs UVs from all selected meshes together into the target UDIM tile
-           (if the batched call fails with several meshes, probes each to
-           isolate the offending one and re-packs the survivors together;
+           (meshes with non-manifold vertices are skipped before the call; if
+           the batched call still fails with several meshes, bisects the list
+           to isolate the offending ones and re-packs the survivors together;
            a single mesh reports its failure directly)
 
         Scope — objects or components: both methods pack exactly what is
@@ -785,6 +862,7 @@ class UvSlots(UvMixin, SlotsMaya):
         # reports the components it actually packed, so a faces/shell selection
         # is not read back as a whole-mesh density the run never produced.
         density_scope = None
+        pack_stats = None  # u3dLayout calls / seconds, from _pack_u3d
         # The pack is one bulk engine call with nothing to tick from the
         # inside, so the marquee is painted BEFORE the blocking region and torn
         # down after it. Nothing ticks while the refresh is suspended and the
@@ -821,7 +899,9 @@ class UvSlots(UvMixin, SlotsMaya):
                         )
                         return
                 else:
-                    self._pack_u3d(all_uvs, meshes, pack_kwargs, successful, failed)
+                    pack_stats = self._pack_u3d(
+                        all_uvs, meshes, pack_kwargs, successful, failed
+                    )
             finally:
                 cmds.refresh(suspend=False)
                 cmds.undoInfo(closeChunk=True)
@@ -856,6 +936,17 @@ class UvSlots(UvMixin, SlotsMaya):
             )
 
         # Report summary
+        if pack_stats and (failed or pack_stats["calls"] > 1):
+            print(
+                f"# UV Pack: {len(failed)} of {len(meshes)} mesh(es) skipped "
+                f"({pack_stats['screened']} by the non-manifold pre-screen), "
+                f"{pack_stats['calls']} u3dLayout call(s), "
+                f"{pack_stats['seconds']:.2f}s #"
+            )
+            stats += (
+                f"<br><b>Pack Calls:</b> {pack_stats['calls']} "
+                f"({pack_stats['seconds']:.1f}s)"
+            )
         if failed:
             failed_list = "<br>".join(
                 f"• <b>{name}</b>: {reason}" for name, reason in failed
@@ -0,0 +1,420 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Cold-start profiler for the marking-menu entry classes (``TclMaya`` / ``TclBlender``).
+
+The checked-in bench JSON says *how long* construction takes (``02_construct`` ≈ 2.5 s,
+``03_lazy_load_ui`` ≈ 0.8 s) but not *what* it is spent on. :class:`StartupProfile` records
+that while the entry class comes up, as one tree of timed spans:
+
+- **phase** — the launcher's own steps (``import``, ``construct``), numbered like the bench
+  phases (``01_import``) so a report lines up against ``bench_*.json``;
+- **import** — every module imported while profiling, inclusive and self time;
+- **ui** — every ``.ui`` file the Switchboard parses (``Switchboard.load_ui``);
+- **slot** — every slot class constructed (``Switchboard._create_slots_instance``: the
+  class ``__init__`` plus its shortcut registration).
+
+Enable it from the launcher — ``Tcl.launch(profile=True)`` or ``TENTACLE_PROFILE=1`` in the
+environment (a path instead of ``1`` names the report file) — or drive it directly::
+
+    with StartupProfile(host="maya") as profile:
+        with profile.phase("construct"):
+            TclMaya()
+    profile.write()
+
+The report is JSON in Chrome's trace-event format (``traceEvents``) with the summaries
+alongside, so the same file opens as a flame graph in Perfetto / ``chrome://tracing`` /
+speedscope and diffs as data. :meth:`StartupProfile.compare` is the regression gate over
+two reports; ``test/bench/startup_profile.py`` runs it headless against stubbed engines.
+
+Only the thread that started the profile is recorded: a background import (the update
+check's worker) would otherwise interleave with the main thread's span stack. Stdlib only,
+like :mod:`tentacle.tcl` — it has to be importable before anything it measures.
+"""
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module's real loader so its ``exec_module`` runs inside an import span.
+
+    The real loader is put back on the module once it has executed: the proxy exists
+    only for the one call, so nothing that later inspects ``module.__loader__``
+    (resource readers, ``reload``) ever sees it.
+    """
+
+    def __init__(self, loader, profile, name):
+        self._loader = loader
+        self._profile = profile
+        self._name = name
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        try:
+            with self._profile.span("import", self._name):
+                self._loader.exec_module(module)
+        finally:
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """First ``sys.meta_path`` entry while profiling: resolves through the finders
+    behind it, then hands back the spec with its loader wrapped in :class:`_TimedLoader`."""
+
+    def __init__(self, profile):
+        self._profile = profile
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "busy", False) or not self._profile.recording():
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                find = getattr(finder, "find_spec", None)
+                if finder is self or find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profile, fullname)
+        return spec
+
+
+class StartupProfile:
+    """Timed span tree of one entry-class startup; see the module docstring.
+
+    Parameters:
+        host (str): The DCC being profiled — recorded in the report and its file name.
+        path (str): Report file. Default: ``Tcl.cache_dir("profiles")/startup-<host>-<time>.json``.
+    """
+
+    #: Environment switch: ``1`` / ``true`` profiles to the default path; anything else
+    #: is taken as the report path.
+    ENV = "TENTACLE_PROFILE"
+
+    #: Switchboard methods timed per call -> (span category, name from the call args).
+    SWITCHBOARD_HOOKS = {
+        "load_ui": ("ui", lambda _sb, file, *_a, **_k: os.path.basename(str(file))),
+        "_create_slots_instance": (
+            "slot",
+            lambda _sb, _ui, slots_cls, *_a, **_k: getattr(
+                slots_cls, "__name__", str(slots_cls)
+            ),
+        ),
+    }
+
+    #: Regression gate defaults (see :meth:`compare`): a timing regresses when it is
+    #: more than ``TOLERANCE`` slower AND at least ``MIN_MS`` slower — below that floor
+    #: a 10% swing is scheduler noise, not a regression.
+    TOLERANCE = 0.10
+    MIN_MS = 10.0
+
+    def __init__(self, host=None, path=None):
+        self.host = host
+        self.path = path
+        self._spans = []  # [category, name, start, end, depth]
+        self._stack = []
+        self._phase_count = 0
+        self._thread = None
+        self._finder = None
+        self._patched = []  # [(owner, attr, original or None when inherited)]
+        self._started = self._stopped = None
+
+    # ------------------------------------------------------------------ request
+    @classmethod
+    def from_request(cls, profile=None, host=None):
+        """The profiler a launch asked for, or None.
+
+        Parameters:
+            profile (bool/str): ``Tcl.launch``'s ``profile`` kwarg — True, or a report
+                path. ``None`` defers to :attr:`ENV`.
+            host (str): The host being launched.
+        """
+        if profile is None:
+            profile = os.environ.get(cls.ENV) or None
+            if isinstance(profile, str) and profile.lower() in ("0", "false", "no"):
+                profile = None
+        if not profile:
+            return None
+        path = None
+        if isinstance(profile, str) and profile.lower() not in ("1", "true", "yes"):
+            path = profile
+        return cls(host=host, path=path)
+
+    @classmethod
+    @contextmanager
+    def maybe(cls, profile=None, host=None):
+        """``with StartupProfile.maybe(profile, host) as p:`` — ``p.phase(...)`` either way.
+
+        Yields an idle (never started) profile when none was requested, so a launcher's
+        phase blocks need no branch. Otherwise starts the requested profiler, writes its report on the way out (also when the
+        body raised — a failed startup is the one most worth reading), and never lets
+        the profiler itself break a launch.
+        """
+        prof = cls.from_request(profile, host)
+        if prof is None:
+            yield cls(host=host)
+            return
+        prof.start()
+        try:
+            yield prof
+        finally:
+            prof.stop()
+            try:
+                path = prof.write()
+                print(f"# tentacle: startup profile written to {path} #")
+            except Exception as error:
+                print(f"# Warning: tentacle: startup profile not written: {error} #")
+
+    # ------------------------------------------------------------------ recording
+    def start(self):
+        """Begin recording on the calling thread (imports, .ui parses, slot inits)."""
+        self._thread = threading.get_ident()
+        self._started = time.perf_counter()
+        self._finder = _ImportTimer(self)
+        sys.meta_path.insert(0, self._finder)
+        self._hook_switchboard()
+        return self
+
+    def stop(self):
+        """Stop recording and remove every hook; spans still open are closed here."""
+        self._stopped = time.perf_counter()
+        while self._stack:
+            self._close(self._stack[-1])
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        for owner, attr, original in reversed(self._patched):
+            if original is None:  # was inherited: drop the shadowing wrapper
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+        self._patched = []
+        self._thread = None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def recording(self):
+        """True on the profiled thread while the profile is running."""
+        return self._thread is not None and threading.get_ident() == self._thread
+
+    @contextmanager
+    def span(self, category, name):
+        """Time the body as a *category* span (``import`` / ``ui`` / ``slot`` / ...)."""
+        if not self.recording():
+            yield
+            return
+        span = [category, name, time.perf_counter(), None, len(self._stack)]
+        self._spans.append(span)
+        self._stack.append(span)
+        try:
+            yield
+        finally:
+            self._close(span)
+
+    @contextmanager
+    def phase(self, name):
+        """Time a launcher phase, numbered in call order (``01_import``, ...).
+
+        Also (re)tries the Switchboard hooks: the first phase usually imports uitk, so
+        the class to patch only exists from the second one on. A no-op when idle.
+        """
+        if not self.recording():
+            yield
+            return
+        self._hook_switchboard()
+        self._phase_count += 1
+        with self.span("phase", f"{self._phase_count:02d}_{name}"):
+            yield
+
+    def _close(self, span):
+        span[3] = time.perf_counter()
+        if span in self._stack:
+            del self._stack[self._stack.index(span) :]
+
+    def _hook_switchboard(self):
+        """Wrap :attr:`SWITCHBOARD_HOOKS` on uitk's Switchboard, once uitk is imported.
+
+        Looked up rather than imported — importing uitk here would move its cost out
+        of the phase that really pays it. A method uitk no longer has is skipped.
+        """
+        if self._patched or "uitk" not in sys.modules:
+            return
+        try:
+            from uitk import Switchboard
+        except Exception:
+            return
+        self.hook_methods(Switchboard, self.SWITCHBOARD_HOOKS)
+
+    def hook_methods(self, owner, hooks):
+        """Time each ``owner.<attr>`` call as a span until :meth:`stop` restores it.
+
+        Parameters:
+            owner (type): Class whose methods are wrapped.
+            hooks (dict): ``{attr: (category, name_from_args)}``; ``name_from_args``
+                receives the call's arguments (``self`` first).
+        """
+        for attr, (category, name_of) in hooks.items():
+            original = getattr(owner, attr, None)
+            if not callable(original):
+                continue
+            own = attr in owner.__dict__
+
+            def timed(*args, _original=original, _cat=category, _name=name_of, **kwargs):
+                try:
+                    name = _name(*args, **kwargs)
+                except Exception:
+                    name = "?"
+                with self.span(_cat, name):
+                    return _original(*args, **kwargs)
+
+            timed.__wrapped__ = original
+            setattr(owner, attr, timed)
+            self._patched.append((owner, attr, original if own else None))
+
+    # ------------------------------------------------------------------ report
+    def _durations(self):
+        """``[(category, name, start, ms, self_ms)]`` for every closed span."""
+        children = [0.0] * len(self._spans)
+        index = {id(span): i for i, span in enumerate(self._spans)}
+        stack = []
+        for i, span in enumerate(self._spans):
+            while stack and self._spans[stack[-1]][4] >= span[4]:
+                stack.pop()
+            if stack and span[3] is not None:
+                children[stack[-1]] += span[3] - span[2]
+            stack.append(i)
+        rows = []
+        for span in self._spans:
+            if span[3] is None:
+                continue
+            total = span[3] - span[2]
+            own = total - children[index[id(span)]]
+            rows.append((span[0], span[1], span[2], total * 1000.0, own * 1000.0))
+        return rows
+
+    def report(self):
+        """The report dict: summaries per category plus Chrome ``traceEvents``."""
+        rows = self._durations()
+        end = self._stopped or time.perf_counter()
+
+        def table(category):
+            entries = [
+                {"name": name, "ms": round(ms, 3), "self_ms": round(own, 3)}
+                for cat, name, _start, ms, own in rows
+                if cat == category
+            ]
+            return sorted(entries, key=lambda e: e["ms"], reverse=True)
+
+        imports = table("import")
+        ui = table("ui")
+        slots = table("slot")
+        return {
+            "host": self.host,
+            "python": sys.version.split()[0],
+            "total_ms": round((end - self._started) * 1000.0, 3) if self._started else 0.0,
+            "phases_ms": {
+                name: round(ms, 3) for cat, name, _s, ms, _o in rows if cat == "phase"
+            },
+            "totals_ms": {
+                "imports": round(sum(e["self_ms"] for e in imports), 3),
+                "ui": round(sum(e["self_ms"] for e in ui), 3),
+                "slots": round(sum(e["self_ms"] for e in slots), 3),
+            },
+            "imports": imports,
+            "ui": ui,
+            "slots": slots,
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": round((start - self._started) * 1e6, 1),
+                    "dur": round(ms * 1000.0, 1),
+                    "pid": 1,
+                    "tid": 1,
+                }
+                for cat, name, start, ms, _own in rows
+            ],
+        }
+
+    def write(self, path=None):
+        """Write :meth:`report` as JSON; returns the path written."""
+        path = path or self.path
+        if not path:
+            from tentacle.tcl import Tcl
+
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(
+                Tcl.cache_dir("profiles"), f"startup-{self.host or 'host'}-{stamp}.json"
+            )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=1)
+        return path
+
+    # ------------------------------------------------------------------ gate
+    @classmethod
+    def compare(cls, current, baseline, tolerance=None, min_ms=None):
+        """Timings in *current* that regressed against *baseline* (two reports).
+
+        Compared: every phase, the per-category totals, and every ``.ui`` / slot class
+        present in both. Individual imports are left out — their self times shift
+        between modules whenever an import moves, which is not a regression.
+
+        Parameters:
+            current (dict): A :meth:`report` (or a loaded report file).
+            baseline (dict): The reference report.
+            tolerance (float): Allowed slowdown ratio. Default :attr:`TOLERANCE`.
+            min_ms (float): Slowdowns smaller than this never count. Default :attr:`MIN_MS`.
+
+        Returns:
+            list: ``[(key, baseline_ms, current_ms), ...]`` — empty when within budget.
+        """
+        tolerance = cls.TOLERANCE if tolerance is None else tolerance
+        min_ms = cls.MIN_MS if min_ms is None else min_ms
+
+        def flat(report):
+            values = {f"phase:{k}": v for k, v in report.get("phases_ms", {}).items()}
+            values.update(
+                {f"total:{k}": v for k, v in report.get("totals_ms", {}).items()}
+            )
+            for category in ("ui", "slots"):
+                for entry in report.get(category, ()):
+                    values[f"{category}:{entry['name']}"] = entry["ms"]
+            return values
+
+        now, then = flat(current), flat(baseline)
+        return [
+            (key, then[key], now[key])
+            for key in sorted(now.keys() & then.keys())
+            if now[key] - then[key] > max(then[key] * tolerance, min_ms)
+        ]
+
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -57,6 +57,9 @@ class _TclInternal:
     #: extra is named after a HOSTS key above, so ``host()`` resolves which one applies.
     DIST = "tentacletk"
 
+    #: Environment override for :meth:`Tcl.cache_dir`'s root.
+    CACHE_DIR_ENV = "TENTACLE_CACHE_DIR"
+
     # The two halves of the PEP 508 rows ``importlib.metadata.requires`` returns (see
     # ``_requires``). Where a requirement name ends, and the ``extra ==`` clause that
     # assigns a row to an extra — matched as a CLAUSE so a combined marker
@@ -74,8 +77,21 @@ class _TclInternal:
         except Exception:  # cmds unavailable/uninitialized — assume interactive
             return False
 
+    @staticmethod
+    def _profiled(host, profile):
+        """The launch's :class:`~tentacle.startup_profile.StartupProfile` context.
+
+        Yields an idle profile (its phases are no-ops) when none was requested.
+
+        Imported here rather than at module level: it is stdlib-only, but ``import tentacle``
+        in a startup script should not pay for a profiler nobody asked for.
+        """
+        from tentacle.startup_profile import StartupProfile
+
+        return StartupProfile.maybe(profile, host)
+
     @classmethod
-    def _launch_maya(cls, **kwargs):
+    def _launch_maya(cls, profile=None, **kwargs):
         """Maya: build on an idle event — ``userSetup.py`` runs before the UI exists.
 
         A batch/standalone session is a deliberate, quiet no-op. The same ``userSetup.py`` also
@@ -90,9 +106,11 @@ class _TclInternal:
             return None
 
         def build():
-            TclMaya = cls._import_entry("maya", "tentacle.tcl_maya", "TclMaya")
-
-            return TclMaya(**kwargs)
+            with cls._profiled("maya", profile) as prof:
+                with prof.phase("import"):
+                    TclMaya = cls._import_entry("maya", "tentacle.tcl_maya", "TclMaya")
+                with prof.phase("construct"):
+                    return TclMaya(**kwargs)
 
         try:
             from maya.utils import executeDeferred
@@ -102,25 +120,29 @@ class _TclInternal:
         return None
 
     @classmethod
-    def _launch_blender(cls, **kwargs):
+    def _launch_blender(cls, profile=None, **kwargs):
         """Blender: build on a one-shot timer, through the add-on entry (Qt host + diagnostics)."""
         import bpy
 
         def build():
-            tcl_blender = cls._import_entry("blender", "tentacle.tcl_blender")
-
-            tcl_blender.register(**kwargs)
+            with cls._profiled("blender", profile) as prof:
+                with prof.phase("import"):
+                    tcl_blender = cls._import_entry("blender", "tentacle.tcl_blender")
+                with prof.phase("construct"):
+                    tcl_blender.register(**kwargs)
             return None  # a timer returning None is unregistered — one shot, not a poll
 
         bpy.app.timers.register(build, first_interval=cls.BLENDER_START_DELAY)
         return None
 
     @classmethod
-    def _launch_max(cls, **kwargs):
+    def _launch_max(cls, profile=None, **kwargs):
         """3ds Max: no deferral needed — its startup scripts already run against a live UI."""
-        TclMax = cls._import_entry("max", "tentacle.tcl_max", "TclMax")
-
-        return TclMax(**kwargs)
+        with cls._profiled("max", profile) as prof:
+            with prof.phase("import"):
+                TclMax = cls._import_entry("max", "tentacle.tcl_max", "TclMax")
+            with prof.phase("construct"):
+                return TclMax(**kwargs)
 
     # ---------------------------------------------------------------- engine extras
     @classmethod
@@ -347,6 +369,37 @@ class Tcl(_TclInternal):
             dists.append(cls.DIST)
         return tuple(dists)
 
+    @classmethod
+    def cache_dir(cls, *parts, create=True):
+        """Per-user cache directory for tentacle's derived, disposable state.
+
+        Everything under it can be deleted at any time and is rebuilt on demand — it
+        holds answers tentacle could recompute (the update check's index result, ...),
+        never user settings (those live in QSettings). Non-roaming on Windows
+        (``LOCALAPPDATA``), ``XDG_CACHE_HOME`` / ``~/.cache`` elsewhere;
+        ``TENTACLE_CACHE_DIR`` overrides both, which is how the suite keeps a run off
+        the developer's real cache.
+
+        Parameters:
+            *parts (str): Sub-path under the cache root (``"updates"``).
+            create (bool): Create the directory when missing.
+
+        Returns:
+            str: The absolute directory path.
+        """
+        root = os.environ.get(cls.CACHE_DIR_ENV)
+        if not root:
+            base = (
+                os.environ.get("LOCALAPPDATA")
+                or os.environ.get("XDG_CACHE_HOME")
+                or os.path.join(os.path.expanduser("~"), ".cache")
+            )
+            root = os.path.join(base, "tentacle")
+        path = os.path.join(root, *parts)
+        if create:
+            os.makedirs(path, exist_ok=True)
+        return path
+
     @classmethod
     def qt_key_name(cls, key_show=None):
         """Normalize an activation key to its Qt name: ``'Z'`` and ``'Key_Z'`` both → ``'Key_Z'``.
@@ -406,7 +459,7 @@ class Tcl(_TclInternal):
         return bindings
 
     @classmethod
-    def launch(cls, key_show=None, **kwargs):
+    def launch(cls, key_show=None, profile=None, **kwargs):
         """Start tentacle in the host DCC, deferring startup the way that host requires.
 
         Parameters:
@@ -414,6 +467,10 @@ class Tcl(_TclInternal):
                     (``'Key_Z'``). A key the user persisted (shortcut editor / DCC rebind)
                     outranks it. Omitted, each entry class applies its own default (Blender
                     additionally honors ``TENTACLE_KEY``; all fall back to :attr:`DEFAULT_KEY`).
+            profile (bool/str): Profile the cold start (imports, ``.ui`` parses, slot
+                    ``__init__``s) and write the report — True for the default location under
+                    :meth:`cache_dir`, or a file path. Omitted, ``TENTACLE_PROFILE`` decides
+                    (see :mod:`tentacle.startup_profile`).
             **kwargs: Forwarded verbatim to the DCC's entry class (``slot_source``, ``log_level``,
                     an explicit ``bindings`` dict, …).
 
@@ -433,6 +490,8 @@ class Tcl(_TclInternal):
             )
         if key_show is not None:
             kwargs["key_show"] = key_show
+        if profile is not None:
+            kwargs["profile"] = profile
         return getattr(cls, f"_launch_{host}")(**kwargs)
 
 
@@ -244,6 +244,10 @@ from uitk import MarkingMenu, ExternalAppHandler  # noqa: E402
 import blendertk as btk  # noqa: E402  (lazy resolver: nothing under btk.* imports yet)
 
 from tentacle.tcl import Tcl  # noqa: E402  (needs bootstrap_paths — see _QtBootstrap)
+from tentacle.panel_pool import PanelPool  # noqa: E402
+from tentacle.slot_manifest import SlotManifest  # noqa: E402
+from tentacle.slot_telemetry import SlotTelemetry  # noqa: E402
+from tentacle.ui_cache import UiCache  # noqa: E402
 
 
 class _NativeWindow:
@@ -1424,6 +1428,9 @@ class TclBlender(MarkingMenu):
             key_show, "blender#startmenu"
         )
 
+        # Slot modules import on first show (see SlotManifest; mirrors tcl_maya).
+        slot_source = SlotManifest.lazy_source(slot_source, __file__)
+
         super().__init__(
             parent,
             ui_source=("ui", "ui/blender_menus"),
@@ -1449,6 +1456,17 @@ class TclBlender(MarkingMenu):
             **kwargs,
         )
 
+        # Panels load from the compiled .ui cache (see UiCache; mirrors tcl_maya).
+        UiCache.install(self.sb)
+
+        # Per-slot dispatch timings (see SlotTelemetry; mirrors tcl_maya). Installed before
+        # the click debugger can patch the same method, so its restore hands this one back.
+        SlotTelemetry.install("blender")
+
+        # Idle-time prebuild of the most opened standalone panels (see PanelPool; mirrors
+        # tcl_maya).
+        PanelPool.install(self, "blender")
+
         # External apps — the same standalone ``extapps`` panels Maya uses.
         # They self-describe via ``extapps``'s ``uitk.external_apps.in_process``
         # entry points and are auto-registered by ExternalAppHandler on
@@ -4,6 +4,10 @@ import mayatk as mtk
 from uitk import MarkingMenu, ExternalAppHandler
 
 from tentacle.tcl import Tcl
+from tentacle.panel_pool import PanelPool
+from tentacle.slot_manifest import SlotManifest
+from tentacle.slot_telemetry import SlotTelemetry
+from tentacle.ui_cache import UiCache
 
 
 class TclMaya(MarkingMenu):
@@ -28,6 +32,10 @@ class TclMaya(MarkingMenu):
             key_show, "maya#startmenu"
         )
 
+        # Slot modules import when their panel is first shown, not here: the registry
+        # gets the manifest's rows, whose classes are import-on-use stand-ins.
+        slot_source = SlotManifest.lazy_source(slot_source, __file__)
+
         super().__init__(
             parent,
             ui_source=("ui", "ui/maya_menus"),
@@ -36,7 +44,6 @@ class TclMaya(MarkingMenu):
             handlers={"ui": mtk.MayaUiHandler, "external_app": ExternalAppHandler},
             log_level=log_level,
             suppress_default_on_reentry=True,
-            precompile=True,
             # Scoped preloading: warm the five binding-target startmenus once
             # Maya's event loop is idle, so the FIRST key_show press behaves
             # exactly like every later one (no cold-page lag/settle).
@@ -45,6 +52,20 @@ class TclMaya(MarkingMenu):
             **kwargs,
         )
 
+        # Panels load from the compiled .ui cache (bytecode keyed on each .ui's hash)
+        # rather than re-parsing Designer XML per process; stale or missing entries
+        # load via QUiLoader and are recompiled in the background. See UiCache.
+        UiCache.install(self.sb)
+
+        # Per-slot dispatch timings, aggregated across sessions for Preferences ▸ Slot
+        # Timings (TENTACLE_TELEMETRY=0 opts out). See SlotTelemetry.
+        SlotTelemetry.install("maya")
+
+        # The standalone panels this user opens most are prebuilt in idle-time slices under
+        # a memory budget, so their first open is a warm show (TENTACLE_PANEL_POOL=0 opts
+        # out). See PanelPool.
+        PanelPool.install(self, "maya")
+
         # ``extapps`` ships the content-pipeline panels but is deliberately NOT
         # a pip dependency (optional, runtime-discovered). Registering it as a
         # provider means launching one of its panels installs it on demand --
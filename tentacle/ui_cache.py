@@ -0,0 +1,371 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Compiled ``.ui`` cache: tentacle's panels load from Python bytecode, not Designer XML.
+
+The Switchboard's default loader (uitk's ``RuntimeLoader``) hands every ``.ui`` to
+``QUiLoader``, which re-parses the XML in every process — after a second ``ElementTree``
+pass for the file's custom-widget and tag metadata. uitk's ``CompiledLoader`` avoids that
+but writes its ``_ui.py`` next to the source, i.e. into the installed package, which is
+read-only in a site-packages install and would ship stale artifacts in a dev checkout.
+(``MarkingMenu(precompile=True)`` only drives that loader, so under the runtime loader it
+never did anything.)
+
+:class:`UiCache` is the same compiled path pointed at a per-user cache instead:
+
+- **Format** — one ``.uic`` file per ``.ui``: a JSON header line (source hash, tags) then
+  the ``marshal``-ed code object of the uic-generated ``setupUi`` module. A load reads the
+  file, ``exec``-s the code into a fresh namespace and calls ``setupUi`` — no XML, no
+  Python source compile, and no trip through the import system (whose per-module hooks,
+  PySide6's included, cost more than the code they import here).
+- **Location / version** — ``Tcl.cache_dir("ui", <key>)``; the key folds in the Qt binding
+  and version, the Python version (marshal is version-specific), uitk's version and
+  :attr:`UiCache.FORMAT`. Any of those changing selects a fresh directory, so an artifact
+  is never loaded by a runtime that did not generate it.
+- **Keying / invalidation** — one entry per source path (``<stem>-<path hash>.uic``), stamped
+  with the SHA-256 of its ``.ui``. Freshness is that hash compared against the source bytes
+  (a read, never a parse), so an edited ``.ui`` is recompiled on its next load.
+- **Misses never block** — a panel whose module is missing, stale or no longer importable
+  (a custom-widget header the registry now places elsewhere) loads through ``QUiLoader``
+  as before, and its compile is queued on a background thread: the next load opens it
+  from the cache. :meth:`UiCache.warm` queues every tentacle ``.ui`` at
+  startup, and ``python -m tentacle.ui_cache`` builds the whole cache ahead of time
+  (install step / CI image).
+- **No uic** — a binding without a ``uic`` (the compiler ``uitk.compile`` drives) turns the
+  cache off for the session; everything keeps loading through ``QUiLoader``.
+
+``test/bench/ui_cache.py`` compares per-panel first-open cost with and without the cache.
+"""
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from qtpy import API_NAME, QT_VERSION
+from uitk.compile import UiCompiler
+from uitk.loaders.compiled import CompiledLoader
+from uitk.loaders.runtime import RuntimeLoader
+
+from tentacle.tcl import Tcl
+
+
+class UiCache(CompiledLoader):
+    """Switchboard loader delegate serving ``.ui`` files from the compiled cache.
+
+    Implements the Switchboard loader contract (``load`` / ``read_ui_tags`` /
+    ``on_tags_written``); install it with :meth:`install`.
+
+    Parameters:
+        switchboard (Switchboard): The switchboard this delegate loads for.
+    """
+
+    #: Bump when the cached artifact's layout changes; it is part of the cache key.
+    FORMAT = 1
+
+    #: Source path -> its entry's file name stem (``Path.resolve`` is several syscalls).
+    _stems = {}
+
+    #: Background compile workers (uic is a subprocess each; a few is plenty).
+    WORKERS = 4
+
+    def __init__(self, switchboard):
+        super().__init__(switchboard)
+        self._runtime = RuntimeLoader(switchboard)
+        self._pool = None
+        self._pending = {}  # resolved .ui path -> Future
+        self._rebuilt = set()  # resolved .ui paths recompiled after an ImportError
+        self._guard = threading.Lock()
+        self.unavailable = None  # why compiling is off for this session, else None
+
+    # ------------------------------------------------------------------ layout
+    @classmethod
+    def version_key(cls):
+        """The cache directory name: binding, Qt, Python, uitk and format versions."""
+        import uitk
+
+        uitk_version = getattr(uitk, "__version__", "0")
+        py = f"py{sys.version_info[0]}{sys.version_info[1]}"
+        return f"v{cls.FORMAT}-{API_NAME}-{QT_VERSION}-{py}-uitk{uitk_version}"
+
+    @classmethod
+    def cache_root(cls, create=True):
+        """The versioned cache directory (:meth:`Tcl.cache_dir` ``ui/<version_key>``)."""
+        return Tcl.cache_dir("ui", cls.version_key(), create=create)
+
+    @classmethod
+    def cached_path(cls, ui_path):
+        """The cache entry for *ui_path*: ``<stem>-<path hash>.uic``."""
+        stem = cls._stems.get(str(ui_path))
+        if stem is None:
+            resolved = Path(ui_path).resolve()
+            key = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:10]
+            stem = cls._stems[str(ui_path)] = f"{resolved.stem}-{key}"
+        return Path(cls.cache_root(create=False)) / f"{stem}.uic"
+
+    @classmethod
+    def read_entry(cls, ui_path):
+        """``(header, code)`` for *ui_path*'s entry when it is fresh, else None.
+
+        Fresh: the entry exists, is readable, and its recorded source hash matches the
+        ``.ui`` bytes on disk now.
+        """
+        try:
+            with open(cls.cached_path(ui_path), "rb") as f:
+                header = json.loads(f.readline())
+                if header.get("source_hash") != UiCompiler.hash_ui_source(ui_path):
+                    return None
+                return header, marshal.loads(f.read())
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+
+    @classmethod
+    def fresh_header(cls, ui_path):
+        """The header of *ui_path*'s entry when it is fresh (no code read), else None."""
+        try:
+            with open(cls.cached_path(ui_path), "rb") as f:
+                header = json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+        if header.get("source_hash") != UiCompiler.hash_ui_source(ui_path):
+            return None
+        return header
+
+    @classmethod
+    def is_fresh(cls, ui_path):
+        """True when *ui_path* has a cache entry carrying its current source hash."""
+        return cls.fresh_header(ui_path) is not None
+
+    @staticmethod
+    def source_files(roots=None):
+        """Every ``.ui`` under *roots* (default: the tentacle package's ``ui`` tree)."""
+        roots = roots or [Path(__file__).resolve().parent / "ui"]
+        return sorted(p for root in roots for p in Path(root).rglob("*.ui"))
+
+    # ------------------------------------------------------------------ install
+    @classmethod
+    def install(cls, switchboard, warm=True):
+        """Make a ``UiCache`` *switchboard*'s loader; returns it.
+
+        ``MarkingMenu`` builds its Switchboard itself and does not forward the
+        Switchboard's ``loader`` argument, so the delegate is swapped in right after
+        construction — before any panel has loaded (preloading waits for the idle loop).
+
+        Parameters:
+            switchboard (Switchboard): The marking menu's switchboard.
+            warm (bool): Queue background compiles for every stale tentacle ``.ui``.
+        """
+        loader = switchboard._loader = cls(switchboard)
+        if warm:
+            loader.warm()
+        return loader
+
+    # ------------------------------------------------------------------ compile
+    def compile(self, ui_path):
+        """Compile *ui_path* into the cache now (blocking); returns the entry's path.
+
+        uic generates the module source (``UiCompiler.compile_ui``, with the
+        Switchboard's widget registry resolving custom-widget headers); only its code
+        object and header are kept.
+        """
+        target = self.cached_path(ui_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        token = uuid.uuid4().hex  # concurrent compiles of one file never share scratch
+        scratch = target.with_name(f"{target.stem}.{token}.tmp")
+        py_path = target.with_name(f"{target.stem}.{token}.py")
+        try:
+            UiCompiler.compile_ui(ui_path, py_path, header_resolver=self._resolve_header)
+            header = {
+                "format": self.FORMAT,
+                "source": str(ui_path),
+                "source_hash": UiCompiler.read_embedded_hash(py_path),
+                "tags": sorted(UiCompiler.read_embedded_tags(py_path)),
+            }
+            code = compile(py_path.read_text(encoding="utf-8"), str(ui_path), "exec")
+            with open(scratch, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                f.write(marshal.dumps(code))
+            os.replace(scratch, target)
+        finally:
+            for leftover in (py_path, scratch):
+                if leftover.exists():
+                    leftover.unlink()
+        return target
+
+    def warm(self, ui_paths=None):
+        """Compile every stale file in *ui_paths* in the background.
+
+        The freshness scan itself (one read + hash per file) runs on a worker too,
+        so installing the cache costs the main thread nothing.
+
+        Parameters:
+            ui_paths (list): ``.ui`` files. Default: :meth:`source_files`.
+
+        Returns:
+            Future: Resolves to the list of compile futures queued (fresh and
+            already-queued files are skipped); None when compiling is off.
+        """
+        if self.unavailable:
+            return None
+        paths = list(ui_paths) if ui_paths is not None else None
+
+        def scan():
+            queued = (self._queue(p) for p in (paths or self.source_files()))
+            return [f for f in queued if f is not None]
+
+        return self._executor().submit(scan)
+
+    def join(self, timeout=None):
+        """Block until every compile queued so far has finished (tooling / tests)."""
+        with self._guard:
+            pending = list(self._pending.values())
+        wait(pending, timeout)
+
+    def _executor(self):
+        with self._guard:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.WORKERS, thread_name_prefix="tentacle-ui-cache"
+                )
+            return self._pool
+
+    def _queue(self, ui_path, stale=False):
+        """Submit *ui_path*'s compile unless it is fresh or already queued.
+
+        *stale*: the caller already knows the entry is unusable — skip the freshness read.
+        """
+        key = str(Path(ui_path).resolve())
+        if self.unavailable or key in self._pending:
+            return None
+        if not stale and self.is_fresh(ui_path):
+            return None
+        pool = self._executor()
+        with self._guard:
+            if key in self._pending:
+                return None
+            future = self._pending[key] = pool.submit(
+                self._compile_queued, ui_path, key
+            )
+            return future
+
+    def _compile_queued(self, ui_path, key):
+        try:
+            return self.compile(ui_path)
+        except FileNotFoundError as error:  # no uic for this binding: stop trying
+            self.unavailable = str(error)
+            self.sb.logger.info(f"[ui_cache] compiled .ui cache disabled: {error}")
+        except Exception as error:
+            self.sb.logger.debug(f"[ui_cache] {Path(ui_path).name}: {error}")
+        finally:
+            with self._guard:
+                self._pending.pop(key, None)
+        return None
+
+    # ------------------------------------------------------------------ contract
+    def load(self, ui_file):
+        """The widget tree for *ui_file*: from its cache entry, else via ``QUiLoader``."""
+        ui_path = Path(ui_file)
+        try:
+            ui_mtime = os.path.getmtime(ui_path)
+        except OSError:
+            ui_mtime = None
+
+        cached = self._load_cache.get(ui_file)
+        if cached is not None and cached[0] == ui_mtime:
+            module = cached[2]
+        else:
+            entry = None if self.unavailable else self.read_entry(ui_path)
+            if entry is None:
+                self._queue(ui_path, stale=True)
+                return self._runtime.load(ui_file)
+            try:
+                module = self._exec(entry[1], ui_path)
+            except ImportError:  # a header the resolver can now place: rebuild once
+                key = str(ui_path.resolve())
+                if key not in self._rebuilt:
+                    self._rebuilt.add(key)
+                    self._queue(ui_path, stale=True)
+                return self._runtime.load(ui_file)
+            self._load_cache[ui_file] = (ui_mtime, None, module)
+        return self._build_form(module, ui_path)
+
+    @staticmethod
+    def _exec(code, ui_path):
+        """Run a cached code object into a fresh module namespace (not ``sys.modules``)."""
+        module = types.ModuleType(f"_tentacle_ui_{ui_path.stem}")
+        module.__file__ = str(ui_path)
+        exec(code, module.__dict__)
+        return module
+
+    def _build_form(self, module, ui_path):
+        """``CompiledLoader.load``'s widget-building tail, for an already-imported module."""
+        for cls_name, _header in getattr(module, "__customwidgets__", []):
+            if cls_name in self._registered_classes:
+                continue
+            if cls_name not in self.sb.registered_widgets.keys():
+                widget_class = self.sb.registry.widget_registry.get(
+                    classname=cls_name, return_field="classobj"
+                )
+                if widget_class:
+                    self.sb.register_widget(widget_class)
+            self._registered_classes.add(cls_name)
+
+        form = CompiledLoader._resolve_qt_class(
+            getattr(module, "__base_class__", "QWidget")
+        )()
+        CompiledLoader._find_form_class(module)().setupUi(form)
+        self.sb.logger.debug(f"[{ui_path.stem}] UI loaded from the compiled cache")
+        return form
+
+    def read_ui_tags(self, ui_path):
+        """``uitk_tags`` from the cache entry's header when fresh, else from the XML."""
+        header = self.fresh_header(ui_path) if ui_path and not self.unavailable else None
+        if header is not None:
+            return set(header.get("tags", ()))
+        return self._runtime.read_ui_tags(ui_path)
+
+    def on_tags_written(self, ui_path):
+        """The ``.ui`` changed on disk: drop what was cached for it and recompile."""
+        self._load_cache.pop(str(ui_path), None)
+        self._runtime.on_tags_written(ui_path)
+        self._queue(ui_path)
+
+
+def main(argv=None):
+    """``python -m tentacle.ui_cache [--check] [roots...]`` — build the cache ahead of time.
+
+    Compiles every stale tentacle ``.ui`` (or those under *roots*) synchronously. With
+    ``--check`` nothing is written; the exit code is the number of stale files.
+    """
+    import argparse
+
+    from uitk import Switchboard
+
+    parser = argparse.ArgumentParser(prog="python -m tentacle.ui_cache")
+    parser.add_argument("roots", nargs="*", help="Directories to scan (default: tentacle/ui).")
+    parser.add_argument("--check", action="store_true", help="Report stale files only.")
+    args = parser.parse_args(argv)
+
+    files = UiCache.source_files(args.roots or None)
+    stale = [p for p in files if not UiCache.is_fresh(p)]
+    print(f"{UiCache.cache_root()}: {len(files) - len(stale)}/{len(files)} fresh")
+    if args.check:
+        return len(stale)
+    cache = UiCache(Switchboard())  # its widget registry resolves the .ui headers
+    for path in stale:
+        cache.compile(path)
+    print(f"compiled {len(stale)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
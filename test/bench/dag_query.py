@@ -0,0 +1,141 @@
+"""Tentacle bulk DAG query bench: per-node commands vs ``SlotsMaya.dag``.
+
+Measures the two scope resolutions :class:`tentacle.slots.maya._slots_maya.DagQuery`
+replaced, at increasing shape counts:
+
+- ``cleanup_pool`` — Mesh Cleanup's "All Geometry" scope: every mesh shape minus
+  intermediates, back to unique transforms. Before: ``ls`` + one ``getAttr
+  .intermediateObject`` per shape. After: ``ls -noIntermediate`` + one ``listRelatives``.
+- ``xray_toggle`` — Display's Xray Other: read every shape's xRay flag and set them
+  all. Before: one ``displaySurface`` query and one edit per shape. After: one of each.
+
+The contract is the shape of the curve, not a number: the batched columns must grow
+far slower than the per-node ones (the commands issued are constant; what remains is
+Maya's own per-node cost inside each command). ``per_shape_us`` makes that visible.
+
+Scenes are built from instanced copies of one cube (``duplicate -instanceLeaf``) plus
+a deformed copy per 100, so intermediates are present and building 30k shapes stays
+quick. Runs inside a fresh Maya launched by ``run_in_maya`` (sibling file)::
+
+    python tentacle/test/bench/run_in_maya.py \\
+        dag_query:TentacleDagQueryBench --ui edit --label batched --samples 3
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List
+
+
+class TentacleDagQueryBench:
+    #: Mesh shape counts benched.
+    SIZES = (1_000, 5_000, 30_000)
+
+    #: Repeats per measurement (the best is reported).
+    REPEATS = 3
+
+    def __init__(self, ui_name: str = "edit", label: str = "") -> None:
+        self.ui_name = ui_name
+        self.label = label
+
+    @staticmethod
+    def _best(fn, repeats) -> float:
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - start) * 1000.0)
+        return min(times)
+
+    @staticmethod
+    def _scene(count: int) -> None:
+        import maya.cmds as cmds
+
+        cmds.file(new=True, force=True)
+        source = cmds.polyCube(ch=False)[0]
+        for i in range(1, count):
+            if i % 100:
+                cmds.duplicate(source, instanceLeaf=True)
+            else:  # a deformed copy: its shape gets an intermediate sibling
+                cmds.lattice(cmds.duplicate(source)[0])
+
+    # ------------------------------------------------------------------ before
+    @staticmethod
+    def _pool_per_node():
+        import maya.cmds as cmds
+
+        shapes = [
+            s
+            for s in (cmds.ls(type="mesh") or [])
+            if not cmds.getAttr(f"{s}.intermediateObject")
+        ]
+        return list(dict.fromkeys(cmds.listRelatives(shapes, parent=True, fullPath=True) or []))
+
+    @staticmethod
+    def _xray_per_node(shapes):
+        import maya.cmds as cmds
+
+        target = not all(
+            (cmds.displaySurface(s, xRay=True, query=True) or [False])[0] for s in shapes
+        )
+        for s in shapes:
+            cmds.displaySurface(s, xRay=target)
+
+    # ------------------------------------------------------------------ after
+    @staticmethod
+    def _pool_batched():
+        from tentacle import SlotsMaya
+
+        dag = SlotsMaya.dag
+        return dag.parents(dag.shapes())
+
+    @staticmethod
+    def _xray_batched(shapes):
+        from tentacle import SlotsMaya
+
+        dag = SlotsMaya.dag
+        target = not all(dag.display_surface(shapes, "xRay"))
+        dag.set_display_surface(shapes, "xRay", target)
+
+    def run(self) -> Dict[str, Any]:
+        from tentacle import SlotsMaya
+
+        rows: List[Dict[str, Any]] = []
+        for size in self.SIZES:
+            self._scene(size)
+            shapes = SlotsMaya.dag.shapes(type="surfaceShape")
+            if sorted(self._pool_per_node()) != sorted(self._pool_batched()):
+                raise AssertionError(f"cleanup pools differ at {size} shapes")
+            row = {"shapes": len(shapes)}
+            for name, before, after in (
+                ("cleanup_pool", self._pool_per_node, self._pool_batched),
+                (
+                    "xray_toggle",
+                    lambda: self._xray_per_node(shapes),
+                    lambda: self._xray_batched(shapes),
+                ),
+            ):
+                per_node = self._best(before, self.REPEATS)
+                batched = self._best(after, self.REPEATS)
+                row[name] = {
+                    "per_node_ms": round(per_node, 3),
+                    "batched_ms": round(batched, 3),
+                    "speedup": round(per_node / batched, 2) if batched else None,
+                    "per_shape_us": {
+                        "per_node": round(per_node * 1000.0 / len(shapes), 3),
+                        "batched": round(batched * 1000.0 / len(shapes), 3),
+                    },
+                }
+            rows.append(row)
+
+        return {
+            "label": self.label,
+            "ui": self.ui_name,
+            "sizes": rows,
+            "phases_ms_best": {
+                f"{row['shapes']}_{name}_{kind}": row[name][f"{kind}_ms"]
+                for row in rows
+                for name in ("cleanup_pool", "xray_toggle")
+                for kind in ("per_node", "batched")
+            },
+        }
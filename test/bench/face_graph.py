@@ -0,0 +1,150 @@
+"""Tentacle face-graph bench: Select Island / Select Edges By Angle on a dense mesh.
+
+Measures the two selections ``SlotsMaya.face_graphs`` replaced, on a deformed plane at
+increasing face counts:
+
+- ``island`` — Select Island: faces within a normal range of the selected faces,
+  grouped into edge-connected islands. Before: ``mtk.Components.
+  get_faces_with_similar_normals`` + ``get_contiguous_islands``. After:
+  :meth:`FaceGraph.similar_islands` on the cached graph.
+- ``edge_angle`` — Select Edges By Angle (70–160°). Before:
+  ``mtk.Components.get_edges_by_normal_angle``. After: :meth:`FaceGraph.edge_angles`.
+
+``cold`` includes the topology read (one ``MItMeshPolygon`` pass, paid once per
+topology); ``warm`` is every later click — points re-read, normals recomputed. The
+contract is :attr:`TentacleFaceGraphBench.WARM_BUDGET_MS` for the warm figure at every
+size. The per-component paths run only up to :attr:`PER_COMPONENT_MAX` faces — past
+that they take minutes.
+
+Runs inside a fresh Maya launched by ``run_in_maya`` (sibling file)::
+
+    python tentacle/test/bench/run_in_maya.py \\
+        face_graph:TentacleFaceGraphBench --ui selection --label numpy --samples 3
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List
+
+
+class TentacleFaceGraphBench:
+    #: Face counts benched (a square plane: side² quads).
+    SIZES = (10_000, 100_000, 1_000_000)
+
+    #: Largest face count the per-component ``mtk`` paths are timed at.
+    PER_COMPONENT_MAX = 100_000
+
+    #: Warm selection budget (ms), either operation, at every size.
+    WARM_BUDGET_MS = 1000.0
+
+    #: Repeats per warm measurement (the best is reported).
+    REPEATS = 3
+
+    RANGES = (0.05, 0.05, 0.05)
+    ANGLES = (70.0, 160.0)
+
+    def __init__(self, ui_name: str = "selection", label: str = "") -> None:
+        self.ui_name = ui_name
+        self.label = label
+
+    @staticmethod
+    def _timed(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1000.0
+
+    @staticmethod
+    def _plane(faces: int) -> str:
+        """A plane rippled by a baked sine deformer, so the normals vary."""
+        import maya.cmds as cmds
+
+        side = max(1, int(faces**0.5))
+        plane = cmds.polyPlane(sx=side, sy=side, ch=False)[0]
+        cmds.nonLinear(plane, type="sine", amplitude=0.05, wavelength=0.02)
+        cmds.delete(plane, constructionHistory=True)
+        return cmds.listRelatives(plane, shapes=True, fullPath=True)[0]
+
+    # ------------------------------------------------------------------ before
+    def _island_per_component(self, shape):
+        import mayatk as mtk
+
+        seeds = [f"{shape}.f[0]", f"{shape}.f[5]"]
+        x, y, z = self.RANGES
+        similar = mtk.Components.get_faces_with_similar_normals(
+            seeds, range_x=x, range_y=y, range_z=z
+        )
+        islands = mtk.Components.get_contiguous_islands(similar)
+        return [f for island in islands if island & set(seeds) for f in island]
+
+    def _angle_per_component(self, shape):
+        import mayatk as mtk
+
+        low, high = self.ANGLES
+        return mtk.Components.get_edges_by_normal_angle(
+            [shape], low_angle=low, high_angle=high
+        )
+
+    # ------------------------------------------------------------------ after
+    def _island_graph(self, shape):
+        from tentacle import SlotsMaya
+
+        graph, normals = SlotsMaya.face_graphs().normals(shape)
+        return graph.similar_islands(normals, [0, 5], self.RANGES)
+
+    def _angle_graph(self, shape):
+        import numpy as np
+        from tentacle import SlotsMaya
+
+        graph, normals = SlotsMaya.face_graphs().normals(shape, world=True)
+        angles = np.nan_to_num(graph.edge_angles(normals), nan=0.0)
+        low, high = self.ANGLES
+        return np.flatnonzero((angles >= low - 1e-3) & (angles <= high + 1e-3))
+
+    def run(self) -> Dict[str, Any]:
+        import maya.cmds as cmds
+        from tentacle import SlotsMaya
+
+        rows: List[Dict[str, Any]] = []
+        for size in self.SIZES:
+            cmds.file(new=True, force=True)
+            shape = self._plane(size)
+            row: Dict[str, Any] = {"faces": cmds.polyEvaluate(shape, face=True)}
+            for name, before, after in (
+                ("island", self._island_per_component, self._island_graph),
+                ("edge_angle", self._angle_per_component, self._angle_graph),
+            ):
+                SlotsMaya.face_graphs().invalidate()
+                cold = self._timed(lambda: after(shape))
+                warm = min(
+                    self._timed(lambda: after(shape)) for _ in range(self.REPEATS)
+                )
+                entry = {
+                    "cold_ms": round(cold, 3),
+                    "warm_ms": round(warm, 3),
+                    "warm_within_budget": warm < self.WARM_BUDGET_MS,
+                }
+                if size <= self.PER_COMPONENT_MAX:
+                    per_component = self._timed(lambda: before(shape))
+                    entry["per_component_ms"] = round(per_component, 3)
+                    entry["speedup"] = round(per_component / warm, 2) if warm else None
+                row[name] = entry
+            rows.append(row)
+
+        return {
+            "label": self.label,
+            "ui": self.ui_name,
+            "warm_budget_ms": self.WARM_BUDGET_MS,
+            "sizes": rows,
+            "phases_ms_best": {
+                f"{row['faces']}_{name}_{kind}": row[name][f"{kind}_ms"]
+                for row in rows
+                for name in ("island", "edge_angle")
+                for kind in ("cold", "warm")
+            },
+            "passed": all(
+                row[name]["warm_within_budget"]
+                for row in rows
+                for name in ("island", "edge_angle")
+            ),
+        }
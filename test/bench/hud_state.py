@@ -0,0 +1,112 @@
+"""Tentacle HUD section-cache bench.
+
+Measures what a user feels on every HUD open once the section cache is warm: a cold
+``construct_hud`` (cache dropped — the pre-cache cost on EVERY open) against a warm one
+(cache replayed), on a selected mesh at increasing densities. The warm figure is the
+contract: it must stay under :attr:`TentacleHudStateBench.WARM_BUDGET_MS` regardless of
+mesh size, because a warm build reads nothing from the scene but the selection list and
+the undo-queue head.
+
+Self-contained (no uitk bench base): the HUD is one slot class, so the Switchboard is
+built the same way :mod:`option_box` builds it and the slot is driven directly.
+
+Runs inside a fresh Maya launched by ``run_in_maya`` (sibling file)::
+
+    python tentacle/test/bench/run_in_maya.py \\
+        hud_state:TentacleHudStateBench \\
+        --ui hud#startmenu --label cache --samples 3
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List
+
+
+class TentacleHudStateBench:
+    #: Triangle counts for the benched mesh (a subdivided plane: 2 tris per quad).
+    DENSITIES = (20_000, 200_000, 2_000_000)
+
+    #: Warm HUD open budget (ms), independent of mesh size.
+    WARM_BUDGET_MS = 5.0
+
+    #: Warm renders averaged per density (the best of them is reported).
+    WARM_REPEATS = 20
+
+    def __init__(self, ui_name: str = "hud#startmenu", label: str = "") -> None:
+        self.ui_name = ui_name
+        self.label = label
+
+    def setup_switchboard(self):
+        import os
+        import tentacle
+        from uitk import Switchboard
+
+        tentacle_root = os.path.dirname(os.path.abspath(tentacle.__file__))
+        sb = Switchboard(
+            ui_source=os.path.join(tentacle_root, "ui"),
+            slot_source=os.path.join(tentacle_root, "slots", "maya"),
+            base_dir=tentacle_root,
+            log_level="warning",
+        )
+        if not hasattr(sb.handlers, "marking_menu"):
+            sb.handlers.marking_menu = None
+        return sb
+
+    @staticmethod
+    def _timed(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1000.0
+
+    def _plane(self, tris: int) -> str:
+        import maya.cmds as cmds
+
+        side = max(1, int((tris / 2) ** 0.5))
+        return cmds.polyPlane(sx=side, sy=side, ch=False)[0]
+
+    def run(self) -> Dict[str, Any]:
+        import maya.cmds as cmds
+
+        sb = self.setup_switchboard()
+        ui = sb.loaded_ui.hud_startmenu
+        slots = ui.slots
+        hud = ui.hudTextEdit
+
+        rows: List[Dict[str, Any]] = []
+        for tris in self.DENSITIES:
+            cmds.file(new=True, force=True)
+            mesh = self._plane(tris)
+            cmds.select(mesh)
+            slots._check_hud_edit_key()
+
+            def build():
+                hud.clear()
+                slots.construct_hud()
+
+            slots.invalidate_hud()
+            cold = self._timed(build)
+            warm = min(self._timed(build) for _ in range(self.WARM_REPEATS))
+            rows.append(
+                {
+                    "tris": tris,
+                    "cold_ms": round(cold, 3),
+                    "warm_ms": round(warm, 3),
+                    "warm_within_budget": warm < self.WARM_BUDGET_MS,
+                }
+            )
+
+        return {
+            "label": self.label,
+            "ui": self.ui_name,
+            "warm_budget_ms": self.WARM_BUDGET_MS,
+            "densities": rows,
+            "phases_ms_best": {
+                f"{i:02d}_{kind}_{row['tris']}": row[f"{kind}_ms"]
+                for i, (row, kind) in enumerate(
+                    ((row, kind) for row in rows for kind in ("cold", "warm")), 1
+                )
+            },
+            "warm_show_ms_best": max(row["warm_ms"] for row in rows),
+            "passed": all(row["warm_within_budget"] for row in rows),
+        }
@@ -0,0 +1,420 @@
+"""Tentacle slots-layer bench, headless: the second tier, for plain Linux / CI.
+
+Every other bench here (``marking_menu``, ``option_box``, ``standalone_ui``, ...) needs
+``run_in_maya`` to launch a Maya GUI, so a slots-layer slowdown is only ever caught on a
+workstation. This tier loads the same ``.ui`` files and slot classes with the host engine
+replaced by stand-ins — stub modules whose every attribute is a ``MagicMock`` (the
+:mod:`startup_profile` stubs), plus canned replies for the calls the benched paths read
+(:data:`SCENE`: a selected mesh, a few hundred materials) — under ``offscreen`` Qt. What is
+left is tentacle's and uitk's own cost, which is what a change to either can regress:
+
+- ``01_import`` — tentacle + the Switchboard;
+- ``02_register`` — Switchboard construction: every ``.ui`` and slot module registered;
+- ``03_init_<ui>`` — each of :data:`REPRESENTATIVE_UIS` loaded, its slots constructed and
+  its children registered, which runs every ``*_init`` (the option-box menus among them);
+- ``04_hud_build_cold`` / ``05_hud_build_warm`` — ``construct_hud`` with the section cache
+  dropped, then replayed;
+- ``06_material_list_cold`` / ``07_material_list_warm`` — the materials combo repopulated
+  with the material index dropped, then reused.
+
+Both hosts are covered (``--host maya`` / ``--host blender``). Each sample is a fresh
+interpreter, and the result has the ``bench_*.json`` shape ``run_in_maya`` writes
+(``phases_ms_best`` / ``phases_ms_median`` / ``all_samples``)::
+
+    python test/bench/slots_headless.py --host maya --samples 5            # gate
+    python test/bench/slots_headless.py --host maya --samples 5 --write-baseline
+
+The gate compares medians of at least :data:`MIN_SAMPLES` runs against
+``bench_slots_headless_<host>.json`` and exits 1 when a phase is slower by more than its
+slack: 10%, at least :data:`MIN_MS` (:data:`SMALL_FLOOR_MS` for a phase under
+:data:`SMALL_MS`), and at least :data:`NOISE_K` times the two runs' summed sample spread.
+A single sample swings tens of percent on an unchanged tree. Baselines are
+machine-specific: regenerate them on the machine that runs the gate. Inside a real Maya,
+``run_in_maya.py slots_headless:TentacleSlotsHeadlessBench`` measures the same phases
+against the live engine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+BENCH_DIR = Path(__file__).resolve().parent
+
+#: Regression gate: a phase regresses when it is more than ``TOLERANCE`` slower AND at
+#: least ``MIN_MS`` slower (below that, a 10% swing is scheduler noise).
+TOLERANCE = 0.10
+MIN_MS = 2.0
+
+#: Phases under ``SMALL_MS`` need ``SMALL_FLOOR_MS`` of slowdown: their run-to-run swing
+#: is a few ms whatever their size (a 20 ms warm rebuild measured 20.3 then 25.0).
+SMALL_MS = 50.0
+SMALL_FLOOR_MS = 5.0
+
+#: A slowdown must also exceed this many median absolute deviations (the baseline's
+#: plus the current run's, from ``all_samples``) — the noise each run reports itself.
+NOISE_K = 3.0
+
+#: The fewest samples the gate compares (a one-sample median is just a sample).
+MIN_SAMPLES = 5
+
+#: Modules stubbed for a Blender run (Maya's are ``startup_profile.HEADLESS_STUBS``).
+BLENDER_STUBS = ("bpy", "bpy.types", "bpy.props", "bpy.app", "bmesh", "mathutils", "blendertk")
+
+#: Per host: the entry class's ``.ui`` / slot sources.
+HOSTS = {
+    "maya": {"ui_source": ("ui", "ui/maya_menus"), "slot_source": "slots/maya"},
+    "blender": {"ui_source": ("ui", "ui/blender_menus"), "slot_source": "slots/blender"},
+}
+
+#: The benched scene the canned replies describe.
+SCENE = {"materials": 400, "selection": "pCube1", "faces": 20_000}
+
+#: Warm repeats (the best is kept).
+WARM_REPEATS = 10
+
+
+def _representative_uis():
+    """``TentacleOptionBoxBench.REPRESENTATIVE_UIS``, read from ``option_box.py``'s syntax —
+    that module imports uitk's Maya-side bench base, which is not importable here, and a
+    copied tuple would drift."""
+    tree = ast.parse((BENCH_DIR / "option_box.py").read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Assign)
+            and getattr(node.targets[0], "id", None) == "REPRESENTATIVE_UIS"
+        ):
+            return tuple(ast.literal_eval(node.value))
+    raise LookupError("REPRESENTATIVE_UIS not found in option_box.py")
+
+
+REPRESENTATIVE_UIS = _representative_uis()
+
+
+# ---------------------------------------------------------------------- stand-ins
+def _answer(table, default=None):
+    """A ``side_effect`` answering from *table* — ``[(kwargs subset, value), ...]``, first
+    match wins — else *default*. Lists are copied so a caller mutating one is harmless."""
+
+    def answer(*args, **kwargs):
+        for when, value in table:
+            if all(kwargs.get(k) == v for k, v in when.items()):
+                return list(value) if isinstance(value, list) else value
+        return list(default) if isinstance(default, list) else default
+
+    return answer
+
+
+def _can_maya(modules):
+    """Canned ``maya.cmds`` / ``mayatk`` replies for :data:`SCENE`."""
+    cmds, mtk = modules["maya.cmds"], modules["mayatk"]
+    selection = [SCENE["selection"]]
+    materials = ["lambert1", "standardSurface1"] + [
+        f"mat_{i:03d}" for i in range(SCENE["materials"] - 2)
+    ]
+
+    cmds.ls.side_effect = _answer(
+        [({"sl": True}, selection), ({"selection": True}, selection)], default=[]
+    )
+    cmds.currentUnit.side_effect = _answer([({"time": True}, "film")], "centimeter")
+    cmds.selectMode.side_effect = _answer([({"object": True}, True)], False)
+    cmds.selectType.side_effect = _answer([], False)
+    cmds.objectType.return_value = "transform"
+    cmds.nodeType.return_value = "transform"
+    cmds.listRelatives.return_value = [f"{SCENE['selection']}Shape"]
+    cmds.polyEvaluate.return_value = SCENE["faces"]
+    cmds.symmetricModelling.return_value = False
+    cmds.xformConstraint.return_value = "none"
+    cmds.file.return_value = ""
+    cmds.undoInfo.return_value = "polyCube"
+    cmds.optionVar.return_value = "film"
+    cmds.autoSave.return_value = True
+
+    mtk.MatUtils.get_scene_mats.side_effect = lambda *a, exclude_defaults=True, **k: (
+        list(materials[2:] if exclude_defaults else materials)
+    )
+    mtk.MatUtils.get_mat_swatch_icon.return_value = None
+    mtk.CoreUtils.short_name.side_effect = lambda name: name.split("|")[-1]
+    mtk.CoreUtils.leaf_name.side_effect = lambda name: name.split(":")[-1]
+    mtk.get_env_info.return_value = ""
+
+
+class _Materials(list):
+    """``bpy.data.materials``: iterable, with ``get(name)``."""
+
+    def get(self, name, default=None):
+        return next((m for m in self if m.name == name), default)
+
+
+def _can_blender(modules):
+    """Canned ``bpy`` / ``blendertk`` replies for :data:`SCENE`."""
+    bpy, btk = modules["bpy"], modules["blendertk"]
+    materials = _Materials(
+        types.SimpleNamespace(name=f"Material.{i:03d}") for i in range(SCENE["materials"])
+    )
+    bpy.data.materials = materials
+    bpy.data.filepath = ""
+    bpy.context.view_layer.objects.active = None
+    scene = bpy.context.scene
+    scene.render.fps, scene.render.fps_base, scene.render.filepath = 24, 1.0, ""
+    scene.unit_settings.system, scene.unit_settings.length_unit = "METRIC", "METERS"
+    bpy.context.preferences.filepaths.temporary_directory = ""
+    btk.get_env_info.return_value = ""
+    btk.selected_objects.return_value = []
+    btk.get_scene_mats.side_effect = lambda *a, **k: list(materials)
+    btk.get_mat_swatch_icon.return_value = None
+
+
+def stub_host(host):
+    """Install *host*'s stub modules in ``sys.modules`` and can their replies (idempotent)."""
+    if str(BENCH_DIR) not in sys.path:
+        sys.path.insert(0, str(BENCH_DIR))
+    import startup_profile
+
+    if host == "maya":
+        startup_profile.stub_engines()
+        _can_maya(sys.modules)
+        return
+    for name in BLENDER_STUBS:
+        sys.modules.setdefault(name, startup_profile._StubModule(name))
+    sys.modules["bpy"].types = sys.modules["bpy.types"]
+    sys.modules["bpy.types"].RenderEngine = type("RenderEngine", (), {})
+    _can_blender(sys.modules)
+
+
+# ---------------------------------------------------------------------- the bench
+class TentacleSlotsHeadlessBench:
+    """The slots-layer phases against whatever engine is importable.
+
+    Headless, :func:`sample` installs the stand-ins first; inside Maya (through
+    ``run_in_maya``) :meth:`run` measures the same phases against the real one.
+    """
+
+    def __init__(self, ui_name: str = "headless", label: str = "", host: str = "maya"):
+        self.ui_name = ui_name
+        self.label = label
+        self.host = host
+        self.phases = {}
+
+    @contextmanager
+    def _phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000.0, 3)
+
+    def _best(self, name, fn, repeats=WARM_REPEATS):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - start) * 1000.0)
+        self.phases[name] = round(min(times), 3)
+
+    def run(self):
+        spec = HOSTS[self.host]
+        with self._phase("01_import"):
+            import tentacle
+            from uitk import Switchboard
+
+        root = os.path.dirname(os.path.abspath(tentacle.__file__))
+        with self._phase("02_register"):
+            sb = Switchboard(
+                ui_source=tuple(os.path.join(root, p) for p in spec["ui_source"]),
+                slot_source=os.path.join(root, spec["slot_source"]),
+                base_dir=root,
+                log_level="error",
+            )
+            if not hasattr(sb.handlers, "marking_menu"):
+                sb.handlers.marking_menu = None
+
+        def load(name):
+            ui = sb.get_ui(name)
+            slots = sb.get_slots_instance(ui)
+            ui.register_children()  # runs every *_init, option boxes included
+            return ui, slots
+
+        for name in REPRESENTATIVE_UIS:
+            with self._phase(f"03_init_{name}"):
+                load(name)
+
+        ui, hud = load("hud#startmenu")
+
+        def build_hud():
+            ui.hudTextEdit.clear()
+            hud.construct_hud()
+
+        hud.invalidate_hud()
+        with self._phase("04_hud_build_cold"):
+            build_hud()
+        self._best("05_hud_build_warm", build_hud)
+
+        ui, materials = load("materials")
+        combo = ui.cmb002
+        materials.invalidate_material_index()
+        with self._phase("06_material_list_cold"):
+            combo.init_slot()
+        self._best("07_material_list_warm", combo.init_slot)
+
+        return {
+            "label": self.label,
+            "ui": self.ui_name,
+            "host": self.host,
+            "material_count": combo.count(),
+            "phases_ms_best": dict(self.phases),
+        }
+
+
+def sample(host):
+    """One cold headless sample in THIS process (stand-ins installed first)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    stub_host(host)
+
+    from qtpy import QtWidgets
+    from uitk.testing import TestSandbox
+
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    TestSandbox.activate()
+    return TentacleSlotsHeadlessBench(host=host).run()
+
+
+def run_samples(host, samples=5):
+    """Each sample in a fresh interpreter (imports and first loads are only cold once)."""
+    results = []
+    for _ in range(samples):
+        fd, out = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            subprocess.run(
+                [sys.executable, __file__, "--host", host, "--sample", out],
+                check=True,
+                env=dict(
+                    os.environ,
+                    QT_QPA_PLATFORM="offscreen",
+                    TENTACLE_CACHE_DIR=tempfile.mkdtemp(),
+                    TENTACLE_TELEMETRY="0",
+                ),
+            )
+            results.append(json.loads(Path(out).read_text(encoding="utf-8")))
+        finally:
+            os.remove(out)
+    return results
+
+
+def aggregate(results, label=""):
+    """The ``run_in_maya`` aggregate shape: best-of and median per phase."""
+    keys = list(results[0]["phases_ms_best"])
+
+    def values(key):
+        return [r["phases_ms_best"][key] for r in results if key in r["phases_ms_best"]]
+
+    return {
+        "label": label,
+        "ui": results[0]["ui"],
+        "host": results[0]["host"],
+        "python": platform.python_version(),
+        "samples": len(results),
+        "scene": dict(SCENE, material_count=results[0].get("material_count")),
+        "phases_ms_best": {k: round(min(values(k)), 3) for k in keys},
+        "phases_ms_median": {k: round(statistics.median(values(k)), 3) for k in keys},
+        "all_samples": [r["phases_ms_best"] for r in results],
+    }
+
+
+def spread(result, phase):
+    """Median absolute deviation of *phase* over *result*'s ``all_samples`` (0 with fewer
+    than two)."""
+    values = [s[phase] for s in result.get("all_samples", ()) if phase in s]
+    if len(values) < 2:
+        return 0.0
+    middle = statistics.median(values)
+    return statistics.median(abs(v - middle) for v in values)
+
+
+def slack(phase, before, current, baseline, tolerance=TOLERANCE, min_ms=MIN_MS):
+    """How much slower than *before* (its baseline value) *phase* may get, in ms."""
+    floor = SMALL_FLOOR_MS if before < SMALL_MS else 0.0
+    noise = NOISE_K * (spread(current, phase) + spread(baseline, phase))
+    return max(before * tolerance, min_ms, floor, noise)
+
+
+def compare(current, baseline, tolerance=TOLERANCE, min_ms=MIN_MS):
+    """Phases of *current* that regressed against *baseline* — ``[(phase, before, after)]``.
+
+    Medians are compared where both have them (a lucky best-of in the baseline would make
+    every ordinary run read as a regression), best-of otherwise. A phase only one side has
+    is not compared. The allowed slowdown is :func:`slack`.
+    """
+    key = (
+        "phases_ms_median"
+        if "phases_ms_median" in current and "phases_ms_median" in baseline
+        else "phases_ms_best"
+    )
+    now, then = current.get(key, {}), baseline.get(key, {})
+    return [
+        (phase, then[phase], now[phase])
+        for phase in sorted(now.keys() & then.keys())
+        if now[phase] - then[phase]
+        > slack(phase, then[phase], current, baseline, tolerance, min_ms)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", choices=sorted(HOSTS), default="maya")
+    parser.add_argument("--samples", type=int, default=MIN_SAMPLES)
+    parser.add_argument("--baseline", help="Default: bench_slots_headless_<host>.json")
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--out", help="Also write the aggregate here.")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--sample", help=argparse.SUPPRESS)  # one child run -> file
+    args = parser.parse_args(argv)
+
+    if args.sample:
+        result = sample(args.host)
+        Path(args.sample).write_text(json.dumps(result), encoding="utf-8")
+        os._exit(0)  # skip Qt teardown of the stubbed session
+
+    if args.samples < MIN_SAMPLES:
+        parser.error(f"--samples must be at least {MIN_SAMPLES} (medians, not samples)")
+    baseline = Path(
+        args.baseline or BENCH_DIR / f"bench_slots_headless_{args.host}.json"
+    )
+    result = aggregate(run_samples(args.host, args.samples), label=f"headless_{args.host}")
+    if args.out:
+        Path(args.out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    for phase, ms in result["phases_ms_median"].items():
+        print(f"{phase:<32} {ms:>10.2f} ms")
+    if args.write_baseline:
+        baseline.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"baseline written: {baseline}")
+        return 0
+
+    regressions = compare(
+        result,
+        json.loads(baseline.read_text(encoding="utf-8")),
+        tolerance=args.tolerance,
+    )
+    for phase, before, after in regressions:
+        print(f"REGRESSION {phase}: {before:.1f} ms -> {after:.1f} ms")
+    print("slots within budget" if not regressions else f"{len(regressions)} regressed")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""Tentacle cold-start profile bench + headless regression gate.
+
+Drives :class:`tentacle.startup_profile.StartupProfile` around the real entry
+class, so the report says *where* ``02_construct`` goes: per-module import
+time, per-``.ui`` parse time and per-slot-class ``__init__`` time, with a
+Chrome ``traceEvents`` block that opens as a flame graph in Perfetto /
+``chrome://tracing`` / speedscope.
+
+Two ways to run it:
+
+**In Maya** — through ``run_in_maya`` like the other benches (fresh GUI
+session per sample)::
+
+    python tentacle/test/bench/run_in_maya.py \\
+        startup_profile:TentacleStartupProfileBench \\
+        --ui hud#startmenu --label startup --samples 3
+
+**Headless, on Linux / CI** — no DCC at all. ``maya`` / ``mayatk`` are
+replaced by stub modules whose every attribute is a ``MagicMock``, Qt runs
+``offscreen``, and uitk's :class:`~uitk.testing.TestSandbox` keeps the run
+from touching real settings. What is left is exactly tentacle's own startup
+cost — the Switchboard registering every ``.ui`` and slot module, the
+marking menu, the panels loaded below — which is the part a tentacle
+change can regress. Each sample is a fresh interpreter (imports are only
+cold once per process)::
+
+    python test/bench/startup_profile.py --samples 5            # gate vs baseline
+    python test/bench/startup_profile.py --samples 5 --write-baseline
+
+The gate compares the median-of-samples report against
+``bench_startup_headless.json`` with :meth:`StartupProfile.compare` and exits
+1 when any phase, category total, ``.ui`` or slot class is more than 10%
+(and at least 10 ms) slower. The baseline is machine-specific: regenerate it
+with ``--write-baseline`` on the machine that runs the gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import types
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[2]
+BASELINE = Path(__file__).resolve().parent / "bench_startup_headless.json"
+
+#: Modules stubbed for the headless run — the Maya side of ``tcl_maya``'s imports.
+HEADLESS_STUBS = (
+    "maya",
+    "maya.cmds",
+    "maya.mel",
+    "maya.utils",
+    "maya.api",
+    "maya.api.OpenMaya",
+    "maya.OpenMayaUI",
+    "mayatk",
+)
+
+#: Panels loaded after construction (the ``lazy_load_ui`` phase — ``.ui`` parse plus
+#: slot-class construction): both startmenus plus the heaviest submenus.
+HEADLESS_UIS = ("hud#startmenu", "main#startmenu", "materials", "scene", "edit")
+
+
+class _StubModule(types.ModuleType):
+    """A real module (import hooks read its dunders) whose other attributes are mocks."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = mock.MagicMock(name=f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+
+def stub_engines():
+    """Install :data:`HEADLESS_STUBS` in ``sys.modules`` (idempotent)."""
+    for name in HEADLESS_STUBS:
+        sys.modules.setdefault(name, _StubModule(name))
+    sys.modules["maya"].cmds = sys.modules["maya.cmds"]
+    sys.modules["mayatk"].get_main_window = lambda: None
+
+
+def profile_headless(ui_names=HEADLESS_UIS):
+    """Profile one stubbed-engine ``TclMaya`` cold start in THIS process; returns the report."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    stub_engines()
+
+    from tentacle.startup_profile import StartupProfile
+
+    profile = StartupProfile(host="maya-headless").start()
+    try:
+        with profile.phase("import"):
+            from qtpy import QtWidgets
+            from uitk.testing import TestSandbox
+
+            from tentacle.tcl_maya import TclMaya
+
+        QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        TestSandbox.activate()
+        with profile.phase("construct"):
+            menu = TclMaya(parent=None, log_level="WARNING")
+        with profile.phase("lazy_load_ui"):
+            for name in ui_names:  # parse the .ui, then build its slots as a show would
+                menu.sb.get_slots_instance(menu.sb.get_ui(name))
+    finally:
+        profile.stop()
+    return profile.report()
+
+
+def median_of(reports):
+    """One report holding the median of every compared timing across *reports*.
+
+    The median, not the best: a single unusually quick sample in the baseline would
+    otherwise make every ordinary run afterwards read as a regression.
+    """
+    med = statistics.median
+    merged = dict(reports[0])
+    for key in ("phases_ms", "totals_ms"):
+        merged[key] = {
+            k: round(med(r[key][k] for r in reports if k in r.get(key, {})), 3)
+            for k in reports[0].get(key, {})
+        }
+    for key in ("ui", "slots"):
+        values = {}
+        for report in reports:
+            for entry in report.get(key, ()):
+                values.setdefault(entry["name"], []).append(entry)
+        merged[key] = sorted(
+            (
+                {
+                    "name": name,
+                    "ms": round(med(e["ms"] for e in entries), 3),
+                    "self_ms": round(med(e["self_ms"] for e in entries), 3),
+                }
+                for name, entries in values.items()
+            ),
+            key=lambda e: e["ms"],
+            reverse=True,
+        )
+    merged["samples"] = len(reports)
+    return merged
+
+
+def run_samples(samples=5):
+    """Each sample in a fresh interpreter, so every import is cold; returns the reports."""
+    reports = []
+    for _ in range(samples):
+        fd, out = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            subprocess.run(
+                [sys.executable, __file__, "--sample", out],
+                check=True,
+                env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+            )
+            reports.append(json.loads(Path(out).read_text(encoding="utf-8")))
+        finally:
+            os.remove(out)
+    return reports
+
+
+class TentacleStartupProfileBench:
+    """``run_in_maya`` bench: profile the real ``TclMaya`` cold start inside Maya.
+
+    ``ui_name`` is the startmenu lazy-loaded after construction. The result
+    carries ``phases_ms_best`` so ``run_in_maya``'s aggregation and ``--diff``
+    work on it like on every other bench file.
+    """
+
+    def __init__(self, ui_name="hud#startmenu", label="startup"):
+        self.ui_name = ui_name
+        self.label = label
+
+    def run(self):
+        from tentacle.startup_profile import StartupProfile
+
+        profile = StartupProfile(host="maya").start()
+        try:
+            with profile.phase("import"):
+                from tentacle.tcl_maya import TclMaya
+            with profile.phase("construct"):
+                menu = TclMaya(log_level="WARNING")
+            with profile.phase("lazy_load_ui"):
+                menu.sb.get_slots_instance(menu.sb.get_ui(self.ui_name))
+        finally:
+            profile.stop()
+        report = profile.report()
+        report.update(
+            label=self.label, ui=self.ui_name, phases_ms_best=report["phases_ms"]
+        )
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--out", help="Also write the median-of-samples report here.")
+    parser.add_argument("--tolerance", type=float, default=None)
+    parser.add_argument("--sample", help=argparse.SUPPRESS)  # one child run -> file
+    args = parser.parse_args(argv)
+
+    if args.sample:
+        report = profile_headless()
+        Path(args.sample).write_text(json.dumps(report), encoding="utf-8")
+        os._exit(0)  # skip Qt teardown of the stubbed session
+
+    report = median_of(run_samples(args.samples))
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=1), encoding="utf-8")
+    print(
+        "  ".join(f"{k}={v:.1f}ms" for k, v in report["phases_ms"].items()),
+        "| slowest slots:",
+        ", ".join(f"{e['name']} {e['ms']:.1f}" for e in report["slots"][:3]),
+    )
+    if args.write_baseline:
+        report.pop("traceEvents", None)  # the gate reads summaries only
+        report["imports"] = report["imports"][:25]
+        Path(args.baseline).write_text(json.dumps(report, indent=1), encoding="utf-8")
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    sys.path.insert(0, str(ROOT))
+    from tentacle.startup_profile import StartupProfile
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    regressions = StartupProfile.compare(report, baseline, tolerance=args.tolerance)
+    for key, before, after in regressions:
+        print(f"REGRESSION {key}: {before:.1f} ms -> {after:.1f} ms")
+    print("startup within budget" if not regressions else f"{len(regressions)} regressed")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""Tentacle ``.ui`` first-open bench: Designer XML (``QUiLoader``) vs the compiled cache.
+
+Measures what :class:`tentacle.ui_cache.UiCache` changes — the cost of turning a
+panel's ``.ui`` into a widget tree the first time it opens in a process — for
+each panel in :data:`PANELS`, in both modes:
+
+- ``xml``   — uitk's ``RuntimeLoader``: ``ElementTree`` metadata pass + ``QUiLoader``;
+- ``cache`` — ``UiCache``: hash check, import of the cached module, ``setupUi``.
+
+Two measurements, both on the headless stubbed-engine ``TclMaya`` from the
+sibling ``startup_profile`` bench, with the cache built first into a throwaway
+``TENTACLE_CACHE_DIR``:
+
+- ``cold``   — median of fresh interpreters, one first-open each (what a user
+  sees, but widget construction dominates and the spread is wide);
+- ``steady`` — best of N loads in one process with the loaders' in-memory
+  caches cleared between them, which isolates the parse/build cost.
+
+Run from the repo root::
+
+    python test/bench/ui_cache.py --samples 5
+    python test/bench/ui_cache.py --samples 5 --out test/bench/bench_ui_cache.json
+
+The JSON carries per-panel ``xml_ms`` / ``cache_ms`` for both, plus totals.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+UI_DIR = ROOT / "tentacle" / "ui"
+
+#: Loaded (untimed) before the measured panel; see :func:`sample`.
+WARMUP = "crease#submenu"
+
+#: The largest panels plus both startmenus.
+PANELS = (
+    "polygons",
+    "uv",
+    "edit",
+    "materials",
+    "scene",
+    "animation",
+    "hud#startmenu",
+    "main#startmenu",
+)
+
+
+def _startup_bench():
+    """The sibling headless bench, loaded by path (see ``test/bench/__init__``)."""
+    spec = importlib.util.spec_from_file_location(
+        "_tentacle_startup_bench", Path(__file__).with_name("startup_profile.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _session():
+    """A headless ``TclMaya`` switchboard in THIS process."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, str(ROOT))
+    _startup_bench().stub_engines()
+
+    from qtpy import QtWidgets
+    from uitk.testing import TestSandbox
+
+    from tentacle.tcl_maya import TclMaya
+
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    TestSandbox.activate()
+    return TclMaya(parent=None, log_level="WARNING").sb
+
+
+def sample(mode, panel):
+    """One first-open of *panel* in THIS process; returns milliseconds."""
+    sb = _session()
+    from uitk.loaders.runtime import RuntimeLoader
+
+    from tentacle.ui_cache import UiCache
+
+    sb._loader = UiCache(sb) if mode == "cache" else RuntimeLoader(sb)
+    # One unrelated panel first, through the same loader: its one-time costs (first
+    # instance of each uitk widget class, settings stores) are not parse cost.
+    sb._loader.load(str(UI_DIR / f"{WARMUP}.ui"))
+    path = str(UI_DIR / f"{panel}.ui")
+    start = time.perf_counter()
+    sb._loader.load(path)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def steady(samples=15, panels=PANELS):
+    """Best-of-*samples* ms per panel and mode, in THIS process (caches cleared per load)."""
+    sb = _session()
+    from qtpy import QtWidgets
+    from uitk.loaders.runtime import RuntimeLoader
+
+    from tentacle.ui_cache import UiCache
+
+    app = QtWidgets.QApplication.instance()
+    xml, cache = RuntimeLoader(sb), UiCache(sb)
+    loaders = {
+        "xml": (xml, xml._metadata_cache.clear),
+        "cache": (cache, cache._load_cache.clear),
+    }
+    results = {}
+    for panel in panels:
+        path = str(UI_DIR / f"{panel}.ui")
+        row = {}
+        for mode, (loader, clear) in loaders.items():
+            times = []
+            for _ in range(samples):
+                clear()
+                start = time.perf_counter()
+                widget = loader.load(path)
+                times.append((time.perf_counter() - start) * 1000.0)
+                widget.deleteLater()
+                app.processEvents()
+            row[f"{mode}_ms"] = round(min(times), 3)
+        row["speedup"] = round(row["xml_ms"] / row["cache_ms"], 2)
+        results[panel] = row
+    return results
+
+
+def _totals(rows):
+    return (
+        round(sum(r["xml_ms"] for r in rows.values()), 3),
+        round(sum(r["cache_ms"] for r in rows.values()), 3),
+    )
+
+
+def build_cache():
+    """Compile every tentacle ``.ui`` into the (throwaway) cache dir."""
+    subprocess.run(
+        [sys.executable, "-m", "tentacle.ui_cache"],
+        cwd=str(ROOT),
+        check=True,
+        capture_output=True,
+    )
+
+
+def run(samples=5, panels=PANELS):
+    """Median first-open ms per panel and mode, each sample a fresh interpreter."""
+    results = {}
+    for panel in panels:
+        row = {}
+        for mode in ("xml", "cache"):
+            times = []
+            for _ in range(samples):
+                proc = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, panel],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                times.append(float(proc.stdout.strip().splitlines()[-1]))
+            row[f"{mode}_ms"] = round(statistics.median(times), 3)
+        row["speedup"] = round(row["xml_ms"] / row["cache_ms"], 2)
+        results[panel] = row
+        print(f"{panel:>16}: xml {row['xml_ms']:7.2f} ms  cache {row['cache_ms']:7.2f} ms")
+    xml, cache = _totals(results)
+    return {"samples": samples, "panels": results, "total_xml_ms": xml, "total_cache_ms": cache}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--out", help="Write the result JSON here.")
+    parser.add_argument("--steady-samples", type=int, default=15)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)  # mode panel
+    parser.add_argument("--steady-child", help=argparse.SUPPRESS)  # out json
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(sample(*args.child), flush=True)
+        os._exit(0)  # skip Qt teardown of the stubbed session
+    if args.steady_child:
+        rows = steady(args.steady_samples)
+        Path(args.steady_child).write_text(json.dumps(rows), encoding="utf-8")
+        os._exit(0)
+
+    os.environ["TENTACLE_CACHE_DIR"] = tempfile.mkdtemp(prefix="tentacle-ui-bench-")
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    build_cache()
+    cold = run(args.samples)
+    out = os.path.join(os.environ["TENTACLE_CACHE_DIR"], "steady.json")
+    subprocess.run(
+        [sys.executable, __file__, "--steady-child", out,
+         "--steady-samples", str(args.steady_samples)],
+        check=True,
+        capture_output=True,
+    )
+    rows = json.loads(Path(out).read_text(encoding="utf-8"))
+    xml, cache = _totals(rows)
+    result = {
+        "label": "ui_cache",
+        "cold": cold,
+        "steady": {"samples": args.steady_samples, "panels": rows,
+                   "total_xml_ms": xml, "total_cache_ms": cache},
+    }
+    for mode in ("cold", "steady"):
+        print(
+            f"{mode:>6} total: xml {result[mode]['total_xml_ms']:.1f} ms -> "
+            f"cache {result[mode]['total_cache_ms']:.1f} ms"
+        )
+    if args.out:
+        Path(args.out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
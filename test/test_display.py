@@ -183,5 +183,45 @@ class TestXrayChain(unittest.TestCase):
         self.assertTrue(self._xray(self.cube_c))
 
 
+
+@unittest.skipUnless(_MAYA_AVAILABLE, "Requires maya.cmds")
+class TestDagQuery(unittest.TestCase):
+    """``SlotsMaya.dag`` — the bulk reads the xray trio and Mesh Cleanup's scope use.
+
+    A batched query is only a win if it answers per node and in order; a mixed
+    set (one shape on, one off, one deformed with an intermediate) pins that.
+    """
+
+    def setUp(self):
+        cmds.file(new=True, force=True)
+        self.dag = display_module.SlotsMaya.dag
+        self.cubes = [cmds.polyCube(name=f"dq_{c}")[0] for c in "abc"]
+        cmds.lattice(self.cubes[2])  # gives dq_c an intermediate orig shape
+
+    def tearDown(self):
+        cmds.file(new=True, force=True)
+
+    def test_shapes_skip_intermediates_and_parents_dedupe(self):
+        shapes = self.dag.shapes()
+        self.assertEqual(len(shapes), 3)
+        self.assertEqual(
+            sorted(p.rsplit("|", 1)[-1] for p in self.dag.parents(shapes)),
+            ["dq_a", "dq_b", "dq_c"],
+        )
+
+    def test_display_surface_answers_per_shape_in_order(self):
+        shapes = self.dag.shapes(self.cubes)
+        cmds.displaySurface(shapes[1], xRay=True)
+        self.assertEqual(self.dag.display_surface(shapes, "xRay"), [False, True, False])
+        self.dag.set_display_surface(shapes, "xRay", True)
+        self.assertEqual(self.dag.display_surface(shapes, "xRay"), [True, True, True])
+
+    def test_by_root_groups_under_the_nearest_root(self):
+        group = cmds.group(self.cubes[0], self.cubes[1], name="dq_grp")
+        roots = cmds.ls([group, self.cubes[1]], long=True)
+        grouped = self.dag.by_root(roots, self.dag.shapes(roots))
+        self.assertEqual([len(v) for v in grouped.values()], [1, 1])
+
+
 if __name__ == "__main__":
     unittest.main()
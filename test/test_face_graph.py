@@ -0,0 +1,178 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared face graph (``tentacle/slots/_face_graph.py``).
+
+``FaceGraph`` takes plain index arrays, so meshes are written out by hand: a unit cube
+(every edge 90°), a strip of quads folded up at its last face, and a fan whose middle
+edge carries three faces. ``FaceGraphs`` runs on a fake engine whose meshes are dicts —
+without ``maya.cmds`` / ``bpy``.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._face_graph import FaceGraph, FaceGraphs, connected_labels  # noqa: E402
+
+
+def _graph(faces):
+    """A :class:`FaceGraph` of vertex-index *faces*, edges numbered in first-seen order."""
+    edges, corner_edges = {}, []
+    for face in faces:
+        for a, b in zip(face, face[1:] + face[:1]):
+            corner_edges.append(edges.setdefault(tuple(sorted((a, b))), len(edges)))
+    corners = [v for face in faces for v in face]
+    return FaceGraph([len(f) for f in faces], corners, corner_edges, len(edges)), list(edges)
+
+
+CUBE_POINTS = [(x, y, z) for z in (0, 1) for y in (0, 1) for x in (0, 1)]
+CUBE_FACES = [
+    (0, 2, 3, 1),  # -z
+    (4, 5, 7, 6),  # +z
+    (0, 1, 5, 4),  # -y
+    (2, 6, 7, 3),  # +y
+    (0, 4, 6, 2),  # -x
+    (1, 3, 7, 5),  # +x
+]
+
+# Four quads along x; the last one turns up to stand vertical.
+STRIP_POINTS = [(x, y, 0) for y in (0, 1) for x in range(4)] + [(3, 0, 1), (3, 1, 1)]
+STRIP_FACES = [(0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 8, 9, 7)]
+
+
+class TestConnectedLabels(unittest.TestCase):
+    def test_components_take_their_lowest_index(self):
+        labels = connected_labels(7, [(5, 1), (1, 3), (4, 6)])
+        self.assertEqual(labels.tolist(), [0, 1, 2, 1, 4, 1, 4])
+        self.assertEqual(connected_labels(3, []).tolist(), [0, 1, 2])
+
+    def test_a_long_chain_collapses(self):
+        count = 1000
+        order = np.random.default_rng(1).permutation(count)
+        labels = connected_labels(count, np.column_stack((order[:-1], order[1:])))
+        self.assertTrue((labels == 0).all())
+
+    def test_shuffled_grids_split_by_component(self):
+        side, rng = 40, np.random.default_rng(2)
+        cells = np.arange(2 * side * side).reshape(2, side, side)  # two separate grids
+        pairs = np.concatenate(
+            [
+                np.column_stack((cells[:, :, :-1].ravel(), cells[:, :, 1:].ravel())),
+                np.column_stack((cells[:, :-1].ravel(), cells[:, 1:].ravel())),
+            ]
+        )
+        names = rng.permutation(cells.size)  # element i of the grids is names[i]
+        pairs = names[pairs][rng.permutation(len(pairs))]
+        labels = connected_labels(cells.size, pairs)
+        first, second = labels[names[cells[0]]], labels[names[cells[1]]]
+        self.assertTrue((first == names[cells[0]].min()).all())
+        self.assertTrue((second == names[cells[1]].min()).all())
+
+
+class TestFaceGraph(unittest.TestCase):
+    def test_cube_normals_and_edge_angles(self):
+        graph, edges = _graph(CUBE_FACES)
+        normals = graph.normals(CUBE_POINTS)
+        expected = [(0, 0, -1), (0, 0, 1), (0, -1, 0), (0, 1, 0), (-1, 0, 0), (1, 0, 0)]
+        np.testing.assert_allclose(normals, expected, atol=1e-12)
+        self.assertEqual(len(edges), 12)
+        np.testing.assert_allclose(graph.edge_angles(normals), 90.0)
+
+    def test_border_and_non_manifold_edges_have_no_angle(self):
+        faces = [(0, 1, 2), (0, 2, 3), (0, 2, 4)]  # edge 0-2 is shared three ways
+        points = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (1, 1, 1)]
+        graph, edges = _graph(faces)
+        angles = graph.edge_angles(graph.normals(points))
+        self.assertTrue(np.isnan(angles).all())
+        self.assertEqual(len(graph.face_pairs), 2)  # still chained for islands
+        self.assertEqual(graph.islands(np.ones(3, bool)).tolist(), [0, 0, 0])
+
+    def test_strip_fold(self):
+        graph, edges = _graph(STRIP_FACES)
+        normals = graph.normals(STRIP_POINTS)
+        angles = graph.edge_angles(normals)
+        self.assertAlmostEqual(angles[edges.index((3, 7))], 90.0)
+        self.assertAlmostEqual(angles[edges.index((1, 5))], 0.0)
+        self.assertTrue(np.isnan(angles[edges.index((0, 1))]))
+
+    def test_similar_agrees_with_a_full_compare(self):
+        rng = np.random.default_rng(7)
+        normals = rng.normal(size=(500, 3))
+        normals /= np.linalg.norm(normals, axis=1)[:, None]
+        sources = normals[[3, 40, 41]]
+        ranges = (0.3, 0.2, 0.4)
+        expected = np.array(
+            [
+                any(all(abs(n[i] - s[i]) <= ranges[i] for i in range(3)) for s in sources)
+                for n in normals
+            ]
+        )
+        np.testing.assert_array_equal(FaceGraph.similar(normals, sources, ranges), expected)
+
+    def test_islands_split_where_the_mask_does(self):
+        graph, _edges = _graph(STRIP_FACES)
+        labels = graph.islands(np.array([True, False, True, True]))
+        self.assertEqual(labels.tolist(), [0, -1, 2, 2])
+
+    def test_similar_islands_stop_at_the_fold(self):
+        graph, _edges = _graph(STRIP_FACES)
+        normals = graph.normals(STRIP_POINTS)
+        ranges = (0.05, 0.05, 0.05)
+        self.assertEqual(graph.similar_islands(normals, [1], ranges).tolist(), [0, 1, 2])
+        self.assertEqual(graph.similar_islands(normals, [3], ranges).tolist(), [3])
+        pooled = graph.similar_islands(normals, [3], ranges, sources=normals[[0, 3]])
+        self.assertEqual(pooled.tolist(), [0, 1, 2, 3])
+
+
+class _FakeGraphs(FaceGraphs):
+    """Meshes are ``{"name", "faces", "points"}`` dicts."""
+
+    def _key(self, mesh):
+        return mesh["name"]
+
+    def _signature(self, mesh):
+        return len(mesh["faces"])
+
+    def _topology(self, mesh):
+        graph, edges = _graph(mesh["faces"])
+        return graph.counts, graph.corners, graph.corner_edges, len(edges)
+
+    def _points(self, mesh, world):
+        points = np.asarray(mesh["points"], dtype=np.float64)
+        return points + 10.0 if world else points
+
+
+class TestFaceGraphs(unittest.TestCase):
+    def setUp(self):
+        self.graphs = _FakeGraphs()
+        self.strip = dict(name="strip", faces=list(STRIP_FACES), points=STRIP_POINTS)
+
+    def test_a_repeat_query_builds_once_and_reads_fresh_points(self):
+        g = self.graphs
+        g.normals(self.strip)
+        self.strip["points"] = [(x, y, -z) for x, y, z in STRIP_POINTS]
+        _, normals = g.normals(self.strip)
+        self.assertEqual(g.built, 1)
+        self.assertAlmostEqual(normals[3][0], 1.0)  # the fold now turns down
+
+    def test_a_topology_change_rebuilds(self):
+        g = self.graphs
+        g.graph(self.strip)
+        self.strip["faces"] = STRIP_FACES[:3]
+        self.assertEqual(g.graph(self.strip).face_count, 3)
+        g.invalidate()
+        g.graph(self.strip)
+        self.assertEqual(g.built, 3)
+
+    def test_instance_is_per_subclass(self):
+        self.assertIs(_FakeGraphs.instance(), _FakeGraphs.instance())
+        self.assertIsNot(_FakeGraphs.instance(), FaceGraphs.instance())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the HUD section cache (``tentacle/slots/_hud.py``).
+
+The HUD used to re-query every readout on every ``hudTextEdit.shown`` — on a dense scene
+that is ``polyEvaluate`` and a ``polyNormalPerVertex`` over every face-vertex per open.
+``HudMixin`` now builds each section once and replays it until an engine event the fork
+maps to it fires. Covered here, DCC-free: a warm render never calls the builder, an event
+drops exactly its sections, the edit key drops the count sections, and an event the
+engine rejects leaves its sections uncached rather than cached forever. AST checks pin
+that both forks mix the shared class in and render through ``hud_section``.
+"""
+import ast
+import unittest
+from pathlib import Path
+
+from tentacle.slots._hud import HudMixin
+
+ROOT = Path(__file__).resolve().parent.parent
+FORKS = {
+    "maya": ROOT / "tentacle" / "slots" / "maya" / "hud.py",
+    "blender": ROOT / "tentacle" / "slots" / "blender" / "hud.py",
+}
+
+
+class _FakeText:
+    def __init__(self):
+        self.lines = []
+
+    def insertText(self, text):
+        self.lines.append(text)
+
+
+class _FakeUi:
+    def __init__(self):
+        self.hudTextEdit = _FakeText()
+
+
+class _FakeLogger:
+    def debug(self, *_args):
+        pass
+
+
+class _FakeSb:
+    logger = _FakeLogger()
+
+
+class _FakeManager:
+    """``ScriptJobManager`` stand-in: records subscriptions, fires them on demand."""
+
+    def __init__(self, reject=()):
+        self.subs = {}
+        self.reject = set(reject)
+        self.cleanup = []
+
+    def instance(self):
+        return self
+
+    def subscribe(self, event, callback, owner=None):
+        if event in self.reject:
+            raise RuntimeError(f"unknown event {event}")
+        self.subs.setdefault(event, []).append(callback)
+
+    def connect_cleanup(self, widget, owner=None):
+        self.cleanup.append(widget)
+
+    def fire(self, event):
+        for callback in self.subs.get(event, ()):
+            callback()
+
+
+class _Host(HudMixin):
+    HUD_SECTION_EVENTS = {
+        "status": ("linearUnitChanged", "SceneOpened"),
+        "selection": ("SelectionChanged", "SceneOpened"),
+    }
+
+    def __init__(self, manager):
+        self.sb = _FakeSb()
+        self.ui = _FakeUi()
+        self._manager = manager
+        self.edit_key = 0
+        self._subscribe_hud_invalidation()
+
+    def _script_job_manager(self):
+        return self._manager
+
+    def _hud_edit_key(self):
+        return self.edit_key
+
+
+class _EditHost(_Host):
+    HUD_EDIT_EVENTS = ("RecentCommandChanged",)
+
+
+class _CountingBuild:
+    def __init__(self, *lines):
+        self.calls = 0
+        self._lines = lines
+
+    def __call__(self, hud):
+        self.calls += 1
+        for line in self._lines:
+            hud.insertText(line)
+
+
+class TestHudSectionCache(unittest.TestCase):
+    def setUp(self):
+        self.manager = _FakeManager()
+        self.host = _Host(self.manager)
+
+    def test_warm_render_replays_without_rebuilding(self):
+        build = _CountingBuild("Units: cm", "Frame Rate: 24")
+        first, second = _FakeText(), _FakeText()
+        self.host.hud_section(first, "status", build)
+        self.host.hud_section(second, "status", build)
+        self.assertEqual(build.calls, 1)
+        self.assertEqual(first.lines, second.lines)
+        self.assertEqual(second.lines, ["Units: cm", "Frame Rate: 24"])
+
+    def test_event_drops_only_its_sections(self):
+        status, selection = _CountingBuild("s"), _CountingBuild("sel")
+        for _ in range(2):
+            self.host.hud_section(_FakeText(), "status", status)
+            self.host.hud_section(_FakeText(), "selection", selection)
+        self.manager.fire("SelectionChanged")
+        self.host.hud_section(_FakeText(), "status", status)
+        self.host.hud_section(_FakeText(), "selection", selection)
+        self.assertEqual((status.calls, selection.calls), (1, 2))
+
+    def test_shared_event_drops_every_mapped_section(self):
+        status, selection = _CountingBuild("s"), _CountingBuild("sel")
+        self.host.hud_section(_FakeText(), "status", status)
+        self.host.hud_section(_FakeText(), "selection", selection)
+        self.manager.fire("SceneOpened")
+        self.host.hud_section(_FakeText(), "status", status)
+        self.host.hud_section(_FakeText(), "selection", selection)
+        self.assertEqual((status.calls, selection.calls), (2, 2))
+
+    def test_one_subscription_per_event(self):
+        self.assertEqual(len(self.manager.subs["SceneOpened"]), 1)
+        self.assertEqual(self.manager.cleanup, [self.host.ui.hudTextEdit])
+
+    def test_unmapped_section_is_never_cached(self):
+        build = _CountingBuild("x")
+        self.host.hud_section(_FakeText(), "other", build)
+        self.host.hud_section(_FakeText(), "other", build)
+        self.assertEqual(build.calls, 2)
+
+    def test_edit_key_drops_the_count_sections(self):
+        status, selection = _CountingBuild("s"), _CountingBuild("sel")
+        self.host._check_hud_edit_key()
+        self.host.hud_section(_FakeText(), "status", status)
+        self.host.hud_section(_FakeText(), "selection", selection)
+        self.host._check_hud_edit_key()  # unchanged: both stay cached
+        self.host.hud_section(_FakeText(), "selection", selection)
+        self.host.edit_key += 1
+        self.host._check_hud_edit_key()
+        self.host.hud_section(_FakeText(), "status", status)
+        self.host.hud_section(_FakeText(), "selection", selection)
+        self.assertEqual((status.calls, selection.calls), (1, 2))
+
+    def test_edit_event_drops_the_count_sections_when_the_key_holds(self):
+        host = _EditHost(self.manager)
+        selection = _CountingBuild("sel")
+        host._check_hud_edit_key()
+        host.hud_section(_FakeText(), "selection", selection)
+        self.manager.fire("RecentCommandChanged")  # the same edit again: key unchanged
+        host._check_hud_edit_key()
+        host.hud_section(_FakeText(), "selection", selection)
+        self.assertEqual(selection.calls, 2)
+
+    def test_rejected_edit_event_leaves_the_count_sections_live(self):
+        host = _EditHost(_FakeManager(reject={"RecentCommandChanged"}))
+        self.assertEqual(host._hud_live_sections, set(host.HUD_EDIT_SECTIONS))
+
+    def test_rejected_event_leaves_its_sections_live(self):
+        host = _Host(_FakeManager(reject={"linearUnitChanged"}))
+        status, selection = _CountingBuild("s"), _CountingBuild("sel")
+        for _ in range(2):
+            host.hud_section(_FakeText(), "status", status)
+            host.hud_section(_FakeText(), "selection", selection)
+        self.assertEqual((status.calls, selection.calls), (2, 1))
+
+    def test_bare_invalidate_clears_everything(self):
+        build = _CountingBuild("s")
+        self.host.hud_section(_FakeText(), "status", build)
+        self.host.invalidate_hud()
+        self.host.hud_section(_FakeText(), "status", build)
+        self.assertEqual(build.calls, 2)
+
+
+class TestForksUseTheSharedCache(unittest.TestCase):
+    """Both forks mix ``HudMixin`` in, wire it, and render their sections through it."""
+
+    def _hud_class(self, path):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.ClassDef) and node.name == "HudSlots":
+                return node
+        raise AssertionError(f"HudSlots not found in {path}")
+
+    def test_forks_mix_in_and_subscribe(self):
+        for dcc, path in FORKS.items():
+            with self.subTest(dcc=dcc):
+                cls = self._hud_class(path)
+                bases = [b.id for b in cls.bases if isinstance(b, ast.Name)]
+                self.assertEqual(bases[0], "HudMixin")
+                source = ast.unparse(cls)
+                self.assertIn("self._subscribe_hud_invalidation()", source)
+                self.assertIn("HUD_SECTION_EVENTS", source)
+
+    def test_expensive_sections_render_through_the_cache(self):
+        for dcc, path in FORKS.items():
+            with self.subTest(dcc=dcc):
+                construct = next(
+                    n
+                    for n in self._hud_class(path).body
+                    if isinstance(n, ast.FunctionDef) and n.name == "construct_hud"
+                )
+                calls = [
+                    n.args[1].value
+                    for n in ast.walk(construct)
+                    if isinstance(n, ast.Call)
+                    and isinstance(n.func, ast.Attribute)
+                    and n.func.attr == "hud_section"
+                ]
+                self.assertEqual(
+                    sorted(calls), ["components", "selection", "status"]
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the columnar Copy / Paste Keys clipboard (``tentacle/slots/_key_clipboard.py``).
+
+``KeyClipboard`` only converts between the engines' copy buffers and its columns, so
+hand-written buffers in mayatk's and blendertk's documented shapes stand in for a copy:
+what goes in must come back out of the paste chunks — including when a curve is split
+across chunks — and survive a round trip through the store. Runs without Maya / Blender.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._key_clipboard import KEY_DTYPE, KeyClipboard  # noqa: E402
+
+
+def _maya_keys(n, start=10.0, detail=False):
+    keys = []
+    for i in range(n):
+        key = {
+            "time": start + i,
+            "value": float(i * i),
+            "inTangentType": "auto",
+            "outTangentType": "step" if i % 2 else "linear",
+        }
+        if detail:
+            key.update(inAngle=1.0 + i, outAngle=2.0, inWeight=1.0, outWeight=0.5, lock=i != 3)
+        keys.append(key)
+    return keys
+
+
+def _maya_copy():
+    return {
+        "|grp|pCube1": {
+            "translateX": _maya_keys(7),
+            "rotateY": {
+                "keys": _maya_keys(3, start=20.0, detail=True),
+                "preInfinity": "cycle",
+                "postInfinity": "linear",
+            },
+        },
+        "pSphere1": {"visibility": 1.0},
+    }
+
+
+def _count(value):
+    if isinstance(value, dict):
+        return len(value["keys"])
+    return len(value) if isinstance(value, list) else 1
+
+
+def _unchunk_maya(chunks):
+    """Merge ``maya_chunks`` output back into one copy dict + per-curve anchors."""
+    merged, anchors = {}, {}
+    for data, anchor in chunks:
+        for obj, attrs in data.items():
+            for attr, value in attrs.items():
+                anchors.setdefault((obj, attr), []).append(anchor)
+                prior = merged.setdefault(obj, {}).get(attr)
+                if isinstance(value, dict) and isinstance(prior, dict):
+                    prior["keys"].extend(value["keys"])
+                elif isinstance(value, list) and isinstance(prior, list):
+                    prior.extend(value)
+                else:
+                    merged[obj][attr] = value
+    return merged, anchors
+
+
+class TestMaya(unittest.TestCase):
+    def test_the_columns_hold_every_key(self):
+        clipboard = KeyClipboard.from_maya(_maya_copy(), mode="selected", frame=5.0)
+        self.assertEqual(clipboard.keys.dtype, KEY_DTYPE)
+        self.assertEqual((len(clipboard), len(clipboard.curves)), (11, 3))
+        self.assertEqual(clipboard.objects(), ["|grp|pCube1", "pSphere1"])
+        self.assertEqual(clipboard.starts.tolist(), [0, 7, 10, 11])
+
+    def test_one_chunk_rebuilds_the_copy(self):
+        copied = _maya_copy()
+        clipboard = KeyClipboard.from_maya(copied, frame=5.0)
+        (data, anchor), = clipboard.maya_chunks(12.0)
+        self.assertEqual(anchor, 12.0)
+        self.assertEqual(data, copied)
+
+    def test_split_curves_rebuild_the_copy_and_keep_their_anchor(self):
+        copied = _maya_copy()
+        clipboard = KeyClipboard.from_maya(copied, frame=5.0)
+        chunks = list(clipboard.maya_chunks(100.0, chunk_keys=3))
+        for data, _anchor in chunks:
+            self.assertLessEqual(sum(_count(v) for a in data.values() for v in a.values()), 3)
+        merged, anchors = _unchunk_maya(chunks)
+        self.assertEqual(merged, copied)
+        # translateX's keys sit at 10..16 and were split at 13 and 16: each piece lands
+        # where its first key would have in one call anchored at 100.
+        self.assertEqual(anchors[("|grp|pCube1", "translateX")], [100.0, 103.0, 106.0])
+
+    def test_matching_compares_short_names(self):
+        clipboard = KeyClipboard.from_maya(_maya_copy())
+        self.assertEqual(
+            clipboard.matching(["|other|pCube1", "pSphere1", "pCone1"]),
+            ["|other|pCube1", "pSphere1"],
+        )
+
+
+class TestBlender(unittest.TestCase):
+    def _selected(self):
+        tangent = {
+            "interpolation": "BEZIER",
+            "easing": "AUTO",
+            "handle_left_type": "AUTO_CLAMPED",
+            "handle_right_type": "VECTOR",
+            "handle_left": (-1.0, 0.5),
+            "handle_right": (1.0, -0.5),
+        }
+        return {
+            "mode": "selected",
+            "keys": {
+                ("location", 0): [(1.0, 0.0), (5.0, 2.0), (9.0, 1.0)],
+                ("rotation_euler", 2): [(3.0, 0.25), (4.0, 0.5)],
+            },
+            "tangents": {("location", 0): [tangent] * 3, ("rotation_euler", 2): [tangent] * 2},
+            "extrapolation": {("location", 0): "LINEAR", ("rotation_euler", 2): "CONSTANT"},
+        }
+
+    def test_selected_keys_round_trip(self):
+        buffer = self._selected()
+        clipboard = KeyClipboard.from_blender(buffer, source="Cube")
+        (out, anchor), = clipboard.blender_chunks(None)
+        self.assertIsNone(anchor)
+        self.assertEqual(out, buffer)
+
+    def test_chunks_keep_their_offset_from_the_earliest_key(self):
+        clipboard = KeyClipboard.from_blender(self._selected())
+        anchors = [a for _b, a in clipboard.blender_chunks(50.0, chunk_keys=2)]
+        # Pieces start at frames 1, 9 and 3; the earliest copied key (1) lands on 50.
+        self.assertEqual(anchors, [50.0, 58.0, 52.0])
+
+    def test_current_frame_snapshot(self):
+        buffer = {"mode": "current_frame", "frame": 12, "values": {("location", 1): 3.5}}
+        clipboard = KeyClipboard.from_blender(buffer)
+        (out, anchor), = clipboard.blender_chunks(None)
+        self.assertEqual(out, buffer)
+        self.assertIsNone(anchor)
+
+
+class TestPersistence(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def test_a_saved_clipboard_loads_memory_mapped(self):
+        clipboard = KeyClipboard.from_maya(_maya_copy(), mode="selected", frame=5.0)
+        clipboard.save(self.directory)
+        loaded = KeyClipboard.load(self.directory)
+        self.assertIsInstance(loaded.keys, np.memmap)
+        self.assertEqual((loaded.mode, loaded.frame), ("selected", 5.0))
+        self.assertEqual(list(loaded.maya_chunks(1.0)), list(clipboard.maya_chunks(1.0)))
+
+    def test_a_new_save_replaces_the_old_keys_file(self):
+        KeyClipboard.from_maya(_maya_copy()).save(self.directory)
+        KeyClipboard.from_maya({"a": {"tx": 1.0}}).save(self.directory)
+        keys = [n for n in os.listdir(self.directory) if n.startswith("keys-")]
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(len(KeyClipboard.load(self.directory, mmap=False)), 1)
+
+    def test_a_missing_or_corrupt_store_loads_nothing(self):
+        self.assertIsNone(KeyClipboard.load(self.directory))
+        Path(self.directory, "clipboard.json").write_text("{not json")
+        self.assertIsNone(KeyClipboard.load(self.directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,10 @@ Assign list (``list000``) on BOTH the panel and the submenu when the current mat
 changes, so each list keeps matching what releasing on it will assign, plus
 ``_assign_root_text``, the per-surface wording of that root row ("Assign: <current>" on
 the free-floating submenu; a bare "Assign Current" on the panel, where ``cmb002`` already
-names the material).
+names the material). Also the material index the combo and both Assign lists read: one
+scan per material-set change (events, a fork key, or ``_refresh_material_lists``), one
+swatch render per material per scan, and the engine's short-name display rule applied
+to the filtered view.
 
 The prefix/suffix affix option box that used to live here went with the menu entry it
 served: renaming is now a double-click on the combo's current item.
@@ -433,5 +436,176 @@ class TestBothSurfacesHaveAnAssignList(unittest.TestCase):
                 )
 
 
+class _FakeEventManager:
+    """``ScriptJobManager`` stand-in: records subscriptions, fires them on demand."""
+
+    def __init__(self, reject=()):
+        self.subs = {}
+        self.reject = set(reject)
+
+    def instance(self):
+        return self
+
+    def subscribe(self, event, callback, owner=None):
+        if event in self.reject:
+            raise RuntimeError(f"unknown event {event}")
+        self.subs.setdefault(event, []).append(callback)
+
+    def connect_cleanup(self, widget, owner=None):
+        pass
+
+    def fire(self, event):
+        for callback in self.subs.get(event, ()):
+            callback()
+
+
+class _IndexHost(MaterialsMixin):
+    """Host whose 'scene' is a list of index rows; counts scans and swatch renders."""
+
+    MATERIAL_INDEX_EVENTS = ("SceneOpened", "NodeRenamed")
+
+    def __init__(self, rows, manager=None, key=None):
+        self.rows = rows
+        self.scans = 0
+        self.swatches = 0
+        self.key = key
+        self._manager = manager or _FakeEventManager()
+        self.sb = type(
+            "_SB", (), {"logger": type("_L", (), {"debug": lambda *_a: None})()}
+        )()
+
+    def _script_job_manager(self):
+        return self._manager
+
+    def _build_material_index(self):
+        self.scans += 1
+        return [dict(row) for row in self.rows]
+
+    def _material_swatch_icon(self, name):
+        self.swatches += 1
+        return f"icon:{name}"
+
+    def _material_index_key(self):
+        return self.key
+
+
+class TestMaterialIndex(unittest.TestCase):
+    """The list surfaces read one cached scan until the material set changes."""
+
+    ROWS = [
+        {"name": "lambert1", "default": True},
+        {"name": "aiStandardSurface1", "arnold": True},
+        {"name": "nsA:wood", "short": "wood"},
+        {"name": "nsB:wood", "short": "wood"},
+        {"name": "metal"},
+    ]
+
+    def _live(self, **kwargs):
+        host = _IndexHost(self.ROWS, **kwargs)
+        host._subscribe_material_index(widget=object())
+        return host
+
+    def test_repeated_reads_scan_once(self):
+        host = self._live()
+        for _ in range(3):
+            host.indexed_materials()
+            host.indexed_materials(exclude_defaults=True)
+        self.assertEqual(host.scans, 1)
+
+    def test_an_event_drops_the_index(self):
+        host = self._live()
+        host.indexed_materials()
+        host._manager.fire("NodeRenamed")
+        host.indexed_materials()
+        self.assertEqual(host.scans, 2)
+
+    def test_a_changed_key_drops_the_index(self):
+        host = self._live(key=("a",))
+        host.indexed_materials()
+        host.key = ("a", "b")
+        host.indexed_materials()
+        host.indexed_materials()
+        self.assertEqual(host.scans, 2)
+
+    def test_refresh_material_lists_drops_the_index(self):
+        host = self._live()
+        host.ui = type("_UI", (), {"cmb002": _FakeCombo("metal")})()
+        host.submenu = type("_UI", (), {})()
+        host.indexed_materials()
+        host._refresh_material_lists()
+        host.indexed_materials()
+        self.assertEqual(host.scans, 2)
+
+    def test_unsubscribed_host_never_caches(self):
+        host = _IndexHost(self.ROWS)
+        host.indexed_materials()
+        host.indexed_materials()
+        self.assertEqual(host.scans, 2)
+
+    def test_a_rejected_event_does_not_stop_the_rest(self):
+        host = self._live(manager=_FakeEventManager(reject={"SceneOpened"}))
+        host.indexed_materials()
+        host._manager.fire("NodeRenamed")
+        host.indexed_materials()
+        self.assertEqual(host.scans, 2)
+
+    def test_flags_filter_the_view(self):
+        host = self._live()
+        names = list(host.indexed_materials(exclude_defaults=True, exclude_arnold=True))
+        self.assertNotIn("lambert1", names)
+        self.assertNotIn("aiStandardSurface1", names)
+        self.assertIn("metal", names)
+
+    def test_colliding_short_names_keep_both(self):
+        host = self._live()
+        view = host.indexed_materials()
+        self.assertEqual(view["nsA:wood"], "nsA:wood")
+        self.assertEqual(view["nsB:wood"], "nsB:wood")
+        self.assertEqual(view["metal"], "metal")
+
+    def test_name_exclusion_matches_the_short_name(self):
+        host = self._live()
+        self.assertNotIn("nsA:wood", host.indexed_materials(exc="wood"))
+
+    def test_swatches_render_once_per_index_build(self):
+        host = self._live()
+        for _ in range(3):
+            self.assertEqual(host.material_swatch("metal"), "icon:metal")
+        self.assertEqual(host.swatches, 1)
+        host._manager.fire("SceneOpened")
+        host.material_swatch("metal")
+        self.assertEqual(host.swatches, 2)
+
+
+class TestForksReadTheIndex(unittest.TestCase):
+    """Both forks subscribe the index and populate cmb002 / list000 from it."""
+
+    def test_lists_read_the_index_not_the_scene(self):
+        for path in (MAYA_FILE, BLENDER_FILE):
+            cls = _classdef(path)
+            for name in ("cmb002_init", "list000_init"):
+                with self.subTest(fork=path.parent.name, method=name):
+                    fn = next(
+                        n
+                        for n in cls.body
+                        if isinstance(n, ast.FunctionDef) and n.name == name
+                    )
+                    source = ast.unparse(fn)
+                    self.assertIn("self.indexed_materials(", source)
+                    self.assertNotIn("get_scene_mats", source)
+
+    def test_cmb002_init_subscribes_the_index(self):
+        for path in (MAYA_FILE, BLENDER_FILE):
+            with self.subTest(fork=path.parent.name):
+                fn = next(
+                    n
+                    for n in _classdef(path).body
+                    if isinstance(n, ast.FunctionDef) and n.name == "cmb002_init"
+                )
+                self.assertIn(
+                    "self._subscribe_material_index(widget)", ast.unparse(fn)
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
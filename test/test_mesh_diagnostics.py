@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared mesh-diagnostics table (``tentacle/slots/_mesh_diagnostics.py``).
+
+``MeshDiagnostics`` is DCC-agnostic: the engine only supplies per-mesh signatures and
+a batched scan. A fake engine whose meshes are plain dicts exercises the cache — what
+is scanned, in how many batches, and what a repair-and-retry rescans — without
+``maya.cmds`` / ``bpy``.
+"""
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._mesh_diagnostics import MeshDiagnostics  # noqa: E402
+
+
+class _FakeDiagnostics(MeshDiagnostics):
+    """Meshes are ``{"name", "verts", "vertices", "uvs"}`` dicts (findings as lists)."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def _key(self, mesh):
+        return mesh["name"]
+
+    def _signatures(self, meshes):
+        return [m["verts"] for m in meshes]
+
+    def _scan(self, meshes, check):
+        self.batches.append((check, [m["name"] for m in meshes]))
+        return [m[check] for m in meshes]
+
+
+def _mesh(name, verts=8, vertices=(), uvs=()):
+    return dict(name=name, verts=verts, vertices=list(vertices), uvs=list(uvs))
+
+
+class TestMeshDiagnostics(unittest.TestCase):
+    def setUp(self):
+        self.diagnostics = _FakeDiagnostics()
+        self.meshes = [_mesh(f"m{i}") for i in range(200)]
+        self.meshes[7]["vertices"] = ["m7.vtx[3]"]
+        self.meshes[9]["uvs"] = ["m9.map[0]", "m9.map[1]"]
+
+    def test_findings_only_list_flagged_meshes(self):
+        d = self.diagnostics
+        self.assertEqual(d.find(self.meshes, "vertices"), {"m7": ["m7.vtx[3]"]})
+        self.assertEqual(d.find(self.meshes, "uvs"), {"m9": ["m9.map[0]", "m9.map[1]"]})
+        self.assertEqual(d.find([], "uvs"), {})
+
+    def test_each_check_scans_once_in_one_batch(self):
+        d = self.diagnostics
+        for _ in range(3):
+            d.find(self.meshes, "vertices")
+            d.find(self.meshes, "uvs")
+        self.assertEqual([check for check, _ in d.batches], ["vertices", "uvs"])
+        self.assertEqual(d.scanned, 400)
+
+    def test_a_repair_and_retry_rescans_only_the_edited_meshes(self):
+        d = self.diagnostics
+        d.find(self.meshes, "vertices")
+        d.find(self.meshes, "uvs")
+        # The cleanup splits m7's vertex (the signature moves); the UV repair keeps
+        # m9's counts, so it reports the edit itself.
+        self.meshes[7].update(verts=9, vertices=[])
+        self.meshes[9]["uvs"] = []
+        d.touch(self.meshes[9])
+        self.assertEqual(d.find(self.meshes, "vertices"), {})
+        self.assertEqual(d.find(self.meshes, "uvs"), {})
+        self.assertEqual(d.batches[2:], [("vertices", ["m7", "m9"]), ("uvs", ["m7", "m9"])])
+        self.assertEqual(d.scanned, 404)
+
+    def test_invalidate_forgets_one_mesh_or_all(self):
+        d = self.diagnostics
+        d.find(self.meshes[:3], "vertices")
+        d.invalidate(self.meshes[1])
+        d.find(self.meshes[:3], "vertices")
+        self.assertEqual(d.batches[-1], ("vertices", ["m1"]))
+        d.invalidate()
+        d.find(self.meshes[:3], "vertices")
+        self.assertEqual(d.batches[-1], ("vertices", ["m0", "m1", "m2"]))
+
+    def test_an_unknown_check_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.diagnostics.find(self.meshes, "lamina")
+
+    def test_instance_is_per_subclass(self):
+        self.assertIs(_FakeDiagnostics.instance(), _FakeDiagnostics.instance())
+        self.assertIsNot(_FakeDiagnostics.instance(), MeshDiagnostics.instance())
+
+
+class TestMayaScan(unittest.TestCase):
+    """``MayaMeshDiagnostics._scan`` against a stand-in ``cmds`` (see
+    ``test_webxr_delta._maya_fork``): findings named by transform go to the right shape.
+    """
+
+    #: ``polyInfo`` answers per queried node, named the way Maya names them.
+    FOUND = {"|a|aShape": ["a.vtx[1]"], "|b|bShape1": [], "|b|bShape2": ["b.vtx[2]"]}
+
+    def setUp(self):
+        maya, api = types.ModuleType("maya"), types.ModuleType("maya.api")
+        cmds, om = types.ModuleType("maya.cmds"), types.ModuleType("maya.api.OpenMaya")
+        maya.cmds, maya.api, api.OpenMaya = cmds, api, om
+        name = "tentacle.slots.maya._slots_maya"
+        stubs = {"maya": maya, "maya.cmds": cmds, "maya.api": api, "maya.api.OpenMaya": om}
+        with mock.patch.dict(sys.modules, stubs):
+            sys.modules.pop(name, None)
+            self.fork = __import__(name, fromlist=["MayaMeshDiagnostics"])
+        self.calls = []
+        cmds.polyInfo = self._poly_info
+        cmds.ls = lambda nodes, long=False, flatten=False: (
+            [f"|{nodes}"] if long else list(nodes)
+        )
+
+    def _poly_info(self, meshes, **_):
+        meshes = [meshes] if isinstance(meshes, str) else meshes
+        self.calls.append(meshes)
+        return [c for m in meshes for c in self.FOUND[m]]
+
+    def test_a_multi_shape_transform_is_rescanned_per_shape(self):
+        meshes = list(self.FOUND)
+        found = self.fork.MayaMeshDiagnostics()._scan(meshes, "vertices")
+        self.assertEqual(found, [["a.vtx[1]"], [], ["|b|bShape2.vtx[2]"]])
+        self.assertEqual(self.calls, [meshes, ["|b|bShape1"], ["|b|bShape2"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
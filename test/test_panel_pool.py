@@ -0,0 +1,177 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the warm-standby panel pool (``tentacle/panel_pool.py``).
+
+DCC-free: a real ``Switchboard`` (offscreen Qt) over copies of shipped tentacle panels.
+Covered: open counts persist and rank the build queue, a build runs in slices without
+showing the panel, the memory budget evicts the least recently built panel the pool still
+owns (never one the user opened), the counting wrapper, and both entry classes install it.
+"""
+import ast
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from qtpy import QtWidgets
+
+from tentacle.panel_pool import PanelPool
+
+ROOT = Path(__file__).resolve().parent.parent
+UI_DIR = ROOT / "tentacle" / "ui"
+PANELS = ("crease.ui", "crease#submenu.ui", "pivot.ui", "symmetry.ui")
+
+
+class _PoolCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        from uitk import Switchboard
+
+        src_dir = tempfile.mkdtemp()
+        for name in PANELS:
+            shutil.copy(UI_DIR / name, src_dir)
+        cls.sb = Switchboard(ui_source=src_dir)
+
+    def setUp(self):
+        self.store = os.path.join(tempfile.mkdtemp(), "maya.json")
+        self.addCleanup(self._unload)
+
+    def _unload(self):
+        for name in ("crease", "pivot", "symmetry"):
+            ui = self.sb.loaded_ui.peek(name)
+            if ui is not None:
+                del self.sb.loaded_ui[name]
+                ui.deleteLater()
+        self.app.sendPostedEvents(None, 0)
+
+    def _pool(self, opens=None, **kwargs):
+        pool = PanelPool(self.sb, "maya", path=self.store, **kwargs)
+        pool.opens.update(opens or {})
+        return pool
+
+    def _drain(self, pool, limit=200):
+        """Run one-step slices until the queue is empty; returns the slice count."""
+        for i in range(1, limit):
+            if not pool.run_slice(slice_ms=1e-6):
+                return i
+        self.fail("the pool never finished")
+
+
+class TestRanking(_PoolCase):
+    def test_the_most_opened_registered_panels_rank_first(self):
+        pool = self._pool({"pivot": 3, "crease": 9, "symmetry": 1, "gone": 50})
+        self.assertEqual(pool.ranked(), ["crease", "pivot"])
+
+    def test_opens_persist_for_the_next_session(self):
+        pool = self._pool()
+        for _ in range(3):
+            pool.record_open("pivot")
+        self.assertEqual(PanelPool(self.sb, "maya", path=self.store).opens, {"pivot": 3})
+
+    def test_a_corrupt_store_is_ignored(self):
+        Path(self.store).write_text("{not json")
+        self.assertEqual(self._pool().opens, {})
+
+
+class TestBuilding(_PoolCase):
+    def test_a_build_runs_in_slices_without_a_show(self):
+        pool = self._pool({"crease": 2})
+        pool.schedule()
+        slices = self._drain(pool)
+
+        ui = self.sb.loaded_ui.peek("crease")
+        self.assertGreater(slices, 2, "load, subtrees and the final flush are separate steps")
+        self.assertEqual(pool.built, ["crease"])
+        self.assertTrue(pool.is_warm("crease"))
+        self.assertTrue(ui.widgets, "children registered ahead of the show")
+        self.assertFalse(ui.isVisible())
+        self.assertFalse(ui.is_initialized, "the first show still runs")
+        self.assertGreater(pool.costs["crease"], 0)
+
+    def test_an_initialized_panel_is_not_queued(self):
+        pool = self._pool({"crease": 2, "pivot": 2})
+        self.sb.get_ui("crease").is_initialized = True
+        pool.schedule()
+        self._drain(pool)
+        self.assertEqual(pool.built, ["pivot"])
+
+
+class TestBudget(_PoolCase):
+    def _sizes(self):
+        pool = self._pool({"crease": 3, "pivot": 2})
+        pool.schedule()
+        self._drain(pool)
+        return pool.costs["crease"], pool.costs["pivot"]
+
+    def test_an_overflowing_build_evicts_the_least_recently_built(self):
+        crease, pivot = self._sizes()
+        self._unload()
+
+        pool = self._pool({"crease": 3, "pivot": 2}, budget_mb=(max(crease, pivot) + 1) / 1024)
+        pool.costs.clear()  # unmeasured: both are attempted, the second overflows
+        pool.schedule()
+        self._drain(pool)
+        self.assertEqual(pool.built, ["crease", "pivot"])
+        self.assertFalse(pool.is_warm("crease"))
+        self.assertIsNone(self.sb.loaded_ui.peek("crease"))
+        self.assertTrue(pool.is_warm("pivot"))
+        self.assertLessEqual(pool.used_kb(), pool.budget_kb)
+
+    def test_an_opened_panel_is_never_evicted(self):
+        crease, pivot = self._sizes()
+        pool = self._pool({"crease": 3, "pivot": 2}, budget_mb=1e-6)
+        pool.record_open("crease")  # loaded above: the user's now
+        pool._owned["pivot"] = pivot
+        pool._evict(0.0)
+        self.assertIsNotNone(self.sb.loaded_ui.peek("crease"))
+        self.assertFalse(pool.is_warm("pivot"))
+
+    def test_nothing_is_built_once_the_budget_is_spent(self):
+        crease, _pivot = self._sizes()
+        self._unload()
+        pool = self._pool({"crease": 3, "pivot": 2}, budget_mb=(crease / 2) / 1024)
+        pool.schedule()
+        self._drain(pool)
+        self.assertEqual(pool.built, [])
+
+
+class TestInstall(_PoolCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(PanelPool.uninstall)
+
+    def test_standalone_opens_are_counted(self):
+        shown = []
+
+        class _Menu:
+            sb = self.sb
+            _show_window = staticmethod(lambda widget, **kw: shown.append(widget))
+
+        menu = _Menu()
+        pool = PanelPool.install(menu, "maya", path=self.store)
+        self.assertIs(PanelPool.install(menu, "maya"), pool)
+        ui = self.sb.get_ui("pivot")
+        menu._show_window(ui, pos="cursor")
+        self.assertEqual(shown, [ui])
+        self.assertEqual(pool.opens, {"pivot": 1})
+
+    def test_the_env_switch_disables_it(self):
+        os.environ[PanelPool.ENV] = "0"
+        self.addCleanup(os.environ.pop, PanelPool.ENV)
+        self.assertIsNone(PanelPool.install(object(), "maya"))
+
+    def test_maya_and_blender_install_the_pool(self):
+        for name in ("tcl_maya.py", "tcl_blender.py"):
+            source = (ROOT / "tentacle" / name).read_text(encoding="utf-8")
+            calls = [
+                ast.unparse(n.func)
+                for n in ast.walk(ast.parse(source))
+                if isinstance(n, ast.Call)
+            ]
+            self.assertIn("PanelPool.install", calls, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,7 +25,7 @@ from pathlib import Path
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # before any widget is built
 
-from qtpy import QtWidgets  # noqa: E402
+from qtpy import QtCore, QtWidgets  # noqa: E402
 
 ROOT = Path(__file__).resolve().parent.parent
 UI_DIR = ROOT / "tentacle" / "ui"
@@ -51,6 +51,37 @@ def _can_create_widgets() -> bool:
         return False
 
 
+def _dispose(widget):
+    """Delete *widget* here, on the UI thread.
+
+    A parentless combo left to the garbage collector can be collected on whichever
+    thread next allocates — a later suite's worker — and Qt crashes destroying a
+    widget off the UI thread.
+    """
+    widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(widget, QtCore.QEvent.DeferredDelete)
+
+
+_preexisting = set()
+
+
+def _top_level_widgets():
+    app = QtWidgets.QApplication.instance()
+    return app.topLevelWidgets() if app is not None else []
+
+
+def setUpModule():
+    _preexisting.update(id(w) for w in _top_level_widgets())
+
+
+def tearDownModule():
+    """:func:`_dispose` every parentless combo these tests built (its popup goes
+    with it)."""
+    for widget in _top_level_widgets():
+        if isinstance(widget, QtWidgets.QComboBox) and id(widget) not in _preexisting:
+            _dispose(widget)
+
+
 class _FakeWidget:
     def __init__(self, current_data):
         self._d = current_data
@@ -0,0 +1,146 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the recent / autosave file index (``tentacle/slots/_recent_files.py``).
+
+Plain files in a temp directory stand in for a project: the worker thread's scan, what
+the readers answer from memory, the persisted store and the MRU bookkeeping of scene
+open / save events — no ``maya.cmds`` / ``bpy``.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._recent_files import RecentFileIndex  # noqa: E402
+
+
+class TestRecentFileIndex(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.project = os.path.join(self.root, "project")
+        self.scenes = os.path.join(self.project, "scenes", "shots")
+        self.autosave = os.path.join(self.root, "autosave")
+        os.makedirs(self.scenes)
+        os.makedirs(self.autosave)
+        Path(self.project, "workspace.mel").write_text("")
+        self.store = os.path.join(self.root, "maya.json")
+
+    def _file(self, *parts, age=0):
+        path = os.path.join(*parts)
+        Path(path).write_text("x" * 10)
+        if age:
+            stamp = time.time() - age
+            os.utime(path, (stamp, stamp))
+        return os.path.normpath(path)
+
+    def _refreshed(self, index, recent, dirs=(), extensions=(".ma", ".mb")):
+        return index.refresh(recent, dirs, extensions).result(timeout=10)
+
+    def test_the_scan_stats_and_resolves_workspaces(self):
+        shot = self._file(self.scenes, "shot.ma")
+        gone = os.path.join(self.scenes, "deleted.ma")
+        index = RecentFileIndex("maya", path=self.store)
+        self._refreshed(index, [shot, gone])
+
+        first, second = index.recent()
+        self.assertEqual((first["path"], first["exists"], first["size"]), (shot, True, 10))
+        self.assertEqual(first["workspace"], os.path.normpath(self.project))
+        self.assertEqual((second["path"], second["exists"]), (os.path.normpath(gone), False))
+        self.assertFalse(index.is_stale())
+
+    def test_autosaves_are_filtered_by_extension_and_age_newest_first(self):
+        old = self._file(self.autosave, "old.ma", age=3 * 24 * 3600)
+        older = self._file(self.autosave, "a.mb", age=120)
+        newer = self._file(self.autosave, "b.ma", age=60)
+        self._file(self.autosave, "notes.txt")
+        index = RecentFileIndex("maya", path=self.store)
+        self._refreshed(index, [], [self.autosave, os.path.join(self.root, "nope")])
+
+        self.assertEqual([e["path"] for e in index.autosaves(24 * 3600)], [newer, older])
+        self.assertIn(old, [e["path"] for e in index.autosaves()])
+
+    def test_a_callable_source_is_read_on_the_worker(self):
+        shot = self._file(self.scenes, "shot.ma")
+        threads = []
+
+        def source():
+            threads.append(threading.current_thread().name)
+            return [shot]
+
+        index = RecentFileIndex("maya", path=self.store)
+        self._refreshed(index, source)
+        self.assertEqual(threads, ["tentacle-recent-maya"])
+        self.assertEqual([e["path"] for e in index.recent()], [shot])
+
+    def test_the_store_persists_for_the_next_session(self):
+        shot = self._file(self.scenes, "shot.ma")
+        self._refreshed(RecentFileIndex("maya", path=self.store), [shot])
+
+        reloaded = RecentFileIndex("maya", path=self.store)
+        self.assertEqual([e["path"] for e in reloaded.recent()], [shot])
+        self.assertTrue(reloaded.get(shot)["exists"])
+
+    def test_a_corrupt_store_is_ignored(self):
+        Path(self.store).write_text("{not json")
+        self.assertEqual(RecentFileIndex("maya", path=self.store).recent(), [])
+
+    def test_touch_reorders_without_io_and_marks_stale(self):
+        a = self._file(self.scenes, "a.ma")
+        b = self._file(self.scenes, "b.ma")
+        index = RecentFileIndex("maya", path=self.store)
+        self._refreshed(index, [a, b])
+        version = index.version
+
+        new = os.path.join(self.scenes, "new.ma")  # never created: no stat happens
+        index.touch(b)
+        index.touch(new)
+        self.assertEqual(
+            [e["path"] for e in index.recent()], [os.path.normpath(new), b, a]
+        )
+        self.assertIsNone(index.get(new)["exists"])  # unknown until the next scan
+        self.assertTrue(index.is_stale())
+        self.assertGreater(index.version, version)
+
+    def test_a_touch_during_a_scan_survives_its_answer(self):
+        a = self._file(self.scenes, "a.ma")
+        b = self._file(self.scenes, "b.ma")
+        started, release = threading.Event(), threading.Event()
+
+        def source():
+            started.set()
+            release.wait(10)
+            return [a]
+
+        index = RecentFileIndex("maya", path=self.store)
+        future = index.refresh(source, (), (".ma",))
+        self.assertTrue(started.wait(10))
+        index.touch(b)
+        release.set()
+        future.result(timeout=10)
+        self.assertEqual([e["path"] for e in index.recent()], [b, a])
+        self.assertTrue(index.is_stale())  # b is not stat'd yet
+
+    def test_an_unchanged_answer_keeps_the_version(self):
+        shot = self._file(self.scenes, "shot.ma")
+        index = RecentFileIndex("maya", path=self.store)
+        self._refreshed(index, [shot])
+        version = index.version
+        self._refreshed(index, [shot])
+        self.assertEqual(index.version, version)
+        os.remove(shot)
+        self._refreshed(index, [shot])
+        self.assertGreater(index.version, version)
+        self.assertFalse(index.get(shot)["exists"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared per-mesh row cache (``tentacle/slots/_row_cache.py``).
+
+``RowCache`` is the bookkeeping behind ``SceneStats``, ``MeshDiagnostics``,
+``SimilarIndex`` and ``FaceGraphs``. A fake engine whose meshes are plain dicts
+exercises it directly: which rows go stale, when the table is dropped, and what
+``touch`` / ``invalidate`` forget.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._row_cache import RowCache  # noqa: E402
+
+
+class _FakeCache(RowCache):
+    """Meshes are ``{"name", "sig"}`` dicts; the measured value is the name upper-cased."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def _key(self, mesh):
+        return mesh["name"]
+
+    def _signatures(self, meshes):
+        return [m["sig"] for m in meshes]
+
+    def query(self, meshes, part=None):
+        def measure(stale):
+            self.batches.append((part, [m["name"] for m in stale]))
+            return [m["name"].upper() for m in stale]
+
+        keys, _ = self._refresh(meshes, measure, part)
+        return [self._value(key, part) for key in keys]
+
+
+def _mesh(name, sig=0):
+    return dict(name=name, sig=sig)
+
+
+class TestRowCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = _FakeCache()
+        self.meshes = [_mesh("a"), _mesh("b"), _mesh("c")]
+
+    def test_only_stale_rows_are_measured_in_one_batch(self):
+        self.cache.query(self.meshes[:2])
+        self.assertEqual(self.cache.query(self.meshes), ["A", "B", "C"])
+        self.assertEqual(self.cache.batches, [(None, ["a", "b"]), (None, ["c"])])
+
+    def test_a_moved_signature_or_a_touch_re_measures_that_mesh(self):
+        self.cache.query(self.meshes)
+        self.meshes[0]["sig"] = 1
+        self.cache.touch(self.meshes[2])
+        self.cache.query(self.meshes)
+        self.assertEqual(self.cache.batches[-1], (None, ["a", "c"]))
+
+    def test_parts_go_stale_independently(self):
+        self.cache.query(self.meshes, "x")
+        self.cache.query(self.meshes, "y")
+        self.cache.query(self.meshes, "x")
+        self.assertEqual([part for part, _ in self.cache.batches], ["x", "y"])
+
+    def test_the_table_is_dropped_past_max_rows(self):
+        self.cache.MAX_ROWS = 3
+        self.cache.query(self.meshes)
+        self.cache.query([_mesh("d"), self.meshes[0]])
+        self.assertEqual(self.cache.batches[-1], (None, ["d", "a"]))
+        self.assertEqual(set(self.cache._rows), {"a", "d"})
+
+    def test_invalidate_forgets_rows_and_edits(self):
+        self.cache.query(self.meshes)
+        self.cache.touch(self.meshes[0])
+        self.cache.invalidate(self.meshes[0])
+        self.cache.query(self.meshes)
+        self.assertEqual(self.cache.batches[-1], (None, ["a"]))
+        self.cache.invalidate()
+        self.cache.query(self.meshes)
+        self.assertEqual(self.cache.batches[-1], (None, ["a", "b", "c"]))
+
+    def test_instance_is_per_subclass(self):
+        class Other(_FakeCache):
+            pass
+
+        self.assertIs(_FakeCache.instance(), _FakeCache.instance())
+        self.assertIsNot(Other.instance(), _FakeCache.instance())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,8 +15,10 @@ the shared class in, supply every hook, and do NOT carry their own copy of a
 shared method.
 """
 import ast
+import json
 import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -25,6 +27,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from tentacle.slots._scene import SceneMixin  # noqa: E402
+from tentacle.slots._slots import SlotJob  # noqa: E402
 
 MAYA_FILE = ROOT / "tentacle" / "slots" / "maya" / "scene.py"
 BLENDER_FILE = ROOT / "tentacle" / "slots" / "blender" / "scene.py"
@@ -590,8 +593,11 @@ class TestForeignExport(unittest.TestCase):
         self.assertEqual(host.cursors, [])
 
 
-def _export_widget(fmt="fbx", scope="all", save="scene_dir", **checks):
-    """A tb003 stand-in: the option box tb003_init builds, with all boxes ticked."""
+def _export_widget(fmt="fbx", scope="all", save="scene_dir", split=None, **checks):
+    """A tb003 stand-in: the option box tb003_init builds, with all boxes ticked.
+
+    *split* adds the Split combo the Maya fork offers; None leaves it out.
+    """
     state = dict(
         chk_cameras=True,
         chk_lights=True,
@@ -609,6 +615,8 @@ def _export_widget(fmt="fbx", scope="all", save="scene_dir", **checks):
             for name, value in state.items()
         },
     )
+    if split is not None:
+        menu.cmb_split = _Attr(currentData=lambda: split)
     return _Attr(option_box=_Attr(menu=menu))
 
 
@@ -633,6 +641,25 @@ class _Tb003Host(_ExportHost):
         self.native.append((export_format, out_path, dict(options)))
         if self._native_error:
             raise self._native_error
+        return self.tail
+
+    tail = None  # what the hook hands back for the job's worker (Maya's GLB leg)
+    roots = ()  # ``_export_chunk_roots`` for a split export
+
+    def _export_chunk_roots(self, options):
+        return list(self.roots)
+
+    def run_job(self, work, *args, name="", done=None, **kwargs):
+        """``Slots.run_job``, synchronously: the thread split is test_slots_base's
+        subject; this flow only needs the outcome and how it is reported."""
+        job = SlotJob(name)
+        try:
+            result = work(job, *args)
+        except Exception as error:
+            self.sb.message_box(f"{name} failed:<br>{error}")
+            return None
+        done(result)
+        return job
 
 
 class TestTb003ExportFlow(unittest.TestCase):
@@ -710,6 +737,24 @@ class TestTb003ExportFlow(unittest.TestCase):
         host.tb003(_export_widget())
         self.assertIn("plugin missing", host.sb.messages[-1])
 
+    def test_a_returned_tail_runs_in_the_job_before_the_report(self):
+        host, ran = self._host(), []
+        host.tail = lambda job: ran.append(host.sb.messages[:])
+        host.tb003(_export_widget(fmt="glb"))
+        self.assertEqual(ran, [[]])  # the conversion ran, nothing reported yet
+        self.assertIn("Exported", host.sb.messages[-1])
+
+    def test_a_failing_tail_is_reported_as_the_export_failing(self):
+        def tail(job):
+            raise RuntimeError("FBX2glTF missing")
+
+        host = self._host()
+        host.tail = tail
+        host.tb003(_export_widget(fmt="glb"))
+        self.assertEqual(len(host.sb.messages), 1)
+        self.assertIn("Export failed", host.sb.messages[-1])
+        self.assertIn("FBX2glTF missing", host.sb.messages[-1])
+
     def test_the_foreign_format_routes_through_the_bridge_not_the_writer(self):
         bridge = _FakeBridge(result={"output": "P:/proj/asset.blend", "duration": 3.0})
         host = _Tb003Host(bridge, scene_path="P:/proj/asset.ma")
@@ -726,5 +771,79 @@ class TestTb003ExportFlow(unittest.TestCase):
         self.assertEqual(bridge.calls[0][1], ["cube"])
 
 
+
+class TestSplitExport(unittest.TestCase):
+    """The Split combo: partitioning, one native write per chunk, the manifest."""
+
+    ROOTS = [("|cam", 0), ("|a", 600), ("|b", 300), ("|c", 500), ("|d", 2000)]
+
+    def test_assembly_mode_gives_each_root_with_geometry_its_own_chunk(self):
+        self.assertEqual(
+            SceneMixin._partition_export(self.ROOTS, "assembly"),
+            [["|cam", "|a"], ["|b"], ["|c"], ["|d"]],
+        )
+
+    def test_tris_mode_packs_up_to_the_budget_and_never_cuts_a_root(self):
+        self.assertEqual(
+            SceneMixin._partition_export(self.ROOTS, "tris", budget=1000),
+            [["|cam", "|a", "|b"], ["|c"], ["|d"]],
+        )
+
+    def test_a_scene_without_geometry_is_still_one_chunk(self):
+        self.assertEqual(
+            SceneMixin._partition_export([("|light", 0)], "tris"), [["|light"]]
+        )
+        self.assertEqual(SceneMixin._partition_export([], "assembly"), [])
+
+    def _export(self, split, fmt="fbx", tail=None):
+        out = os.path.join(tempfile.mkdtemp(), "asset.ma")
+        host = _Tb003Host(_FakeBridge(), scene_path=out)
+        host.roots = self.ROOTS
+        host.tail = tail
+        host.tb003(_export_widget(fmt=fmt, split=split))
+        return host, os.path.dirname(out)
+
+    def test_each_chunk_is_a_native_write_of_its_own_roots(self):
+        host, folder = self._export("assembly")
+        self.assertEqual(
+            [(os.path.basename(path), options["objects"]) for _, path, options in host.native],
+            [
+                ("asset_a.fbx", ["|cam", "|a"]),
+                ("asset_b.fbx", ["|b"]),
+                ("asset_c.fbx", ["|c"]),
+                ("asset_d.fbx", ["|d"]),
+            ],
+        )
+        with open(os.path.join(folder, "asset.manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["split"], "assembly")
+        self.assertEqual(
+            [(c["file"], c["triangles"]) for c in manifest["chunks"]],
+            [("asset_a.fbx", 600), ("asset_b.fbx", 300), ("asset_c.fbx", 500),
+             ("asset_d.fbx", 2000)],
+        )
+        self.assertIn("asset.manifest.json", host.sb.messages[-1])
+
+    def test_every_chunks_tail_runs_before_the_report(self):
+        ran = []
+        host, _ = self._export("tris", fmt="glb", tail=lambda job: ran.append(job))
+        self.assertEqual(len(ran), len(host.native))
+        self.assertTrue(all(path.endswith(".glb") for _, path, _ in host.native))
+        self.assertIn("Exported", host.sb.messages[-1])
+
+    def test_a_failing_chunk_tail_fails_the_export(self):
+        def tail(job):
+            raise RuntimeError("FBX2glTF missing")
+
+        host, folder = self._export("assembly", fmt="glb", tail=tail)
+        self.assertIn("Export failed", host.sb.messages[-1])
+        self.assertFalse(os.path.exists(os.path.join(folder, "asset.manifest.json")))
+
+    def test_single_file_keeps_the_unsplit_path(self):
+        host, _ = self._export("none")
+        self.assertEqual(len(host.native), 1)
+        self.assertNotIn("objects", host.native[0][2])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared scene-statistics table (``tentacle/slots/_scene_stats.py``).
+
+``SceneStats`` is DCC-agnostic: the engine only supplies per-mesh signatures and
+measurements. A fake engine whose meshes are plain dicts exercises the cache —
+what is measured, when it is measured again, and what the totals add up to —
+without ``maya.cmds`` / ``bpy``.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._scene_stats import SceneStats  # noqa: E402
+
+
+class _FakeStats(SceneStats):
+    """Meshes are ``{"name", "faces", "tris", "uvs", "verts"}`` dicts."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def _key(self, mesh):
+        return mesh["name"]
+
+    def _signatures(self, meshes):
+        return [(m["faces"], m["verts"], m["uvs"]) for m in meshes]
+
+    def _measure(self, meshes):
+        self.batches.append([m["name"] for m in meshes])
+        return [[m["faces"], m["tris"], m["uvs"], m["verts"]] for m in meshes]
+
+
+def _mesh(name, faces=6, tris=12, uvs=14, verts=8):
+    return dict(name=name, faces=faces, tris=tris, uvs=uvs, verts=verts)
+
+
+class TestSceneStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = _FakeStats()
+        self.meshes = [_mesh("a"), _mesh("b", faces=100, tris=200, verts=102), _mesh("c")]
+
+    def test_totals_sum_any_subset(self):
+        self.assertEqual(
+            self.stats.totals(self.meshes),
+            {"faces": 112, "tris": 224, "uvs": 42, "verts": 118},
+        )
+        self.assertEqual(self.stats.totals(self.meshes[1:2])["tris"], 200)
+        self.assertEqual(
+            self.stats.totals([]), {"faces": 0, "tris": 0, "uvs": 0, "verts": 0}
+        )
+
+    def test_misses_are_measured_in_one_batch_and_hits_not_at_all(self):
+        self.stats.totals(self.meshes[:2])
+        self.stats.totals(self.meshes)
+        self.stats.totals(self.meshes[::-1])
+        self.assertEqual(self.stats.batches, [["a", "b"], ["c"]])
+        self.assertEqual(self.stats.measured, 3)
+
+    def test_a_moved_signature_re_measures_only_that_mesh(self):
+        self.stats.totals(self.meshes)
+        self.meshes[1].update(faces=50, tris=100, verts=52)  # a reduce
+        self.assertEqual(self.stats.totals(self.meshes)["tris"], 124)
+        self.assertEqual(self.stats.batches[-1], ["b"])
+
+    def test_invalidate_forgets_one_mesh_or_all(self):
+        self.stats.totals(self.meshes)
+        self.stats.invalidate(self.meshes[0])
+        self.stats.totals(self.meshes)
+        self.assertEqual(self.stats.batches[-1], ["a"])
+        self.stats.invalidate()
+        self.stats.totals(self.meshes)
+        self.assertEqual(self.stats.batches[-1], ["a", "b", "c"])
+
+    def test_counts_keep_the_query_order(self):
+        counts = self.stats.counts(self.meshes[::-1])
+        self.assertEqual(counts[:, SceneStats.FIELDS.index("faces")].tolist(), [6, 100, 6])
+
+    def test_the_table_is_dropped_rather_than_grown_past_its_cap(self):
+        self.stats.MAX_ROWS = 2
+        self.stats.totals(self.meshes[:2])
+        self.assertEqual(self.stats.totals(self.meshes)["faces"], 112)  # "c" makes three
+        self.assertEqual(self.stats.batches[-1], ["a", "b", "c"])
+        self.assertEqual(sorted(self.stats._rows), ["a", "b", "c"])
+
+    def test_each_engine_has_its_own_instance(self):
+        class _Other(_FakeStats):
+            pass
+
+        self.assertIs(_FakeStats.instance(), _FakeStats.instance())
+        self.assertIsNot(_Other.instance(), _FakeStats.instance())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the Blender selection masks (``tentacle/slots/_selection_mask.py``).
+
+``SelectionMask`` touches a mesh only through ``foreach_get`` / ``foreach_set`` on its
+collections, so a fake mesh backed by NumPy arrays stands in for ``bpy.types.Mesh``: a
+strip of three quads, whose flush and grow results are easy to state by hand. Runs
+without Blender.
+"""
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._selection_mask import SelectionMask  # noqa: E402
+
+
+class _Collection:
+    def __init__(self, size, **columns):
+        self.size = size
+        self.columns = {k: np.asarray(v) for k, v in columns.items()}
+
+    def __len__(self):
+        return self.size
+
+    def foreach_get(self, attr, out):
+        out[...] = self.columns[attr].reshape(out.shape)
+
+    def foreach_set(self, attr, values):
+        self.columns[attr] = np.array(values, dtype=bool)
+
+
+class _StripMesh:
+    """Three quads in a row: verts 0-3 along the bottom, 4-7 along the top."""
+
+    name = "strip"
+
+    def __init__(self):
+        faces = [(0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6)]
+        edges, loop_edges = [], []
+        for face in faces:
+            for a, b in zip(face, face[1:] + face[:1]):
+                key = tuple(sorted((a, b)))
+                if key not in edges:
+                    edges.append(key)
+                loop_edges.append(edges.index(key))
+        self.vertices = _Collection(8, select=np.zeros(8, dtype=bool))
+        self.edges = _Collection(
+            len(edges),
+            vertices=np.array(edges).ravel(),
+            select=np.zeros(len(edges), dtype=bool),
+        )
+        self.polygons = _Collection(
+            3, loop_start=[0, 4, 8], loop_total=[4, 4, 4], select=np.zeros(3, dtype=bool)
+        )
+        self.loops = _Collection(
+            12, vertex_index=np.array(faces).ravel(), edge_index=loop_edges
+        )
+        self.edge_keys = edges
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+
+class _Object:
+    def __init__(self, mode="OBJECT"):
+        self.data = _StripMesh()
+        self.mode = mode
+        self.synced = 0
+
+    def update_from_editmode(self):
+        self.synced += 1
+
+
+def _fake_bmesh():
+    """A ``bmesh`` whose edit-mesh rebuilds its elements on ``from_mesh``, as the real one
+    does (the select history then points at elements that are gone)."""
+    module = types.ModuleType("bmesh")
+    kinds = {a: type(a, (), {}) for a in ("BMVert", "BMEdge", "BMFace")}
+    module.types = types.SimpleNamespace(**kinds)
+
+    class _Seq(list):
+        def index_update(self):
+            for i, element in enumerate(self):
+                element.index = i
+
+        def ensure_lookup_table(self):
+            pass
+
+    class _History(list):
+        def add(self, element):
+            self.append(element)
+
+    class _BMesh:
+        def __init__(self, mesh):
+            self.select_history = _History()
+            self.from_mesh(mesh)
+
+        def clear(self):
+            self.verts = self.edges = self.faces = _Seq()
+            self.select_history.clear()
+
+        def from_mesh(self, mesh):
+            for attr, kind, collection in (
+                ("verts", kinds["BMVert"], mesh.vertices),
+                ("edges", kinds["BMEdge"], mesh.edges),
+                ("faces", kinds["BMFace"], mesh.polygons),
+            ):
+                setattr(self, attr, _Seq(kind() for _ in range(len(collection))))
+                for element in getattr(self, attr):
+                    element.index = -1  # indices are dirty until index_update()
+
+    edit_meshes = {}
+    module.from_edit_mesh = lambda mesh: edit_meshes.setdefault(id(mesh), _BMesh(mesh))
+    module.update_edit_mesh = lambda mesh: None
+    return module
+
+
+class TestSelectionMask(unittest.TestCase):
+    def setUp(self):
+        self.obj = _Object()
+
+    def test_from_faces_flushes_down_to_verts_and_edges(self):
+        mask = SelectionMask.from_faces(self.obj, [0])
+        self.assertEqual(mask.face_indices().tolist(), [0])
+        self.assertEqual(np.flatnonzero(mask.verts).tolist(), [0, 1, 4, 5])
+        edges = {self.obj.data.edge_keys[i] for i in np.flatnonzero(mask.edges)}
+        self.assertEqual(edges, {(0, 1), (1, 5), (4, 5), (0, 4)})
+
+    def test_from_edges_selects_their_verts_and_the_faces_they_close(self):
+        keys = self.obj.data.edge_keys
+        ring = [keys.index(k) for k in ((0, 1), (1, 5), (4, 5), (0, 4), (1, 2))]
+        mask = SelectionMask.from_edges(self.obj, ring)
+        self.assertEqual(mask.face_indices().tolist(), [0])
+        self.assertEqual(np.flatnonzero(mask.verts).tolist(), [0, 1, 2, 4, 5])
+        self.assertEqual(mask.counts(), (5, 5, 1))
+
+    def test_grow_adds_vertex_adjacent_faces_per_step(self):
+        mask = SelectionMask.from_faces(self.obj, [0])
+        self.assertEqual(mask.grown().face_indices().tolist(), [0, 1])
+        self.assertEqual(mask.grown(2).face_indices().tolist(), [0, 1, 2])
+        self.assertEqual(mask.grown(2).counts(), (8, 10, 3))
+
+    def test_set_operations(self):
+        first = SelectionMask.from_faces(self.obj, [0])
+        last = SelectionMask.from_faces(self.obj, [2])
+        both = first | last
+        self.assertEqual(both.face_indices().tolist(), [0, 2])
+        self.assertEqual((both - last).face_indices().tolist(), [0])
+        self.assertFalse(first & last)
+        self.assertEqual((first.grown() & last.grown()).face_indices().tolist(), [1])
+
+    def test_capture_and_apply_round_trip_through_the_flags(self):
+        SelectionMask.from_faces(self.obj, [1]).apply(self.obj)
+        self.assertEqual(self.obj.data.updates, 1)
+        captured = SelectionMask.capture(self.obj)
+        self.assertEqual(captured.face_indices().tolist(), [1])
+        self.assertEqual(captured.counts(), (4, 4, 1))
+
+    def test_an_edit_mode_capture_syncs_the_edit_mesh_first(self):
+        obj = _Object(mode="EDIT")
+        SelectionMask.capture(obj)
+        self.assertEqual(obj.synced, 1)
+
+    def test_a_capture_without_sync_reads_the_data_as_it_stands(self):
+        obj = _Object(mode="EDIT")
+        SelectionMask.capture(obj, sync=False)
+        self.assertEqual(obj.synced, 0)
+
+    def test_an_edit_mode_apply_keeps_the_select_history(self):
+        obj = _Object(mode="EDIT")
+        bmesh = _fake_bmesh()
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.verts.index_update()
+        bm.faces.index_update()
+        bm.select_history.add(bm.faces[2])
+        bm.select_history.add(bm.faces[1])  # the active face
+        for element in bm.verts + bm.faces:
+            element.index = -1
+        with mock.patch.dict(sys.modules, {"bmesh": bmesh}):
+            SelectionMask.from_faces(obj, [1]).apply(obj)
+        # The rebuilt face 1 (face 2 was deselected, so it drops out).
+        self.assertEqual(list(bm.select_history), [bm.faces[1]])
+
+    def test_non_contiguous_loop_blocks_map_to_the_right_faces(self):
+        """Loop blocks need not follow face order (a mesh edited in place)."""
+        mesh = self.obj.data
+        mesh.polygons.columns["loop_start"] = np.array([8, 0, 4])
+        loops = mesh.loops.columns
+        order = np.r_[4:8, 8:12, 0:4]  # face 0's loops now sit last
+        loops["vertex_index"] = loops["vertex_index"][order]
+        loops["edge_index"] = loops["edge_index"][order]
+        mask = SelectionMask.from_faces(self.obj, [0])
+        self.assertEqual(np.flatnonzero(mask.verts).tolist(), [0, 1, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
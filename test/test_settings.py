@@ -25,11 +25,13 @@ live in uitk (``MarkingMenu.set_activation_key`` + the external-binding command
 register) and are covered by uitk's test_marking_menu_shortcuts /
 test_shortcut_commands.
 """
+import os
+import tempfile
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from tentacle.slots._settings import SettingsMixin
+from tentacle.slots._settings import SettingsMixin, _UpdateCheck
 
 from _host import MAYA_AVAILABLE as _MAYA_AVAILABLE, maya_module
 
@@ -199,6 +201,23 @@ class _UpdaterHost(SettingsMixin):
     def _update_python_path(self):
         return "python"
 
+    def deliver(self, future, callback):
+        """Synchronous stand-in for ``Slots.deliver`` (a Qt-timer poll in the app):
+        wait for the background check, then hand it over as the UI thread would."""
+        future.exception(timeout=10)
+        callback(future)
+
+
+def setUpModule():
+    # The updater caches its answer on disk; give the tests their own cache dir.
+    global _cache_env
+    _cache_env = patch.dict(os.environ, {"TENTACLE_CACHE_DIR": tempfile.mkdtemp()})
+    _cache_env.start()
+
+
+def tearDownModule():
+    _cache_env.stop()
+
 
 class _FakePkgMgr:
     installed = {}
@@ -230,6 +249,10 @@ class TestCheckForUpdate(unittest.TestCase):
 
     ALL_CURRENT = {d: "1.0" for d in _UpdaterHost.DISTS}
 
+    def setUp(self):
+        # Each case is a fresh environment: never replay the previous case's answer.
+        _UpdateCheck.invalidate("python")
+
     def _run(self, installed, latest, answer="Yes"):
         _FakePkgMgr.installed = installed
         _FakePkgMgr.latest = latest
@@ -378,6 +401,7 @@ class TestEcosystemDistsDerivation(unittest.TestCase):
         """If `check_for_update` stopped forwarding it, the foreign-engine rule above
         would be unreachable and every existing install would silently lose coverage."""
         seen = {}
+        _UpdateCheck.invalidate("python")
 
         class _Host(_UpdaterHost):
             def ecosystem_dists(self, installed=None):
@@ -419,6 +443,7 @@ class TestEcosystemDistsDerivation(unittest.TestCase):
         be the outdated one — otherwise the assertion passes under either wiring.
         """
         self.assertNotIn("mayatk", SettingsMixin.ECOSYSTEM_DISTS)  # fixture premise
+        _UpdateCheck.invalidate("python")
 
         host = _UpdaterHost(_FakeSb(), dists=("pythontk", "mayatk", "tentacletk"))
         _FakePkgMgr.installed = {"pythontk": "1.0", "mayatk": "1.0", "tentacletk": "1.0"}
@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared Select Similar descriptor index (``tentacle/slots/_similar_index.py``).
+
+``SimilarIndex`` is DCC-agnostic: the engine only supplies per-mesh signatures and a
+batched measure. A fake engine whose meshes are plain dicts of metric values exercises
+the matching rules (tolerance, float floors, multi-value metrics), the sorted-window
+lookup against a brute-force compare, what an edit re-measures, and the shell / area
+helpers — without ``maya.cmds`` / ``bpy``.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._similar_index import SimilarIndex  # noqa: E402
+
+
+class _FakeIndex(SimilarIndex):
+    """Meshes are ``{"name", "edits", metric: value}`` dicts."""
+
+    EPS = {"worldArea": 1e-2}
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def _key(self, mesh):
+        return mesh["name"]
+
+    def _signatures(self, meshes):
+        return [m["edits"] for m in meshes]
+
+    def _measure(self, meshes):
+        self.batches.append([m["name"] for m in meshes])
+        return [{k: v for k, v in m.items() if k in self.METRICS} for m in meshes]
+
+
+def _mesh(name, vertex=8, area=6.0, world=6.0, box=(1.0, 1.0, 1.0), **kw):
+    values = dict(vertex=vertex, edge=12, face=6, triangle=12, shell=1, uvcoord=14)
+    values.update(area=area, worldArea=world, boundingBox=box, **kw)
+    return dict(name=name, edits=0, **values)
+
+
+class TestMatch(unittest.TestCase):
+    def setUp(self):
+        self.index = _FakeIndex()
+        self.meshes = [
+            _mesh("cube"),
+            _mesh("copy", world=6.05),  # world round-off: inside the 1% floor
+            _mesh("dense", vertex=10),
+            _mesh("tall", box=(1.0, 3.0, 1.0)),
+            _mesh("big", world=24.0),
+        ]
+        self.snapshot = self.index.snapshot(self.meshes)
+
+    def _names(self, rows):
+        return [self.meshes[i]["name"] for i in rows]
+
+    def test_the_default_metrics_and_the_float_floor(self):
+        rows = self.snapshot.match([0])
+        self.assertEqual(self._names(rows), ["copy", "tall"])
+
+    def test_the_tolerance_widens_every_metric(self):
+        s = self.snapshot
+        self.assertEqual(self._names(s.match([0], ["vertex"])), ["copy", "tall", "big"])
+        self.assertEqual(
+            self._names(s.match([0], ["vertex"], tolerance=2)),
+            ["copy", "dense", "tall", "big"],
+        )
+
+    def test_index_finds_a_mesh_by_its_key(self):
+        self.assertEqual(self.snapshot.index(_mesh("tall")), 3)
+        self.assertIsNone(self.snapshot.index(_mesh("gone")))
+
+    def test_a_multi_value_metric_compares_every_value(self):
+        s = self.snapshot
+        self.assertEqual(self._names(s.match([0], ["boundingBox"])), ["copy", "dense", "big"])
+        self.assertIn("tall", self._names(s.match([0], ["boundingBox"], tolerance=2)))
+
+    def test_a_missing_metric_never_matches(self):
+        meshes = [_mesh("a"), _mesh("b", box=None)]
+        snapshot = _FakeIndex().snapshot(meshes)
+        self.assertEqual(snapshot.match([0], ["boundingBox"], tolerance=100), [])
+        self.assertEqual(snapshot.match([0], ["vertex"]), [1])
+
+    def test_the_window_lookup_agrees_with_a_full_compare(self):
+        rng = np.random.default_rng(3)
+        meshes = [
+            _mesh(f"m{i}", vertex=int(v), area=float(a), world=float(a))
+            for i, (v, a) in enumerate(zip(rng.integers(0, 20, 300), rng.random(300) * 4))
+        ]
+        snapshot = _FakeIndex().snapshot(meshes)
+        for metrics in (["vertex", "area"], ["area"], ["worldArea"]):
+            for tolerance in (0, 1, 0.25):
+                expected = [
+                    i
+                    for i, m in enumerate(meshes)
+                    if i not in (0, 5)
+                    and any(
+                        all(
+                            abs(m[k] - meshes[r][k])
+                            <= max(
+                                tolerance,
+                                _FakeIndex.EPS.get(k, 0)
+                                * max(abs(m[k]), abs(meshes[r][k])),
+                            )
+                            for k in metrics
+                        )
+                        for r in (0, 5)
+                    )
+                ]
+                self.assertEqual(snapshot.match([0, 5], metrics, tolerance), expected)
+
+
+class TestTable(unittest.TestCase):
+    def setUp(self):
+        self.index = _FakeIndex()
+        self.meshes = [_mesh(f"m{i}") for i in range(4)]
+
+    def test_a_repeat_snapshot_measures_nothing(self):
+        for _ in range(3):
+            self.index.snapshot(self.meshes)
+        self.assertEqual(len(self.index.batches), 1)
+        self.assertEqual(self.index.measured, 4)
+
+    def test_an_edit_re_measures_only_that_mesh(self):
+        i = self.index
+        i.snapshot(self.meshes)
+        self.meshes[1]["edits"] = 1
+        i.touch(self.meshes[3])
+        i.snapshot(self.meshes)
+        self.assertEqual(i.batches[-1], ["m1", "m3"])
+        i.invalidate()
+        i.snapshot(self.meshes[:1])
+        self.assertEqual(i.batches[-1], ["m0"])
+
+    def test_instance_is_per_subclass(self):
+        self.assertIs(_FakeIndex.instance(), _FakeIndex.instance())
+        self.assertIsNot(_FakeIndex.instance(), SimilarIndex.instance())
+
+
+class TestValues(unittest.TestCase):
+    def test_count_shells(self):
+        count = SimilarIndex.count_shells
+        self.assertEqual(count(6, [(0, 1), (1, 2), (3, 4)]), 3)
+        self.assertEqual(count(5, [(4, 3), (3, 2), (2, 1), (1, 0)]), 1)
+        self.assertEqual(count(3, []), 3)
+
+    def test_fan_area_of_a_quad_and_a_triangle(self):
+        points = [(0, 0, 0), (2, 0, 0), (2, 3, 0), (0, 3, 0), (0, 0, 4)]
+        corners = [0, 1, 2, 3, 0, 1, 4]
+        area = SimilarIndex.fan_area(points, corners, starts=[0, 4], totals=[4, 3])
+        self.assertAlmostEqual(area, 6.0 + 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the slot manifest (``tentacle/slot_manifest.py``) and the entry classes' use of it.
+
+DCC-free: the manifest is built for the real ``slots/maya`` directory with
+``TENTACLE_CACHE_DIR`` pointed at a temp dir, which reads syntax only. The stand-in
+mechanics run against an importable non-slot class. One end-to-end check builds a
+stubbed-engine ``TclMaya`` (the headless bench's stubs) in a child interpreter: no slot
+module is imported by construction, the registry rows match the eager directory scan,
+and a panel's slots still come up as the real class.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slot_manifest import SlotManifest, _LazySlotsMeta  # noqa: E402
+from tentacle.tcl import Tcl  # noqa: E402
+
+MAYA_SLOTS = ROOT / "tentacle" / "slots" / "maya"
+BENCH = ROOT / "test" / "bench" / "startup_profile.py"
+
+
+class _ManifestCase(unittest.TestCase):
+    def setUp(self):
+        env = mock.patch.dict(os.environ, {Tcl.CACHE_DIR_ENV: tempfile.mkdtemp()})
+        env.start()
+        self.addCleanup(env.stop)
+        self.manifest = SlotManifest(MAYA_SLOTS)
+
+
+class TestScan(unittest.TestCase):
+    def test_classes_bases_and_methods_come_from_syntax(self):
+        path = Path(tempfile.mkdtemp(), "panel.py")
+        path.write_text(
+            textwrap.dedent(
+                """
+                import does_not_exist  # never imported by a scan
+
+                class PanelSlots(tentacle.SceneMixin, SlotsMaya):
+                    def b000(self): ...
+                    async def tb001(self, widget): ...
+                    class Inner:
+                        def helper(self): ...
+
+                def factory():
+                    class Local:  # not importable: not registered
+                        pass
+                """
+            ),
+            encoding="utf-8",
+        )
+        classes = SlotManifest.scan(path)
+        self.assertEqual(list(classes), ["PanelSlots", "PanelSlots.Inner"])
+        self.assertEqual(classes["PanelSlots"]["bases"], ["SceneMixin", "SlotsMaya"])
+        self.assertEqual(classes["PanelSlots"]["methods"], ["b000", "tb001"])
+
+
+class TestCache(_ManifestCase):
+    def test_nothing_cached_means_no_rows(self):
+        self.assertIsNone(self.manifest.rows())
+
+    def test_rows_cover_every_slot_module_without_importing_it(self):
+        self.manifest.build()
+        rows = SlotManifest(MAYA_SLOTS).rows()
+        by_name = {row[0]: row for row in rows}
+        name, stand_in, stem, filepath = by_name["UvSlots"]
+        self.assertEqual((stem, filepath), ("uv", str(MAYA_SLOTS / "uv.py")))
+        self.assertEqual(stand_in.__module__, "tentacle.slots.maya.uv")
+        self.assertIn("unloaded", repr(stand_in))
+        self.assertEqual(
+            {row[2] for row in rows},
+            {p.stem for p in MAYA_SLOTS.glob("*.py")} - {"__init__"},
+        )
+
+    def test_slot_methods_include_the_shared_mixins(self):
+        self.manifest.build()
+        methods = self.manifest.slot_methods("MaterialsSlots")
+        self.assertIn("cmb002_init", methods)  # MaterialsMixin (slots/_materials.py)
+        self.assertIn("require_selection", methods)  # SlotsMaya
+
+    def test_only_files_whose_stamp_moved_are_rescanned(self):
+        self.manifest.build()
+        path = self.manifest.cache_path()
+        modules = json.loads(path.read_text(encoding="utf-8"))
+        modules["uv.py"]["stamp"] = [0, 0]
+        modules["deleted.py"] = {"stamp": [0, 0], "classes": {"GoneSlots": {}}}
+        path.write_text(json.dumps(modules), encoding="utf-8")
+
+        manifest = SlotManifest(MAYA_SLOTS)
+        with mock.patch.object(SlotManifest, "scan", wraps=SlotManifest.scan) as scan:
+            modules = manifest.modules()
+        scan.assert_called_once_with(MAYA_SLOTS / "uv.py")
+        self.assertNotIn("deleted.py", modules)
+        self.assertNotIn("deleted.py", json.loads(path.read_text(encoding="utf-8")))
+
+
+class TestLazySource(_ManifestCase):
+    ANCHOR = str(ROOT / "tentacle" / "tcl_maya.py")
+
+    def test_other_sources_pass_through(self):
+        for source in (SlotManifest, tempfile.mkdtemp(), "slots/missing"):
+            self.assertIs(SlotManifest.lazy_source(source, self.ANCHOR), source)
+
+    def test_a_first_run_scans_eagerly_and_builds_in_the_background(self):
+        self.assertEqual(SlotManifest.lazy_source("slots/maya", self.ANCHOR), "slots/maya")
+        for thread in threading.enumerate():
+            if thread.name == "tentacle-slot-manifest":
+                thread.join(60)
+        rows = SlotManifest.lazy_source("slots/maya", self.ANCHOR)
+        self.assertIn("HudSlots", [row[0] for row in rows])
+
+
+class TestStandIn(unittest.TestCase):
+    def _stand_in(self):
+        return _LazySlotsMeta(
+            "Tcl", (), {"__module__": "tentacle.tcl", "__qualname__": "Tcl"}
+        )
+
+    def test_it_forwards_to_the_real_class(self):
+        stand_in = self._stand_in()
+        self.assertIn("unloaded", repr(stand_in))
+        self.assertEqual(stand_in.DEFAULT_KEY, Tcl.DEFAULT_KEY)
+        self.assertIs(stand_in.resolve(), Tcl)
+        self.assertNotIn("unloaded", repr(stand_in))
+        self.assertIsInstance(stand_in(), Tcl)
+        self.assertIsInstance(Tcl(), stand_in)
+        self.assertIn("cache_dir", dir(stand_in))
+
+    def test_dunder_probes_do_not_import(self):
+        stand_in = self._stand_in()
+        self.assertFalse(hasattr(stand_in, "__wrapped__"))
+        self.assertIsNone(stand_in.__dict__.get("_resolved"))
+
+
+class TestEntryClasses(unittest.TestCase):
+    def test_maya_and_blender_register_lazily(self):
+        for name in ("tcl_maya.py", "tcl_blender.py"):
+            source = (ROOT / "tentacle" / name).read_text(encoding="utf-8")
+            calls = [
+                ast.unparse(n.func)
+                for n in ast.walk(ast.parse(source))
+                if isinstance(n, ast.Call)
+            ]
+            self.assertIn("SlotManifest.lazy_source", calls, name)
+
+    def test_headless_construction_imports_no_slot_module(self):
+        script = textwrap.dedent(
+            f"""
+            import importlib.util, json, os, sys
+            sys.path.insert(0, {str(ROOT)!r})
+            spec = importlib.util.spec_from_file_location("bench", {str(BENCH)!r})
+            bench = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(bench)
+            bench.stub_engines()
+            from qtpy import QtWidgets
+            from uitk import Switchboard
+            from uitk.testing import TestSandbox
+            from tentacle.slot_manifest import SlotManifest
+            from tentacle.tcl_maya import TclMaya
+
+            app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+            TestSandbox.activate()
+            SlotManifest({str(MAYA_SLOTS)!r}).build()
+            sb = TclMaya(parent=None).sb
+            imported = [m for m in sys.modules if m.startswith("tentacle.slots.maya.")]
+            rows = lambda b: sorted(
+                [r.classname, r.filename, r.filepath]
+                for r in b.registry.slot_registry.named_tuples
+            )
+            eager = Switchboard(slot_source={str(MAYA_SLOTS)!r})
+            slots = sb.get_slots_instance(sb.get_ui("polygons"))
+            print(json.dumps([imported, rows(sb) == rows(eager), type(slots).__module__]))
+            sys.stdout.flush()
+            os._exit(0)
+            """
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            env=dict(
+                os.environ, QT_QPA_PLATFORM="offscreen", TENTACLE_CACHE_DIR=tempfile.mkdtemp()
+            ),
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+        imported, same_rows, slots_module = json.loads(proc.stdout.strip().splitlines()[-1])
+        self.assertEqual(imported, [])
+        self.assertTrue(same_rows)
+        self.assertEqual(slots_module, "tentacle.slots.maya.polygons")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the per-slot dispatch telemetry (``tentacle/slot_telemetry.py``).
+
+The aggregation and the on-disk rolling window are plain Python and run anywhere. The
+install tests patch the real uitk ``SlotWrapper._invoke`` / ``progress`` and drive them
+with a namespace standing in for a wrapper (``_invoke`` reads only a handful of its
+attributes), so no Qt widget or Switchboard is needed.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slot_telemetry import SlotTelemetry, _SlotStats  # noqa: E402
+
+
+def _telemetry(**kwargs):
+    path = os.path.join(tempfile.mkdtemp(), "maya.json")
+    return SlotTelemetry("maya", path=path, **kwargs)
+
+
+class TestSlotStats(unittest.TestCase):
+    def test_percentiles_land_within_a_bucket_of_the_true_value(self):
+        stats = _SlotStats()
+        for ms in range(1, 101):  # 1..100 ms
+            stats.add(float(ms), 0.0, False)
+        for q, true in ((50, 50), (95, 95), (99, 99)):
+            value = stats.percentile(q)
+            self.assertGreaterEqual(value, true)
+            self.assertLessEqual(value, true * 1.25)
+        self.assertEqual(stats.percentile(100), 100.0)  # capped at the max seen
+
+    def test_merge_and_round_trip_keep_the_histogram(self):
+        a, b = _SlotStats(), _SlotStats()
+        for ms in (1.0, 2.0, 400.0):
+            a.add(ms, 0.0, False)
+        b.add(900.0, 300.0, True)
+        merged = _SlotStats.from_json(json.loads(json.dumps(a.to_json()))).merge(b)
+        self.assertEqual((merged.count, merged.errors), (4, 1))
+        self.assertEqual(merged.max_ms, 900.0)
+        self.assertEqual(merged.progress_ms, 300.0)
+        self.assertGreaterEqual(merged.percentile(99), 400.0)
+
+
+class TestSlotTelemetry(unittest.TestCase):
+    def test_the_ring_folds_when_full_and_on_demand(self):
+        telemetry = _telemetry(capacity=4)
+        for _ in range(5):
+            telemetry.record("Edit.tb000", 0.002)
+        self.assertEqual(len(telemetry._ring), 1)  # four folded at capacity
+        rows = telemetry.rows(history=False)
+        self.assertEqual(len(telemetry._ring), 0)
+        self.assertEqual(rows[0]["count"], 5)
+
+    def test_rows_are_slowest_first_with_errors_and_progress(self):
+        telemetry = _telemetry()
+        telemetry.record("Edit.tb000", 0.001)
+        telemetry.record("Scene.tb003", 2.0, progress_seconds=1.5, raised=True)
+        rows = telemetry.rows(history=False)
+        self.assertEqual([r["slot"] for r in rows], ["Scene.tb003", "Edit.tb000"])
+        self.assertEqual(rows[0]["errors"], 1)
+        self.assertAlmostEqual(rows[0]["progress_ms"], 1500.0)
+        self.assertIn("Scene.tb003", telemetry.report(history=False))
+
+    def test_written_sessions_roll_and_merge_into_the_next(self):
+        first = _telemetry()
+        first.record("Edit.tb000", 0.010)
+        first.write()
+        first.record("Edit.tb000", 0.010)
+        first.write()  # rewrites the same session, does not add one
+        with open(first.path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["sessions"]), 1)
+
+        second = SlotTelemetry("maya", path=first.path)
+        second.SESSIONS = 2
+        second.record("Edit.tb000", 0.010)
+        self.assertEqual(second.rows()[0]["count"], 3)
+        self.assertEqual(second.rows(history=False)[0]["count"], 1)
+        second.write()
+
+        third = SlotTelemetry("maya", path=first.path)
+        third.SESSIONS = 2
+        third.record("Edit.tb000", 0.010)
+        third.write()
+        with open(first.path, encoding="utf-8") as f:
+            sessions = json.load(f)["sessions"]
+        self.assertEqual([s["id"] for s in sessions], [second.session, third.session])
+
+    def test_an_empty_session_writes_nothing(self):
+        telemetry = _telemetry()
+        self.assertIsNone(telemetry.write())
+        self.assertFalse(os.path.exists(telemetry.path))
+
+    def test_a_corrupt_file_is_ignored(self):
+        telemetry = _telemetry()
+        with open(telemetry.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        telemetry.record("Edit.tb000", 0.001)
+        self.assertEqual(telemetry.rows()[0]["count"], 1)
+        self.assertEqual(telemetry.write(), telemetry.path)
+
+
+class TestInstall(unittest.TestCase):
+    """The dispatch patch itself, over the real uitk classes."""
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from uitk import SlotWrapper
+            from uitk.switchboard.dialogs import SwitchboardDialogsMixin
+        except ImportError as error:
+            raise unittest.SkipTest(f"uitk unavailable: {error}")
+        cls.SlotWrapper = SlotWrapper
+        cls.Dialogs = SwitchboardDialogsMixin
+
+    def setUp(self):
+        self.env = mock.patch.dict(
+            os.environ, {"TENTACLE_CACHE_DIR": tempfile.mkdtemp()}
+        )
+        self.env.start()
+        self.originals = (self.SlotWrapper._invoke, self.Dialogs.progress)
+        self.telemetry = SlotTelemetry.install("maya")
+
+    def tearDown(self):
+        SlotTelemetry.uninstall(write=False)
+        self.env.stop()
+
+    def _wrapper(self, slot):
+        """What ``SlotWrapper._invoke`` reads off ``self``: no busy cursor, no timeout."""
+        sb = types.SimpleNamespace(slot_history=lambda add=None: None)
+        return types.SimpleNamespace(
+            slot=slot,
+            widget=types.SimpleNamespace(no_busy_indicator=True, text=lambda: "Go"),
+            sb=sb,
+            _get_timeout=lambda: None,
+        )
+
+    def test_a_dispatch_is_timed_with_its_progress_share(self):
+        progress = self.Dialogs.progress  # patched; bare sb -> the no-op context
+
+        class Panel:
+            def tb000(self):
+                time.sleep(0.002)
+                with progress(types.SimpleNamespace()):
+                    time.sleep(0.01)
+                return "done"
+
+        wrapper = self._wrapper(Panel().tb000)
+        self.assertEqual(self.SlotWrapper._invoke(wrapper), "done")
+        row = self.telemetry.rows(history=False)[0]
+        self.assertEqual((row["slot"], row["label"], row["count"]), ("Panel.tb000", "Go", 1))
+        self.assertGreaterEqual(row["progress_ms"], 10.0)
+        self.assertGreater(row["total_ms"], row["progress_ms"])
+
+    def test_a_raising_slot_is_counted_and_still_raises(self):
+        def boom():
+            raise RuntimeError("slot failed")
+
+        with self.assertRaises(RuntimeError):
+            self.SlotWrapper._invoke(self._wrapper(boom))
+        row = self.telemetry.rows(history=False)[0]
+        self.assertEqual((row["slot"], row["errors"]), ("boom", 1))
+
+    def test_progress_outside_a_dispatch_is_left_alone(self):
+        context = self.Dialogs.progress(types.SimpleNamespace())
+        self.assertEqual(type(context).__name__, "_NoOpProgressContext")
+
+    def test_install_is_idempotent_and_uninstall_restores(self):
+        self.assertIs(SlotTelemetry.install("maya"), self.telemetry)
+        SlotTelemetry.uninstall(write=False)
+        self.assertEqual((self.SlotWrapper._invoke, self.Dialogs.progress), self.originals)
+        self.assertIsNone(SlotTelemetry.active())
+
+    def test_the_environment_opts_out(self):
+        SlotTelemetry.uninstall(write=False)
+        with mock.patch.dict(os.environ, {SlotTelemetry.ENV: "0"}):
+            self.assertIsNone(SlotTelemetry.install("maya"))
+        self.assertEqual(self.SlotWrapper._invoke, self.originals[0])
+
+    def test_a_uitk_without_the_dispatch_is_left_unpatched(self):
+        SlotTelemetry.uninstall(write=False)
+        with mock.patch.dict(sys.modules, {"uitk.switchboard.dialogs": None}):
+            self.assertIsNone(SlotTelemetry.install("maya"))
+        self.assertEqual(self.SlotWrapper._invoke, self.originals[0])
+        self.assertIsNone(SlotTelemetry.active())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -764,5 +764,237 @@ class TestRecheckAppGates(unittest.TestCase):
         self.assertEqual(good.refreshes, 1)
 
 
+class _JobSb:
+    """Switchboard double for ``run_job``: a real uitk footer on the active UI."""
+
+    def __init__(self):
+        from types import SimpleNamespace
+        from uitk.widgets.footer import Footer
+
+        self.window = QtWidgets.QWidget()
+        self.active_ui = SimpleNamespace(footer=Footer(self.window))
+        self.messages = []
+        self.viewers = []
+        self.logger = SimpleNamespace(
+            info=lambda *a, **k: None, error=lambda *a, **k: None
+        )
+
+    def message_box(self, text, *buttons, **kwargs):
+        self.messages.append(text)
+
+    def text_view_dialog(self, text="", *buttons, **kwargs):
+        viewer = _Viewer(text, kwargs)
+        self.viewers.append(viewer)
+        return viewer
+
+
+class _Viewer:
+    """``TextViewBox`` double: the text it was given, over a real scrollable QTextEdit."""
+
+    def __init__(self, text, options):
+        self.options = options
+        self.text_edit = QtWidgets.QTextEdit()
+        self.text_edit.resize(200, 80)
+        self.texts = []
+        self.visible = True
+        self.setText(text)
+
+    def setText(self, text):
+        self.texts.append(text)
+        self.text_edit.setHtml(text)
+
+    def isVisible(self):
+        return self.visible
+
+
+@unittest.skipUnless(
+    _can_create_widgets(),
+    "Maya's non-GUI Qt stub crashes on QWidget construction (batch/standalone)",
+)
+class TestRunJob(unittest.TestCase):
+    """``run_job`` — a slot's long tail on a worker, DCC calls marshalled back.
+
+    The contract the export (and any later adopter) relies on: *work* runs off the
+    UI thread, everything routed through ``job.on_main`` runs ON it, the footer
+    shows the job and can cancel it, and the outcome lands on the UI thread.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        # One footer for the class: a finished job leaves the footer's own delayed
+        # hide queued, and a window torn down per test would be gone when it fires.
+        cls.sb = _JobSb()
+        cls.footer = cls.sb.active_ui.footer
+
+    def setUp(self):
+        self.sb.messages.clear()
+        self.sb.viewers.clear()
+        self.slot = Slots(self.sb)
+
+    def _wait(self, job, timeout=10.0):
+        import time
+
+        deadline = time.monotonic() + timeout
+        while job.name in self.slot._jobs or not job.future.done():
+            self.assertLess(time.monotonic(), deadline, "job never finished")
+            self.app.processEvents()
+            time.sleep(0.005)
+
+    def test_work_runs_off_the_ui_thread_and_done_runs_on_it(self):
+        import threading
+
+        ui_thread, seen = threading.get_ident(), {}
+
+        def work(job, value):
+            seen["work"] = threading.get_ident()
+            seen["main"] = job.on_main(threading.get_ident)
+            return value * 2
+
+        job = self.slot.run_job(
+            work, 21, name="Double", done=lambda r: seen.update(done=(r, threading.get_ident()))
+        )
+        self._wait(job)
+        self.assertNotEqual(seen["work"], ui_thread)
+        self.assertEqual(seen["main"], ui_thread)
+        self.assertEqual(seen["done"], (42, ui_thread))
+        self.assertEqual(self.footer.statusText(), "Complete")
+
+    def test_map_on_main_batches_the_round_trips(self):
+        calls = []
+
+        def hop(fn):
+            calls.append(fn)
+            return fn()
+
+        def work(job):
+            job.on_main = hop  # count hops; the batching is map_on_main's own
+            return job.map_on_main(lambda i: i * i, range(10), batch=4)
+
+        results = []
+        self._wait(self.slot.run_job(work, name="Squares", done=results.append))
+        self.assertEqual(results, [[i * i for i in range(10)]])
+        self.assertEqual(len(calls), 3)
+
+    def test_progress_reaches_the_footer(self):
+        import threading
+
+        release = threading.Event()
+
+        def work(job):
+            job.progress(3, 10, "Formatting…")
+            release.wait(5)
+
+        job = self.slot.run_job(work, name="Report")
+        for _ in range(50):
+            self.app.processEvents()
+            if self.footer.statusText() == "Formatting…":
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(self.footer.statusText(), "Formatting…")
+        self.assertEqual(self.footer.progress_bar.maximum(), 10)
+        release.set()
+        self._wait(job)
+
+    def test_the_footer_stop_button_cancels_the_job_quietly(self):
+        import threading
+
+        started, done = threading.Event(), []
+
+        def work(job):
+            started.set()
+            while True:
+                job.check()
+                threading.Event().wait(0.01)
+
+        job = self.slot.run_job(work, name="Endless", done=done.append)
+        started.wait(5)
+        self.footer.progress_bar.cancel("test")  # what Esc-hold does
+        self._wait(job)
+        self.assertTrue(job.cancelled)
+        self.assertEqual(done, [])
+        self.assertEqual(self.sb.messages, [])
+        self.assertEqual(self.footer.statusText(), "Cancelled")
+
+    def test_a_cancelled_job_does_not_run_its_queued_dcc_calls(self):
+        ran = []
+
+        def work(job):
+            job.cancel()
+            job.on_main(ran.append, "scene edit")
+
+        self._wait(self.slot.run_job(work, name="Edit"))
+        self.assertEqual(ran, [])
+
+    def test_a_failure_is_reported_by_name(self):
+        def work(job):
+            job.on_main(lambda: 1 / 0)
+
+        self._wait(self.slot.run_job(work, name="Export"))
+        self.assertIn("Export failed", self.sb.messages[-1])
+        self.assertIn("division by zero", self.sb.messages[-1])
+
+    def test_one_running_job_per_key(self):
+        import threading
+
+        release = threading.Event()
+        first = self.slot.run_job(lambda job: release.wait(5), name="Export")
+        self.assertIsNone(self.slot.run_job(lambda job: None, name="Export"))
+        self.assertIn("already running", self.sb.messages[-1])
+        release.set()
+        self._wait(first)
+        self.assertIsNotNone(self.slot.run_job(lambda job: None, name="Export"))
+
+    def test_a_report_streams_into_one_viewer_section_by_section(self):
+        import threading
+
+        ui_thread, built = threading.get_ident(), []
+
+        def sections():
+            for i in range(3):
+                built.append(threading.get_ident())
+                yield f"<p>section {i}</p>" if i != 1 else ""
+
+        job = self.slot.stream_report(sections(), name="Scene Info", title="Info")
+        self._wait(job)
+        viewer, = self.sb.viewers
+        self.assertNotIn(ui_thread, built, "sections are built on the worker")
+        self.assertEqual(viewer.options["title"], "Info")
+        self.assertEqual(
+            viewer.texts, ["<p>section 0</p>", "<p>section 0</p><p>section 2</p>"]
+        )
+
+    def test_an_update_keeps_the_scroll_position(self):
+        body = "".join(f"<p>row {i}</p>" for i in range(200))
+        viewer = self.slot._show_report(None, body, "Info", (640, 400), False)
+        bar = viewer.text_edit.verticalScrollBar()
+        bar.setValue(bar.maximum() // 2)
+        position = bar.value()
+        self.slot._show_report(viewer, body + "<p>more</p>", "Info", (640, 400), False)
+        self.assertEqual(bar.value(), position)
+
+    def test_closing_the_viewer_stops_the_report(self):
+        built = []
+
+        def sections():
+            for i in range(5):
+                built.append(i)
+                if i == 1:
+                    self.sb.viewers[0].visible = False  # the user closed it
+                yield f"<p>{i}</p>"
+
+        job = self.slot.stream_report(sections(), name="Scene Info")
+        self._wait(job)
+        self.assertTrue(job.cancelled)
+        self.assertEqual(built, [0, 1])
+        self.assertEqual(len(self.sb.viewers[0].texts), 1)
+
+    def test_an_empty_report_says_so_instead(self):
+        job = self.slot.stream_report(iter(["", ""]), name="Info", empty="Nothing.")
+        self._wait(job)
+        self.assertEqual(self.sb.viewers, [])
+        self.assertEqual(self.sb.messages, ["Nothing."])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the headless slots-layer bench (``test/bench/slots_headless.py``).
+
+The regression gate runs against hand-made results; one sample per host runs end to end
+in a child interpreter — the real ``.ui`` files and slot classes against the stubbed,
+canned engines — checking the result's shape and that the canned scene reached the
+benched paths, never its timings (those belong to the bench's own baseline gate).
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH = ROOT / "test" / "bench" / "slots_headless.py"
+
+_spec = importlib.util.spec_from_file_location("slots_headless", BENCH)
+slots_headless = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(slots_headless)
+
+
+def _result(**phases):
+    return {"phases_ms_best": dict(phases), "phases_ms_median": dict(phases)}
+
+
+class TestGate(unittest.TestCase):
+    def test_a_phase_regresses_past_ten_percent_and_the_floor(self):
+        baseline = _result(a=100.0, b=100.0, c=5.0)
+        current = _result(a=109.0, b=115.0, c=6.5)  # c: +30% but under MIN_MS
+        self.assertEqual(
+            slots_headless.compare(current, baseline), [("b", 100.0, 115.0)]
+        )
+
+    def test_medians_are_compared_when_both_sides_have_them(self):
+        baseline = {"phases_ms_best": {"a": 50.0}, "phases_ms_median": {"a": 100.0}}
+        current = {"phases_ms_best": {"a": 90.0}, "phases_ms_median": {"a": 100.0}}
+        self.assertEqual(slots_headless.compare(current, baseline), [])
+        del baseline["phases_ms_median"]
+        self.assertEqual(slots_headless.compare(current, baseline), [("a", 50.0, 90.0)])
+
+    def test_a_sub_50_ms_phase_needs_the_absolute_floor(self):
+        baseline, current = _result(warm=20.3), _result(warm=25.0)
+        self.assertEqual(slots_headless.compare(current, baseline), [])
+        current = _result(warm=25.5)
+        self.assertEqual(slots_headless.compare(current, baseline), [("warm", 20.3, 25.5)])
+
+    def test_a_noisy_phase_needs_to_clear_its_spread(self):
+        baseline = _result(init=140.0)
+        baseline["all_samples"] = [{"init": ms} for ms in (120, 130, 140, 150, 160)]
+        current = _result(init=170.0)
+        current["all_samples"] = [{"init": ms} for ms in (150, 160, 170, 180, 190)]
+        self.assertEqual(slots_headless.compare(current, baseline), [])  # 30 < 3 * (10 + 10)
+        current["phases_ms_median"]["init"] = 201.0
+        self.assertEqual(slots_headless.compare(current, baseline), [("init", 140.0, 201.0)])
+
+    def test_the_gate_refuses_fewer_than_min_samples(self):
+        with self.assertRaises(SystemExit):
+            slots_headless.main(["--samples", str(slots_headless.MIN_SAMPLES - 1)])
+
+    def test_aggregate_has_the_run_in_maya_shape(self):
+        samples = [
+            {"ui": "headless", "host": "maya", "phases_ms_best": {"01_import": ms}}
+            for ms in (30.0, 10.0, 20.0)
+        ]
+        result = slots_headless.aggregate(samples, label="x")
+        self.assertEqual(result["phases_ms_best"], {"01_import": 10.0})
+        self.assertEqual(result["phases_ms_median"], {"01_import": 20.0})
+        self.assertEqual(len(result["all_samples"]), 3)
+
+    def test_the_representative_uis_are_the_option_box_benchs(self):
+        self.assertIn("edit", slots_headless.REPRESENTATIVE_UIS)
+        self.assertEqual(len(slots_headless.REPRESENTATIVE_UIS), 6)
+
+    def test_the_baselines_are_comparable(self):
+        for host in slots_headless.HOSTS:
+            path = BENCH.parent / f"bench_slots_headless_{host}.json"
+            baseline = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual(slots_headless.compare(baseline, baseline), [])
+            self.assertIn("02_register", baseline["phases_ms_median"])
+
+
+class TestHeadlessSample(unittest.TestCase):
+    """One cold sample per host, in a child interpreter."""
+
+    def _sample(self, host):
+        out = os.path.join(tempfile.mkdtemp(), "sample.json")
+        proc = subprocess.run(
+            [sys.executable, str(BENCH), "--host", host, "--sample", out],
+            env=dict(
+                os.environ,
+                QT_QPA_PLATFORM="offscreen",
+                TENTACLE_CACHE_DIR=tempfile.mkdtemp(),
+                TENTACLE_TELEMETRY="0",
+            ),
+            capture_output=True,
+            timeout=300,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr.decode(errors="replace")[-2000:])
+        return json.loads(Path(out).read_text(encoding="utf-8"))
+
+    def _check(self, result, host):
+        phases = result["phases_ms_best"]
+        self.assertEqual(result["host"], host)
+        for name in slots_headless.REPRESENTATIVE_UIS:
+            self.assertIn(f"03_init_{name}", phases)
+        for phase in ("02_register", "05_hud_build_warm", "07_material_list_warm"):
+            self.assertIn(phase, phases)
+        self.assertEqual(result["material_count"], slots_headless.SCENE["materials"])
+
+    def test_maya(self):
+        self._check(self._sample("maya"), "maya")
+
+    def test_blender(self):
+        self._check(self._sample("blender"), "blender")
+
+
+if __name__ == "__main__":
+    unittest.main()
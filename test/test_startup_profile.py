@@ -0,0 +1,274 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the cold-start profiler (``tentacle/startup_profile.py``) and its launcher wiring.
+
+DCC-free: spans, import timing and the method hooks are exercised against throwaway
+modules and classes; the regression gate against hand-made reports; and one end-to-end
+run drives the headless bench (``test/bench/startup_profile.py``) — a real ``TclMaya``
+against stubbed engines — in a child interpreter, checking the report's shape (never its
+timings, which belong to the bench's own baseline gate).
+"""
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.startup_profile import StartupProfile, _TimedLoader  # noqa: E402
+from tentacle.tcl import Tcl  # noqa: E402
+
+BENCH = ROOT / "test" / "bench" / "startup_profile.py"
+
+
+def _entry(report, category, name):
+    return next(e for e in report[category] if e["name"] == name)
+
+
+class TestSpans(unittest.TestCase):
+    def test_phases_are_numbered_and_nest_self_time(self):
+        with StartupProfile(host="test") as profile:
+            with profile.phase("construct"):
+                with profile.span("slot", "Outer"):
+                    time.sleep(0.02)
+                    with profile.span("slot", "Inner"):
+                        time.sleep(0.02)
+        report = profile.report()
+        self.assertEqual(list(report["phases_ms"]), ["01_construct"])
+        outer, inner = _entry(report, "slots", "Outer"), _entry(report, "slots", "Inner")
+        self.assertGreaterEqual(outer["ms"], inner["ms"] + 15)
+        self.assertLess(outer["self_ms"], outer["ms"] - 15)  # Inner is not Outer's own time
+        self.assertAlmostEqual(report["totals_ms"]["slots"], outer["ms"], delta=1)
+
+    def test_trace_events_are_chrome_complete_events(self):
+        with StartupProfile() as profile:
+            with profile.phase("import"):
+                pass
+        (event,) = profile.report()["traceEvents"]
+        self.assertEqual(
+            (event["name"], event["cat"], event["ph"]), ("01_import", "phase", "X")
+        )
+        self.assertGreaterEqual(event["dur"], 0)
+
+    def test_an_idle_profile_records_nothing(self):
+        profile = StartupProfile()
+        with profile.phase("construct"), profile.span("slot", "X"):
+            pass
+        self.assertEqual(profile.report()["traceEvents"], [])
+
+    def test_other_threads_are_not_recorded(self):
+        with StartupProfile() as profile:
+            worker = threading.Thread(target=lambda: profile.span("slot", "bg").__enter__())
+            worker.start()
+            worker.join()
+        self.assertEqual(profile.report()["slots"], [])
+
+
+class TestImportTiming(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        Path(self.dir, "_sp_outer.py").write_text("import _sp_inner\n", encoding="utf-8")
+        Path(self.dir, "_sp_inner.py").write_text(
+            "import time\ntime.sleep(0.02)\n", encoding="utf-8"
+        )
+        sys.path.insert(0, self.dir)
+        self.addCleanup(sys.path.remove, self.dir)
+        for name in ("_sp_outer", "_sp_inner"):
+            self.addCleanup(sys.modules.pop, name, None)
+        importlib.invalidate_caches()
+
+    def test_imports_are_timed_inclusive_and_self(self):
+        with StartupProfile() as profile:
+            import _sp_outer  # noqa: F401
+        report = profile.report()
+        outer = _entry(report, "imports", "_sp_outer")
+        inner = _entry(report, "imports", "_sp_inner")
+        self.assertGreaterEqual(inner["ms"], 15)
+        self.assertGreaterEqual(outer["ms"], inner["ms"])
+        self.assertLess(outer["self_ms"], inner["ms"])
+
+    def test_the_real_loader_is_restored_and_the_finder_removed(self):
+        with StartupProfile() as profile:
+            import _sp_outer
+        self.assertNotIsInstance(_sp_outer.__loader__, _TimedLoader)
+        self.assertNotIsInstance(_sp_outer.__spec__.loader, _TimedLoader)
+        self.assertNotIn(profile._finder, sys.meta_path)
+
+
+class _Board:
+    def load_ui(self, file):
+        return file
+
+
+class _SubBoard(_Board):
+    pass
+
+
+class TestMethodHooks(unittest.TestCase):
+    HOOKS = {"load_ui": ("ui", lambda _self, file: os.path.basename(file))}
+
+    def test_calls_are_timed_and_the_method_restored(self):
+        original = _Board.__dict__["load_ui"]
+        with StartupProfile() as profile:
+            profile.hook_methods(_Board, self.HOOKS)
+            self.assertEqual(_Board().load_ui("/x/hud.ui"), "/x/hud.ui")
+        self.assertIs(_Board.__dict__["load_ui"], original)
+        self.assertEqual([e["name"] for e in profile.report()["ui"]], ["hud.ui"])
+
+    def test_an_inherited_method_is_unshadowed_on_stop(self):
+        with StartupProfile() as profile:
+            profile.hook_methods(_SubBoard, self.HOOKS)
+            self.assertIn("load_ui", _SubBoard.__dict__)
+        self.assertNotIn("load_ui", _SubBoard.__dict__)
+
+    def test_switchboard_hooks_name_real_methods(self):
+        """A renamed uitk method would silently drop its category from every report."""
+        from uitk import Switchboard
+
+        for attr in StartupProfile.SWITCHBOARD_HOOKS:
+            self.assertTrue(callable(getattr(Switchboard, attr, None)), attr)
+
+
+class TestCompare(unittest.TestCase):
+    BASE = {
+        "phases_ms": {"01_import": 500.0, "02_construct": 2000.0},
+        "totals_ms": {"ui": 60.0},
+        "ui": [{"name": "hud#startmenu.ui", "ms": 12.0}],
+        "slots": [{"name": "HudSlots", "ms": 100.0}],
+    }
+
+    def _with(self, **changes):
+        report = json.loads(json.dumps(self.BASE))
+        for key, value in changes.items():
+            section, name = key.split("__")
+            if section in ("phases_ms", "totals_ms"):
+                report[section][name] = value
+            else:
+                report[section][0]["ms"] = value
+        return report
+
+    def test_within_budget(self):
+        self.assertEqual(StartupProfile.compare(self.BASE, self.BASE), [])
+
+    def test_a_slow_phase_and_slot_regress(self):
+        current = self._with(phases_ms__02_construct=2300.0, slots__HudSlots=125.0)
+        self.assertEqual(
+            StartupProfile.compare(current, self.BASE),
+            [("phase:02_construct", 2000.0, 2300.0), ("slots:HudSlots", 100.0, 125.0)],
+        )
+
+    def test_small_absolute_slowdowns_are_noise(self):
+        current = self._with(ui__hud=18.0)  # +50%, but only 6 ms
+        self.assertEqual(StartupProfile.compare(current, self.BASE), [])
+
+    def test_speedups_and_new_entries_never_regress(self):
+        current = self._with(phases_ms__01_import=100.0)
+        current["slots"].append({"name": "NewSlots", "ms": 900.0})
+        self.assertEqual(StartupProfile.compare(current, self.BASE), [])
+
+    def test_tolerance_is_tunable(self):
+        current = self._with(phases_ms__02_construct=2300.0)
+        self.assertEqual(StartupProfile.compare(current, self.BASE, tolerance=0.2), [])
+
+
+class TestRequest(unittest.TestCase):
+    def test_off_unless_asked(self):
+        with mock.patch.dict(os.environ, {StartupProfile.ENV: ""}):
+            self.assertIsNone(StartupProfile.from_request(None))
+        with mock.patch.dict(os.environ, {StartupProfile.ENV: "0"}):
+            self.assertIsNone(StartupProfile.from_request(None))
+        self.assertIsNone(StartupProfile.from_request(False))
+
+    def test_env_true_or_path(self):
+        with mock.patch.dict(os.environ, {StartupProfile.ENV: "1"}):
+            self.assertIsNone(StartupProfile.from_request(None).path)
+        with mock.patch.dict(os.environ, {StartupProfile.ENV: "/tmp/p.json"}):
+            self.assertEqual(StartupProfile.from_request(None).path, "/tmp/p.json")
+
+    def test_the_kwarg_outranks_the_env(self):
+        with mock.patch.dict(os.environ, {StartupProfile.ENV: "1"}):
+            self.assertIsNone(StartupProfile.from_request(False))
+
+    def test_default_report_lands_in_the_cache_dir(self):
+        cache = tempfile.mkdtemp()
+        with mock.patch.dict(os.environ, {Tcl.CACHE_DIR_ENV: cache}):
+            with StartupProfile(host="maya") as profile:
+                pass
+            path = profile.write()
+        self.assertEqual(Path(path).parent, Path(cache, "profiles"))
+        self.assertTrue(Path(path).name.startswith("startup-maya-"))
+
+
+class TestLaunchWiring(unittest.TestCase):
+    def test_profile_is_forwarded_only_when_given(self):
+        with mock.patch.object(Tcl, "host", classmethod(lambda cls: "max")):
+            with mock.patch.object(Tcl, "_launch_max") as launcher:
+                Tcl.launch(key_show="Z")
+                launcher.assert_called_once_with(key_show="Z")
+                launcher.reset_mock()
+                Tcl.launch(profile=True)
+                launcher.assert_called_once_with(profile=True)
+
+    def test_a_profiled_launch_writes_its_phases(self):
+        out = os.path.join(tempfile.mkdtemp(), "startup.json")
+        entry = mock.MagicMock(return_value="menu")
+        with mock.patch.object(Tcl, "_import_entry", return_value=entry):
+            with mock.patch("builtins.print"):
+                self.assertEqual(Tcl._launch_max(profile=out, log_level="DEBUG"), "menu")
+        entry.assert_called_once_with(log_level="DEBUG")
+        report = json.loads(Path(out).read_text(encoding="utf-8"))
+        self.assertEqual(list(report["phases_ms"]), ["01_import", "02_construct"])
+        self.assertEqual(report["host"], "max")
+
+    def test_a_failed_startup_still_writes_its_report(self):
+        out = os.path.join(tempfile.mkdtemp(), "startup.json")
+        entry = mock.MagicMock(side_effect=RuntimeError("no Qt"))
+        with mock.patch.object(Tcl, "_import_entry", return_value=entry):
+            with mock.patch("builtins.print"), self.assertRaises(RuntimeError):
+                Tcl._launch_max(profile=out)
+        self.assertTrue(os.path.exists(out))
+
+
+class TestHeadlessGate(unittest.TestCase):
+    """One stubbed-engine ``TclMaya`` cold start, profiled in a child interpreter."""
+
+    def test_headless_sample_reports_every_category(self):
+        out = os.path.join(tempfile.mkdtemp(), "sample.json")
+        proc = subprocess.run(
+            [sys.executable, str(BENCH), "--sample", out],
+            env=dict(
+                os.environ,
+                QT_QPA_PLATFORM="offscreen",
+                TENTACLE_CACHE_DIR=tempfile.mkdtemp(),  # the .ui cache warms here
+            ),
+            capture_output=True,
+            timeout=300,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr.decode(errors="replace")[-2000:])
+        report = json.loads(Path(out).read_text(encoding="utf-8"))
+        self.assertEqual(
+            list(report["phases_ms"]), ["01_import", "02_construct", "03_lazy_load_ui"]
+        )
+        self.assertIn("tentacle.tcl_maya", {e["name"] for e in report["imports"]})
+        self.assertIn("hud#startmenu.ui", {e["name"] for e in report["ui"]})
+        self.assertIn("HudSlots", {e["name"] for e in report["slots"]})
+
+    def test_the_baseline_is_comparable(self):
+        baseline = json.loads(
+            (BENCH.parent / "bench_startup_headless.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(StartupProfile.compare(baseline, baseline), [])
+        self.assertIn("02_construct", baseline["phases_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared node-type index (``tentacle/slots/_type_index.py``).
+
+``TypeIndex`` is DCC-agnostic: the engine only supplies a scan, an event resolver and
+the type hierarchy. A fake engine whose scene is a ``{id: type}`` dict exercises the
+queries, the queued add / remove events and the rescan after ``mark_stale`` — without
+``maya.cmds`` / ``bpy``.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._type_index import TypeIndex  # noqa: E402
+
+
+class _FakeIndex(TypeIndex):
+    """The scene is ``{id: type}``; an added event names an id, resolved at query time."""
+
+    DERIVED = {"transform": ("transform", "joint"), "shape": ("mesh", "locator")}
+
+    def __init__(self, scene=None):
+        super().__init__()
+        self.scene = {} if scene is None else scene
+        self.expanded = []
+
+    def _scan(self):
+        return list(self.scene.items())
+
+    def _resolve(self, node):
+        if isinstance(node, tuple):
+            return node
+        node_type = self.scene.get(node)
+        return None if node_type is None else (node, node_type)
+
+    def _expand(self, node_type):
+        self.expanded.append(node_type)
+        return self.DERIVED.get(node_type, (node_type,))
+
+    # The engine side: edit the scene, then fire the event.
+    def create(self, node_id, node_type):
+        self.scene[node_id] = node_type
+        self.added(node_id)
+
+    def delete(self, node_id):
+        self.removed((node_id, None))
+        del self.scene[node_id]
+
+
+class TestTypeIndex(unittest.TestCase):
+    def setUp(self):
+        self.scene = {"t1": "transform", "t2": "transform", "j1": "joint", "m1": "mesh"}
+        self.index = _FakeIndex(dict(self.scene))
+
+    def test_queries_expand_abstract_types(self):
+        i = self.index
+        self.assertEqual(i.ids("transform"), {"t1", "t2", "j1"})
+        self.assertEqual(i.ids("transform", exact=True), {"t1", "t2"})
+        self.assertEqual(i.count(["joint", "shape"]), 2)
+        self.assertEqual(i.count("camera"), 0)
+        self.assertEqual(i.types(), {"transform": 2, "joint": 1, "mesh": 1})
+
+    def test_repeat_queries_scan_and_expand_once(self):
+        i = self.index
+        for _ in range(3):
+            i.ids("transform")
+            i.count("shape")
+        self.assertEqual(i.scans, 1)
+        self.assertEqual(i.expanded, ["transform", "shape"])
+
+    def test_events_update_the_sets_without_a_rescan(self):
+        i = self.index
+        i.ids("shape")
+        i.create("l1", "locator")
+        i.delete("t1")
+        self.assertEqual(i.ids("shape"), {"m1", "l1"})
+        self.assertEqual(i.ids("transform"), {"t2", "j1"})
+        self.assertEqual(i.scans, 1)
+
+    def test_a_node_gone_before_the_query_is_skipped(self):
+        i = self.index
+        i.count("mesh")
+        i.create("m2", "mesh")
+        i.delete("m2")
+        self.assertEqual(i.ids("mesh"), {"m1"})
+
+    def test_events_before_the_first_scan_are_not_queued(self):
+        i = self.index
+        i.create("m2", "mesh")
+        self.assertEqual(i._events, [])
+        self.assertEqual(i.ids("mesh"), {"m1", "m2"})
+
+    def test_mark_stale_drops_the_queue_and_rescans(self):
+        i = self.index
+        i.count("mesh")
+        i.create("m2", "mesh")
+        i.mark_stale()
+        i.scene = {"m9": "mesh"}  # a new scene opened
+        self.assertEqual(i._events, [])
+        self.assertEqual(i.ids("mesh"), {"m9"})
+        self.assertEqual(i.scans, 2)
+
+    def test_types_changed_re_expands_on_the_next_query(self):
+        i = self.index
+        i.ids("shape")
+        i.DERIVED = dict(i.DERIVED, shape=("mesh", "locator", "pluginShape"))
+        i.scene["p1"] = "pluginShape"
+        i.mark_stale()
+        self.assertEqual(i.ids("shape"), {"m1"})  # the cached expansion still applies
+        i.types_changed()
+        self.assertEqual(i.ids("shape"), {"m1", "p1"})
+        self.assertEqual(i.expanded, ["shape", "shape"])
+
+    def test_instance_is_per_subclass(self):
+        self.assertIs(_FakeIndex.instance(), _FakeIndex.instance())
+        self.assertIsNot(_FakeIndex.instance(), TypeIndex.instance())
+
+
+if __name__ == "__main__":
+    unittest.main()
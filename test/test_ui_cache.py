@@ -0,0 +1,152 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the compiled ``.ui`` cache (``tentacle/ui_cache.py``).
+
+DCC-free: a real ``Switchboard`` (offscreen Qt) loads copies of shipped tentacle panels
+through :class:`UiCache` with ``TENTACLE_CACHE_DIR`` pointed at a temp dir. Covered: the
+cache layout is versioned and keyed per source path, a cached panel builds the same
+widget tree ``QUiLoader`` does, a miss loads through ``QUiLoader`` while the compile runs
+in the background, an edited ``.ui`` invalidates its entry, a missing ``uic`` turns the
+cache off instead of breaking loads, and both entry classes install it.
+"""
+import ast
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from qtpy import QtWidgets
+
+from tentacle.ui_cache import UiCache
+
+ROOT = Path(__file__).resolve().parent.parent
+UI_DIR = ROOT / "tentacle" / "ui"
+PANEL = "crease#submenu.ui"
+
+
+class _UiCacheCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        from uitk import Switchboard
+
+        cls.sb = Switchboard()
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.src_dir = tempfile.mkdtemp()
+        env = mock.patch.dict(os.environ, {"TENTACLE_CACHE_DIR": self.cache_dir})
+        env.start()
+        self.addCleanup(env.stop)
+        self.ui = Path(shutil.copy(UI_DIR / PANEL, self.src_dir))
+        self.cache = UiCache(self.sb)
+
+    def _wait(self, future):
+        return [f.result(timeout=60) for f in future.result(timeout=60)]
+
+
+class TestLayout(_UiCacheCase):
+    def test_cache_lives_in_a_versioned_user_dir(self):
+        root = Path(UiCache.cache_root())
+        self.assertEqual(root.parent, Path(self.cache_dir, "ui"))
+        self.assertIn(f"v{UiCache.FORMAT}-", root.name)
+
+    def test_entries_are_keyed_per_source_path(self):
+        """Same file name in two directories (ui/ vs ui/maya_menus): two entries."""
+        other = Path(tempfile.mkdtemp(), PANEL)
+        self.assertNotEqual(UiCache.cached_path(self.ui), UiCache.cached_path(other))
+
+    def test_source_files_cover_every_menu_set(self):
+        parents = {p.parent.name for p in UiCache.source_files()}
+        self.assertTrue({"ui", "maya_menus", "blender_menus"} <= parents, parents)
+
+
+class TestCompiledLoad(_UiCacheCase):
+    def test_a_cached_panel_matches_the_xml_build(self):
+        self.cache.compile(self.ui)
+        with mock.patch.object(self.cache._runtime, "load") as xml:
+            cached = self.cache.load(str(self.ui))
+        xml.assert_not_called()
+        reference = self.cache._runtime.load(str(self.ui))
+
+        def names(w):
+            return sorted(c.objectName() for c in w.findChildren(QtWidgets.QWidget))
+
+        self.assertEqual(type(cached).__name__, type(reference).__name__)
+        self.assertEqual(names(cached), names(reference))
+
+    def test_tags_come_from_the_cached_header(self):
+        self.cache.compile(self.ui)
+        with mock.patch.object(self.cache._runtime, "read_ui_tags") as xml:
+            tags = self.cache.read_ui_tags(str(self.ui))
+        xml.assert_not_called()
+        self.assertEqual(tags, self.cache._runtime.read_ui_tags(str(self.ui)))
+
+
+class TestMisses(_UiCacheCase):
+    def test_a_miss_loads_the_xml_and_compiles_in_the_background(self):
+        widget = self.cache.load(str(self.ui))
+        self.assertIsInstance(widget, QtWidgets.QWidget)
+        self.cache.join(timeout=60)
+        self.assertTrue(UiCache.is_fresh(self.ui))
+
+    def test_an_unimportable_entry_is_rebuilt_off_the_ui_thread(self):
+        self.cache.compile(self.ui)
+        threads = []
+        compile_ui = self.cache.compile
+
+        def compile(path):
+            threads.append(threading.current_thread())
+            return compile_ui(path)
+
+        with mock.patch.object(UiCache, "_exec", side_effect=ImportError("header")):
+            with mock.patch.object(self.cache, "compile", side_effect=compile):
+                for _ in range(2):
+                    widget = self.cache.load(str(self.ui))
+                    self.assertIsInstance(widget, QtWidgets.QWidget)
+                self.cache.join(timeout=60)
+        self.assertEqual(len(threads), 1)  # rebuilt once, not on every load
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_warm_compiles_only_stale_files(self):
+        self.assertEqual(len(self._wait(self.cache.warm([self.ui]))), 1)
+        self.assertEqual(self._wait(self.cache.warm([self.ui])), [])
+
+    def test_an_edited_ui_invalidates_its_entry(self):
+        self.cache.compile(self.ui)
+        self.ui.write_text(
+            self.ui.read_text(encoding="utf-8") + "\n<!-- edited -->\n", encoding="utf-8"
+        )
+        self.assertFalse(UiCache.is_fresh(self.ui))
+        self.cache.on_tags_written(str(self.ui))
+        self.cache.join(timeout=60)
+        self.assertTrue(UiCache.is_fresh(self.ui))
+
+    def test_no_uic_turns_the_cache_off(self):
+        with mock.patch(
+            "tentacle.ui_cache.UiCompiler.compile_ui", side_effect=FileNotFoundError("uic")
+        ):
+            self.cache.load(str(self.ui))
+            self.cache.join(timeout=60)
+        self.assertTrue(self.cache.unavailable)
+        self.assertIsNone(self.cache.warm([self.ui]))
+        self.assertIsInstance(self.cache.load(str(self.ui)), QtWidgets.QWidget)
+
+
+class TestEntryClassesInstallIt(unittest.TestCase):
+    def test_maya_and_blender_install_the_cache(self):
+        for name in ("tcl_maya.py", "tcl_blender.py"):
+            source = (ROOT / "tentacle" / name).read_text(encoding="utf-8")
+            calls = [
+                ast.unparse(n.func)
+                for n in ast.walk(ast.parse(source))
+                if isinstance(n, ast.Call)
+            ]
+            self.assertIn("UiCache.install", calls, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
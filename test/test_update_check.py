@@ -0,0 +1,219 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the shared ecosystem update check (``_UpdateCheck`` in
+``tentacle/slots/_settings.py``).
+
+The check used to run twice, synchronously: the Maya HUD started its own
+``PackageManager`` version thread, and the Update Package button ran ``pip list`` plus
+one index round trip per dist on the Qt thread — a multi-second freeze behind a slow
+proxy. Both now read one background answer cached on disk per interpreter. Covered
+here, DCC-free, against a local stand-in index (``TENTACLE_UPDATE_INDEX``): a fresh
+answer is reused without asking pip or the index, concurrent readers share one check,
+a process that finds another's lock adopts its result, a failed check is remembered
+only briefly and never reads as "outdated", and the Maya HUD reads the shared answer.
+"""
+import ast
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from tentacle.slots._settings import SettingsMixin, _UpdateCheck
+
+ROOT = Path(__file__).resolve().parent.parent
+MAYA_HUD = ROOT / "tentacle" / "slots" / "maya" / "hud.py"
+
+DISTS = ("pythontk", "uitk", "tentacletk")
+
+
+class _IndexHandler(BaseHTTPRequestHandler):
+    """``/pypi/<dist>/json`` with PyPI's layout; 404 for anything it doesn't carry."""
+
+    releases = {}
+    hits = []
+
+    def do_GET(self):
+        dist = self.path.split("/")[2]
+        type(self).hits.append(dist)
+        version = type(self).releases.get(dist)
+        if version is None:
+            self.send_error(404)
+            return
+        body = json.dumps({"info": {"version": version}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+class _FakePkgMgr:
+    """Only ``list_packages`` is reached: the stand-in index answers the rest."""
+
+    installed = {}
+    calls = 0
+
+    def __init__(self, python_path=None):
+        self.python_path = python_path
+
+    def list_packages(self):
+        type(self).calls += 1
+        return dict(type(self).installed)
+
+
+def _dists_for(_installed):
+    return DISTS
+
+
+class _UpdateCheckCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("127.0.0.1", 0), _IndexHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.index = f"http://127.0.0.1:{cls.server.server_port}/pypi/{{dist}}/json"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        env = {"TENTACLE_CACHE_DIR": self.cache_dir, _UpdateCheck.INDEX_ENV: self.index}
+        for p in (
+            patch.dict(os.environ, env),
+            patch("tentacle.slots._settings.ptk.PackageManager", _FakePkgMgr),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        _UpdateCheck._futures.clear()
+        _FakePkgMgr.installed = {d: "1.0" for d in DISTS}
+        _FakePkgMgr.calls = 0
+        _IndexHandler.releases = {d: "1.0" for d in DISTS}
+        _IndexHandler.hits = []
+
+    def _result(self, python_path="py", max_age=None):
+        return SettingsMixin.start_update_check(python_path, max_age, _dists_for).result(
+            timeout=10
+        )
+
+
+class TestSharedAnswer(_UpdateCheckCase):
+    def test_reads_the_stand_in_index(self):
+        _IndexHandler.releases["uitk"] = "1.1"
+        rows = SettingsMixin.outdated_dists(self._result())
+        self.assertEqual(rows, [("uitk", "1.0", "1.1")])
+
+    def test_a_fresh_answer_asks_nobody(self):
+        self._result()
+        _UpdateCheck._futures.clear()  # a new process: only the disk remains
+        self._result()
+        self.assertEqual(_FakePkgMgr.calls, 1)
+        self.assertEqual(len(_IndexHandler.hits), len(DISTS))
+
+    def test_a_stricter_reader_rechecks(self):
+        self._result()
+        time.sleep(0.05)
+        self._result(max_age=0.01)  # an explicit Update click wants it newer
+        self.assertEqual(_FakePkgMgr.calls, 2)
+
+    def test_concurrent_readers_share_one_check(self):
+        futures = [
+            SettingsMixin.start_update_check("py", None, _dists_for) for _ in range(5)
+        ]
+        self.assertEqual(len({id(f) for f in futures}), 1)
+        futures[0].result(timeout=10)
+        self.assertEqual(_FakePkgMgr.calls, 1)
+
+    def test_interpreters_do_not_share_an_answer(self):
+        self._result("mayapy")
+        self._result("blender-python")
+        self.assertEqual(_FakePkgMgr.calls, 2)
+
+    def test_invalidate_forces_a_recheck(self):
+        self._result()
+        _UpdateCheck.invalidate("py")
+        self._result()
+        self.assertEqual(_FakePkgMgr.calls, 2)
+
+
+class TestFailures(_UpdateCheckCase):
+    def test_unreachable_index_is_an_error_not_outdated(self):
+        _IndexHandler.releases = {}
+        result = self._result()
+        self.assertTrue(result["error"])
+        self.assertEqual(SettingsMixin.outdated_dists(result), [])
+
+    def test_a_failure_is_remembered_only_briefly(self):
+        _IndexHandler.releases = {}
+        result = self._result()
+        self.assertTrue(_UpdateCheck.is_fresh(result))
+        result["checked_at"] -= _UpdateCheck.FAILURE_TTL + 1
+        self.assertFalse(_UpdateCheck.is_fresh(result))
+        result["error"] = None
+        self.assertTrue(_UpdateCheck.is_fresh(result))  # a success lives for TTL
+
+    def test_a_raising_check_is_retried_by_the_next_reader(self):
+        with patch.object(
+            _FakePkgMgr, "list_packages", side_effect=RuntimeError("pip broke")
+        ):
+            future = SettingsMixin.start_update_check("py", None, _dists_for)
+            self.assertIsInstance(future.exception(timeout=10), RuntimeError)
+        self.assertFalse(self._result()["error"])
+
+
+class TestCrossProcessLock(_UpdateCheckCase):
+    def _lock(self, python_path="py"):
+        return _UpdateCheck.cache_path(python_path) + ".lock"
+
+    def test_a_held_lock_adopts_the_holders_answer(self):
+        """Another session is mid-check: wait for its file instead of asking again."""
+        Path(self._lock()).touch()
+        theirs = {
+            "checked_at": time.time(),
+            "installed": {"tentacletk": "1.0"},
+            "latest": {"tentacletk": "2.0"},
+            "dists": ["tentacletk"],
+            "error": None,
+        }
+        timer = threading.Timer(0.3, _UpdateCheck.write, ("py", theirs))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        result = self._result()
+        self.assertEqual(result["latest"], {"tentacletk": "2.0"})
+        self.assertEqual(_FakePkgMgr.calls, 0)
+
+    def test_a_stale_lock_is_broken(self):
+        lock = self._lock()
+        Path(lock).touch()
+        old = time.time() - _UpdateCheck.LOCK_STALE - 1
+        os.utime(lock, (old, old))
+        self._result()
+        self.assertEqual(_FakePkgMgr.calls, 1)
+        self.assertFalse(os.path.exists(lock))
+
+
+class TestMayaHudReadsTheSharedCheck(unittest.TestCase):
+    """The HUD no longer runs a second, private version check of its own."""
+
+    def test_no_private_package_manager(self):
+        tree = ast.parse(MAYA_HUD.read_text(encoding="utf-8"))
+        cls = next(
+            n for n in ast.walk(tree) if isinstance(n, ast.ClassDef) and n.name == "HudSlots"
+        )
+        self.assertNotIn("ptk.PackageManager", [ast.unparse(b) for b in cls.bases])
+        source = ast.unparse(cls)
+        self.assertNotIn("start_version_check", source)
+        self.assertIn("SettingsMixin.start_update_check", source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1280,6 +1280,8 @@ class TestTb000Pack(unittest.TestCase):
     - layoutScaleMode omitted == Uniform; 1 keeps shell scale exactly.
     - tileU/tileV distribute shells across a grid anchored at the pack box.
     - A single-mesh batch failure reports directly — no redundant probe pass.
+    - A multi-mesh failure is isolated by bisection; non-manifold meshes are
+      screened out before the batch.
     """
 
     @classmethod
@@ -1392,6 +1394,53 @@ class TestTb000Pack(unittest.TestCase):
         self.assertIn("Skipped: 1", text)
         self.assertIn("non-manifold", text)
 
+    def test_bisection_isolates_a_bad_mesh_in_log_calls(self):
+        """One bad mesh among 16: bisection costs the batch, two calls per
+        halving (4 levels) and the survivors' combined re-pack — 10 calls,
+        where probing every mesh cost 18."""
+        objs = [cmds.polyCube(name=f"pack{i}", ch=False)[0] for i in range(16)]
+        cmds.select(objs)
+        real, calls = cmds.u3dLayout, []
+
+        def layout(uvs, **kwargs):
+            calls.append(uvs)
+            if any(str(uv).startswith("pack5.") for uv in uvs):
+                raise RuntimeError("u3dLayout: overlapping UVs detected")
+            return real(uvs, **kwargs)
+
+        with mock.patch.object(uv_module.cmds, "u3dLayout", side_effect=layout):
+            self.instance.tb000(widget=_FakeTb000Widget())
+
+        self.assertEqual(len(calls), 10)
+        text = self._message_text()
+        self.assertIn("Packed: 15", text)
+        self.assertIn("pack5</b>: overlapping UVs", text)
+        self.assertIn("Pack Calls:</b> 10", text)
+
+    def test_non_manifold_meshes_are_screened_before_the_batch(self):
+        a = cmds.polyCube(name="packA", ch=False)[0]
+        b = cmds.polyCube(name="packB", ch=False)[0]
+        cmds.select(a, b)
+        shape = cmds.listRelatives(b, shapes=True, fullPath=True)[0]
+        real, calls = cmds.u3dLayout, []
+
+        def layout(uvs, **kwargs):
+            calls.append(uvs)
+            return real(uvs, **kwargs)
+
+        with mock.patch.object(
+            uv_module.UvSlots,
+            "_non_manifold_vertices",
+            return_value={shape: [f"{b}.vtx[0]"]},
+        ), mock.patch.object(uv_module.cmds, "u3dLayout", side_effect=layout):
+            self.instance.tb000(widget=_FakeTb000Widget())
+
+        self.assertEqual(len(calls), 1, "the screened mesh never reaches a pack")
+        self.assertFalse(any("packB" in str(uv) for uv in calls[0]))
+        text = self._message_text()
+        self.assertIn("Skipped: 1", text)
+        self.assertIn("packB</b>: non-manifold vertices", text)
+
     def test_xatlas_method_packs_into_target_tile(self):
         """Method: xatlas dispatches to mtk.UvUtils.pack_uvs and honors the
         UDIM anchor + coverage; u3dLayout is never called."""
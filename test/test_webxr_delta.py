@@ -0,0 +1,338 @@
+#!/usr/bin/python
+# coding=utf-8
+"""Tests for the WebXR Live Update delta (``tentacle/slots/_webxr_delta.py``).
+
+``WebXrDelta`` writes into a real ``pythontk.PreviewServer`` root, served on a loopback
+port; a fake page client reads it back over HTTP the way ``_webxr_delta.js`` does —
+the manifest's version, then ``delta.json``, then each blob it has not fetched yet —
+so the tests see what crossed the wire. The engine is a fake whose scene is a dict:
+Z up in centimetres, so every value has to come out in glTF's Y up and metres.
+"""
+import json
+import sys
+import tempfile
+import types
+import unittest
+import urllib.request
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tentacle.slots._webxr_delta import WebXrDelta  # noqa: E402
+
+try:
+    import pythontk as ptk
+except ImportError:  # pragma: no cover - pythontk is a hard dependency
+    ptk = None
+
+
+def _maya_fork():
+    """``tentacle.slots.maya._slots_maya`` imported against stand-in ``maya`` modules.
+
+    Real module objects, not bare mocks (see ``test_tcl_launcher._fake_bpy``); the
+    fork is dropped from ``sys.modules`` again on the way out.
+    """
+    maya, api = types.ModuleType("maya"), types.ModuleType("maya.api")
+    cmds, om = types.ModuleType("maya.cmds"), types.ModuleType("maya.api.OpenMaya")
+    om.MSpace = mock.MagicMock()
+    om.MFnDependencyNode = mock.MagicMock()
+    maya.cmds, maya.api, api.OpenMaya = cmds, api, om
+    name = "tentacle.slots.maya._slots_maya"
+    stubs = {"maya": maya, "maya.cmds": cmds, "maya.api": api, "maya.api.OpenMaya": om}
+    with mock.patch.dict(sys.modules, stubs):
+        sys.modules.pop(name, None)
+        return __import__(name, fromlist=["MayaWebXrDelta"])
+
+
+def _translate(x, y, z):
+    matrix = np.eye(4)
+    matrix[:3, 3] = (x, y, z)
+    return matrix
+
+
+def _quad(z=0.0):
+    """Two triangles, one per material slot."""
+    return {
+        "position": [(0, 0, z), (100, 0, z), (100, 100, z), (0, 100, z)],
+        "normal": [(0, 0, 1)] * 4,
+        "uv": [(0, 0), (1, 0), (1, 1), (0, 1)],
+        "index": [0, 1, 2, 0, 2, 3],
+        "slot": [1, 0],
+    }
+
+
+class _FakeDelta(WebXrDelta):
+    """Nodes are names in ``scene["nodes"]``: ``{parent, matrix, mesh}``; a mesh is
+    ``{edits, materials, geometry}`` and a material a dict of values.
+    """
+
+    BASIS = ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, -1.0, 0.0))
+
+    def __init__(self, scene=None):
+        super().__init__()
+        self.scene = scene
+
+    def _unit(self):
+        return 0.01
+
+    def _nodes(self, objects):
+        nodes = self.scene["nodes"]
+        return [(n, nodes[n]["parent"], n) for n in nodes]  # inserted parents first
+
+    def _worlds(self, nodes):
+        def world(name):
+            node = self.scene["nodes"][name]
+            local = node["matrix"]
+            return local if node["parent"] is None else world(node["parent"]) @ local
+
+        return np.array([world(n) for n in nodes])
+
+    def _mesh(self, node):
+        return self.scene["nodes"][node]["mesh"]
+
+    def _signature(self, mesh):
+        return mesh["edits"]
+
+    def _materials(self, node, mesh):
+        return [(key, key) for key in mesh["materials"]]
+
+    def _geometry(self, mesh):
+        return mesh["geometry"]
+
+    def _material(self, material):
+        return dict(self.scene["materials"][material])
+
+
+class _Page:
+    """What ``_webxr_delta.js`` does, over HTTP, with the three.js half left out."""
+
+    def __init__(self, url):
+        self.url = url
+        self.blobs = {}
+        self.fetched = []
+        self.reset()
+
+    def get(self, path):
+        with urllib.request.urlopen(self.url + path) as response:
+            return response.read()
+
+    def reset(self):
+        """A model load: the manifest's version, nothing applied against it."""
+        self.version = json.loads(self.get("manifest.json"))["version"]
+        self.seq = 0
+        self.nodes, self.meshes, self.materials = {}, {}, {}
+
+    def blob(self, url):
+        if url not in self.blobs:
+            self.fetched.append(url)
+            self.blobs[url] = self.get(url)
+        return self.blobs[url]
+
+    def poll(self):
+        delta = json.loads(self.get(WebXrDelta.FILE))
+        if delta["base"] != self.version or delta["seq"] <= self.seq:
+            return False
+        for name, entry in delta["materials"].items():
+            if entry.get("map"):
+                self.blob(entry["map"])
+            self.materials[name] = entry
+        for name, entry in delta["nodes"].items():
+            self.nodes[name] = np.array(entry["delta"]).reshape(4, 4).T
+        for name, entry in delta["meshes"].items():
+            buffer = self.blob(entry["buffer"])
+            offset, count = entry["layout"]["position"]
+            points = np.frombuffer(buffer, np.float32, count * 3, offset).reshape(-1, 3)
+            world = np.array(entry["world"]).reshape(4, 4).T
+            self.meshes[name] = dict(entry, points=points, world=world)
+        self.seq = delta["seq"]
+        return True
+
+
+@unittest.skipIf(ptk is None, "pythontk is not installed")
+class TestWebXrDelta(unittest.TestCase):
+    OPTIONS = ("selection", True, True)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        tmp = Path(self.tmp.name)
+        self.texture = tmp / "albedo.png"
+        self.texture.write_bytes(b"\x89PNG not really" * 64)
+        self.scene = {
+            "nodes": {
+                "root": dict(parent=None, matrix=_translate(0, 0, 0), mesh=None),
+                "floor": dict(
+                    parent="root",
+                    matrix=_translate(0, 0, 0),
+                    mesh=dict(edits=0, materials=["tile", "grout"], geometry=_quad()),
+                ),
+                "lamp": dict(parent="root", matrix=_translate(0, 0, 200), mesh=None),
+            },
+            "materials": {
+                "tile": dict(color=(1, 1, 1, 1), roughness=0.4, map=str(self.texture)),
+                "grout": dict(color=(0.2, 0.2, 0.2, 1), roughness=0.9, map=None),
+            },
+        }
+        self.server = ptk.PreviewServer(root=tmp / "serve", viewer=False, port=0)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        glb = tmp / "scene.glb"
+        glb.write_bytes(b"glTF")
+        self.server.publish(glb)
+        self.delta = _FakeDelta(self.scene)
+        self.delta.rebase(self.server, None, self.server.version, self.OPTIONS)
+        self.page = _Page(self.server.url)
+
+    def push(self):
+        return self.delta.push(self.server, None, self.OPTIONS)
+
+    def test_a_move_sends_a_matrix_and_no_geometry(self):
+        self.scene["nodes"]["root"]["matrix"] = _translate(0, 0, 100)
+        sent = self.push()
+        self.assertEqual((sent["nodes"], sent["meshes"], sent["blobs"]), (3, 0, 0))
+        self.assertTrue(self.page.poll())
+        # 100 cm up Blender's Z is 1 m up glTF's Y — for the children too.
+        np.testing.assert_allclose(self.page.nodes["lamp"], _translate(0, 1, 0))
+        self.assertEqual(self.delta.read, 0)
+        self.assertFalse(self.page.poll())  # applied once
+
+    def test_an_edited_mesh_crosses_once(self):
+        floor = self.scene["nodes"]["floor"]["mesh"]
+        floor.update(edits=1, geometry=_quad(z=50))
+        sent = self.push()
+        self.assertEqual((sent["meshes"], sent["blobs"], sent["materials"]), (1, 2, 2))
+        self.page.poll()
+        mesh = self.page.meshes["floor"]
+        np.testing.assert_allclose(mesh["points"][2], (1.0, 0.5, -1.0), atol=1e-6)
+        # Triangles sorted by slot: tile's (slot 0) first, then grout's.
+        self.assertEqual(mesh["groups"], [[0, 3, 0], [3, 3, 1]])
+        self.assertEqual(mesh["materials"], ["tile", "grout"])
+
+        # A later push carries the same entry (the document is cumulative) but
+        # nothing is read, written or fetched again.
+        self.scene["nodes"]["lamp"]["matrix"] = _translate(0, 0, 300)
+        sent = self.push()
+        self.assertEqual((sent["meshes"], sent["blobs"]), (1, 0))
+        self.page.poll()
+        self.assertEqual(self.delta.read, 1)
+        self.assertEqual(len(self.page.fetched), 2)  # the buffer and the texture
+
+    def test_a_texture_crosses_once(self):
+        materials = self.scene["materials"]
+        materials["tile"]["roughness"] = 0.2
+        self.assertEqual(self.push()["blobs"], 1)
+        self.page.poll()
+        materials["tile"]["color"] = (1, 0, 0, 1)
+        self.assertEqual(self.push()["blobs"], 0)
+        self.page.poll()
+        self.assertEqual(self.page.materials["tile"]["color"], [1, 0, 0, 1])
+        self.assertEqual(self.page.materials["tile"]["roughness"], 0.2)
+        self.assertEqual(len(self.page.fetched), 1)
+        self.assertNotIn("grout", self.page.materials)  # untouched
+
+        # A new version of the file is a new blob.
+        self.texture.write_bytes(b"\x89PNG repainted" * 64)
+        self.assertEqual(self.push()["blobs"], 1)
+        self.page.poll()
+        self.assertEqual(len(self.page.fetched), 2)
+
+    def test_a_rebase_prunes_the_blobs_it_no_longer_needs(self):
+        floor = self.scene["nodes"]["floor"]["mesh"]
+        self.texture.write_bytes(b"\x89PNG repainted" * 64)
+        for z in (10, 20):
+            floor.update(edits=z, geometry=_quad(z=z))
+            self.push()
+        blobs = Path(self.server.root) / WebXrDelta.BLOBS
+        self.assertEqual(len(list(blobs.iterdir())), 3)  # two buffers, one texture
+
+        self.delta.rebase(self.server, None, self.server.version, self.OPTIONS)
+        latest = self.delta._read["floor"][2]["buffer"]
+        texture = self.delta._files[str(self.texture)][1]
+        kept = sorted(f"{WebXrDelta.BLOBS}/{p.name}" for p in blobs.iterdir())
+        self.assertEqual(kept, sorted([latest, texture]))
+        self.assertEqual(self.delta._written, set(kept))
+
+        del self.scene["nodes"]["floor"]
+        self.delta.rebase(self.server, None, self.server.version, self.OPTIONS)
+        self.assertEqual(
+            [f"{WebXrDelta.BLOBS}/{p.name}" for p in blobs.iterdir()], [texture]
+        )
+
+    def test_what_a_delta_cannot_carry_needs_a_full_push(self):
+        nodes = self.scene["nodes"]
+        nodes["extra"] = dict(parent=None, matrix=np.eye(4), mesh=None)
+        self.assertIsNone(self.push())
+        del nodes["extra"]
+        self.assertIsNotNone(self.push())
+        self.assertIsNone(self.delta.push(self.server, None, ("all", True, True)))
+
+        self.server.publish(Path(self.tmp.name) / "scene.glb")
+        self.assertIsNone(self.push())
+        self.delta.rebase(self.server, None, self.server.version, self.OPTIONS)
+        self.assertIsNotNone(self.push())
+        self.delta.invalidate()
+        self.assertIsNone(self.push())
+
+    def test_a_page_applies_only_against_its_own_version(self):
+        self.scene["nodes"]["lamp"]["matrix"] = _translate(0, 0, 300)
+        self.push()
+        self.server.publish(Path(self.tmp.name) / "scene.glb")
+        self.delta.rebase(self.server, None, self.server.version, self.OPTIONS)
+        self.assertFalse(self.page.poll())  # the rebase reset the document
+        self.push()
+        self.assertFalse(self.page.poll())  # written for a model it has not loaded
+        self.page.reset()
+        self.assertTrue(self.page.poll())
+        self.assertEqual(self.page.nodes, {})
+
+    def test_instance_is_per_subclass(self):
+        self.assertIs(_FakeDelta.instance(), _FakeDelta.instance())
+        self.assertIsNot(_FakeDelta.instance(), WebXrDelta.instance())
+
+
+class TestMayaGeometry(unittest.TestCase):
+    """``MayaWebXrDelta._geometry`` over a faked ``MFnMesh``: a quad and a triangle."""
+
+    def setUp(self):
+        fork = _maya_fork()
+        points = [(0, 0, 0, 1), (1, 0, 0, 1), (1, 1, 0, 1), (0, 1, 0, 1), (2, 0, 0, 1)]
+        fn = mock.MagicMock()
+        fn.getPoints.return_value = points
+        fn.getVertices.return_value = ([4, 3], [0, 1, 2, 3, 1, 4, 2])
+        # Maya's offsets index the face-vertices of the whole mesh.
+        fn.getTriangleOffsets.return_value = ([2, 1], [0, 1, 2, 0, 2, 3, 4, 5, 6])
+        fn.getNormalIds.return_value = ([4, 3], [0] * 7)
+        fn.getNormals.return_value = [(0, 0, 1)]
+        fn.numUVs.return_value = 0
+        fn.getConnectedShaders.return_value = ([], [0, 0])
+        fn.getUVs.return_value = ([0.0, 1.0, 0.5], [0.0, 0.0, 1.0])
+        fn.uuid.return_value.asString.return_value = "uuid"
+        fn.numPolygons, fn.numFaceVertices = 2, 7
+        self.fn, self.delta = fn, fork.MayaWebXrDelta()
+        self.addCleanup(mock.patch.stopall)
+        mock.patch.object(fork.MayaFaceGraphs, "_fn", return_value=fn).start()
+        mock.patch.object(fork.MayaWebXrDelta, "_engines", return_value=[]).start()
+        self.geometry = self.delta._geometry("|quadTri|quadTriShape")
+
+    def test_triangles_index_the_mesh_face_vertices(self):
+        index = self.geometry["index"]
+        self.assertEqual(index.tolist(), [0, 1, 2, 0, 2, 3, 4, 5, 6])
+        corners = self.geometry["position"][index].reshape(-1, 3, 3)
+        self.assertEqual(corners[2].tolist(), [[1, 0, 0], [2, 0, 0], [1, 1, 0]])
+        self.assertEqual(self.geometry["slot"].tolist(), [0, 0, 0])
+
+    def test_the_signature_sees_a_uv_or_normal_edit(self):
+        before = self.delta._signature("|quadTri|quadTriShape")
+        self.fn.getUVs.return_value = ([0.0, 1.0, 0.5], [0.0, 0.0, 0.9])
+        moved = self.delta._signature("|quadTri|quadTriShape")
+        self.fn.getNormals.return_value = [(0, 1, 0)]
+        self.assertEqual(len({before, moved, self.delta._signature("x")}), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()